@@ -8,6 +8,8 @@
 # Changes may cause incorrect behavior and will be lost if the code is
 # regenerated.
 # --------------------------------------------------------------------------
+from __future__ import annotations
+
 from ._serialization import Serializer, Deserializer
 from collections.abc import MutableMapping
 from io import IOBase
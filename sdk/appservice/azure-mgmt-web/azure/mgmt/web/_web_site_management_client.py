@@ -118,7 +118,9 @@ class WebSiteManagementClient(WebSiteManagementClientOperationsMixin, MultiApiCl
 
     @classmethod
     def _models_dict(cls, api_version):
-        return {k: v for k, v in cls.models(api_version).__dict__.items() if isinstance(v, type)}
+        models = cls.models(api_version)
+        client_models = {k: getattr(models, k) for k in models.__all__}
+        return {k: v for k, v in client_models.items() if isinstance(v, type)}
 
     @classmethod
     def models(cls, api_version=DEFAULT_API_VERSION):
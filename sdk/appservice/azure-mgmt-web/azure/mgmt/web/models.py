@@ -4,7 +4,37 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-from .v2016_03_01.models import *
-from .v2018_02_01.models import *
-from .v2023_01_01.models import *
-from .v2024_11_01.models import *
+import importlib
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .v2016_03_01.models import *
+    from .v2018_02_01.models import *
+    from .v2023_01_01.models import *
+    from .v2024_11_01.models import *
+
+# Latest API version first: a model resolves to the most recent version defining it. Each version's models are
+# imported when first needed (PEP 562), not with the package.
+_API_VERSIONS = (".v2024_11_01.models", ".v2023_01_01.models", ".v2018_02_01.models", ".v2016_03_01.models")
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        value: Any = sorted(
+            {key for version in _API_VERSIONS for key in importlib.import_module(version, __package__).__all__}
+        )
+        globals()[name] = value
+        return value
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    for version in _API_VERSIONS:
+        models = importlib.import_module(version, __package__)
+        if name in models.__all__:
+            value = getattr(models, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__getattr__("__all__")))
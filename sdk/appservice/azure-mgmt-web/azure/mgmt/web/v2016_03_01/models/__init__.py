@@ -7,185 +7,186 @@
 # --------------------------------------------------------------------------
 # pylint: disable=wrong-import-position
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
 
+    from ._models_py3 import (  # type: ignore
+        AbnormalTimePeriod,
+        AnalysisData,
+        AnalysisDefinition,
+        ApiDefinitionInfo,
+        AppServiceEnvironment,
+        AppServicePlan,
+        AppServicePlanCollection,
+        ApplicationStack,
+        ApplicationStackCollection,
+        AutoHealActions,
+        AutoHealCustomAction,
+        AutoHealRules,
+        AutoHealTriggers,
+        BillingMeter,
+        BillingMeterCollection,
+        Capability,
+        Certificate,
+        CertificateCollection,
+        CertificatePatchResource,
+        CloningInfo,
+        ConnStringInfo,
+        CorsSettings,
+        CsmMoveResourceEnvelope,
+        CsmOperationCollection,
+        CsmOperationDescription,
+        CsmOperationDescriptionProperties,
+        CsmOperationDisplay,
+        CsmUsageQuota,
+        CsmUsageQuotaCollection,
+        DataSource,
+        DataTableResponseColumn,
+        DataTableResponseObject,
+        DefaultErrorResponse,
+        DefaultErrorResponseError,
+        DefaultErrorResponseErrorDetailsItem,
+        DeletedSite,
+        DeletedWebAppCollection,
+        DeploymentLocations,
+        DetectorAbnormalTimePeriod,
+        DetectorDefinition,
+        DetectorInfo,
+        DetectorResponse,
+        DetectorResponseCollection,
+        DiagnosticAnalysis,
+        DiagnosticAnalysisCollection,
+        DiagnosticCategory,
+        DiagnosticCategoryCollection,
+        DiagnosticData,
+        DiagnosticDetectorCollection,
+        DiagnosticDetectorResponse,
+        DiagnosticMetricSample,
+        DiagnosticMetricSet,
+        Dimension,
+        ErrorEntity,
+        Experiments,
+        GeoRegion,
+        GeoRegionCollection,
+        GlobalCsmSkuDescription,
+        HandlerMapping,
+        HostNameSslState,
+        HostingEnvironmentDeploymentInfo,
+        HostingEnvironmentProfile,
+        HybridConnection,
+        HybridConnectionKey,
+        Identifier,
+        IdentifierCollection,
+        IpSecurityRestriction,
+        LocalizableString,
+        ManagedServiceIdentity,
+        MetricAvailability,
+        MetricSpecification,
+        NameIdentifier,
+        NameValuePair,
+        NetworkAccessControlEntry,
+        Operation,
+        PremierAddOnOffer,
+        PremierAddOnOfferCollection,
+        ProxyOnlyResource,
+        PushSettings,
+        RampUpRule,
+        Recommendation,
+        RecommendationCollection,
+        RecommendationRule,
+        Rendering,
+        RequestsBasedTrigger,
+        Resource,
+        ResourceHealthMetadata,
+        ResourceHealthMetadataCollection,
+        ResourceMetric,
+        ResourceMetricAvailability,
+        ResourceMetricCollection,
+        ResourceMetricDefinition,
+        ResourceMetricDefinitionCollection,
+        ResourceMetricName,
+        ResourceMetricProperty,
+        ResourceMetricValue,
+        ResourceNameAvailability,
+        ResourceNameAvailabilityRequest,
+        ResponseMetaData,
+        ServiceSpecification,
+        Site,
+        SiteConfig,
+        SiteLimits,
+        SiteMachineKey,
+        SkuCapacity,
+        SkuDescription,
+        SkuInfos,
+        SlotSwapStatus,
+        SlowRequestsBasedTrigger,
+        SnapshotRecoveryRequest,
+        SnapshotRecoveryTarget,
+        Solution,
+        SourceControl,
+        SourceControlCollection,
+        StackMajorVersion,
+        StackMinorVersion,
+        StampCapacity,
+        StatusCodesBasedTrigger,
+        User,
+        ValidateRequest,
+        ValidateResponse,
+        ValidateResponseError,
+        VirtualApplication,
+        VirtualDirectory,
+        VirtualIPMapping,
+        VirtualNetworkProfile,
+        VnetGateway,
+        VnetInfo,
+        VnetParameters,
+        VnetRoute,
+        VnetValidationFailureDetails,
+        VnetValidationTestFailure,
+        WebAppCollection,
+        WorkerPool,
+    )
 
-from ._models_py3 import (  # type: ignore
-    AbnormalTimePeriod,
-    AnalysisData,
-    AnalysisDefinition,
-    ApiDefinitionInfo,
-    AppServiceEnvironment,
-    AppServicePlan,
-    AppServicePlanCollection,
-    ApplicationStack,
-    ApplicationStackCollection,
-    AutoHealActions,
-    AutoHealCustomAction,
-    AutoHealRules,
-    AutoHealTriggers,
-    BillingMeter,
-    BillingMeterCollection,
-    Capability,
-    Certificate,
-    CertificateCollection,
-    CertificatePatchResource,
-    CloningInfo,
-    ConnStringInfo,
-    CorsSettings,
-    CsmMoveResourceEnvelope,
-    CsmOperationCollection,
-    CsmOperationDescription,
-    CsmOperationDescriptionProperties,
-    CsmOperationDisplay,
-    CsmUsageQuota,
-    CsmUsageQuotaCollection,
-    DataSource,
-    DataTableResponseColumn,
-    DataTableResponseObject,
-    DefaultErrorResponse,
-    DefaultErrorResponseError,
-    DefaultErrorResponseErrorDetailsItem,
-    DeletedSite,
-    DeletedWebAppCollection,
-    DeploymentLocations,
-    DetectorAbnormalTimePeriod,
-    DetectorDefinition,
-    DetectorInfo,
-    DetectorResponse,
-    DetectorResponseCollection,
-    DiagnosticAnalysis,
-    DiagnosticAnalysisCollection,
-    DiagnosticCategory,
-    DiagnosticCategoryCollection,
-    DiagnosticData,
-    DiagnosticDetectorCollection,
-    DiagnosticDetectorResponse,
-    DiagnosticMetricSample,
-    DiagnosticMetricSet,
-    Dimension,
-    ErrorEntity,
-    Experiments,
-    GeoRegion,
-    GeoRegionCollection,
-    GlobalCsmSkuDescription,
-    HandlerMapping,
-    HostNameSslState,
-    HostingEnvironmentDeploymentInfo,
-    HostingEnvironmentProfile,
-    HybridConnection,
-    HybridConnectionKey,
-    Identifier,
-    IdentifierCollection,
-    IpSecurityRestriction,
-    LocalizableString,
-    ManagedServiceIdentity,
-    MetricAvailability,
-    MetricSpecification,
-    NameIdentifier,
-    NameValuePair,
-    NetworkAccessControlEntry,
-    Operation,
-    PremierAddOnOffer,
-    PremierAddOnOfferCollection,
-    ProxyOnlyResource,
-    PushSettings,
-    RampUpRule,
-    Recommendation,
-    RecommendationCollection,
-    RecommendationRule,
-    Rendering,
-    RequestsBasedTrigger,
-    Resource,
-    ResourceHealthMetadata,
-    ResourceHealthMetadataCollection,
-    ResourceMetric,
-    ResourceMetricAvailability,
-    ResourceMetricCollection,
-    ResourceMetricDefinition,
-    ResourceMetricDefinitionCollection,
-    ResourceMetricName,
-    ResourceMetricProperty,
-    ResourceMetricValue,
-    ResourceNameAvailability,
-    ResourceNameAvailabilityRequest,
-    ResponseMetaData,
-    ServiceSpecification,
-    Site,
-    SiteConfig,
-    SiteLimits,
-    SiteMachineKey,
-    SkuCapacity,
-    SkuDescription,
-    SkuInfos,
-    SlotSwapStatus,
-    SlowRequestsBasedTrigger,
-    SnapshotRecoveryRequest,
-    SnapshotRecoveryTarget,
-    Solution,
-    SourceControl,
-    SourceControlCollection,
-    StackMajorVersion,
-    StackMinorVersion,
-    StampCapacity,
-    StatusCodesBasedTrigger,
-    User,
-    ValidateRequest,
-    ValidateResponse,
-    ValidateResponseError,
-    VirtualApplication,
-    VirtualDirectory,
-    VirtualIPMapping,
-    VirtualNetworkProfile,
-    VnetGateway,
-    VnetInfo,
-    VnetParameters,
-    VnetRoute,
-    VnetValidationFailureDetails,
-    VnetValidationTestFailure,
-    WebAppCollection,
-    WorkerPool,
-)
+    from ._web_site_management_client_enums import (  # type: ignore
+        AccessControlEntryAction,
+        AppServicePlanRestrictions,
+        AutoHealActionType,
+        Channels,
+        CheckNameResourceTypes,
+        ComputeModeOptions,
+        ConnectionStringType,
+        Enum0,
+        Enum1,
+        HostType,
+        HostingEnvironmentStatus,
+        InAvailabilityReasonType,
+        InternalLoadBalancingMode,
+        IssueType,
+        KeyVaultSecretStatus,
+        ManagedPipelineMode,
+        ManagedServiceIdentityType,
+        NotificationLevel,
+        OperationStatus,
+        ProvisioningState,
+        RenderingType,
+        ResourceScopeType,
+        RouteType,
+        ScmType,
+        SiteAvailabilityState,
+        SiteLoadBalancing,
+        SkuName,
+        SolutionType,
+        SslState,
+        StatusOptions,
+        SupportedTlsVersions,
+        UsageState,
+        ValidateResourceTypes,
+        WorkerSizeOptions,
+    )
 
-from ._web_site_management_client_enums import (  # type: ignore
-    AccessControlEntryAction,
-    AppServicePlanRestrictions,
-    AutoHealActionType,
-    Channels,
-    CheckNameResourceTypes,
-    ComputeModeOptions,
-    ConnectionStringType,
-    Enum0,
-    Enum1,
-    HostType,
-    HostingEnvironmentStatus,
-    InAvailabilityReasonType,
-    InternalLoadBalancingMode,
-    IssueType,
-    KeyVaultSecretStatus,
-    ManagedPipelineMode,
-    ManagedServiceIdentityType,
-    NotificationLevel,
-    OperationStatus,
-    ProvisioningState,
-    RenderingType,
-    ResourceScopeType,
-    RouteType,
-    ScmType,
-    SiteAvailabilityState,
-    SiteLoadBalancing,
-    SkuName,
-    SolutionType,
-    SslState,
-    StatusOptions,
-    SupportedTlsVersions,
-    UsageState,
-    ValidateResourceTypes,
-    WorkerSizeOptions,
-)
 from ._patch import __all__ as _patch_all
 from ._patch import *
 from ._patch import patch_sdk as _patch_sdk
@@ -362,3 +363,24 @@ __all__ = [
 ]
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+# Models are imported when one of them is first accessed (PEP 562), not with the package: for the largest
+# services, executing _models_py3 takes most of the time and memory needed to import the whole client library.
+_LAZY_SUBMODULES = ("._models_py3", "._web_site_management_client_enums")
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        for submodule in _LAZY_SUBMODULES:
+            module = vars(importlib.import_module(submodule, __name__))
+            for key in __all__:
+                if key in module and key not in globals():
+                    globals()[key] = module[key]
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
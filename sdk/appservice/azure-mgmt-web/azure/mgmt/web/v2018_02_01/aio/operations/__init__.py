@@ -7,26 +7,27 @@
 # --------------------------------------------------------------------------
 # pylint: disable=wrong-import-position
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
 
-from ._app_service_certificate_orders_operations import AppServiceCertificateOrdersOperations  # type: ignore
-from ._certificate_registration_provider_operations import CertificateRegistrationProviderOperations  # type: ignore
-from ._domains_operations import DomainsOperations  # type: ignore
-from ._top_level_domains_operations import TopLevelDomainsOperations  # type: ignore
-from ._domain_registration_provider_operations import DomainRegistrationProviderOperations  # type: ignore
-from ._certificates_operations import CertificatesOperations  # type: ignore
-from ._deleted_web_apps_operations import DeletedWebAppsOperations  # type: ignore
-from ._diagnostics_operations import DiagnosticsOperations  # type: ignore
-from ._provider_operations import ProviderOperations  # type: ignore
-from ._recommendations_operations import RecommendationsOperations  # type: ignore
-from ._web_site_management_client_operations import WebSiteManagementClientOperationsMixin  # type: ignore
-from ._web_apps_operations import WebAppsOperations  # type: ignore
-from ._app_service_environments_operations import AppServiceEnvironmentsOperations  # type: ignore
-from ._app_service_plans_operations import AppServicePlansOperations  # type: ignore
-from ._resource_health_metadata_operations import ResourceHealthMetadataOperations  # type: ignore
+    from ._app_service_certificate_orders_operations import AppServiceCertificateOrdersOperations  # type: ignore
+    from ._certificate_registration_provider_operations import CertificateRegistrationProviderOperations  # type: ignore
+    from ._domains_operations import DomainsOperations  # type: ignore
+    from ._top_level_domains_operations import TopLevelDomainsOperations  # type: ignore
+    from ._domain_registration_provider_operations import DomainRegistrationProviderOperations  # type: ignore
+    from ._certificates_operations import CertificatesOperations  # type: ignore
+    from ._deleted_web_apps_operations import DeletedWebAppsOperations  # type: ignore
+    from ._diagnostics_operations import DiagnosticsOperations  # type: ignore
+    from ._provider_operations import ProviderOperations  # type: ignore
+    from ._recommendations_operations import RecommendationsOperations  # type: ignore
+    from ._web_site_management_client_operations import WebSiteManagementClientOperationsMixin  # type: ignore
+    from ._web_apps_operations import WebAppsOperations  # type: ignore
+    from ._app_service_environments_operations import AppServiceEnvironmentsOperations  # type: ignore
+    from ._app_service_plans_operations import AppServicePlansOperations  # type: ignore
+    from ._resource_health_metadata_operations import ResourceHealthMetadataOperations  # type: ignore
 
 from ._patch import __all__ as _patch_all
 from ._patch import *
@@ -51,3 +52,36 @@ __all__ = [
 ]
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+# Each operation group is imported when it is first accessed (PEP 562), not with the package.
+_LAZY_IMPORTS = {
+    "AppServiceCertificateOrdersOperations": "._app_service_certificate_orders_operations",
+    "CertificateRegistrationProviderOperations": "._certificate_registration_provider_operations",
+    "DomainsOperations": "._domains_operations",
+    "TopLevelDomainsOperations": "._top_level_domains_operations",
+    "DomainRegistrationProviderOperations": "._domain_registration_provider_operations",
+    "CertificatesOperations": "._certificates_operations",
+    "DeletedWebAppsOperations": "._deleted_web_apps_operations",
+    "DiagnosticsOperations": "._diagnostics_operations",
+    "ProviderOperations": "._provider_operations",
+    "RecommendationsOperations": "._recommendations_operations",
+    "WebSiteManagementClientOperationsMixin": "._web_site_management_client_operations",
+    "WebAppsOperations": "._web_apps_operations",
+    "AppServiceEnvironmentsOperations": "._app_service_environments_operations",
+    "AppServicePlansOperations": "._app_service_plans_operations",
+    "ResourceHealthMetadataOperations": "._resource_health_metadata_operations",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
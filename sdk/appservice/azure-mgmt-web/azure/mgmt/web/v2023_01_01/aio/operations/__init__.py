@@ -8,42 +8,43 @@
 # --------------------------------------------------------------------------
 # pylint: disable=wrong-import-position
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
 
-from ._app_service_certificate_orders_operations import AppServiceCertificateOrdersOperations  # type: ignore
-from ._certificate_orders_diagnostics_operations import CertificateOrdersDiagnosticsOperations  # type: ignore
-from ._certificate_registration_provider_operations import CertificateRegistrationProviderOperations  # type: ignore
-from ._domains_operations import DomainsOperations  # type: ignore
-from ._top_level_domains_operations import TopLevelDomainsOperations  # type: ignore
-from ._domain_registration_provider_operations import DomainRegistrationProviderOperations  # type: ignore
-from ._app_service_environments_operations import AppServiceEnvironmentsOperations  # type: ignore
-from ._app_service_plans_operations import AppServicePlansOperations  # type: ignore
-from ._certificates_operations import CertificatesOperations  # type: ignore
-from ._container_apps_operations import ContainerAppsOperations  # type: ignore
-from ._container_apps_revisions_operations import ContainerAppsRevisionsOperations  # type: ignore
-from ._deleted_web_apps_operations import DeletedWebAppsOperations  # type: ignore
-from ._diagnostics_operations import DiagnosticsOperations  # type: ignore
-from ._global_operations_operations import GlobalOperations  # type: ignore
-from ._kube_environments_operations import KubeEnvironmentsOperations  # type: ignore
-from ._provider_operations import ProviderOperations  # type: ignore
-from ._recommendations_operations import RecommendationsOperations  # type: ignore
-from ._resource_health_metadata_operations import ResourceHealthMetadataOperations  # type: ignore
-from ._web_site_management_client_operations import WebSiteManagementClientOperationsMixin  # type: ignore
-from ._get_usages_in_location_operations import GetUsagesInLocationOperations  # type: ignore
-from ._static_sites_operations import StaticSitesOperations  # type: ignore
-from ._web_apps_operations import WebAppsOperations  # type: ignore
-from ._workflows_operations import WorkflowsOperations  # type: ignore
-from ._workflow_runs_operations import WorkflowRunsOperations  # type: ignore
-from ._workflow_run_actions_operations import WorkflowRunActionsOperations  # type: ignore
-from ._workflow_run_action_repetitions_operations import WorkflowRunActionRepetitionsOperations  # type: ignore
-from ._workflow_run_action_repetitions_request_histories_operations import WorkflowRunActionRepetitionsRequestHistoriesOperations  # type: ignore
-from ._workflow_run_action_scope_repetitions_operations import WorkflowRunActionScopeRepetitionsOperations  # type: ignore
-from ._workflow_triggers_operations import WorkflowTriggersOperations  # type: ignore
-from ._workflow_trigger_histories_operations import WorkflowTriggerHistoriesOperations  # type: ignore
-from ._workflow_versions_operations import WorkflowVersionsOperations  # type: ignore
+    from ._app_service_certificate_orders_operations import AppServiceCertificateOrdersOperations  # type: ignore
+    from ._certificate_orders_diagnostics_operations import CertificateOrdersDiagnosticsOperations  # type: ignore
+    from ._certificate_registration_provider_operations import CertificateRegistrationProviderOperations  # type: ignore
+    from ._domains_operations import DomainsOperations  # type: ignore
+    from ._top_level_domains_operations import TopLevelDomainsOperations  # type: ignore
+    from ._domain_registration_provider_operations import DomainRegistrationProviderOperations  # type: ignore
+    from ._app_service_environments_operations import AppServiceEnvironmentsOperations  # type: ignore
+    from ._app_service_plans_operations import AppServicePlansOperations  # type: ignore
+    from ._certificates_operations import CertificatesOperations  # type: ignore
+    from ._container_apps_operations import ContainerAppsOperations  # type: ignore
+    from ._container_apps_revisions_operations import ContainerAppsRevisionsOperations  # type: ignore
+    from ._deleted_web_apps_operations import DeletedWebAppsOperations  # type: ignore
+    from ._diagnostics_operations import DiagnosticsOperations  # type: ignore
+    from ._global_operations_operations import GlobalOperations  # type: ignore
+    from ._kube_environments_operations import KubeEnvironmentsOperations  # type: ignore
+    from ._provider_operations import ProviderOperations  # type: ignore
+    from ._recommendations_operations import RecommendationsOperations  # type: ignore
+    from ._resource_health_metadata_operations import ResourceHealthMetadataOperations  # type: ignore
+    from ._web_site_management_client_operations import WebSiteManagementClientOperationsMixin  # type: ignore
+    from ._get_usages_in_location_operations import GetUsagesInLocationOperations  # type: ignore
+    from ._static_sites_operations import StaticSitesOperations  # type: ignore
+    from ._web_apps_operations import WebAppsOperations  # type: ignore
+    from ._workflows_operations import WorkflowsOperations  # type: ignore
+    from ._workflow_runs_operations import WorkflowRunsOperations  # type: ignore
+    from ._workflow_run_actions_operations import WorkflowRunActionsOperations  # type: ignore
+    from ._workflow_run_action_repetitions_operations import WorkflowRunActionRepetitionsOperations  # type: ignore
+    from ._workflow_run_action_repetitions_request_histories_operations import WorkflowRunActionRepetitionsRequestHistoriesOperations  # type: ignore
+    from ._workflow_run_action_scope_repetitions_operations import WorkflowRunActionScopeRepetitionsOperations  # type: ignore
+    from ._workflow_triggers_operations import WorkflowTriggersOperations  # type: ignore
+    from ._workflow_trigger_histories_operations import WorkflowTriggerHistoriesOperations  # type: ignore
+    from ._workflow_versions_operations import WorkflowVersionsOperations  # type: ignore
 
 from ._patch import __all__ as _patch_all
 from ._patch import *
@@ -84,3 +85,52 @@ __all__ = [
 ]
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+# Each operation group is imported when it is first accessed (PEP 562), not with the package.
+_LAZY_IMPORTS = {
+    "AppServiceCertificateOrdersOperations": "._app_service_certificate_orders_operations",
+    "CertificateOrdersDiagnosticsOperations": "._certificate_orders_diagnostics_operations",
+    "CertificateRegistrationProviderOperations": "._certificate_registration_provider_operations",
+    "DomainsOperations": "._domains_operations",
+    "TopLevelDomainsOperations": "._top_level_domains_operations",
+    "DomainRegistrationProviderOperations": "._domain_registration_provider_operations",
+    "AppServiceEnvironmentsOperations": "._app_service_environments_operations",
+    "AppServicePlansOperations": "._app_service_plans_operations",
+    "CertificatesOperations": "._certificates_operations",
+    "ContainerAppsOperations": "._container_apps_operations",
+    "ContainerAppsRevisionsOperations": "._container_apps_revisions_operations",
+    "DeletedWebAppsOperations": "._deleted_web_apps_operations",
+    "DiagnosticsOperations": "._diagnostics_operations",
+    "GlobalOperations": "._global_operations_operations",
+    "KubeEnvironmentsOperations": "._kube_environments_operations",
+    "ProviderOperations": "._provider_operations",
+    "RecommendationsOperations": "._recommendations_operations",
+    "ResourceHealthMetadataOperations": "._resource_health_metadata_operations",
+    "WebSiteManagementClientOperationsMixin": "._web_site_management_client_operations",
+    "GetUsagesInLocationOperations": "._get_usages_in_location_operations",
+    "StaticSitesOperations": "._static_sites_operations",
+    "WebAppsOperations": "._web_apps_operations",
+    "WorkflowsOperations": "._workflows_operations",
+    "WorkflowRunsOperations": "._workflow_runs_operations",
+    "WorkflowRunActionsOperations": "._workflow_run_actions_operations",
+    "WorkflowRunActionRepetitionsOperations": "._workflow_run_action_repetitions_operations",
+    "WorkflowRunActionRepetitionsRequestHistoriesOperations": "._workflow_run_action_repetitions_request_histories_operations",
+    "WorkflowRunActionScopeRepetitionsOperations": "._workflow_run_action_scope_repetitions_operations",
+    "WorkflowTriggersOperations": "._workflow_triggers_operations",
+    "WorkflowTriggerHistoriesOperations": "._workflow_trigger_histories_operations",
+    "WorkflowVersionsOperations": "._workflow_versions_operations",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,652 +8,653 @@
 # --------------------------------------------------------------------------
 # pylint: disable=wrong-import-position
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
 
+    from ._models_py3 import (  # type: ignore
+        AbnormalTimePeriod,
+        Address,
+        AddressResponse,
+        AllowedAudiencesValidation,
+        AllowedPrincipals,
+        AnalysisData,
+        AnalysisDefinition,
+        ApiDefinitionInfo,
+        ApiKVReference,
+        ApiKVReferenceCollection,
+        ApiManagementConfig,
+        AppInsightsWebAppStackSettings,
+        AppLogsConfiguration,
+        AppRegistration,
+        AppServiceCertificate,
+        AppServiceCertificateCollection,
+        AppServiceCertificateOrder,
+        AppServiceCertificateOrderCollection,
+        AppServiceCertificateOrderPatchResource,
+        AppServiceCertificatePatchResource,
+        AppServiceCertificateResource,
+        AppServiceEnvironment,
+        AppServiceEnvironmentCollection,
+        AppServiceEnvironmentPatchResource,
+        AppServiceEnvironmentResource,
+        AppServicePlan,
+        AppServicePlanCollection,
+        AppServicePlanPatchResource,
+        Apple,
+        AppleRegistration,
+        ApplicationLogsConfig,
+        ApplicationStack,
+        ApplicationStackCollection,
+        ApplicationStackResource,
+        AppserviceGithubToken,
+        AppserviceGithubTokenRequest,
+        ArcConfiguration,
+        ArmIdWrapper,
+        ArmPlan,
+        AseRegion,
+        AseRegionCollection,
+        AseV3NetworkingConfiguration,
+        AuthPlatform,
+        AutoHealActions,
+        AutoHealCustomAction,
+        AutoHealRules,
+        AutoHealTriggers,
+        AzureActiveDirectory,
+        AzureActiveDirectoryLogin,
+        AzureActiveDirectoryRegistration,
+        AzureActiveDirectoryValidation,
+        AzureBlobStorageApplicationLogsConfig,
+        AzureBlobStorageHttpLogsConfig,
+        AzureResourceErrorInfo,
+        AzureStaticWebApps,
+        AzureStaticWebAppsRegistration,
+        AzureStorageInfoValue,
+        AzureStoragePropertyDictionaryResource,
+        AzureTableStorageApplicationLogsConfig,
+        BackupItem,
+        BackupItemCollection,
+        BackupRequest,
+        BackupSchedule,
+        BillingMeter,
+        BillingMeterCollection,
+        BlobStorageTokenStore,
+        Capability,
+        Certificate,
+        CertificateCollection,
+        CertificateDetails,
+        CertificateEmail,
+        CertificateOrderAction,
+        CertificateOrderContact,
+        CertificatePatchResource,
+        CipherSuites,
+        ClientRegistration,
+        CloningInfo,
+        ConnStringInfo,
+        ConnStringValueTypePair,
+        ConnectionStringDictionary,
+        Contact,
+        Container,
+        ContainerAppsConfiguration,
+        ContainerCpuStatistics,
+        ContainerCpuUsage,
+        ContainerInfo,
+        ContainerMemoryStatistics,
+        ContainerNetworkInterfaceStatistics,
+        ContainerResources,
+        ContainerThrottlingData,
+        ContentHash,
+        ContentLink,
+        ContinuousWebJob,
+        ContinuousWebJobCollection,
+        CookieExpiration,
+        Correlation,
+        CorsSettings,
+        CsmDeploymentStatus,
+        CsmDeploymentStatusCollection,
+        CsmMoveResourceEnvelope,
+        CsmOperationCollection,
+        CsmOperationDescription,
+        CsmOperationDescriptionProperties,
+        CsmOperationDisplay,
+        CsmPublishingCredentialsPoliciesEntity,
+        CsmPublishingProfileOptions,
+        CsmSlotEntity,
+        CsmUsageQuota,
+        CsmUsageQuotaCollection,
+        CustomDnsSuffixConfiguration,
+        CustomHostnameAnalysisResult,
+        CustomHostnameSites,
+        CustomHostnameSitesCollection,
+        CustomOpenIdConnectProvider,
+        CustomScaleRule,
+        Dapr,
+        DaprComponent,
+        DaprConfig,
+        DaprMetadata,
+        DataProviderMetadata,
+        DataSource,
+        DataTableResponseColumn,
+        DataTableResponseObject,
+        DatabaseBackupSetting,
+        DatabaseConnection,
+        DatabaseConnectionCollection,
+        DatabaseConnectionOverview,
+        DatabaseConnectionPatchRequest,
+        DefaultAuthorizationPolicy,
+        DefaultErrorResponse,
+        DefaultErrorResponseError,
+        DefaultErrorResponseErrorDetailsItem,
+        DeletedAppRestoreRequest,
+        DeletedSite,
+        DeletedWebAppCollection,
+        Deployment,
+        DeploymentCollection,
+        DeploymentLocations,
+        DetectorAbnormalTimePeriod,
+        DetectorDefinition,
+        DetectorDefinitionResource,
+        DetectorInfo,
+        DetectorResponse,
+        DetectorResponseCollection,
+        DiagnosticAnalysis,
+        DiagnosticAnalysisCollection,
+        DiagnosticCategory,
+        DiagnosticCategoryCollection,
+        DiagnosticData,
+        DiagnosticDetectorCollection,
+        DiagnosticDetectorResponse,
+        DiagnosticMetricSample,
+        DiagnosticMetricSet,
+        Dimension,
+        DnlResourceNameAvailability,
+        DnlResourceNameAvailabilityRequest,
+        Domain,
+        DomainAvailabilityCheckResult,
+        DomainCollection,
+        DomainControlCenterSsoRequest,
+        DomainOwnershipIdentifier,
+        DomainOwnershipIdentifierCollection,
+        DomainPatchResource,
+        DomainPurchaseConsent,
+        DomainRecommendationSearchParameters,
+        EnabledConfig,
+        EndpointDependency,
+        EndpointDetail,
+        EnvironmentVar,
+        EnvironmentVariable,
+        ErrorEntity,
+        ErrorInfo,
+        ErrorPage,
+        ErrorProperties,
+        ErrorResponse,
+        Experiments,
+        Expression,
+        ExpressionRoot,
+        ExpressionTraces,
+        ExtendedLocation,
+        Facebook,
+        FileSystemApplicationLogsConfig,
+        FileSystemHttpLogsConfig,
+        FileSystemTokenStore,
+        FlowAccessControlConfiguration,
+        FlowAccessControlConfigurationPolicy,
+        FlowEndpoints,
+        FlowEndpointsConfiguration,
+        ForwardProxy,
+        FrontEndConfiguration,
+        FunctionAppConfig,
+        FunctionAppMajorVersion,
+        FunctionAppMinorVersion,
+        FunctionAppRuntimeSettings,
+        FunctionAppRuntimes,
+        FunctionAppStack,
+        FunctionAppStackCollection,
+        FunctionEnvelope,
+        FunctionEnvelopeCollection,
+        FunctionSecrets,
+        FunctionsAlwaysReadyConfig,
+        FunctionsDeployment,
+        FunctionsDeploymentStorage,
+        FunctionsDeploymentStorageAuthentication,
+        FunctionsRuntime,
+        FunctionsScaleAndConcurrency,
+        FunctionsScaleAndConcurrencyTriggers,
+        FunctionsScaleAndConcurrencyTriggersHttp,
+        GeoRegion,
+        GeoRegionCollection,
+        GitHub,
+        GitHubActionCodeConfiguration,
+        GitHubActionConfiguration,
+        GitHubActionContainerConfiguration,
+        GitHubActionWebAppStackSettings,
+        GlobalCsmSkuDescription,
+        GlobalValidation,
+        Google,
+        HandlerMapping,
+        HostKeys,
+        HostName,
+        HostNameBinding,
+        HostNameBindingCollection,
+        HostNameSslState,
+        HostingEnvironmentDeploymentInfo,
+        HostingEnvironmentDiagnostics,
+        HostingEnvironmentProfile,
+        HttpLogsConfig,
+        HttpScaleRule,
+        HttpSettings,
+        HttpSettingsRoutes,
+        HybridConnection,
+        HybridConnectionCollection,
+        HybridConnectionKey,
+        HybridConnectionLimits,
+        Identifier,
+        IdentifierCollection,
+        IdentityProviders,
+        InboundEnvironmentEndpoint,
+        InboundEnvironmentEndpointCollection,
+        IpAddress,
+        IpAddressRange,
+        IpSecurityRestriction,
+        JsonSchema,
+        JwtClaimChecks,
+        KeyInfo,
+        KeyValuePairStringObject,
+        KubeEnvironment,
+        KubeEnvironmentCollection,
+        KubeEnvironmentPatchResource,
+        KubeEnvironmentProfile,
+        LegacyMicrosoftAccount,
+        LinuxJavaContainerSettings,
+        LocalizableString,
+        LogAnalyticsConfiguration,
+        LogSpecification,
+        Login,
+        LoginRoutes,
+        LoginScopes,
+        MSDeploy,
+        MSDeployLog,
+        MSDeployLogEntry,
+        MSDeployStatus,
+        ManagedServiceIdentity,
+        MetricAvailability,
+        MetricSpecification,
+        MigrateMySqlRequest,
+        MigrateMySqlStatus,
+        NameIdentifier,
+        NameIdentifierCollection,
+        NameValuePair,
+        NetworkFeatures,
+        NetworkTrace,
+        Nonce,
+        OpenAuthenticationAccessPolicies,
+        OpenAuthenticationAccessPolicy,
+        OpenAuthenticationPolicyClaim,
+        OpenIdConnectClientCredential,
+        OpenIdConnectConfig,
+        OpenIdConnectLogin,
+        OpenIdConnectRegistration,
+        Operation,
+        OperationResult,
+        OperationResultProperties,
+        OutboundEnvironmentEndpoint,
+        OutboundEnvironmentEndpointCollection,
+        OutboundVnetRouting,
+        PerfMonCounterCollection,
+        PerfMonResponse,
+        PerfMonSample,
+        PerfMonSet,
+        PremierAddOn,
+        PremierAddOnOffer,
+        PremierAddOnOfferCollection,
+        PremierAddOnPatchResource,
+        PrivateAccess,
+        PrivateAccessSubnet,
+        PrivateAccessVirtualNetwork,
+        PrivateEndpointConnectionCollection,
+        PrivateLinkConnectionApprovalRequestResource,
+        PrivateLinkConnectionState,
+        PrivateLinkResource,
+        PrivateLinkResourceProperties,
+        PrivateLinkResourcesWrapper,
+        ProcessInfo,
+        ProcessInfoCollection,
+        ProcessModuleInfo,
+        ProcessModuleInfoCollection,
+        ProcessThreadInfo,
+        ProcessThreadInfoCollection,
+        ProxyOnlyResource,
+        PublicCertificate,
+        PublicCertificateCollection,
+        PublishingCredentialsPoliciesCollection,
+        PushSettings,
+        QueryUtterancesResult,
+        QueryUtterancesResults,
+        QueueScaleRule,
+        RampUpRule,
+        Recommendation,
+        RecommendationCollection,
+        RecommendationRule,
+        RecurrenceSchedule,
+        RecurrenceScheduleOccurrence,
+        RegenerateActionParameter,
+        ReissueCertificateOrderRequest,
+        RelayServiceConnectionEntity,
+        RemotePrivateEndpointConnection,
+        RemotePrivateEndpointConnectionARMResource,
+        Rendering,
+        RenewCertificateOrderRequest,
+        RepetitionIndex,
+        Request,
+        RequestHistory,
+        RequestHistoryListResult,
+        RequestHistoryProperties,
+        RequestsBasedTrigger,
+        Resource,
+        ResourceCollection,
+        ResourceConfig,
+        ResourceHealthMetadata,
+        ResourceHealthMetadataCollection,
+        ResourceMetricAvailability,
+        ResourceMetricDefinition,
+        ResourceMetricDefinitionCollection,
+        ResourceNameAvailability,
+        ResourceNameAvailabilityRequest,
+        ResourceReference,
+        Response,
+        ResponseMessageEnvelopeRemotePrivateEndpointConnection,
+        ResponseMetaData,
+        RestoreRequest,
+        RetryHistory,
+        RunActionCorrelation,
+        RunCorrelation,
+        SampleUtterance,
+        Scale,
+        ScaleRule,
+        ScaleRuleAuth,
+        ServiceSpecification,
+        Site,
+        SiteAuthSettings,
+        SiteAuthSettingsV2,
+        SiteCloneability,
+        SiteCloneabilityCriterion,
+        SiteConfig,
+        SiteConfigPropertiesDictionary,
+        SiteConfigResource,
+        SiteConfigResourceCollection,
+        SiteConfigurationSnapshotInfo,
+        SiteConfigurationSnapshotInfoCollection,
+        SiteContainer,
+        SiteContainerCollection,
+        SiteDnsConfig,
+        SiteExtensionInfo,
+        SiteExtensionInfoCollection,
+        SiteLimits,
+        SiteLogsConfig,
+        SiteMachineKey,
+        SitePatchResource,
+        SitePhpErrorLogFlag,
+        SiteSeal,
+        SiteSealRequest,
+        SiteSourceControl,
+        SkuCapacity,
+        SkuDescription,
+        SkuInfo,
+        SkuInfoCollection,
+        SkuInfos,
+        SlotConfigNamesResource,
+        SlotDifference,
+        SlotDifferenceCollection,
+        SlotSwapStatus,
+        SlowRequestsBasedTrigger,
+        Snapshot,
+        SnapshotCollection,
+        SnapshotRecoverySource,
+        SnapshotRestoreRequest,
+        Solution,
+        SourceControl,
+        SourceControlCollection,
+        StackMajorVersion,
+        StackMinorVersion,
+        StampCapacity,
+        StampCapacityCollection,
+        StaticSiteARMResource,
+        StaticSiteBasicAuthPropertiesARMResource,
+        StaticSiteBasicAuthPropertiesCollection,
+        StaticSiteBuildARMResource,
+        StaticSiteBuildCollection,
+        StaticSiteBuildProperties,
+        StaticSiteCollection,
+        StaticSiteCustomDomainOverviewARMResource,
+        StaticSiteCustomDomainOverviewCollection,
+        StaticSiteCustomDomainRequestPropertiesARMResource,
+        StaticSiteDatabaseConnectionConfigurationFileOverview,
+        StaticSiteFunctionOverviewARMResource,
+        StaticSiteFunctionOverviewCollection,
+        StaticSiteLinkedBackend,
+        StaticSiteLinkedBackendARMResource,
+        StaticSiteLinkedBackendsCollection,
+        StaticSitePatchResource,
+        StaticSiteResetPropertiesARMResource,
+        StaticSiteTemplateOptions,
+        StaticSiteUserARMResource,
+        StaticSiteUserCollection,
+        StaticSiteUserInvitationRequestResource,
+        StaticSiteUserInvitationResponseResource,
+        StaticSiteUserProvidedFunctionApp,
+        StaticSiteUserProvidedFunctionAppARMResource,
+        StaticSiteUserProvidedFunctionAppsCollection,
+        StaticSiteZipDeploymentARMResource,
+        StaticSitesWorkflowPreview,
+        StaticSitesWorkflowPreviewRequest,
+        Status,
+        StatusCodesBasedTrigger,
+        StatusCodesRangeBasedTrigger,
+        StorageMigrationOptions,
+        StorageMigrationResponse,
+        StringDictionary,
+        StringList,
+        SubResource,
+        SupportTopic,
+        SwiftVirtualNetwork,
+        Template,
+        TldLegalAgreement,
+        TldLegalAgreementCollection,
+        TokenStore,
+        TopLevelDomain,
+        TopLevelDomainAgreementOption,
+        TopLevelDomainCollection,
+        TriggeredJobHistory,
+        TriggeredJobHistoryCollection,
+        TriggeredJobRun,
+        TriggeredWebJob,
+        TriggeredWebJobCollection,
+        Twitter,
+        TwitterRegistration,
+        Usage,
+        UsageCollection,
+        User,
+        UserAssignedIdentity,
+        ValidateRequest,
+        ValidateResponse,
+        ValidateResponseError,
+        VirtualApplication,
+        VirtualDirectory,
+        VirtualIPMapping,
+        VirtualNetworkProfile,
+        VnetGateway,
+        VnetInfo,
+        VnetInfoResource,
+        VnetParameters,
+        VnetRoute,
+        VnetValidationFailureDetails,
+        VnetValidationTestFailure,
+        VolumeMount,
+        WebAppCollection,
+        WebAppInstanceStatusCollection,
+        WebAppMajorVersion,
+        WebAppMinorVersion,
+        WebAppRuntimeSettings,
+        WebAppRuntimes,
+        WebAppStack,
+        WebAppStackCollection,
+        WebJob,
+        WebJobCollection,
+        WebSiteInstanceStatus,
+        WindowsJavaContainerSettings,
+        WorkerPoolCollection,
+        WorkerPoolResource,
+        Workflow,
+        WorkflowArtifacts,
+        WorkflowEnvelope,
+        WorkflowEnvelopeCollection,
+        WorkflowEnvelopeProperties,
+        WorkflowFilter,
+        WorkflowHealth,
+        WorkflowListResult,
+        WorkflowOutputParameter,
+        WorkflowParameter,
+        WorkflowResource,
+        WorkflowRun,
+        WorkflowRunAction,
+        WorkflowRunActionFilter,
+        WorkflowRunActionListResult,
+        WorkflowRunActionRepetitionDefinition,
+        WorkflowRunActionRepetitionDefinitionCollection,
+        WorkflowRunActionRepetitionProperties,
+        WorkflowRunFilter,
+        WorkflowRunListResult,
+        WorkflowRunTrigger,
+        WorkflowSku,
+        WorkflowTrigger,
+        WorkflowTriggerCallbackUrl,
+        WorkflowTriggerFilter,
+        WorkflowTriggerHistory,
+        WorkflowTriggerHistoryFilter,
+        WorkflowTriggerHistoryListResult,
+        WorkflowTriggerListCallbackUrlQueries,
+        WorkflowTriggerListResult,
+        WorkflowTriggerRecurrence,
+        WorkflowVersion,
+        WorkflowVersionListResult,
+    )
 
-from ._models_py3 import (  # type: ignore
-    AbnormalTimePeriod,
-    Address,
-    AddressResponse,
-    AllowedAudiencesValidation,
-    AllowedPrincipals,
-    AnalysisData,
-    AnalysisDefinition,
-    ApiDefinitionInfo,
-    ApiKVReference,
-    ApiKVReferenceCollection,
-    ApiManagementConfig,
-    AppInsightsWebAppStackSettings,
-    AppLogsConfiguration,
-    AppRegistration,
-    AppServiceCertificate,
-    AppServiceCertificateCollection,
-    AppServiceCertificateOrder,
-    AppServiceCertificateOrderCollection,
-    AppServiceCertificateOrderPatchResource,
-    AppServiceCertificatePatchResource,
-    AppServiceCertificateResource,
-    AppServiceEnvironment,
-    AppServiceEnvironmentCollection,
-    AppServiceEnvironmentPatchResource,
-    AppServiceEnvironmentResource,
-    AppServicePlan,
-    AppServicePlanCollection,
-    AppServicePlanPatchResource,
-    Apple,
-    AppleRegistration,
-    ApplicationLogsConfig,
-    ApplicationStack,
-    ApplicationStackCollection,
-    ApplicationStackResource,
-    AppserviceGithubToken,
-    AppserviceGithubTokenRequest,
-    ArcConfiguration,
-    ArmIdWrapper,
-    ArmPlan,
-    AseRegion,
-    AseRegionCollection,
-    AseV3NetworkingConfiguration,
-    AuthPlatform,
-    AutoHealActions,
-    AutoHealCustomAction,
-    AutoHealRules,
-    AutoHealTriggers,
-    AzureActiveDirectory,
-    AzureActiveDirectoryLogin,
-    AzureActiveDirectoryRegistration,
-    AzureActiveDirectoryValidation,
-    AzureBlobStorageApplicationLogsConfig,
-    AzureBlobStorageHttpLogsConfig,
-    AzureResourceErrorInfo,
-    AzureStaticWebApps,
-    AzureStaticWebAppsRegistration,
-    AzureStorageInfoValue,
-    AzureStoragePropertyDictionaryResource,
-    AzureTableStorageApplicationLogsConfig,
-    BackupItem,
-    BackupItemCollection,
-    BackupRequest,
-    BackupSchedule,
-    BillingMeter,
-    BillingMeterCollection,
-    BlobStorageTokenStore,
-    Capability,
-    Certificate,
-    CertificateCollection,
-    CertificateDetails,
-    CertificateEmail,
-    CertificateOrderAction,
-    CertificateOrderContact,
-    CertificatePatchResource,
-    CipherSuites,
-    ClientRegistration,
-    CloningInfo,
-    ConnStringInfo,
-    ConnStringValueTypePair,
-    ConnectionStringDictionary,
-    Contact,
-    Container,
-    ContainerAppsConfiguration,
-    ContainerCpuStatistics,
-    ContainerCpuUsage,
-    ContainerInfo,
-    ContainerMemoryStatistics,
-    ContainerNetworkInterfaceStatistics,
-    ContainerResources,
-    ContainerThrottlingData,
-    ContentHash,
-    ContentLink,
-    ContinuousWebJob,
-    ContinuousWebJobCollection,
-    CookieExpiration,
-    Correlation,
-    CorsSettings,
-    CsmDeploymentStatus,
-    CsmDeploymentStatusCollection,
-    CsmMoveResourceEnvelope,
-    CsmOperationCollection,
-    CsmOperationDescription,
-    CsmOperationDescriptionProperties,
-    CsmOperationDisplay,
-    CsmPublishingCredentialsPoliciesEntity,
-    CsmPublishingProfileOptions,
-    CsmSlotEntity,
-    CsmUsageQuota,
-    CsmUsageQuotaCollection,
-    CustomDnsSuffixConfiguration,
-    CustomHostnameAnalysisResult,
-    CustomHostnameSites,
-    CustomHostnameSitesCollection,
-    CustomOpenIdConnectProvider,
-    CustomScaleRule,
-    Dapr,
-    DaprComponent,
-    DaprConfig,
-    DaprMetadata,
-    DataProviderMetadata,
-    DataSource,
-    DataTableResponseColumn,
-    DataTableResponseObject,
-    DatabaseBackupSetting,
-    DatabaseConnection,
-    DatabaseConnectionCollection,
-    DatabaseConnectionOverview,
-    DatabaseConnectionPatchRequest,
-    DefaultAuthorizationPolicy,
-    DefaultErrorResponse,
-    DefaultErrorResponseError,
-    DefaultErrorResponseErrorDetailsItem,
-    DeletedAppRestoreRequest,
-    DeletedSite,
-    DeletedWebAppCollection,
-    Deployment,
-    DeploymentCollection,
-    DeploymentLocations,
-    DetectorAbnormalTimePeriod,
-    DetectorDefinition,
-    DetectorDefinitionResource,
-    DetectorInfo,
-    DetectorResponse,
-    DetectorResponseCollection,
-    DiagnosticAnalysis,
-    DiagnosticAnalysisCollection,
-    DiagnosticCategory,
-    DiagnosticCategoryCollection,
-    DiagnosticData,
-    DiagnosticDetectorCollection,
-    DiagnosticDetectorResponse,
-    DiagnosticMetricSample,
-    DiagnosticMetricSet,
-    Dimension,
-    DnlResourceNameAvailability,
-    DnlResourceNameAvailabilityRequest,
-    Domain,
-    DomainAvailabilityCheckResult,
-    DomainCollection,
-    DomainControlCenterSsoRequest,
-    DomainOwnershipIdentifier,
-    DomainOwnershipIdentifierCollection,
-    DomainPatchResource,
-    DomainPurchaseConsent,
-    DomainRecommendationSearchParameters,
-    EnabledConfig,
-    EndpointDependency,
-    EndpointDetail,
-    EnvironmentVar,
-    EnvironmentVariable,
-    ErrorEntity,
-    ErrorInfo,
-    ErrorPage,
-    ErrorProperties,
-    ErrorResponse,
-    Experiments,
-    Expression,
-    ExpressionRoot,
-    ExpressionTraces,
-    ExtendedLocation,
-    Facebook,
-    FileSystemApplicationLogsConfig,
-    FileSystemHttpLogsConfig,
-    FileSystemTokenStore,
-    FlowAccessControlConfiguration,
-    FlowAccessControlConfigurationPolicy,
-    FlowEndpoints,
-    FlowEndpointsConfiguration,
-    ForwardProxy,
-    FrontEndConfiguration,
-    FunctionAppConfig,
-    FunctionAppMajorVersion,
-    FunctionAppMinorVersion,
-    FunctionAppRuntimeSettings,
-    FunctionAppRuntimes,
-    FunctionAppStack,
-    FunctionAppStackCollection,
-    FunctionEnvelope,
-    FunctionEnvelopeCollection,
-    FunctionSecrets,
-    FunctionsAlwaysReadyConfig,
-    FunctionsDeployment,
-    FunctionsDeploymentStorage,
-    FunctionsDeploymentStorageAuthentication,
-    FunctionsRuntime,
-    FunctionsScaleAndConcurrency,
-    FunctionsScaleAndConcurrencyTriggers,
-    FunctionsScaleAndConcurrencyTriggersHttp,
-    GeoRegion,
-    GeoRegionCollection,
-    GitHub,
-    GitHubActionCodeConfiguration,
-    GitHubActionConfiguration,
-    GitHubActionContainerConfiguration,
-    GitHubActionWebAppStackSettings,
-    GlobalCsmSkuDescription,
-    GlobalValidation,
-    Google,
-    HandlerMapping,
-    HostKeys,
-    HostName,
-    HostNameBinding,
-    HostNameBindingCollection,
-    HostNameSslState,
-    HostingEnvironmentDeploymentInfo,
-    HostingEnvironmentDiagnostics,
-    HostingEnvironmentProfile,
-    HttpLogsConfig,
-    HttpScaleRule,
-    HttpSettings,
-    HttpSettingsRoutes,
-    HybridConnection,
-    HybridConnectionCollection,
-    HybridConnectionKey,
-    HybridConnectionLimits,
-    Identifier,
-    IdentifierCollection,
-    IdentityProviders,
-    InboundEnvironmentEndpoint,
-    InboundEnvironmentEndpointCollection,
-    IpAddress,
-    IpAddressRange,
-    IpSecurityRestriction,
-    JsonSchema,
-    JwtClaimChecks,
-    KeyInfo,
-    KeyValuePairStringObject,
-    KubeEnvironment,
-    KubeEnvironmentCollection,
-    KubeEnvironmentPatchResource,
-    KubeEnvironmentProfile,
-    LegacyMicrosoftAccount,
-    LinuxJavaContainerSettings,
-    LocalizableString,
-    LogAnalyticsConfiguration,
-    LogSpecification,
-    Login,
-    LoginRoutes,
-    LoginScopes,
-    MSDeploy,
-    MSDeployLog,
-    MSDeployLogEntry,
-    MSDeployStatus,
-    ManagedServiceIdentity,
-    MetricAvailability,
-    MetricSpecification,
-    MigrateMySqlRequest,
-    MigrateMySqlStatus,
-    NameIdentifier,
-    NameIdentifierCollection,
-    NameValuePair,
-    NetworkFeatures,
-    NetworkTrace,
-    Nonce,
-    OpenAuthenticationAccessPolicies,
-    OpenAuthenticationAccessPolicy,
-    OpenAuthenticationPolicyClaim,
-    OpenIdConnectClientCredential,
-    OpenIdConnectConfig,
-    OpenIdConnectLogin,
-    OpenIdConnectRegistration,
-    Operation,
-    OperationResult,
-    OperationResultProperties,
-    OutboundEnvironmentEndpoint,
-    OutboundEnvironmentEndpointCollection,
-    OutboundVnetRouting,
-    PerfMonCounterCollection,
-    PerfMonResponse,
-    PerfMonSample,
-    PerfMonSet,
-    PremierAddOn,
-    PremierAddOnOffer,
-    PremierAddOnOfferCollection,
-    PremierAddOnPatchResource,
-    PrivateAccess,
-    PrivateAccessSubnet,
-    PrivateAccessVirtualNetwork,
-    PrivateEndpointConnectionCollection,
-    PrivateLinkConnectionApprovalRequestResource,
-    PrivateLinkConnectionState,
-    PrivateLinkResource,
-    PrivateLinkResourceProperties,
-    PrivateLinkResourcesWrapper,
-    ProcessInfo,
-    ProcessInfoCollection,
-    ProcessModuleInfo,
-    ProcessModuleInfoCollection,
-    ProcessThreadInfo,
-    ProcessThreadInfoCollection,
-    ProxyOnlyResource,
-    PublicCertificate,
-    PublicCertificateCollection,
-    PublishingCredentialsPoliciesCollection,
-    PushSettings,
-    QueryUtterancesResult,
-    QueryUtterancesResults,
-    QueueScaleRule,
-    RampUpRule,
-    Recommendation,
-    RecommendationCollection,
-    RecommendationRule,
-    RecurrenceSchedule,
-    RecurrenceScheduleOccurrence,
-    RegenerateActionParameter,
-    ReissueCertificateOrderRequest,
-    RelayServiceConnectionEntity,
-    RemotePrivateEndpointConnection,
-    RemotePrivateEndpointConnectionARMResource,
-    Rendering,
-    RenewCertificateOrderRequest,
-    RepetitionIndex,
-    Request,
-    RequestHistory,
-    RequestHistoryListResult,
-    RequestHistoryProperties,
-    RequestsBasedTrigger,
-    Resource,
-    ResourceCollection,
-    ResourceConfig,
-    ResourceHealthMetadata,
-    ResourceHealthMetadataCollection,
-    ResourceMetricAvailability,
-    ResourceMetricDefinition,
-    ResourceMetricDefinitionCollection,
-    ResourceNameAvailability,
-    ResourceNameAvailabilityRequest,
-    ResourceReference,
-    Response,
-    ResponseMessageEnvelopeRemotePrivateEndpointConnection,
-    ResponseMetaData,
-    RestoreRequest,
-    RetryHistory,
-    RunActionCorrelation,
-    RunCorrelation,
-    SampleUtterance,
-    Scale,
-    ScaleRule,
-    ScaleRuleAuth,
-    ServiceSpecification,
-    Site,
-    SiteAuthSettings,
-    SiteAuthSettingsV2,
-    SiteCloneability,
-    SiteCloneabilityCriterion,
-    SiteConfig,
-    SiteConfigPropertiesDictionary,
-    SiteConfigResource,
-    SiteConfigResourceCollection,
-    SiteConfigurationSnapshotInfo,
-    SiteConfigurationSnapshotInfoCollection,
-    SiteContainer,
-    SiteContainerCollection,
-    SiteDnsConfig,
-    SiteExtensionInfo,
-    SiteExtensionInfoCollection,
-    SiteLimits,
-    SiteLogsConfig,
-    SiteMachineKey,
-    SitePatchResource,
-    SitePhpErrorLogFlag,
-    SiteSeal,
-    SiteSealRequest,
-    SiteSourceControl,
-    SkuCapacity,
-    SkuDescription,
-    SkuInfo,
-    SkuInfoCollection,
-    SkuInfos,
-    SlotConfigNamesResource,
-    SlotDifference,
-    SlotDifferenceCollection,
-    SlotSwapStatus,
-    SlowRequestsBasedTrigger,
-    Snapshot,
-    SnapshotCollection,
-    SnapshotRecoverySource,
-    SnapshotRestoreRequest,
-    Solution,
-    SourceControl,
-    SourceControlCollection,
-    StackMajorVersion,
-    StackMinorVersion,
-    StampCapacity,
-    StampCapacityCollection,
-    StaticSiteARMResource,
-    StaticSiteBasicAuthPropertiesARMResource,
-    StaticSiteBasicAuthPropertiesCollection,
-    StaticSiteBuildARMResource,
-    StaticSiteBuildCollection,
-    StaticSiteBuildProperties,
-    StaticSiteCollection,
-    StaticSiteCustomDomainOverviewARMResource,
-    StaticSiteCustomDomainOverviewCollection,
-    StaticSiteCustomDomainRequestPropertiesARMResource,
-    StaticSiteDatabaseConnectionConfigurationFileOverview,
-    StaticSiteFunctionOverviewARMResource,
-    StaticSiteFunctionOverviewCollection,
-    StaticSiteLinkedBackend,
-    StaticSiteLinkedBackendARMResource,
-    StaticSiteLinkedBackendsCollection,
-    StaticSitePatchResource,
-    StaticSiteResetPropertiesARMResource,
-    StaticSiteTemplateOptions,
-    StaticSiteUserARMResource,
-    StaticSiteUserCollection,
-    StaticSiteUserInvitationRequestResource,
-    StaticSiteUserInvitationResponseResource,
-    StaticSiteUserProvidedFunctionApp,
-    StaticSiteUserProvidedFunctionAppARMResource,
-    StaticSiteUserProvidedFunctionAppsCollection,
-    StaticSiteZipDeploymentARMResource,
-    StaticSitesWorkflowPreview,
-    StaticSitesWorkflowPreviewRequest,
-    Status,
-    StatusCodesBasedTrigger,
-    StatusCodesRangeBasedTrigger,
-    StorageMigrationOptions,
-    StorageMigrationResponse,
-    StringDictionary,
-    StringList,
-    SubResource,
-    SupportTopic,
-    SwiftVirtualNetwork,
-    Template,
-    TldLegalAgreement,
-    TldLegalAgreementCollection,
-    TokenStore,
-    TopLevelDomain,
-    TopLevelDomainAgreementOption,
-    TopLevelDomainCollection,
-    TriggeredJobHistory,
-    TriggeredJobHistoryCollection,
-    TriggeredJobRun,
-    TriggeredWebJob,
-    TriggeredWebJobCollection,
-    Twitter,
-    TwitterRegistration,
-    Usage,
-    UsageCollection,
-    User,
-    UserAssignedIdentity,
-    ValidateRequest,
-    ValidateResponse,
-    ValidateResponseError,
-    VirtualApplication,
-    VirtualDirectory,
-    VirtualIPMapping,
-    VirtualNetworkProfile,
-    VnetGateway,
-    VnetInfo,
-    VnetInfoResource,
-    VnetParameters,
-    VnetRoute,
-    VnetValidationFailureDetails,
-    VnetValidationTestFailure,
-    VolumeMount,
-    WebAppCollection,
-    WebAppInstanceStatusCollection,
-    WebAppMajorVersion,
-    WebAppMinorVersion,
-    WebAppRuntimeSettings,
-    WebAppRuntimes,
-    WebAppStack,
-    WebAppStackCollection,
-    WebJob,
-    WebJobCollection,
-    WebSiteInstanceStatus,
-    WindowsJavaContainerSettings,
-    WorkerPoolCollection,
-    WorkerPoolResource,
-    Workflow,
-    WorkflowArtifacts,
-    WorkflowEnvelope,
-    WorkflowEnvelopeCollection,
-    WorkflowEnvelopeProperties,
-    WorkflowFilter,
-    WorkflowHealth,
-    WorkflowListResult,
-    WorkflowOutputParameter,
-    WorkflowParameter,
-    WorkflowResource,
-    WorkflowRun,
-    WorkflowRunAction,
-    WorkflowRunActionFilter,
-    WorkflowRunActionListResult,
-    WorkflowRunActionRepetitionDefinition,
-    WorkflowRunActionRepetitionDefinitionCollection,
-    WorkflowRunActionRepetitionProperties,
-    WorkflowRunFilter,
-    WorkflowRunListResult,
-    WorkflowRunTrigger,
-    WorkflowSku,
-    WorkflowTrigger,
-    WorkflowTriggerCallbackUrl,
-    WorkflowTriggerFilter,
-    WorkflowTriggerHistory,
-    WorkflowTriggerHistoryFilter,
-    WorkflowTriggerHistoryListResult,
-    WorkflowTriggerListCallbackUrlQueries,
-    WorkflowTriggerListResult,
-    WorkflowTriggerRecurrence,
-    WorkflowVersion,
-    WorkflowVersionListResult,
-)
+    from ._web_site_management_client_enums import (  # type: ignore
+        AppServicePlanRestrictions,
+        AuthType,
+        AuthenticationType,
+        AutoGeneratedDomainNameLabelScope,
+        AutoHealActionType,
+        AzureResourceType,
+        AzureStorageProtocol,
+        AzureStorageState,
+        AzureStorageType,
+        BackupItemStatus,
+        BackupRestoreOperationType,
+        BasicAuthName,
+        BuildStatus,
+        BuiltInAuthenticationProvider,
+        CertificateOrderActionType,
+        CertificateOrderStatus,
+        CertificateProductType,
+        Channels,
+        CheckNameResourceTypes,
+        ClientCertMode,
+        CloneAbilityResult,
+        ComputeModeOptions,
+        ConnectionStringType,
+        ContinuousWebJobStatus,
+        CookieExpirationConvention,
+        CustomDnsSuffixProvisioningState,
+        CustomDomainStatus,
+        CustomHostNameDnsRecordType,
+        DaprLogLevel,
+        DatabaseType,
+        DayOfWeek,
+        DaysOfWeek,
+        DefaultAction,
+        DeploymentBuildStatus,
+        DetectorType,
+        DnsType,
+        DnsVerificationTestResult,
+        DomainStatus,
+        DomainType,
+        EnterpriseGradeCdnStatus,
+        ForwardProxyConvention,
+        FrequencyUnit,
+        FrontEndServiceType,
+        FtpsState,
+        FunctionsDeploymentStorageType,
+        HostNameType,
+        HostType,
+        HostingEnvironmentStatus,
+        IPMode,
+        InAvailabilityReasonType,
+        InsightStatus,
+        IpFilterTag,
+        IssueType,
+        KeyType,
+        KeyVaultSecretStatus,
+        Kind,
+        KubeEnvironmentProvisioningState,
+        LoadBalancingMode,
+        LogLevel,
+        MSDeployLogEntryType,
+        MSDeployProvisioningState,
+        ManagedPipelineMode,
+        ManagedServiceIdentityType,
+        MySqlMigrationType,
+        NotificationLevel,
+        OpenAuthenticationProviderType,
+        OperationStatus,
+        ParameterType,
+        ProviderOsTypeSelected,
+        ProviderStackOsType,
+        ProvisioningState,
+        PublicCertificateLocation,
+        PublishingProfileFormat,
+        RecurrenceFrequency,
+        RedundancyMode,
+        RenderingType,
+        ResolveStatus,
+        ResourceNotRenewableReason,
+        ResourceScopeType,
+        RouteType,
+        RuntimeName,
+        ScmType,
+        SiteAvailabilityState,
+        SiteExtensionType,
+        SiteLoadBalancing,
+        SiteRuntimeState,
+        SkuName,
+        SolutionType,
+        SslState,
+        StackPreferredOs,
+        StagingEnvironmentPolicy,
+        StatusOptions,
+        StorageType,
+        SupportedTlsVersions,
+        TlsCipherSuites,
+        TriggerTypes,
+        TriggeredWebJobStatus,
+        UnauthenticatedClientAction,
+        UnauthenticatedClientActionV2,
+        UpgradeAvailability,
+        UpgradePreference,
+        UsageState,
+        ValidateResourceTypes,
+        WebJobType,
+        WorkerSizeOptions,
+        WorkflowHealthState,
+        WorkflowProvisioningState,
+        WorkflowSkuName,
+        WorkflowState,
+        WorkflowStatus,
+        WorkflowTriggerProvisioningState,
+    )
 
-from ._web_site_management_client_enums import (  # type: ignore
-    AppServicePlanRestrictions,
-    AuthType,
-    AuthenticationType,
-    AutoGeneratedDomainNameLabelScope,
-    AutoHealActionType,
-    AzureResourceType,
-    AzureStorageProtocol,
-    AzureStorageState,
-    AzureStorageType,
-    BackupItemStatus,
-    BackupRestoreOperationType,
-    BasicAuthName,
-    BuildStatus,
-    BuiltInAuthenticationProvider,
-    CertificateOrderActionType,
-    CertificateOrderStatus,
-    CertificateProductType,
-    Channels,
-    CheckNameResourceTypes,
-    ClientCertMode,
-    CloneAbilityResult,
-    ComputeModeOptions,
-    ConnectionStringType,
-    ContinuousWebJobStatus,
-    CookieExpirationConvention,
-    CustomDnsSuffixProvisioningState,
-    CustomDomainStatus,
-    CustomHostNameDnsRecordType,
-    DaprLogLevel,
-    DatabaseType,
-    DayOfWeek,
-    DaysOfWeek,
-    DefaultAction,
-    DeploymentBuildStatus,
-    DetectorType,
-    DnsType,
-    DnsVerificationTestResult,
-    DomainStatus,
-    DomainType,
-    EnterpriseGradeCdnStatus,
-    ForwardProxyConvention,
-    FrequencyUnit,
-    FrontEndServiceType,
-    FtpsState,
-    FunctionsDeploymentStorageType,
-    HostNameType,
-    HostType,
-    HostingEnvironmentStatus,
-    IPMode,
-    InAvailabilityReasonType,
-    InsightStatus,
-    IpFilterTag,
-    IssueType,
-    KeyType,
-    KeyVaultSecretStatus,
-    Kind,
-    KubeEnvironmentProvisioningState,
-    LoadBalancingMode,
-    LogLevel,
-    MSDeployLogEntryType,
-    MSDeployProvisioningState,
-    ManagedPipelineMode,
-    ManagedServiceIdentityType,
-    MySqlMigrationType,
-    NotificationLevel,
-    OpenAuthenticationProviderType,
-    OperationStatus,
-    ParameterType,
-    ProviderOsTypeSelected,
-    ProviderStackOsType,
-    ProvisioningState,
-    PublicCertificateLocation,
-    PublishingProfileFormat,
-    RecurrenceFrequency,
-    RedundancyMode,
-    RenderingType,
-    ResolveStatus,
-    ResourceNotRenewableReason,
-    ResourceScopeType,
-    RouteType,
-    RuntimeName,
-    ScmType,
-    SiteAvailabilityState,
-    SiteExtensionType,
-    SiteLoadBalancing,
-    SiteRuntimeState,
-    SkuName,
-    SolutionType,
-    SslState,
-    StackPreferredOs,
-    StagingEnvironmentPolicy,
-    StatusOptions,
-    StorageType,
-    SupportedTlsVersions,
-    TlsCipherSuites,
-    TriggerTypes,
-    TriggeredWebJobStatus,
-    UnauthenticatedClientAction,
-    UnauthenticatedClientActionV2,
-    UpgradeAvailability,
-    UpgradePreference,
-    UsageState,
-    ValidateResourceTypes,
-    WebJobType,
-    WorkerSizeOptions,
-    WorkflowHealthState,
-    WorkflowProvisioningState,
-    WorkflowSkuName,
-    WorkflowState,
-    WorkflowStatus,
-    WorkflowTriggerProvisioningState,
-)
 from ._patch import __all__ as _patch_all
 from ._patch import *
 from ._patch import patch_sdk as _patch_sdk
@@ -1297,3 +1298,24 @@ __all__ = [
 ]
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+# Models are imported when one of them is first accessed (PEP 562), not with the package: for the largest
+# services, executing _models_py3 takes most of the time and memory needed to import the whole client library.
+_LAZY_SUBMODULES = ("._models_py3", "._web_site_management_client_enums")
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        for submodule in _LAZY_SUBMODULES:
+            module = vars(importlib.import_module(submodule, __name__))
+            for key in __all__:
+                if key in module and key not in globals():
+                    globals()[key] = module[key]
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
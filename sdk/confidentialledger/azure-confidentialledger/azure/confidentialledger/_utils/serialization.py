@@ -46,6 +46,11 @@ from typing_extensions import Self
 from azure.core.exceptions import DeserializationError, SerializationError
 from azure.core.serialization import NULL as CoreNull
 
+try:
+    from azure.core.runtime.datetime_codec import parse_iso8601 as _parse_iso8601, parse_rfc1123 as _parse_rfc1123
+except ImportError:  # azure-core without the shared datetime codec
+    _parse_iso8601 = _parse_rfc1123 = None  # type: ignore
+
 _BOM = codecs.BOM_UTF8.decode(encoding="utf-8")
 
 JSON = MutableMapping[str, Any]
@@ -1178,27 +1183,49 @@ class Serializer:  # pylint: disable=too-many-public-methods
             raise TypeError("Unix time object must be valid Datetime object.") from exc
 
 
-def rest_key_extractor(attr, attr_desc, data):  # pylint: disable=unused-argument
-    key = attr_desc["key"]
-    working_data = data
+def _split_rest_key(key):
+    """Split an _attribute_map key into the flattened JSON path and the final key.
 
+    :param str key: A key string from the generated code
+    :returns: The decoded path to follow and the key to read at the end of it
+    :rtype: tuple
+    """
+    path = []
     while "." in key:
         # Need the cast, as for some reasons "split" is typed as list[str | Any]
         dict_keys = cast(List[str], _FLATTEN.split(key))
         if len(dict_keys) == 1:
             key = _decode_attribute_map_key(dict_keys[0])
             break
-        working_key = _decode_attribute_map_key(dict_keys[0])
+        path.append(_decode_attribute_map_key(dict_keys[0]))
+        key = ".".join(dict_keys[1:])
+    return tuple(path), key
+
+
+def _follow_rest_key(data, path, key):
+    """Read the value at the end of a flattened JSON path split by "_split_rest_key".
+
+    :param dict data: The data to extract from
+    :param tuple path: The decoded path to follow
+    :param str key: The key to read at the end of the path
+    :returns: The extracted value
+    :rtype: object
+    """
+    working_data = data
+    for working_key in path:
         working_data = working_data.get(working_key, data)
         if working_data is None:
             # If at any point while following flatten JSON path see None, it means
             # that all properties under are None as well
             return None
-        key = ".".join(dict_keys[1:])
-
     return working_data.get(key)
 
 
+def rest_key_extractor(attr, attr_desc, data):  # pylint: disable=unused-argument
+    path, key = _split_rest_key(attr_desc["key"])
+    return _follow_rest_key(data, path, key)
+
+
 def rest_key_case_insensitive_extractor(  # pylint: disable=unused-argument, inconsistent-return-statements
     attr, attr_desc, data
 ):
@@ -1395,6 +1422,7 @@ class Deserializer:
         # used if your expect the deserialization to NOT come from a JSON REST syntax.
         # Otherwise, result are unexpected
         self.additional_properties_detection = True
+        self._plans: Dict[Any, Any] = {}
 
     def __call__(self, target_obj, response_data, content_type=None):
         """Call the deserializer to process a REST response.
@@ -1450,39 +1478,84 @@ class Deserializer:
             return data
         try:
             attributes = response._attribute_map  # type: ignore # pylint: disable=protected-access
+            plan, extractors, known_keys = self._get_deserialization_plan(response, attributes)
+            if isinstance(data, dict):
+                # "xml_key_extractor" never finds anything in a dict
+                extractors = tuple(e for e in extractors if e is not xml_key_extractor)
             d_attrs = {}
-            for attr, attr_desc in attributes.items():
-                # Check empty string. If it's not empty, someone has a real "additionalProperties"...
-                if attr == "additional_properties" and attr_desc["key"] == "":
-                    continue
-                raw_value = None
-                # Enhance attr_desc with some dynamic data
-                attr_desc = attr_desc.copy()  # Do a copy, do not change the real one
-                internal_data_type = attr_desc["type"].strip("[]{}")
-                if internal_data_type in self.dependencies:
-                    attr_desc["internalType"] = self.dependencies[internal_data_type]
-
-                for key_extractor in self.key_extractors:
-                    found_value = key_extractor(attr, attr_desc, data)
-                    if found_value is not None:
-                        if raw_value is not None and raw_value != found_value:
-                            msg = (
-                                "Ignoring extracted value '%s' from %s for key '%s'"
-                                " (duplicate extraction, follow extractors order)"
-                            )
-                            _LOGGER.warning(msg, found_value, key_extractor, attr)
-                            continue
-                        raw_value = found_value
-
-                value = self.deserialize_data(raw_value, attr_desc["type"])
-                d_attrs[attr] = value
+            if extractors == (rest_key_extractor,):
+                for attr, _, data_type, rest_path, rest_key in plan:
+                    raw_value = _follow_rest_key(data, rest_path, rest_key) if rest_path else data.get(rest_key)
+                    d_attrs[attr] = None if raw_value is None else self.deserialize_data(raw_value, data_type)
+            else:
+                for attr, attr_desc, data_type, rest_path, rest_key in plan:
+                    raw_value = None
+                    for key_extractor in extractors:
+                        if key_extractor is rest_key_extractor:
+                            found_value = _follow_rest_key(data, rest_path, rest_key)
+                        else:
+                            found_value = key_extractor(attr, attr_desc, data)
+                        if found_value is not None:
+                            if raw_value is not None and raw_value != found_value:
+                                msg = (
+                                    "Ignoring extracted value '%s' from %s for key '%s'"
+                                    " (duplicate extraction, follow extractors order)"
+                                )
+                                _LOGGER.warning(msg, found_value, key_extractor, attr)
+                                continue
+                            raw_value = found_value
+
+                    d_attrs[attr] = None if raw_value is None else self.deserialize_data(raw_value, data_type)
         except (AttributeError, TypeError, KeyError) as err:
             msg = "Unable to deserialize to object: " + class_name  # type: ignore
             raise DeserializationError(msg) from err
-        additional_properties = self._build_additional_properties(attributes, data)
+        additional_properties = self._build_additional_properties(attributes, data, known_keys)
         return self._instantiate_model(response, d_attrs, additional_properties)
 
-    def _build_additional_properties(self, attribute_map, data):
+    def _get_deserialization_plan(self, response, attributes):
+        """Get the deserialization plan of a model, compiling it on first use.
+
+        The plan holds, for every attribute, the attribute description enhanced with its
+        internal type, the data type and the split flattened JSON path, so that
+        "_deserialize" does not recompute them for every object of the same model.
+        Plans are cached per model class and key extractors.
+
+        :param type response: The model to deserialize to.
+        :param dict attributes: The _attribute_map of the model.
+        :return: The attribute plan, the key extractors and the keys known by the model.
+        :rtype: tuple
+        """
+        extractors = tuple(self.key_extractors)
+        cacheable = isinstance(response, type)
+        if cacheable:
+            cached = self._plans.get((response, extractors))
+            if cached is not None:
+                return cached
+
+        plan = []
+        for attr, attr_desc in attributes.items():
+            # Check empty string. If it's not empty, someone has a real "additionalProperties"...
+            if attr == "additional_properties" and attr_desc["key"] == "":
+                continue
+            # Enhance attr_desc with some dynamic data
+            attr_desc = attr_desc.copy()  # Do a copy, do not change the real one
+            internal_data_type = attr_desc["type"].strip("[]{}")
+            if internal_data_type in self.dependencies:
+                attr_desc["internalType"] = self.dependencies[internal_data_type]
+            rest_path, rest_key = _split_rest_key(attr_desc["key"]) if rest_key_extractor in extractors else ((), "")
+            plan.append((attr, attr_desc, attr_desc["type"], rest_path, rest_key))
+        known_keys = {
+            _decode_attribute_map_key(_FLATTEN.split(desc["key"])[0])
+            for desc in attributes.values()
+            if desc["key"] != ""
+        }
+
+        compiled = (tuple(plan), extractors, frozenset(known_keys))
+        if cacheable:
+            self._plans[(response, extractors)] = compiled
+        return compiled
+
+    def _build_additional_properties(self, attribute_map, data, known_keys=None):
         if not self.additional_properties_detection:
             return None
         if "additional_properties" in attribute_map and attribute_map.get("additional_properties", {}).get("key") != "":
@@ -1491,11 +1564,12 @@ class Deserializer:
         if isinstance(data, ET.Element):
             data = {el.tag: el.text for el in data}
 
-        known_keys = {
-            _decode_attribute_map_key(_FLATTEN.split(desc["key"])[0])
-            for desc in attribute_map.values()
-            if desc["key"] != ""
-        }
+        if known_keys is None:
+            known_keys = {
+                _decode_attribute_map_key(_FLATTEN.split(desc["key"])[0])
+                for desc in attribute_map.values()
+                if desc["key"] != ""
+            }
         present_keys = set(data.keys())
         missing_keys = present_keys - known_keys
         return {key: data[key] for key in missing_keys}
@@ -1962,6 +2036,11 @@ class Deserializer:
         """
         if isinstance(attr, ET.Element):
             attr = attr.text
+        if _parse_rfc1123 is not None:
+            try:
+                return _parse_rfc1123(attr)
+            except (ValueError, TypeError, AttributeError) as err:
+                raise DeserializationError("Cannot deserialize to rfc datetime object.") from err
         try:
             parsed_date = email.utils.parsedate_tz(attr)  # type: ignore
             date_obj = datetime.datetime(
@@ -1985,6 +2064,11 @@ class Deserializer:
         """
         if isinstance(attr, ET.Element):
             attr = attr.text
+        if _parse_iso8601 is not None:
+            try:
+                return _parse_iso8601(attr)
+            except (ValueError, OverflowError, TypeError, AttributeError) as err:
+                raise DeserializationError("Cannot deserialize datetime object.") from err
         try:
             attr = attr.upper()  # type: ignore
             match = Deserializer.valid_date.match(attr)
@@ -27,6 +27,11 @@ from azure.core import CaseInsensitiveEnumMeta
 from azure.core.pipeline import PipelineResponse
 from azure.core.serialization import _Null
 
+try:
+    from azure.core.runtime.datetime_codec import parse_iso8601 as _parse_iso8601, parse_rfc1123 as _parse_rfc1123
+except ImportError:  # azure-core without the shared datetime codec
+    _parse_iso8601 = _parse_rfc1123 = None  # type: ignore
+
 if sys.version_info >= (3, 9):
     from collections.abc import MutableMapping
 else:
@@ -183,6 +188,8 @@ def _deserialize_datetime(attr: typing.Union[str, datetime]) -> datetime:
     if isinstance(attr, datetime):
         # i'm already deserialized
         return attr
+    if _parse_iso8601 is not None:
+        return _parse_iso8601(attr)
     attr = attr.upper()
     match = _VALID_DATE.match(attr)
     if not match:
@@ -220,6 +227,8 @@ def _deserialize_datetime_rfc7231(attr: typing.Union[str, datetime]) -> datetime
     if not match:
         raise ValueError("Invalid datetime string: " + attr)
 
+    if _parse_rfc1123 is not None:
+        return _parse_rfc1123(attr)
     return email.utils.parsedate_to_datetime(attr)
 
 
@@ -347,8 +356,12 @@ _UNSET = object()
 
 
 class _MyMutableMapping(MutableMapping[str, typing.Any]):  # pylint: disable=unsubscriptable-object
+    # decoded attribute values are kept out of __dict__, which copy() passes on
+    __slots__ = ("_decoded",)
+
     def __init__(self, data: typing.Dict[str, typing.Any]) -> None:
         self._data = data
+        self._decoded: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {}
 
     def __contains__(self, key: typing.Any) -> bool:
         return key in self._data
@@ -357,9 +370,11 @@ class _MyMutableMapping(MutableMapping[str, typing.Any]):  # pylint: disable=uns
         return self._data.__getitem__(key)
 
     def __setitem__(self, key: str, value: typing.Any) -> None:
+        self._decoded.pop(key, None)
         self._data.__setitem__(key, value)
 
     def __delitem__(self, key: str) -> None:
+        self._decoded.pop(key, None)
         self._data.__delitem__(key)
 
     def __iter__(self) -> typing.Iterator[typing.Any]:
@@ -404,6 +419,7 @@ class _MyMutableMapping(MutableMapping[str, typing.Any]):  # pylint: disable=uns
         return self._data.popitem()
 
     def clear(self) -> None:
+        self._decoded.clear()
         self._data.clear()
 
     def update(self, *args: typing.Any, **kwargs: typing.Any) -> None:
@@ -893,6 +909,19 @@ def _deserialize(
     return _deserialize_with_callable(deserializer, value)
 
 
+_IMMUTABLE_RAW_TYPES = (str, int, float, bytes)
+
+
+def _is_shareable(raw: typing.Any, value: typing.Any) -> bool:
+    # A decoded value can be handed out again only if nothing can change it in place: the raw value
+    # is a scalar, or a list of scalars whose decoded list is copied on every read.
+    if isinstance(raw, list):
+        return isinstance(value, list) and all(isinstance(x, _IMMUTABLE_RAW_TYPES) for x in raw)
+    return isinstance(raw, _IMMUTABLE_RAW_TYPES) and not isinstance(
+        value, (list, dict, set, bytearray, _MyMutableMapping)
+    )
+
+
 class _RestField:
     def __init__(
         self,
@@ -935,7 +964,15 @@ class _RestField:
             return item
         if self._is_model:
             return item
-        return _deserialize(self._type, _serialize(item, self._format), rf=self)
+        # reuse the value decoded by the last read as long as the raw value has not changed
+        cached = obj._decoded.get(self._rest_name)
+        if cached is None or not (cached[0] is item or (isinstance(item, list) and cached[0] == item)):
+            value = _deserialize(self._type, _serialize(item, self._format), rf=self)
+            if not _is_shareable(item, value):
+                return value
+            cached = (list(item) if isinstance(item, list) else item, value)
+            obj._decoded[self._rest_name] = cached
+        return list(cached[1]) if isinstance(cached[1], list) else cached[1]
 
     def __set__(self, obj: Model, value) -> None:
         if value is None:
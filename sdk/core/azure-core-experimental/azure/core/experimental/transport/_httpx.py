@@ -23,7 +23,8 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
-from typing import Any, ContextManager, Iterator, Optional, Union
+import threading
+from typing import Any, AsyncIterator, ContextManager, Dict, Iterator, Optional, Tuple, Union
 
 import httpx
 from azure.core.configuration import ConnectionConfiguration
@@ -130,12 +131,66 @@ class HttpXStreamDownloadGenerator:
             raise DecodeError("Failed to decode.") from ex
 
 
+async def _async_single_chunk(content: memoryview) -> AsyncIterator[memoryview]:
+    yield content
+
+
+def _content_parameters(request: Union[HttpRequest, LegacyHttpRequest], asynchronous: bool = False) -> Tuple[Any, Any]:
+    """The data and content parameters of httpx for a request.
+
+    httpx would iterate a memoryview item by item, so it is sent as a single chunk instead.
+
+    :param request: The request object to be sent.
+    :type request: ~azure.core.rest.HttpRequest or LegacyHttpRequest
+    :param bool asynchronous: Whether the content is sent by an async client, which needs an async iterator.
+    :return: The data and the content.
+    :rtype: tuple[any, any]
+    """
+    data = request.data
+    content = request.content if hasattr(request, "content") else None
+    if isinstance(content, memoryview):
+        data = None
+        content = _async_single_chunk(content) if asynchronous else iter((content,))
+    return data, content
+
+
+def _pool_stats(client: Any, requests: int, http2_requests: int) -> Dict[str, int]:
+    """Report the connections of the pool of a httpx client.
+
+    :param client: The httpx client, or None if the transport is not opened.
+    :type client: httpx.Client or httpx.AsyncClient
+    :param int requests: The number of requests sent by the transport.
+    :param int http2_requests: The number of responses received over HTTP/2.
+    :return: The pool statistics.
+    :rtype: dict[str, int]
+    """
+    # httpx doesn't expose its httpcore pool; clients built on a custom transport have no connection stats
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {
+        "connections": len(connections),
+        "active": len(connections) - idle,
+        "idle": idle,
+        "http2_connections": sum(1 for connection in connections if "HTTP/2" in connection.info()),
+        "requests": requests,
+        "http2_requests": http2_requests,
+    }
+
+
 class HttpXTransport(HttpTransport):
     """Implements a basic httpx HTTP sender
 
+    With `http2=True`, HTTP/2 is negotiated with the services supporting it (over TLS) and requests to a host
+    are multiplexed as concurrent streams over few connections, up to the number of streams allowed by the
+    service; this requires the `h2` package (`pip install httpx[http2]`).
+
     :keyword httpx.Client client: HTTPX client to use instead of the default one
     :keyword bool client_owner: Decide if the client provided by user is owned by this transport. Default to True.
     :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword bool http2: Whether to negotiate HTTP/2. Defaults to False. Ignored if a client is provided.
+    :keyword httpx.Limits limits: The connection pool limits (max connections, max keep-alive connections and
+     keep-alive expiry). Defaults to the httpx defaults. Ignored if a client is provided.
     """
 
     def __init__(
@@ -144,21 +199,41 @@ class HttpXTransport(HttpTransport):
         client: Optional[httpx.Client] = None,
         client_owner: bool = True,
         use_env_settings: bool = True,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
         **kwargs: Any
     ) -> None:
         self.client = client
         self.connection_config = ConnectionConfiguration(**kwargs)
         self._client_owner = client_owner
         self._use_env_settings = use_env_settings
+        self._http2 = http2
+        self._limits = limits
+        self._requests = 0
+        self._http2_requests = 0
+        self._stats_lock = threading.Lock()
 
     def open(self) -> None:
         if self.client is None:
+            # without limits, httpx applies its own defaults to the pool
+            limits = {"limits": self._limits} if self._limits is not None else {}
             self.client = httpx.Client(
                 trust_env=self._use_env_settings,
                 verify=self.connection_config.verify,
                 cert=self.connection_config.cert,
+                http2=self._http2,
+                **limits,
             )
 
+    def pool_stats(self) -> Dict[str, int]:
+        """Report the connections of the pool and the requests sent.
+
+        :return: The number of pooled `connections`, split into `active` and `idle` ones, the number of
+         `http2_connections`, the number of `requests` sent and the number of `http2_requests` among them.
+        :rtype: dict[str, int]
+        """
+        return _pool_stats(self.client, self._requests, self._http2_requests)
+
     def close(self) -> None:
         """Close the session.
 
@@ -192,19 +267,18 @@ class HttpXTransport(HttpTransport):
         timeout = kwargs.pop("connection_timeout", self.connection_config.timeout)
         # not needed here as its already handled during init
         kwargs.pop("connection_verify", None)
+        data, content = _content_parameters(request)
         parameters = {
             "method": request.method,
             "url": request.url,
             "headers": request.headers.items(),
-            "data": request.data,
+            "data": data,
+            "content": content,
             "files": request.files,
             "timeout": timeout,
             **kwargs,
         }
 
-        if hasattr(request, "content"):
-            parameters["content"] = request.content
-
         stream_ctx: Optional[ContextManager] = None
         try:
             if stream_response and self.client:
@@ -221,6 +295,10 @@ class HttpXTransport(HttpTransport):
         except httpx.RequestError as err:
             raise ServiceRequestError(err, error=err) from err
 
+        with self._stats_lock:
+            self._requests += 1
+            if response.http_version == "HTTP/2":  # pylint: disable=used-before-assignment
+                self._http2_requests += 1
         return HttpXTransportResponse(
             request, response, stream_contextmanager=stream_ctx  # pylint: disable=used-before-assignment
         )
@@ -23,7 +23,7 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
-from typing import Any, AsyncIterator, ContextManager, Optional, Union
+from typing import Any, AsyncIterator, ContextManager, Dict, Optional, Union
 
 import httpx
 from azure.core.configuration import ConnectionConfiguration
@@ -33,6 +33,7 @@ from azure.core.pipeline.transport import AsyncHttpTransport
 from azure.core.pipeline.transport import HttpRequest as LegacyHttpRequest
 from azure.core.rest import HttpRequest
 from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+from ._httpx import _content_parameters, _pool_stats
 
 
 class AsyncHttpXTransportResponse(AsyncHttpResponseImpl):
@@ -129,9 +130,16 @@ class AsyncHttpXStreamDownloadGenerator(AsyncIterator):
 class AsyncHttpXTransport(AsyncHttpTransport):
     """Implements a basic async httpx HTTP sender
 
+    With `http2=True`, HTTP/2 is negotiated with the services supporting it (over TLS) and requests to a host
+    are multiplexed as concurrent streams over few connections, up to the number of streams allowed by the
+    service; this requires the `h2` package (`pip install httpx[http2]`).
+
     :keyword httpx.AsyncClient client: HTTPX client to use instead of the default one
     :keyword bool client_owner: Decide if the client provided by user is owned by this transport. Default to True.
     :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword bool http2: Whether to negotiate HTTP/2. Defaults to False. Ignored if a client is provided.
+    :keyword httpx.Limits limits: The connection pool limits (max connections, max keep-alive connections and
+     keep-alive expiry). Defaults to the httpx defaults. Ignored if a client is provided.
     """
 
     def __init__(
@@ -140,21 +148,40 @@ class AsyncHttpXTransport(AsyncHttpTransport):
         client: Optional[httpx.AsyncClient] = None,
         client_owner: bool = True,
         use_env_settings: bool = True,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
         **kwargs: Any
     ) -> None:
         self.client = client
         self.connection_config = ConnectionConfiguration(**kwargs)
         self._client_owner = client_owner
         self._use_env_settings = use_env_settings
+        self._http2 = http2
+        self._limits = limits
+        self._requests = 0
+        self._http2_requests = 0
 
     async def open(self) -> None:
         if self.client is None:
+            # without limits, httpx applies its own defaults to the pool
+            limits = {"limits": self._limits} if self._limits is not None else {}
             self.client = httpx.AsyncClient(
                 trust_env=self._use_env_settings,
                 verify=self.connection_config.verify,
                 cert=self.connection_config.cert,
+                http2=self._http2,
+                **limits,
             )
 
+    def pool_stats(self) -> Dict[str, int]:
+        """Report the connections of the pool and the requests sent.
+
+        :return: The number of pooled `connections`, split into `active` and `idle` ones, the number of
+         `http2_connections`, the number of `requests` sent and the number of `http2_requests` among them.
+        :rtype: dict[str, int]
+        """
+        return _pool_stats(self.client, self._requests, self._http2_requests)
+
     async def close(self) -> None:
         if self._client_owner and self.client:
             await self.client.aclose()
@@ -180,12 +207,13 @@ class AsyncHttpXTransport(AsyncHttpTransport):
         """
         await self.open()
         stream_response = stream
+        data, content = _content_parameters(request, asynchronous=True)
         parameters = {
             "method": request.method,
             "url": request.url,
             "headers": request.headers.items(),
-            "data": request.data,
-            "content": request.content if hasattr(request, "content") else None,
+            "data": data,
+            "content": content,
             "files": request.files,
             **kwargs,
         }
@@ -206,4 +234,7 @@ class AsyncHttpXTransport(AsyncHttpTransport):
         except httpx.RequestError as err:
             raise ServiceRequestError(err, error=err) from err
 
+        self._requests += 1
+        if response.http_version == "HTTP/2":
+            self._http2_requests += 1
         return AsyncHttpXTransportResponse(request, response, stream_contextmanager=stream_ctx)
@@ -34,6 +34,23 @@ class TestAsyncHttpXTransport:
         assert response.status_code == expected.status_code
         assert response.reason == expected.reason_phrase
 
+    @pytest.mark.asyncio
+    async def test_send_bytes_like_content(self) -> None:
+        received = []
+
+        def mock_echo(request: httpx.Request) -> httpx.Response:
+            received.append(request.headers["Content-Length"])
+            return httpx.Response(200, content=request.content)
+
+        mock_transport = httpx.MockTransport(mock_echo)
+        transport = AsyncHttpXTransport(client=httpx.AsyncClient(transport=mock_transport))
+        pipeline = AsyncPipeline(transport, [AsyncRetryPolicy()])
+        content = bytearray(b"Hello, world!")
+        request = HttpRequest(method="PUT", url=PLACEHOLDER_ENDPOINT, content=content)
+        response = (await pipeline.run(request=request)).http_response
+        assert response.body() == b"Hello, world!"
+        assert received == ["13"]
+
     @pytest.mark.asyncio
     async def test_exception(self) -> None:
         mock_transport = httpx.MockTransport(self.mock_exception)
@@ -43,3 +60,19 @@ class TestAsyncHttpXTransport:
         with pytest.raises(ServiceRequestError) as ex:
             await pipeline.run(request=request)
             assert ex.value == "connection timed out"
+
+    @pytest.mark.asyncio
+    async def test_http2_pool_stats(self) -> None:
+        transport = AsyncHttpXTransport(http2=True, limits=httpx.Limits(max_connections=2))
+        async with transport:
+            pool = transport.client._transport._pool
+            assert pool._http2
+            assert pool._max_connections == 2
+
+        mock_transport = httpx.MockTransport(self.mock_successful_post)
+        transport = AsyncHttpXTransport(client=httpx.AsyncClient(transport=mock_transport))
+        pipeline = AsyncPipeline(transport, [AsyncRetryPolicy()])
+        await pipeline.run(request=HttpRequest(method="GET", url=PLACEHOLDER_ENDPOINT))
+        stats = transport.pool_stats()
+        assert stats["requests"] == 1
+        assert stats["connections"] == 0
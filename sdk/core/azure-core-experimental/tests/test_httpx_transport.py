@@ -33,6 +33,22 @@ class TestHttpXTransport:
         assert response.status_code == expected.status_code
         assert response.reason == expected.reason_phrase
 
+    def test_send_bytes_like_content(self) -> None:
+        received = []
+
+        def mock_echo(request: httpx.Request) -> httpx.Response:
+            received.append(request.headers["Content-Length"])
+            return httpx.Response(200, content=request.content)
+
+        mock_transport = httpx.MockTransport(mock_echo)
+        transport = HttpXTransport(client=httpx.Client(transport=mock_transport))
+        pipeline = Pipeline(transport, [RetryPolicy()])
+        content = bytearray(b"Hello, world!")
+        request = HttpRequest(method="PUT", url=PLACEHOLDER_ENDPOINT, content=memoryview(content)[7:])
+        response = (pipeline.run(request=request)).http_response
+        assert response.body() == b"world!"
+        assert received == ["6"]
+
     def test_exception(self) -> None:
         mock_transport = httpx.MockTransport(self.mock_exception)
         transport = HttpXTransport(client=httpx.Client(transport=mock_transport))
@@ -41,3 +57,40 @@ class TestHttpXTransport:
         with pytest.raises(ServiceRequestError) as ex:
             pipeline.run(request=request)
             assert ex.value == "connection timed out"
+
+    def test_pool_stats(self) -> None:
+        mock_transport = httpx.MockTransport(self.mock_successful_post)
+        transport = HttpXTransport(client=httpx.Client(transport=mock_transport))
+        pipeline = Pipeline(transport, [RetryPolicy()])
+        for _ in range(3):
+            pipeline.run(request=HttpRequest(method="GET", url=PLACEHOLDER_ENDPOINT))
+        stats = transport.pool_stats()
+        assert stats["requests"] == 3
+        assert stats["http2_requests"] == 0
+        # A mock transport has no connection pool
+        assert stats["connections"] == 0
+
+    def test_http2_limits(self) -> None:
+        transport = HttpXTransport(http2=True, limits=httpx.Limits(max_connections=2, max_keepalive_connections=1))
+        with transport:
+            pool = transport.client._transport._pool
+            assert pool._http2
+            assert pool._max_connections == 2
+            assert pool._max_keepalive_connections == 1
+            assert transport.pool_stats() == {
+                "connections": 0,
+                "active": 0,
+                "idle": 0,
+                "http2_connections": 0,
+                "requests": 0,
+                "http2_requests": 0,
+            }
+
+    def test_default_limits(self) -> None:
+        transport = HttpXTransport()
+        with transport, httpx.Client() as client:
+            pool = transport.client._transport._pool
+            default_pool = client._transport._pool
+            assert pool._max_connections == default_pool._max_connections
+            assert pool._max_keepalive_connections == default_pool._max_keepalive_connections
+            assert pool._keepalive_expiry == default_pool._keepalive_expiry
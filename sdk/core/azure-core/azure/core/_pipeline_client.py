@@ -60,6 +60,10 @@ class PipelineClient(PipelineClientBase, Generic[HTTPRequestType, HTTPResponseTy
     :keyword per_retry_policies: If specified, the policies will be added into the policy list after RetryPolicy
     :paramtype per_retry_policies: Union[HTTPPolicy, SansIOHTTPPolicy, list[HTTPPolicy], list[SansIOHTTPPolicy]]
     :keyword HttpTransport transport: If omitted, RequestsTransport is used for synchronous transport.
+    :keyword pipeline_profiler: Opt-in instrumentation, called after each request with a
+     :class:`~azure.core.pipeline.PipelineProfile` holding the per-policy and transport times, bytes sent and
+     received and retry count. Ignored if `pipeline` is passed.
+    :paramtype pipeline_profiler: callable[[~azure.core.pipeline.PipelineProfile], any]
     :return: A pipeline object.
     :rtype: ~azure.core.pipeline.Pipeline
 
@@ -177,7 +181,7 @@ class PipelineClient(PipelineClientBase, Generic[HTTPRequestType, HTTPResponseTy
 
             transport = RequestsTransport(**kwargs)
 
-        return Pipeline(transport, policies)
+        return Pipeline(transport, policies, profiler=kwargs.get("pipeline_profiler"))
 
     def send_request(self, request: HTTPRequestType, *, stream: bool = False, **kwargs: Any) -> HTTPResponseType:
         """Method that runs the network request through the client's chained policies.
@@ -139,6 +139,10 @@ class AsyncPipelineClient(
     :paramtype per_retry_policies: Union[AsyncHTTPPolicy, SansIOHTTPPolicy,
         list[AsyncHTTPPolicy], list[SansIOHTTPPolicy]]
     :keyword AsyncHttpTransport transport: If omitted, AioHttpTransport is used for asynchronous transport.
+    :keyword pipeline_profiler: Opt-in instrumentation, called after each request with a
+     :class:`~azure.core.pipeline.PipelineProfile` holding the per-policy and transport times, bytes sent and
+     received and retry count. Ignored if `pipeline` is passed.
+    :paramtype pipeline_profiler: callable[[~azure.core.pipeline.PipelineProfile], any]
     :return: An async pipeline object.
     :rtype: ~azure.core.pipeline.AsyncPipeline
 
@@ -261,7 +265,9 @@ class AsyncPipelineClient(
 
             transport = AioHttpTransport(**kwargs)
 
-        return AsyncPipeline[HTTPRequestType, AsyncHTTPResponseType](transport, policies)
+        return AsyncPipeline[HTTPRequestType, AsyncHTTPResponseType](
+            transport, policies, profiler=kwargs.get("pipeline_profiler")
+        )
 
     async def _make_pipeline_call(self, request: HTTPRequestType, **kwargs) -> AsyncHTTPResponseType:
         return_pipeline_response = kwargs.pop("_return_pipeline_response", False)
@@ -25,6 +25,7 @@
 # --------------------------------------------------------------------------
 import collections.abc
 import logging
+import weakref
 from typing import (
     Iterable,
     AsyncIterator,
@@ -34,10 +35,14 @@ from typing import (
     Optional,
     Awaitable,
     Any,
+    TYPE_CHECKING,
 )
 
 from .exceptions import AzureError
 
+if TYPE_CHECKING:
+    import asyncio  # pylint: disable=do-not-import-asyncio
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -108,22 +113,114 @@ class AsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
         return self._current_page
 
 
+# Marks the end of the pages in the prefetch queue
+_END_OF_PAGING = object()
+
+
+async def _prefetch_pages(
+    page_iterator: AsyncIterator[AsyncIterator[ReturnType]],
+    page_queue: "asyncio.Queue[Tuple[Any, Optional[str]]]",
+) -> None:
+    """Background task feeding the prefetch queue.
+
+    :param page_iterator: The page iterator to drain
+    :type page_iterator: AsyncIterator[AsyncIterator[ReturnType]]
+    :param page_queue: The queue receiving (page, continuation token) tuples, an exception or the end marker
+    :type page_queue: asyncio.Queue
+    """
+    try:
+        async for page in page_iterator:
+            await page_queue.put((page, getattr(page_iterator, "continuation_token", None)))
+    except Exception as err:  # pylint: disable=broad-except
+        await page_queue.put((err, None))
+        return
+    await page_queue.put((_END_OF_PAGING, None))
+
+
+def _cancel_task(task: "asyncio.Future[None]") -> None:
+    try:
+        task.cancel()
+    except RuntimeError:
+        # The event loop is already closed
+        pass
+
+
+class _AsyncPrefetchPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
+    def __init__(self, page_iterator: AsyncIterator[AsyncIterator[ReturnType]], prefetch_pages: int) -> None:
+        """Return an async iterator of pages, fetching up to `prefetch_pages` pages ahead in a background task.
+
+        While the caller consumes a page, the next ones are requested in the background. At most
+        `prefetch_pages` pages are buffered, plus the one being fetched.
+        `continuation_token` is the token of the last page returned to the caller, not of the last
+        page fetched. Prefetching requires an asyncio event loop, pages are fetched on demand otherwise.
+
+        :param page_iterator: The page iterator to prefetch from
+        :type page_iterator: AsyncIterator[AsyncIterator[ReturnType]]
+        :param int prefetch_pages: The number of pages to buffer ahead of the caller
+        """
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be a positive integer")
+        self._page_iterator = page_iterator
+        self._prefetch_pages = prefetch_pages
+        self.continuation_token: Optional[str] = getattr(page_iterator, "continuation_token", None)
+        self._queue: Optional["asyncio.Queue[Tuple[Any, Optional[str]]]"] = None
+        self._task: Optional["asyncio.Future[None]"] = None
+        self._done = False
+
+    async def __anext__(self) -> AsyncIterator[ReturnType]:
+        if self._done:
+            raise StopAsyncIteration("End of paging")
+        if self._queue is None:
+            # Prefetching is asyncio specific, pages are also iterated on other event loops
+            import asyncio  # pylint: disable=do-not-import-asyncio
+
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Not running on asyncio (e.g. trio): no background task, fetch on demand
+                page = await self._page_iterator.__anext__()
+                self.continuation_token = getattr(self._page_iterator, "continuation_token", None)
+                return page
+            self._queue = asyncio.Queue(maxsize=self._prefetch_pages)
+            self._task = asyncio.ensure_future(_prefetch_pages(self._page_iterator, self._queue))
+            weakref.finalize(self, _cancel_task, self._task).atexit = False
+
+        page, continuation_token = await self._queue.get()
+        if page is _END_OF_PAGING:
+            self._done = True
+            raise StopAsyncIteration("End of paging")
+        if isinstance(page, Exception):
+            self.close()
+            raise page
+        self.continuation_token = continuation_token
+        return page
+
+    def close(self) -> None:
+        """Stop prefetching. Pages already fetched are dropped."""
+        self._done = True
+        if self._task is not None:
+            self._task.cancel()
+
+
 class AsyncItemPaged(AsyncIterator[ReturnType]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Return an async iterator of items.
 
         args and kwargs will be passed to the AsyncPageIterator constructor directly,
-        except page_iterator_class
+        except page_iterator_class and prefetch_pages
         """
         self._args = args
         self._kwargs = kwargs
         self._page_iterator: Optional[AsyncIterator[AsyncIterator[ReturnType]]] = None
         self._page: Optional[AsyncIterator[ReturnType]] = None
         self._page_iterator_class = self._kwargs.pop("page_iterator_class", AsyncPageIterator)
+        self._prefetch_pages: int = self._kwargs.pop("prefetch_pages", 0)
 
     def by_page(
         self,
         continuation_token: Optional[str] = None,
+        *,
+        prefetch_pages: Optional[int] = None,
     ) -> AsyncIterator[AsyncIterator[ReturnType]]:
         """Get an async iterator of pages of objects, instead of an async iterator of objects.
 
@@ -131,10 +228,17 @@ class AsyncItemPaged(AsyncIterator[ReturnType]):
             An opaque continuation token. This value can be retrieved from the
             continuation_token field of a previous generator object. If specified,
             this generator will begin returning results from this point.
+        :keyword int prefetch_pages: Opt-in. If positive, fetch up to that many pages ahead in a background
+            task while the current page is consumed. At most that many pages are buffered in memory.
         :returns: An async iterator of pages (themselves async iterator of objects)
         :rtype: AsyncIterator[AsyncIterator[ReturnType]]
         """
-        return self._page_iterator_class(*self._args, **self._kwargs, continuation_token=continuation_token)
+        page_iterator = self._page_iterator_class(*self._args, **self._kwargs, continuation_token=continuation_token)
+        if prefetch_pages is None:
+            prefetch_pages = self._prefetch_pages
+        if prefetch_pages:
+            return _AsyncPrefetchPageIterator(page_iterator, prefetch_pages)
+        return page_iterator
 
     async def __anext__(self) -> ReturnType:
         if self._page_iterator is None:
@@ -23,7 +23,11 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import contextvars
 import itertools
+import queue
+import threading
+import weakref
 from typing import (
     Callable,
     Optional,
@@ -94,29 +98,146 @@ class PageIterator(Iterator[Iterator[ReturnType]]):
     next = __next__  # Python 2 compatibility. Can't be removed as some people are using ".next()" even in Py3
 
 
+_PREFETCH_POLL_INTERVAL = 0.1
+
+# Marks the end of the pages in the prefetch queue
+_END_OF_PAGING = object()
+
+
+def _prefetch_pages(
+    page_iterator: Iterator[Iterator[ReturnType]],
+    page_queue: "queue.Queue[Tuple[Any, Optional[str]]]",
+    closed: threading.Event,
+) -> None:
+    """Background thread feeding the prefetch queue.
+
+    It doesn't reference the _PrefetchPageIterator, so an abandoned iterator can be garbage collected
+    and close the thread.
+
+    :param page_iterator: The page iterator to drain
+    :type page_iterator: iterator[iterator[ReturnType]]
+    :param page_queue: The queue receiving (page, continuation token) tuples, an exception or the end marker
+    :type page_queue: queue.Queue
+    :param closed: Set when the consumer is gone
+    :type closed: threading.Event
+    """
+
+    def put(item: Tuple[Any, Optional[str]]) -> bool:
+        while not closed.is_set():
+            try:
+                page_queue.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for page in page_iterator:
+            if not put((page, getattr(page_iterator, "continuation_token", None))):
+                return
+    except Exception as err:  # pylint: disable=broad-except
+        put((err, None))
+        return
+    put((_END_OF_PAGING, None))
+
+
+class _PrefetchPageIterator(Iterator[Iterator[ReturnType]]):
+    def __init__(self, page_iterator: Iterator[Iterator[ReturnType]], prefetch_pages: int) -> None:
+        """Return an iterator of pages, fetching up to `prefetch_pages` pages ahead in a background thread.
+
+        While the caller consumes a page, the next ones are requested in the background. At most
+        `prefetch_pages` pages are buffered, plus the one being fetched.
+        `continuation_token` is the token of the last page returned to the caller, not of the last
+        page fetched.
+
+        :param page_iterator: The page iterator to prefetch from
+        :type page_iterator: iterator[iterator[ReturnType]]
+        :param int prefetch_pages: The number of pages to buffer ahead of the caller
+        """
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be a positive integer")
+        self._page_iterator = page_iterator
+        self.continuation_token: Optional[str] = getattr(page_iterator, "continuation_token", None)
+        self._queue: "queue.Queue[Tuple[Any, Optional[str]]]" = queue.Queue(maxsize=prefetch_pages)
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._done = False
+
+    def __iter__(self) -> Iterator[Iterator[ReturnType]]:
+        return self
+
+    def __next__(self) -> Iterator[ReturnType]:
+        """Get the next page in the iterator.
+
+        :returns: An iterator of objects in the next page.
+        :rtype: iterator[ReturnType]
+        :raises StopIteration: If there are no more pages to return.
+        :raises AzureError: If the request fails.
+        """
+        if self._done:
+            raise StopIteration("End of paging")
+        if self._thread is None:
+            # The pages are requested with the context of the caller, e.g. its current tracing span
+            self._thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(_prefetch_pages, self._page_iterator, self._queue, self._closed),
+                name="azure-core-page-prefetch",
+                daemon=True,
+            )
+            weakref.finalize(self, self._closed.set)
+            self._thread.start()
+
+        page, continuation_token = self._queue.get()
+        if page is _END_OF_PAGING:
+            self._done = True
+            raise StopIteration("End of paging")
+        if isinstance(page, Exception):
+            self.close()
+            raise page
+        self.continuation_token = continuation_token
+        return page
+
+    next = __next__  # Python 2 compatibility. Can't be removed as some people are using ".next()" even in Py3
+
+    def close(self) -> None:
+        """Stop prefetching. Pages already fetched are dropped."""
+        self._done = True
+        self._closed.set()
+
+
 class ItemPaged(Iterator[ReturnType]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Return an iterator of items.
 
         args and kwargs will be passed to the PageIterator constructor directly,
-        except page_iterator_class
+        except page_iterator_class and prefetch_pages
         """
         self._args = args
         self._kwargs = kwargs
         self._page_iterator: Optional[Iterator[ReturnType]] = None
         self._page_iterator_class = self._kwargs.pop("page_iterator_class", PageIterator)
+        self._prefetch_pages: int = self._kwargs.pop("prefetch_pages", 0)
 
-    def by_page(self, continuation_token: Optional[str] = None) -> Iterator[Iterator[ReturnType]]:
+    def by_page(
+        self, continuation_token: Optional[str] = None, *, prefetch_pages: Optional[int] = None
+    ) -> Iterator[Iterator[ReturnType]]:
         """Get an iterator of pages of objects, instead of an iterator of objects.
 
         :param str continuation_token:
             An opaque continuation token. This value can be retrieved from the
             continuation_token field of a previous generator object. If specified,
             this generator will begin returning results from this point.
+        :keyword int prefetch_pages: Opt-in. If positive, fetch up to that many pages ahead in a background
+            thread while the current page is consumed. At most that many pages are buffered in memory.
         :returns: An iterator of pages (themselves iterator of objects)
         :rtype: iterator[iterator[ReturnType]]
         """
-        return self._page_iterator_class(continuation_token=continuation_token, *self._args, **self._kwargs)
+        page_iterator = self._page_iterator_class(continuation_token=continuation_token, *self._args, **self._kwargs)
+        if prefetch_pages is None:
+            prefetch_pages = self._prefetch_pages
+        if prefetch_pages:
+            return _PrefetchPageIterator(page_iterator, prefetch_pages)
+        return page_iterator
 
     def __repr__(self) -> str:
         return "<iterator object azure.core.paging.ItemPaged at {}>".format(hex(id(self)))
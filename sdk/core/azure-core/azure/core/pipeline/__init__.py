@@ -190,6 +190,9 @@ class PipelineResponse(Generic[HTTPRequestType, HTTPResponseType]):
 
 from ._base import Pipeline  # pylint: disable=wrong-import-position
 from ._base_async import AsyncPipeline  # pylint: disable=wrong-import-position
+from ._profiling import PipelineProfile  # pylint: disable=wrong-import-position
+from ._template import PipelineTemplate  # pylint: disable=wrong-import-position
+from ._template_async import AsyncPipelineTemplate  # pylint: disable=wrong-import-position
 
 __all__ = [
     "Pipeline",
@@ -197,4 +200,7 @@ __all__ = [
     "PipelineResponse",
     "PipelineContext",
     "AsyncPipeline",
+    "PipelineProfile",
+    "PipelineTemplate",
+    "AsyncPipelineTemplate",
 ]
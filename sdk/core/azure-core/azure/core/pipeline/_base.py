@@ -34,6 +34,7 @@ from typing import (
     Dict,
     Optional,
     Iterable,
+    Callable,
     ContextManager,
 )
 from azure.core.pipeline import (
@@ -43,6 +44,7 @@ from azure.core.pipeline import (
 )
 from azure.core.pipeline.policies import HTTPPolicy, SansIOHTTPPolicy
 from ._tools import await_result as _await_result
+from ._profiling import PipelineProfile, PROFILE_CONTEXT_KEY, _ProfilingProbe, policy_name, report_profile
 from .transport import HttpTransport
 
 HTTPResponseType = TypeVar("HTTPResponseType")
@@ -141,6 +143,10 @@ class Pipeline(ContextManager["Pipeline"], Generic[HTTPRequestType, HTTPResponse
     :param transport: The Http Transport instance
     :type transport: ~azure.core.pipeline.transport.HttpTransport
     :param list policies: List of configured policies.
+    :keyword profiler: Opt-in instrumentation. If set, called after each run with a
+     :class:`~azure.core.pipeline.PipelineProfile` holding the time spent in each policy and in the transport,
+     the bytes sent and received and the retry count. The pipeline has no instrumentation overhead otherwise.
+    :paramtype profiler: callable[[~azure.core.pipeline.PipelineProfile], any]
 
     .. admonition:: Example:
 
@@ -163,6 +169,8 @@ class Pipeline(ContextManager["Pipeline"], Generic[HTTPRequestType, HTTPResponse
                 ]
             ]
         ] = None,
+        *,
+        profiler: Optional[Callable[[PipelineProfile], Any]] = None,
     ) -> None:
         self._impl_policies: List[HTTPPolicy[HTTPRequestType, HTTPResponseType]] = []
         self._transport = transport
@@ -172,11 +180,31 @@ class Pipeline(ContextManager["Pipeline"], Generic[HTTPRequestType, HTTPResponse
                 self._impl_policies.append(_SansIOHTTPPolicyRunner(policy))
             elif policy:
                 self._impl_policies.append(policy)
+        self._chain(profiler)
+
+    def _chain(self, profiler: Optional[Callable[[PipelineProfile], Any]]) -> None:
+        """Link the policies of the pipeline to each other and to the transport.
+
+        :param profiler: The profiler of the pipeline, if any.
+        :type profiler: callable[[~azure.core.pipeline.PipelineProfile], any] or None
+        """
         for index in range(len(self._impl_policies) - 1):
             self._impl_policies[index].next = self._impl_policies[index + 1]
         if self._impl_policies:
             self._impl_policies[-1].next = _TransportRunner(self._transport)
 
+        self._profiler = profiler
+        self._policy_names: List[str] = []
+        if profiler:
+            self._policy_names = [policy_name(policy) for policy in self._impl_policies]
+            # Probes between the nodes measure the time spent in each of them
+            for index, policy in enumerate(self._impl_policies):
+                probe: _ProfilingProbe[HTTPRequestType, HTTPResponseType] = _ProfilingProbe(
+                    index + 1, transport=index == len(self._impl_policies) - 1
+                )
+                probe.next = policy.next
+                policy.next = probe
+
     def __enter__(self) -> Pipeline[HTTPRequestType, HTTPResponseType]:
         self._transport.__enter__()
         return self
@@ -239,4 +267,19 @@ class Pipeline(ContextManager["Pipeline"], Generic[HTTPRequestType, HTTPResponse
         context = PipelineContext(self._transport, **kwargs)
         pipeline_request: PipelineRequest[HTTPRequestType] = PipelineRequest(request, context)
         first_node = self._impl_policies[0] if self._impl_policies else _TransportRunner(self._transport)
-        return first_node.send(pipeline_request)
+        if self._profiler is None:
+            return first_node.send(pipeline_request)
+
+        profile = PipelineProfile(self._policy_names, request.method, request.url)  # type: ignore
+        context[PROFILE_CONTEXT_KEY] = profile
+        probe: _ProfilingProbe[HTTPRequestType, HTTPResponseType] = _ProfilingProbe(
+            0, transport=not self._impl_policies
+        )
+        probe.next = first_node
+        try:
+            return probe.send(pipeline_request)
+        except BaseException as err:
+            profile.error = err
+            raise
+        finally:
+            report_profile(self._profiler, profile)
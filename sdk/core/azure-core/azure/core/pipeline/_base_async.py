@@ -34,6 +34,7 @@ from typing import (
     Dict,
     Optional,
     Iterable,
+    Callable,
     Type,
     AsyncContextManager,
 )
@@ -42,6 +43,7 @@ from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineConte
 from azure.core.pipeline.policies import AsyncHTTPPolicy, SansIOHTTPPolicy
 from ._tools_async import await_result as _await_result
 from ._base import cleanup_kwargs_for_transport
+from ._profiling import PipelineProfile, PROFILE_CONTEXT_KEY, _AsyncProfilingProbe, policy_name, report_profile
 from .transport import AsyncHttpTransport
 
 AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType")
@@ -125,6 +127,10 @@ class AsyncPipeline(
     :param transport: The async Http Transport instance.
     :type transport: ~azure.core.pipeline.transport.AsyncHttpTransport
     :param list policies: List of configured policies.
+    :keyword profiler: Opt-in instrumentation. If set, called after each run with a
+     :class:`~azure.core.pipeline.PipelineProfile` holding the time spent in each policy and in the transport,
+     the bytes sent and received and the retry count. The pipeline has no instrumentation overhead otherwise.
+    :paramtype profiler: callable[[~azure.core.pipeline.PipelineProfile], any]
 
     .. admonition:: Example:
 
@@ -147,6 +153,8 @@ class AsyncPipeline(
                 ]
             ]
         ] = None,
+        *,
+        profiler: Optional[Callable[[PipelineProfile], Any]] = None,
     ) -> None:
         self._impl_policies: List[AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]] = []
         self._transport = transport
@@ -156,11 +164,31 @@ class AsyncPipeline(
                 self._impl_policies.append(_SansIOAsyncHTTPPolicyRunner(policy))
             elif policy:
                 self._impl_policies.append(policy)
+        self._chain(profiler)
+
+    def _chain(self, profiler: Optional[Callable[[PipelineProfile], Any]]) -> None:
+        """Link the policies of the pipeline to each other and to the transport.
+
+        :param profiler: The profiler of the pipeline, if any.
+        :type profiler: callable[[~azure.core.pipeline.PipelineProfile], any] or None
+        """
         for index in range(len(self._impl_policies) - 1):
             self._impl_policies[index].next = self._impl_policies[index + 1]
         if self._impl_policies:
             self._impl_policies[-1].next = _AsyncTransportRunner(self._transport)
 
+        self._profiler = profiler
+        self._policy_names: List[str] = []
+        if profiler:
+            self._policy_names = [policy_name(policy) for policy in self._impl_policies]
+            # Probes between the nodes measure the time spent in each of them
+            for index, policy in enumerate(self._impl_policies):
+                probe: _AsyncProfilingProbe[HTTPRequestType, AsyncHTTPResponseType] = _AsyncProfilingProbe(
+                    index + 1, transport=index == len(self._impl_policies) - 1
+                )
+                probe.next = policy.next
+                policy.next = probe
+
     async def __aenter__(self) -> AsyncPipeline[HTTPRequestType, AsyncHTTPResponseType]:
         await self._transport.__aenter__()
         return self
@@ -226,4 +254,19 @@ class AsyncPipeline(
         context = PipelineContext(self._transport, **kwargs)
         pipeline_request = PipelineRequest(request, context)
         first_node = self._impl_policies[0] if self._impl_policies else _AsyncTransportRunner(self._transport)
-        return await first_node.send(pipeline_request)
+        if self._profiler is None:
+            return await first_node.send(pipeline_request)
+
+        profile = PipelineProfile(self._policy_names, request.method, request.url)  # type: ignore
+        context[PROFILE_CONTEXT_KEY] = profile
+        probe: _AsyncProfilingProbe[HTTPRequestType, AsyncHTTPResponseType] = _AsyncProfilingProbe(
+            0, transport=not self._impl_policies
+        )
+        probe.next = first_node
+        try:
+            return await probe.send(pipeline_request)
+        except BaseException as err:
+            profile.error = err
+            raise
+        finally:
+            report_profile(self._profiler, profile)
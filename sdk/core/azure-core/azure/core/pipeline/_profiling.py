@@ -0,0 +1,214 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from __future__ import annotations
+import logging
+import time
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import HTTPPolicy, AsyncHTTPPolicy
+
+HTTPResponseType = TypeVar("HTTPResponseType")
+HTTPRequestType = TypeVar("HTTPRequestType")
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key of the current PipelineProfile in the pipeline context
+PROFILE_CONTEXT_KEY = "pipeline_profile"
+
+TRANSPORT_NAME = "transport"
+
+
+def _content_length(message: Any) -> Optional[int]:
+    try:
+        return int(message.headers["Content-Length"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+class PipelineProfile:
+    """Measurements of one pipeline run, passed to the `pipeline_profiler` callback.
+
+    Times are wall-clock seconds. A policy time excludes the time spent in the policies after it and in the
+    transport, so the policy times and the transport time add up to the total time. If a policy sends the
+    request several times (e.g. retries), the times of all the attempts are summed.
+
+    :param list[str] policy_names: Names of the pipeline policies, in order.
+    :param str method: The HTTP method of the request.
+    :param str url: The URL of the request.
+    :ivar int transport_calls: The number of times the request was sent on the wire.
+    :ivar int request_bytes: The bytes sent, as declared by the Content-Length header of each attempt.
+    :ivar int response_bytes: The bytes received, as declared by the Content-Length header of each response.
+    :ivar status_code: The status code of the last response, None if no response was received.
+    :vartype status_code: int or None
+    :ivar error: The exception raised by the pipeline, if any.
+    :vartype error: BaseException or None
+    """
+
+    def __init__(self, policy_names: List[str], method: str, url: str) -> None:
+        self.policy_names = policy_names
+        self.method = method
+        self.url = url
+        self.transport_calls = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        # Time spent in each node and all the nodes after it, the last node is the transport
+        self._inclusive_times = [0.0] * (len(policy_names) + 1)
+
+    @property
+    def total_time(self) -> float:
+        """The time spent in the pipeline.
+
+        :return: The time in seconds.
+        :rtype: float
+        """
+        return self._inclusive_times[0]
+
+    @property
+    def transport_time(self) -> float:
+        """The time spent in the transport, sending requests and receiving responses.
+
+        :return: The time in seconds.
+        :rtype: float
+        """
+        return self._inclusive_times[-1]
+
+    @property
+    def retry_count(self) -> int:
+        """The number of times the request was sent again after the first attempt.
+
+        :return: The retry count.
+        :rtype: int
+        """
+        return max(self.transport_calls - 1, 0)
+
+    @property
+    def policy_times(self) -> List[Tuple[str, float]]:
+        """The time spent in each policy, excluding the time spent in the next ones.
+
+        :return: (policy name, time in seconds) tuples, in pipeline order.
+        :rtype: list[tuple[str, float]]
+        """
+        times = self._inclusive_times
+        return [(name, times[index] - times[index + 1]) for index, name in enumerate(self.policy_names)]
+
+    def __repr__(self) -> str:
+        return "<PipelineProfile {} {}, total: {:.6f}s, transport: {:.6f}s, retries: {}>".format(
+            self.method, self.url, self.total_time, self.transport_time, self.retry_count
+        )
+
+
+def policy_name(policy: Any) -> str:
+    """The name to report for a pipeline node, unwrapping the SansIO runners.
+
+    :param any policy: The pipeline node.
+    :return: The class name of the policy.
+    :rtype: str
+    """
+    return type(getattr(policy, "_policy", policy)).__name__
+
+
+def report_profile(profiler: Callable[[PipelineProfile], Any], profile: PipelineProfile) -> None:
+    """Hand the profile to the profiler. A failing profiler never fails the request.
+
+    :param callable profiler: The callback.
+    :param profile: The profile of the run.
+    :type profile: ~azure.core.pipeline.PipelineProfile
+    """
+    try:
+        profiler(profile)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.warning("Pipeline profiler failed", exc_info=True)
+
+
+class _ProfilingProbe(HTTPPolicy[HTTPRequestType, HTTPResponseType], Generic[HTTPRequestType, HTTPResponseType]):
+    """Measures the time spent in the next node of the chain and all the nodes after it.
+
+    Only inserted in the chain when a profiler is configured.
+
+    :param int index: The position of the measured node in the pipeline.
+    :param bool transport: Whether the measured node is the transport.
+    """
+
+    def __init__(self, index: int, transport: bool = False) -> None:
+        super(_ProfilingProbe, self).__init__()
+        self._index = index
+        self._transport = transport
+
+    def send(self, request: PipelineRequest[HTTPRequestType]) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
+        profile: Optional[PipelineProfile] = request.context.get(PROFILE_CONTEXT_KEY)
+        if profile is None:
+            return self.next.send(request)
+        if self._transport:
+            profile.transport_calls += 1
+            profile.request_bytes += _content_length(request.http_request) or 0
+        start = time.perf_counter()
+        try:
+            response = self.next.send(request)
+        finally:
+            profile._inclusive_times[self._index] += time.perf_counter() - start  # pylint: disable=protected-access
+        if self._transport:
+            profile.status_code = response.http_response.status_code  # type: ignore
+            profile.response_bytes += _content_length(response.http_response) or 0
+        return response
+
+
+class _AsyncProfilingProbe(
+    AsyncHTTPPolicy[HTTPRequestType, HTTPResponseType], Generic[HTTPRequestType, HTTPResponseType]
+):
+    """Measures the time spent in the next node of the chain and all the nodes after it.
+
+    Only inserted in the chain when a profiler is configured.
+
+    :param int index: The position of the measured node in the pipeline.
+    :param bool transport: Whether the measured node is the transport.
+    """
+
+    def __init__(self, index: int, transport: bool = False) -> None:
+        super(_AsyncProfilingProbe, self).__init__()
+        self._index = index
+        self._transport = transport
+
+    async def send(
+        self, request: PipelineRequest[HTTPRequestType]
+    ) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
+        profile: Optional[PipelineProfile] = request.context.get(PROFILE_CONTEXT_KEY)
+        if profile is None:
+            return await self.next.send(request)
+        if self._transport:
+            profile.transport_calls += 1
+            profile.request_bytes += _content_length(request.http_request) or 0
+        start = time.perf_counter()
+        try:
+            response = await self.next.send(request)
+        finally:
+            profile._inclusive_times[self._index] += time.perf_counter() - start  # pylint: disable=protected-access
+        if self._transport:
+            profile.status_code = response.http_response.status_code  # type: ignore
+            profile.response_bytes += _content_length(response.http_response) or 0
+        return response
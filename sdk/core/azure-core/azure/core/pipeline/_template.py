@@ -0,0 +1,298 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from __future__ import annotations
+import copy
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Iterable,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from azure.core.pipeline.policies import HTTPPolicy, SansIOHTTPPolicy
+from ._base import Pipeline, _SansIOHTTPPolicyRunner
+from ._profiling import PipelineProfile
+from .transport import HttpTransport
+
+HTTPResponseType = TypeVar("HTTPResponseType")
+HTTPRequestType = TypeVar("HTTPRequestType")
+
+
+def _compile_policies(
+    policies: Optional[Iterable[Any]], runner_type: Type[Any]
+) -> Tuple[Tuple[Any, ...], Tuple[bool, ...]]:
+    """Flatten a policy list once: drop empty entries and remember which policies are SansIO.
+
+    Policies coming from an existing pipeline are unwrapped from their SansIO runner.
+
+    :param policies: The policies of the template.
+    :type policies: iterable[any] or None
+    :param type runner_type: The class used by the pipeline to wrap SansIO policies.
+    :return: The policies and, for each of them, whether it is a SansIO policy.
+    :rtype: tuple[tuple[any, ...], tuple[bool, ...]]
+    """
+    compiled = []
+    for policy in policies or []:
+        if isinstance(policy, runner_type):
+            policy = policy._policy  # pylint: disable=protected-access
+        if policy:
+            compiled.append(policy)
+    return tuple(compiled), tuple(isinstance(policy, SansIOHTTPPolicy) for policy in compiled)
+
+
+def _clone_policy(policy: Any) -> Any:
+    """Shallow copy of a policy, faster than copy.copy for plain instances.
+
+    :param any policy: The policy to copy.
+    :return: The copy.
+    :rtype: any
+    """
+    try:
+        state = policy.__dict__
+    except AttributeError:
+        return copy.copy(policy)
+    clone = object.__new__(type(policy))
+    clone.__dict__.update(state)
+    return clone
+
+
+def _instantiate_policies(
+    policies: Tuple[Any, ...],
+    sansio: Tuple[bool, ...],
+    runner_type: Type[Any],
+    overrides: Optional[Mapping[Type[Any], Any]],
+    matches: Dict[Type[Any], Tuple[int, ...]],
+) -> List[Any]:
+    """Build the per-pipeline nodes of a template.
+
+    SansIO policies are stateless and shared, only their runner is created. Other policies hold the link
+    to the next node, so each pipeline gets a shallow copy of them.
+
+    :param policies: The policies of the template.
+    :type policies: tuple[any, ...]
+    :param sansio: For each policy, whether it is a SansIO policy.
+    :type sansio: tuple[bool, ...]
+    :param type runner_type: The class used by the pipeline to wrap SansIO policies.
+    :param overrides: Policies replacing the template policies that are instances of their key. None removes them.
+    :type overrides: mapping[type, any] or None
+    :param matches: Cache of the indexes of the template policies that are instances of an override key.
+    :type matches: dict[type, tuple[int, ...]]
+    :return: The pipeline nodes.
+    :rtype: list[any]
+    """
+    if overrides:
+        policies_list = list(policies)
+        sansio_list = list(sansio)
+        for policy_type, replacement in overrides.items():
+            try:
+                indexes = matches[policy_type]
+            except KeyError:
+                indexes = matches[policy_type] = tuple(
+                    index for index, policy in enumerate(policies) if isinstance(policy, policy_type)
+                )
+            for index in indexes:
+                policies_list[index] = replacement
+                sansio_list[index] = isinstance(replacement, SansIOHTTPPolicy)
+        return [
+            runner_type(policy) if is_sansio else _clone_policy(policy)
+            for policy, is_sansio in zip(policies_list, sansio_list)
+            if policy
+        ]
+    return [runner_type(policy) if is_sansio else _clone_policy(policy) for policy, is_sansio in zip(policies, sansio)]
+
+
+def _new_pipeline(pipeline_type: Type[Any], transport: Any, nodes: List[Any], profiler: Any) -> Any:
+    """Create a pipeline from already built nodes, skipping the policy checks of its constructor.
+
+    :param type pipeline_type: Pipeline or AsyncPipeline.
+    :param any transport: The transport of the pipeline.
+    :param list nodes: The pipeline nodes.
+    :param any profiler: The profiler of the pipeline, if any.
+    :return: The pipeline.
+    :rtype: any
+    """
+    # pylint: disable=protected-access
+    pipeline = object.__new__(pipeline_type)
+    pipeline._transport = transport
+    pipeline._impl_policies = nodes
+    pipeline._chain(profiler)
+    return pipeline
+
+
+class _SharedTransport(HttpTransport[HTTPRequestType, HTTPResponseType]):
+    """Transport given to the pipelines of a template.
+
+    Sends through the template transport, but closing a pipeline (or its client) does not close it:
+    the transport is owned by the template.
+
+    :param transport: The template transport.
+    :type transport: ~azure.core.pipeline.transport.HttpTransport
+    """
+
+    def __init__(self, transport: HttpTransport[HTTPRequestType, HTTPResponseType]) -> None:
+        self._transport = transport
+
+    def __getattr__(self, name: str) -> Any:
+        # Policies may inspect the transport, e.g. its connection_config
+        if name == "_transport":
+            raise AttributeError(name)
+        return getattr(self._transport, name)
+
+    def send(self, request: HTTPRequestType, **kwargs: Any) -> HTTPResponseType:
+        return self._transport.send(request, **kwargs)
+
+    def open(self) -> None:
+        self._transport.open()
+
+    def close(self) -> None:
+        pass
+
+    def sleep(self, duration: float) -> None:
+        self._transport.sleep(duration)
+
+    def __enter__(self) -> _SharedTransport[HTTPRequestType, HTTPResponseType]:
+        self.open()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+class PipelineTemplate(Generic[HTTPRequestType, HTTPResponseType]):
+    """An immutable, precompiled pipeline description that pipelines are cheaply cloned from.
+
+    Building a pipeline the usual way creates the transport and every policy, and wraps the SansIO
+    policies. A template does this once; :meth:`create_pipeline` then only creates the SansIO runners and
+    shallow copies of the non-SansIO policies. All the pipelines of a template share its transport (and its
+    connection pool) and its SansIO policies, which must be stateless.
+
+    The template owns the transport: closing a pipeline created from it (or the client using that pipeline)
+    does not close the transport. Close the template when no pipeline uses it anymore.
+
+    :param transport: The Http Transport instance shared by the pipelines.
+    :type transport: ~azure.core.pipeline.transport.HttpTransport
+    :param list policies: List of configured policies.
+    :keyword profiler: Opt-in instrumentation given to every pipeline of the template.
+    :paramtype profiler: callable[[~azure.core.pipeline.PipelineProfile], any]
+
+    .. code-block:: python
+
+        template = PipelineTemplate(RequestsTransport(), [HeadersPolicy(), RetryPolicy(), auth_policy])
+        client = PipelineClient(
+            endpoint,
+            pipeline=template.create_pipeline(overrides={BearerTokenCredentialPolicy: tenant_auth_policy}),
+        )
+    """
+
+    def __init__(
+        self,
+        transport: HttpTransport[HTTPRequestType, HTTPResponseType],
+        policies: Optional[
+            Iterable[
+                Union[
+                    HTTPPolicy[HTTPRequestType, HTTPResponseType],
+                    SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType],
+                ]
+            ]
+        ] = None,
+        *,
+        profiler: Optional[Callable[[PipelineProfile], Any]] = None,
+    ) -> None:
+        self._transport = transport
+        self._shared_transport: _SharedTransport[HTTPRequestType, HTTPResponseType] = _SharedTransport(transport)
+        self._policies, self._sansio = _compile_policies(policies, _SansIOHTTPPolicyRunner)
+        self._profiler = profiler
+        self._override_matches: Dict[Type[Any], Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_pipeline(
+        cls, pipeline: Pipeline[HTTPRequestType, HTTPResponseType]
+    ) -> PipelineTemplate[HTTPRequestType, HTTPResponseType]:
+        """Create a template from the policies, transport and profiler of an existing pipeline.
+
+        The template takes over the pipeline transport; the pipeline must not be closed while the template
+        is in use.
+
+        :param pipeline: The pipeline to precompile.
+        :type pipeline: ~azure.core.pipeline.Pipeline
+        :return: The template.
+        :rtype: ~azure.core.pipeline.PipelineTemplate
+        """
+        # pylint: disable=protected-access
+        return cls(pipeline._transport, pipeline._impl_policies, profiler=pipeline._profiler)
+
+    @property
+    def policies(self) -> Tuple[Any, ...]:
+        """The policies of the template, SansIO policies are not wrapped.
+
+        :return: The policies.
+        :rtype: tuple
+        """
+        return self._policies
+
+    @property
+    def transport(self) -> HttpTransport[HTTPRequestType, HTTPResponseType]:
+        """The transport shared by the pipelines of the template.
+
+        :return: The transport.
+        :rtype: ~azure.core.pipeline.transport.HttpTransport
+        """
+        return self._transport
+
+    def create_pipeline(
+        self, *, overrides: Optional[Mapping[Type[Any], Any]] = None
+    ) -> Pipeline[HTTPRequestType, HTTPResponseType]:
+        """Create a pipeline from the template.
+
+        :keyword overrides: Per-pipeline policies, e.g. an authentication policy with another credential.
+         Each template policy that is an instance of a key is replaced by the value; a None value removes it.
+        :paramtype overrides: mapping[type, HTTPPolicy or SansIOHTTPPolicy or None]
+        :return: A pipeline sharing the transport and the SansIO policies of the template.
+        :rtype: ~azure.core.pipeline.Pipeline
+        """
+        nodes = _instantiate_policies(
+            self._policies, self._sansio, _SansIOHTTPPolicyRunner, overrides, self._override_matches
+        )
+        return _new_pipeline(Pipeline, self._shared_transport, nodes, self._profiler)
+
+    def __enter__(self) -> PipelineTemplate[HTTPRequestType, HTTPResponseType]:
+        self._transport.__enter__()
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self._transport.__exit__(*exc_details)
+
+    def close(self) -> None:
+        """Close the transport of the template."""
+        self._transport.close()
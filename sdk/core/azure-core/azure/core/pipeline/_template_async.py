@@ -0,0 +1,196 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from __future__ import annotations
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Mapping,
+    Optional,
+    Iterable,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from azure.core.pipeline.policies import AsyncHTTPPolicy, SansIOHTTPPolicy
+from ._base_async import AsyncPipeline, _SansIOAsyncHTTPPolicyRunner
+from ._profiling import PipelineProfile
+from ._template import _compile_policies, _instantiate_policies, _new_pipeline
+from .transport import AsyncHttpTransport
+
+AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType")
+HTTPRequestType = TypeVar("HTTPRequestType")
+
+
+class _AsyncSharedTransport(AsyncHttpTransport[HTTPRequestType, AsyncHTTPResponseType]):
+    """Transport given to the pipelines of an async template.
+
+    Sends through the template transport, but closing a pipeline (or its client) does not close it:
+    the transport is owned by the template.
+
+    :param transport: The template transport.
+    :type transport: ~azure.core.pipeline.transport.AsyncHttpTransport
+    """
+
+    def __init__(self, transport: AsyncHttpTransport[HTTPRequestType, AsyncHTTPResponseType]) -> None:
+        self._transport = transport
+
+    def __getattr__(self, name: str) -> Any:
+        # Policies may inspect the transport, e.g. its connection_config
+        if name == "_transport":
+            raise AttributeError(name)
+        return getattr(self._transport, name)
+
+    async def send(self, request: HTTPRequestType, **kwargs: Any) -> AsyncHTTPResponseType:
+        return await self._transport.send(request, **kwargs)
+
+    async def open(self) -> None:
+        await self._transport.open()
+
+    async def close(self) -> None:
+        pass
+
+    async def sleep(self, duration: float) -> None:
+        await self._transport.sleep(duration)
+
+    async def __aenter__(self) -> _AsyncSharedTransport[HTTPRequestType, AsyncHTTPResponseType]:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        pass
+
+
+class AsyncPipelineTemplate(Generic[HTTPRequestType, AsyncHTTPResponseType]):
+    """An immutable, precompiled async pipeline description that pipelines are cheaply cloned from.
+
+    See :class:`~azure.core.pipeline.PipelineTemplate`. All the pipelines of a template share its transport
+    and its SansIO policies; the template owns the transport and must be closed when no pipeline uses it anymore.
+
+    :param transport: The async Http Transport instance shared by the pipelines.
+    :type transport: ~azure.core.pipeline.transport.AsyncHttpTransport
+    :param list policies: List of configured policies.
+    :keyword profiler: Opt-in instrumentation given to every pipeline of the template.
+    :paramtype profiler: callable[[~azure.core.pipeline.PipelineProfile], any]
+    """
+
+    def __init__(
+        self,
+        transport: AsyncHttpTransport[HTTPRequestType, AsyncHTTPResponseType],
+        policies: Optional[
+            Iterable[
+                Union[
+                    AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType],
+                    SansIOHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType],
+                ]
+            ]
+        ] = None,
+        *,
+        profiler: Optional[Callable[[PipelineProfile], Any]] = None,
+    ) -> None:
+        self._transport = transport
+        self._shared_transport: _AsyncSharedTransport[HTTPRequestType, AsyncHTTPResponseType] = _AsyncSharedTransport(
+            transport
+        )
+        self._policies, self._sansio = _compile_policies(policies, _SansIOAsyncHTTPPolicyRunner)
+        self._profiler = profiler
+        self._override_matches: Dict[Type[Any], Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_pipeline(
+        cls, pipeline: AsyncPipeline[HTTPRequestType, AsyncHTTPResponseType]
+    ) -> AsyncPipelineTemplate[HTTPRequestType, AsyncHTTPResponseType]:
+        """Create a template from the policies, transport and profiler of an existing async pipeline.
+
+        The template takes over the pipeline transport; the pipeline must not be closed while the template
+        is in use.
+
+        :param pipeline: The async pipeline to precompile.
+        :type pipeline: ~azure.core.pipeline.AsyncPipeline
+        :return: The template.
+        :rtype: ~azure.core.pipeline.AsyncPipelineTemplate
+        """
+        # pylint: disable=protected-access
+        return cls(pipeline._transport, pipeline._impl_policies, profiler=pipeline._profiler)
+
+    @property
+    def policies(self) -> Tuple[Any, ...]:
+        """The policies of the template, SansIO policies are not wrapped.
+
+        :return: The policies.
+        :rtype: tuple
+        """
+        return self._policies
+
+    @property
+    def transport(self) -> AsyncHttpTransport[HTTPRequestType, AsyncHTTPResponseType]:
+        """The transport shared by the pipelines of the template.
+
+        :return: The transport.
+        :rtype: ~azure.core.pipeline.transport.AsyncHttpTransport
+        """
+        return self._transport
+
+    def create_pipeline(
+        self, *, overrides: Optional[Mapping[Type[Any], Any]] = None
+    ) -> AsyncPipeline[HTTPRequestType, AsyncHTTPResponseType]:
+        """Create an async pipeline from the template.
+
+        :keyword overrides: Per-pipeline policies, e.g. an authentication policy with another credential.
+         Each template policy that is an instance of a key is replaced by the value; a None value removes it.
+        :paramtype overrides: mapping[type, AsyncHTTPPolicy or SansIOHTTPPolicy or None]
+        :return: An async pipeline sharing the transport and the SansIO policies of the template.
+        :rtype: ~azure.core.pipeline.AsyncPipeline
+        """
+        nodes = _instantiate_policies(
+            self._policies, self._sansio, _SansIOAsyncHTTPPolicyRunner, overrides, self._override_matches
+        )
+        return _new_pipeline(AsyncPipeline, self._shared_transport, nodes, self._profiler)
+
+    async def __aenter__(self) -> AsyncPipelineTemplate[HTTPRequestType, AsyncHTTPResponseType]:
+        await self._transport.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        await self._transport.__aexit__(exc_type, exc_value, traceback)
+
+    async def close(self) -> None:
+        """Close the transport of the template."""
+        await self._transport.close()
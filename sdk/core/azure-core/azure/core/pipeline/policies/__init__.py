@@ -30,6 +30,8 @@ from ._authentication import (
     AzureKeyCredentialPolicy,
     AzureSasCredentialPolicy,
 )
+from ._cache import HttpCacheBackend, InMemoryHttpCache, FileHttpCache, HttpCachePolicy
+from ._concurrency import AdaptiveConcurrencyLimiter, AdaptiveConcurrencyPolicy
 from ._custom_hook import CustomHookPolicy
 from ._redirect import RedirectPolicy
 from ._retry import RetryPolicy, RetryMode
@@ -47,6 +49,8 @@ from ._base_async import AsyncHTTPPolicy
 from ._authentication_async import AsyncBearerTokenCredentialPolicy
 from ._redirect_async import AsyncRedirectPolicy
 from ._retry_async import AsyncRetryPolicy
+from ._concurrency_async import AsyncAdaptiveConcurrencyPolicy
+from ._cache_async import AsyncHttpCachePolicy
 from ._sensitive_header_cleanup_policy import SensitiveHeaderCleanupPolicy
 
 __all__ = [
@@ -73,4 +77,12 @@ __all__ = [
     "AsyncRedirectPolicy",
     "AsyncRetryPolicy",
     "SensitiveHeaderCleanupPolicy",
+    "AdaptiveConcurrencyLimiter",
+    "AdaptiveConcurrencyPolicy",
+    "AsyncAdaptiveConcurrencyPolicy",
+    "HttpCacheBackend",
+    "InMemoryHttpCache",
+    "FileHttpCache",
+    "HttpCachePolicy",
+    "AsyncHttpCachePolicy",
 ]
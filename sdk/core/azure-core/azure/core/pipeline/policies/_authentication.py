@@ -3,9 +3,11 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
+import logging
+import threading
 import time
 import base64
-from typing import TYPE_CHECKING, Optional, TypeVar, MutableMapping, Any, Union, cast
+from typing import TYPE_CHECKING, Dict, Optional, TypeVar, MutableMapping, Any, Union, cast
 from azure.core.credentials import (
     TokenCredential,
     SupportsTokenInfo,
@@ -34,6 +36,19 @@ if TYPE_CHECKING:
 HTTPResponseType = TypeVar("HTTPResponseType", HttpResponse, LegacyHttpResponse)
 HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
 
+_LOGGER = logging.getLogger(__name__)
+
+# With background refresh, a cached token keeps being used while it is renewed until this
+# many seconds before it expires
+_MIN_REMAINING_VALIDITY = 30
+
+# After a failed background refresh, the cached token is used without retrying for this many seconds
+_REFRESH_RETRY_DELAY = 30
+
+
+def _token_is_usable(token: Optional[Union["AccessToken", "AccessTokenInfo"]]) -> bool:
+    return token is not None and token.expires_on - time.time() > _MIN_REMAINING_VALIDITY
+
 
 # pylint:disable=too-few-public-methods
 class _BearerTokenCredentialPolicyBase:
@@ -44,6 +59,8 @@ class _BearerTokenCredentialPolicyBase:
     :param str scopes: Lets you specify the type of access needed.
     :keyword bool enable_cae: Indicates whether to enable Continuous Access Evaluation (CAE) on all requested
         tokens. Defaults to False.
+    :keyword bool background_refresh: Whether a token due for refresh is renewed in the background while
+        requests keep using the cached token, as long as it is not about to expire. Defaults to False.
     """
 
     def __init__(self, credential: TokenProvider, *scopes: str, **kwargs: Any) -> None:
@@ -52,6 +69,24 @@ class _BearerTokenCredentialPolicyBase:
         self._credential = credential
         self._token: Optional[Union["AccessToken", "AccessTokenInfo"]] = None
         self._enable_cae: bool = kwargs.get("enable_cae", False)
+        self._background_refresh: bool = kwargs.get("background_refresh", False)
+        # Only one thread at a time asks the credential for a token
+        self._token_lock = threading.RLock()
+        # Held while a background refresh is in flight
+        self._background_refresh_lock = threading.Lock()
+        self._last_refresh_failure = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Remove the unpicklable entries.
+        del state["_token_lock"]
+        del state["_background_refresh_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._token_lock = threading.RLock()
+        self._background_refresh_lock = threading.Lock()
 
     @staticmethod
     def _enforce_https(request: PipelineRequest[HTTPRequestType]) -> None:
@@ -107,6 +142,43 @@ class _BearerTokenCredentialPolicyBase:
         """
         self._token = self._get_token(*scopes, **kwargs)
 
+    def _refresh_token(self) -> None:
+        """Make sure the policy has a token for its scopes, renewing it if needed.
+
+        Concurrent calls result in a single call to the credential. With background refresh, a token that is due
+        for refresh but still usable is renewed by a background thread, and this method returns without waiting.
+        """
+        if self._background_refresh and _token_is_usable(self._token):
+            if time.time() - self._last_refresh_failure < _REFRESH_RETRY_DELAY:
+                return  # the last attempt failed recently
+            if not self._background_refresh_lock.acquire(blocking=False):
+                return  # already in flight
+            try:
+                thread = threading.Thread(target=self._refresh_in_background, name="azure-core-token-refresh")
+                thread.daemon = True
+                thread.start()
+            except BaseException:
+                self._background_refresh_lock.release()
+                raise
+            return
+
+        with self._token_lock:
+            # double check because another thread may have acquired a token while we waited for the lock
+            if self._token is None or self._need_new_token:
+                self._request_token(*self._scopes)
+
+    def _refresh_in_background(self) -> None:
+        try:
+            with self._token_lock:
+                if self._token is None or self._need_new_token:
+                    self._request_token(*self._scopes)
+        except Exception:  # pylint:disable=broad-except
+            # The cached token is still usable; a request due for refresh tries again after a delay
+            self._last_refresh_failure = time.time()
+            _LOGGER.warning("Background token refresh failed", exc_info=True)
+        finally:
+            self._background_refresh_lock.release()
+
 
 class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy[HTTPRequestType, HTTPResponseType]):
     """Adds a bearer token Authorization header to requests.
@@ -116,6 +188,9 @@ class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy[H
     :param str scopes: Lets you specify the type of access needed.
     :keyword bool enable_cae: Indicates whether to enable Continuous Access Evaluation (CAE) on all requested
         tokens. Defaults to False.
+    :keyword bool background_refresh: Whether a token due for refresh is renewed in the background while
+        requests keep using the cached token, as long as it is not about to expire. Concurrent token requests are
+        always deduplicated into a single call to the credential. Defaults to False.
     :raises ~azure.core.exceptions.ServiceRequestError: If the request fails.
     """
 
@@ -129,7 +204,7 @@ class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy[H
         self._enforce_https(request)
 
         if self._token is None or self._need_new_token:
-            self._request_token(*self._scopes)
+            self._refresh_token()
         bearer_token = cast(Union["AccessToken", "AccessTokenInfo"], self._token).token
         self._update_headers(request.http_request.headers, bearer_token)
 
@@ -142,7 +217,8 @@ class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, HTTPPolicy[H
         :param ~azure.core.pipeline.PipelineRequest request: the request
         :param str scopes: required scopes of authentication
         """
-        self._request_token(*scopes, **kwargs)
+        with self._token_lock:
+            self._request_token(*scopes, **kwargs)
         bearer_token = cast(Union["AccessToken", "AccessTokenInfo"], self._token).token
         self._update_headers(request.http_request.headers, bearer_token)
 
@@ -3,9 +3,10 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
+import logging
 import time
 import base64
-from typing import Any, Awaitable, Optional, cast, TypeVar, Union
+from typing import Any, Awaitable, Dict, Optional, cast, TypeVar, Union, TYPE_CHECKING
 
 from azure.core.credentials import AccessToken, AccessTokenInfo, TokenRequestOptions
 from azure.core.credentials_async import (
@@ -17,6 +18,8 @@ from azure.core.pipeline import PipelineRequest, PipelineResponse
 from azure.core.pipeline.policies import AsyncHTTPPolicy
 from azure.core.pipeline.policies._authentication import (
     _BearerTokenCredentialPolicyBase,
+    _token_is_usable,
+    _REFRESH_RETRY_DELAY,
 )
 from azure.core.pipeline.transport import (
     AsyncHttpResponse as LegacyAsyncHttpResponse,
@@ -28,9 +31,14 @@ from ._utils import get_challenge_parameter
 
 from .._tools_async import await_result
 
+if TYPE_CHECKING:
+    import asyncio  # pylint: disable=do-not-import-asyncio
+
 AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType", AsyncHttpResponse, LegacyAsyncHttpResponse)
 HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class AsyncBearerTokenCredentialPolicy(AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]):
     """Adds a bearer token Authorization header to requests.
@@ -40,6 +48,10 @@ class AsyncBearerTokenCredentialPolicy(AsyncHTTPPolicy[HTTPRequestType, AsyncHTT
     :param str scopes: Lets you specify the type of access needed.
     :keyword bool enable_cae: Indicates whether to enable Continuous Access Evaluation (CAE) on all requested
         tokens. Defaults to False.
+    :keyword bool background_refresh: Whether a token due for refresh is renewed in a background task while
+        requests keep using the cached token, as long as it is not about to expire. Concurrent token requests are
+        always deduplicated into a single call to the credential. Only supported with asyncio, other event loops
+        refresh the token inline. Defaults to False.
     """
 
     def __init__(self, credential: AsyncTokenProvider, *scopes: str, **kwargs: Any) -> None:
@@ -49,6 +61,16 @@ class AsyncBearerTokenCredentialPolicy(AsyncHTTPPolicy[HTTPRequestType, AsyncHTT
         self._lock_instance = None
         self._token: Optional[Union["AccessToken", "AccessTokenInfo"]] = None
         self._enable_cae: bool = kwargs.get("enable_cae", False)
+        self._background_refresh: bool = kwargs.get("background_refresh", False)
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+        self._last_refresh_failure = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Remove the unpicklable entries; the lock is created again when needed.
+        state["_lock_instance"] = None
+        state["_refresh_task"] = None
+        return state
 
     @property
     def _lock(self):
@@ -66,10 +88,11 @@ class AsyncBearerTokenCredentialPolicy(AsyncHTTPPolicy[HTTPRequestType, AsyncHTT
         _BearerTokenCredentialPolicyBase._enforce_https(request)  # pylint:disable=protected-access
 
         if self._token is None or self._need_new_token():
-            async with self._lock:
-                # double check because another coroutine may have acquired a token while we waited to acquire the lock
-                if self._token is None or self._need_new_token():
-                    await self._request_token(*self._scopes)
+            if not (self._background_refresh and _token_is_usable(self._token) and self._refresh_in_background()):
+                async with self._lock:
+                    # double check because another coroutine may have acquired a token while we waited for the lock
+                    if self._token is None or self._need_new_token():
+                        await self._request_token(*self._scopes)
         bearer_token = cast(Union[AccessToken, AccessTokenInfo], self._token).token
         request.http_request.headers["Authorization"] = "Bearer " + bearer_token
 
@@ -206,6 +229,38 @@ class AsyncBearerTokenCredentialPolicy(AsyncHTTPPolicy[HTTPRequestType, AsyncHTT
             **kwargs,
         )
 
+    def _refresh_in_background(self) -> bool:
+        """Start renewing the token in a background task, unless a renewal is already in flight.
+
+        The cached token keeps being used without a new attempt for a while after a renewal failed.
+
+        :return: False if the token cannot be renewed in the background (not running on asyncio).
+        :rtype: bool
+        """
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return True
+        if time.time() - self._last_refresh_failure < _REFRESH_RETRY_DELAY:
+            return True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # trio: no task can outlive the request, refresh inline
+            return False
+        self._refresh_task = loop.create_task(self._background_refresh_task())
+        return True
+
+    async def _background_refresh_task(self) -> None:
+        try:
+            async with self._lock:
+                if self._token is None or self._need_new_token():
+                    await self._request_token(*self._scopes)
+        except Exception:  # pylint:disable=broad-except
+            # The cached token is still usable; a request due for refresh tries again after a delay
+            self._last_refresh_failure = time.time()
+            _LOGGER.warning("Background token refresh failed", exc_info=True)
+
     async def _request_token(self, *scopes: str, **kwargs: Any) -> None:
         """Request a new token from the credential.
 
@@ -0,0 +1,567 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module provides an opt-in HTTP cache policy, with in-memory and on-disk backends.
+"""
+import abc
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.client import HTTPResponse as _HTTPResponse
+from typing import TypeVar, Any, Dict, List, Optional, Iterable, Tuple, Type, Union
+
+from azure.core.pipeline import PipelineResponse, PipelineRequest
+from azure.core.pipeline.transport import (
+    HttpResponse as LegacyHttpResponse,
+    HttpRequest as LegacyHttpRequest,
+)
+from azure.core.pipeline.transport._base import HttpClientTransportResponse as LegacyHttpClientTransportResponse
+from azure.core.rest import HttpResponse, HttpRequest
+from azure.core.rest._http_response_impl import RestHttpClientTransportResponse
+from azure.core.utils._pipeline_transport_rest_shared import BytesIOSocket
+from .._tools import is_rest
+from ._base import HTTPPolicy
+
+HTTPResponseType = TypeVar("HTTPResponseType", HttpResponse, LegacyHttpResponse)
+HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Headers describing the encoding of the body on the wire: the cache stores the decoded body
+_FRAMING_HEADERS = {"content-length", "transfer-encoding", "content-encoding"}
+_CONDITIONAL_HEADERS = ("if-match", "if-none-match", "if-modified-since", "if-unmodified-since", "range")
+# The context entry holding the validators added by the policy to revalidate a cached response
+_VALIDATORS_CONTEXT = "http_cache_validators"
+
+
+class HttpCacheBackend(abc.ABC):
+    """The storage of an :class:`~azure.core.pipeline.policies.HttpCachePolicy`.
+
+    An entry is a dict of JSON serializable values, except its "body" which is bytes.
+    Implementations must be thread-safe, and may evict entries at any time.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry stored under a key.
+
+        :param str key: The key of the entry.
+        :return: The entry, or None if there is none.
+        :rtype: dict or None
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry, replacing the entry of the key if any.
+
+        :param str key: The key of the entry.
+        :param dict entry: The entry.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry of a key, if any.
+
+        :param str key: The key of the entry.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all the entries."""
+
+
+class InMemoryHttpCache(HttpCacheBackend):
+    """An LRU cache in memory.
+
+    :keyword int max_entries: The maximum number of entries. Default value is 128.
+    """
+
+    def __init__(self, *, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileHttpCache(HttpCacheBackend):
+    """An LRU cache in a directory, one JSON file per entry.
+
+    The cache can be shared by several processes; the least recently used entries are the files with the
+    oldest modification time.
+
+    :param str directory: The directory of the cache. Created if it doesn't exist.
+    :keyword int max_entries: The maximum number of entries. Default value is 1024.
+    """
+
+    def __init__(self, directory: str, *, max_entries: int = 1024) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._files())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _files(self) -> List[str]:
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".json")]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as cache_file:
+                entry = json.loads(cache_file.read().decode("utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key:
+            return None
+        entry["body"] = base64.b64decode(entry["body"])
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        data = dict(entry, key=key, body=base64.b64encode(entry["body"]).decode("ascii"))
+        path = self._path(key)
+        temp_path = "{}.{}.{}.tmp".format(path, os.getpid(), threading.get_ident())
+        with self._lock:
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(json.dumps(data).encode("utf-8"))
+            os.replace(temp_path, path)
+            files = self._files()
+            if len(files) > self.max_entries:
+                files.sort(key=self._mtime)
+                for old_path in files[: len(files) - self.max_entries]:
+                    self._remove(old_path)
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+
+    def clear(self) -> None:
+        for path in self._files():
+            self._remove(path)
+
+
+def _cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header.
+
+    :param str value: The value of the header.
+    :return: The directives, lower-cased, with their value if any.
+    :rtype: dict[str, str or None]
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for directive in (value or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+class _HttpCachePolicyBase:
+    """Cache logic shared by the sync and async cache policies.
+
+    :keyword cache: The storage of the cached responses. Defaults to an
+     :class:`~azure.core.pipeline.policies.InMemoryHttpCache` of 128 entries.
+    :paramtype cache: ~azure.core.pipeline.policies.HttpCacheBackend
+    :keyword vary_headers: The request headers whose values select the cached response, in addition to the
+     headers listed by the Vary header of the responses. Default value is ("Accept", "Authorization").
+    :paramtype vary_headers: iterable[str]
+    :keyword int max_entry_size: The largest response body cached, in bytes. Default value is 1 MiB.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Optional[HttpCacheBackend] = None,
+        vary_headers: Iterable[str] = ("Accept", "Authorization"),
+        max_entry_size: int = 1024 * 1024,
+        **kwargs: Any  # pylint: disable=unused-argument
+    ) -> None:
+        super(_HttpCachePolicyBase, self).__init__()
+        self.cache = cache if cache is not None else InMemoryHttpCache()
+        self.vary_headers = [header.lower() for header in vary_headers]
+        self.max_entry_size = max_entry_size
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """The number of responses served from the cache, including the revalidated ones.
+
+        :return: The number of cache hits.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of cacheable requests sent without a usable cache entry.
+
+        :return: The number of cache misses.
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def revalidated(self) -> int:
+        """The number of responses served from the cache after the service answered 304 Not Modified.
+
+        :return: The number of revalidated hits.
+        :rtype: int
+        """
+        return self._revalidated
+
+    def _count(self, hit: bool, revalidated: bool = False) -> None:
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+                if revalidated:
+                    self._revalidated += 1
+            else:
+                self._misses += 1
+
+    @staticmethod
+    def _key(method: str, url: str) -> str:
+        return "{} {}".format(method, url)
+
+    def _vary_values(self, http_request: Any, names: Iterable[str]) -> Dict[str, str]:
+        """Hash the values of the request headers selecting a cached response.
+
+        Hashed so that credentials never reach the storage.
+
+        :param http_request: The request.
+        :type http_request: ~azure.core.rest.HttpRequest
+        :param names: The lower-cased header names.
+        :type names: iterable[str]
+        :return: The hashed value of each header.
+        :rtype: dict[str, str]
+        """
+        return {
+            name: hashlib.sha256((http_request.headers.get(name) or "").encode("utf-8")).hexdigest()
+            for name in sorted(set(names))
+        }
+
+    def _lookup(self, request: PipelineRequest[Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]], bool]:
+        """Find the cached response of a request.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The cache key, or None if the request bypasses the cache, the cached entry if any,
+         and whether the entry is fresh (can be served without revalidation).
+        :rtype: tuple[str or None, dict or None, bool]
+        """
+        http_request = request.http_request
+        # move 'http_cache' from options to context so it persists
+        # across retries but isn't passed to a transport implementation
+        option = request.context.options.pop("http_cache", None)
+        if option is not None:
+            request.context["http_cache"] = option
+        enabled = request.context.get("http_cache", True)
+        method = http_request.method.upper()
+        if method != "GET":
+            if method != "HEAD":
+                # A successful change invalidates the cached response of the resource
+                self.cache.delete(self._key("GET", http_request.url))
+            return None, None, False
+        request_directives = _cache_control(http_request.headers.get("Cache-Control"))
+        # The validators this policy added for a previous attempt are not conditions of the caller
+        added = {name.lower() for name in request.context.get(_VALIDATORS_CONTEXT) or {}}
+        if (
+            not enabled
+            or request.context.options.get("stream")
+            or "no-store" in request_directives
+            or any(header in http_request.headers and header not in added for header in _CONDITIONAL_HEADERS)
+        ):
+            return None, None, False
+        key = self._key(method, http_request.url)
+        entry = self.cache.get(key)
+        if entry is None or entry["vary"] != self._vary_values(http_request, entry["vary"]):
+            return key, None, False
+        if "no-cache" not in request_directives and entry["expires"] > time.time():
+            return key, entry, True
+        return key, entry, False
+
+    @staticmethod
+    def _add_validators(request: PipelineRequest[Any], entry: Dict[str, Any]) -> None:
+        """Add the validators of a cached entry to the request, to revalidate the entry.
+
+        The headers added are recorded in the context, to be removed once the response is received.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param dict entry: The cached entry.
+        """
+        headers = dict(entry["headers"])
+        validators = {}
+        if "etag" in headers:
+            validators["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            validators["If-Modified-Since"] = headers["last-modified"]
+        request.http_request.headers.update(validators)
+        request.context[_VALIDATORS_CONTEXT] = validators
+
+    @staticmethod
+    def _remove_validators(request: PipelineRequest[Any]) -> None:
+        """Remove the validators added to the request, so that a retry doesn't take them for the caller's.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        """
+        validators = request.context.pop(_VALIDATORS_CONTEXT, None) or {}
+        headers = request.http_request.headers
+        for name, value in validators.items():
+            if headers.get(name) == value:
+                del headers[name]
+
+    def _build_entry(
+        self,
+        http_request: Any,
+        status_code: int,
+        reason: Optional[str],
+        headers: Iterable[Tuple[str, str]],
+        body: bytes,
+    ) -> Optional[Dict[str, Any]]:
+        """Build the cache entry of a response, or None if it must not be stored.
+
+        :param http_request: The request.
+        :type http_request: ~azure.core.rest.HttpRequest
+        :param int status_code: The status code of the response.
+        :param str reason: The reason of the response.
+        :param headers: The headers of the response.
+        :type headers: iterable[tuple[str, str]]
+        :param bytes body: The decoded body of the response.
+        :return: The entry, or None.
+        :rtype: dict or None
+        """
+        stored_headers = [(name.lower(), value) for name, value in headers if name.lower() not in _FRAMING_HEADERS]
+        header_map = dict(stored_headers)
+        directives = _cache_control(header_map.get("cache-control"))
+        vary = [name.strip().lower() for name in header_map.get("vary", "").split(",") if name.strip()]
+        if "no-store" in directives or "*" in vary:
+            return None
+        max_age = 0.0
+        if "no-cache" not in directives:
+            try:
+                max_age = float(directives.get("max-age") or 0) - float(header_map.get("age") or 0)
+            except ValueError:
+                max_age = 0.0
+        if max_age <= 0 and "etag" not in header_map and "last-modified" not in header_map:
+            return None
+        return {
+            "status_code": status_code,
+            "reason": reason or "",
+            "headers": stored_headers,
+            "body": body,
+            "vary": self._vary_values(http_request, self.vary_headers + vary),
+            "expires": time.time() + max_age if max_age > 0 else 0.0,
+        }
+
+    def _is_cacheable(self, http_response: Any) -> bool:
+        if http_response.status_code != 200:
+            return False
+        try:
+            size = int(http_response.headers.get("Content-Length") or 0)
+        except ValueError:
+            size = 0
+        return size <= self.max_entry_size
+
+    def _store(self, key: str, http_response: Any, body: bytes) -> None:
+        if len(body) > self.max_entry_size:
+            return
+        entry = self._build_entry(
+            http_response.request,
+            http_response.status_code,
+            http_response.reason,
+            http_response.headers.items(),
+            body,
+        )
+        if entry is not None:
+            self.cache.set(key, entry)
+
+    def _revalidate(self, key: str, entry: Dict[str, Any], http_response: Any) -> Optional[Dict[str, Any]]:
+        """Refresh a cached entry with the headers of the 304 Not Modified response that validated it.
+
+        :param str key: The cache key.
+        :param dict entry: The cached entry.
+        :param http_response: The 304 response.
+        :type http_response: ~azure.core.rest.HttpResponse
+        :return: The refreshed entry.
+        :rtype: dict
+        """
+        updated = {name.lower(): value for name, value in http_response.headers.items()}
+        headers = [(name, updated.pop(name, value)) for name, value in entry["headers"]]
+        headers.extend((name, value) for name, value in updated.items() if name not in _FRAMING_HEADERS)
+        refreshed = self._build_entry(
+            http_response.request, entry["status_code"], entry["reason"], headers, entry["body"]
+        )
+        if refreshed is None:
+            self.cache.delete(key)
+            return dict(entry, headers=headers)
+        self.cache.set(key, refreshed)
+        return refreshed
+
+    @staticmethod
+    def _to_http_response(entry: Dict[str, Any], http_request: Any, response_type: Type[Any]) -> Any:
+        """Rebuild the response stored in a cache entry.
+
+        :param dict entry: The cache entry.
+        :param http_request: The request to attach to the response.
+        :type http_request: ~azure.core.rest.HttpRequest
+        :param type response_type: The type of response to build, initialized from a http.client response.
+        :return: The response, its body not read yet.
+        :rtype: ~azure.core.rest.HttpResponse
+        """
+        lines = ["HTTP/1.1 {} {}".format(entry["status_code"], entry["reason"])]
+        lines.extend("{}: {}".format(name, value) for name, value in entry["headers"])
+        lines.append("content-length: {}".format(len(entry["body"])))
+        data = ("\r\n".join(lines) + "\r\n\r\n").encode("iso-8859-1") + entry["body"]
+        internal_response = _HTTPResponse(BytesIOSocket(data), method=http_request.method)  # type: ignore
+        internal_response.begin()
+        if is_rest(http_request):
+            return response_type(request=http_request, internal_response=internal_response)
+        return response_type(http_request, internal_response)
+
+
+class HttpCachePolicy(_HttpCachePolicyBase, HTTPPolicy[HTTPRequestType, HTTPResponseType]):
+    """An opt-in cache of the GET responses.
+
+    Responses to GET requests with an ETag, a Last-Modified or a Cache-Control max-age header are stored,
+    keyed on the URL; their variant is selected by `vary_headers` and the Vary header of the response. A fresh
+    cached response is served without sending the request. Otherwise the request is revalidated with
+    If-None-Match / If-Modified-Since and, if the service answers 304 Not Modified, the cached response is
+    served. A PUT, PATCH, POST or DELETE request to a URL invalidates its cached response.
+
+    Streamed requests, requests with their own conditional headers or Range, and responses with
+    `Cache-Control: no-store` are never cached. Pass `http_cache=False` to a request to bypass the cache.
+
+    Add the policy after the authentication policy (e.g. in `per_retry_policies`) to select the cached response
+    on the Authorization header.
+
+    :keyword cache: The storage of the cached responses. Defaults to an
+     :class:`~azure.core.pipeline.policies.InMemoryHttpCache` of 128 entries.
+    :paramtype cache: ~azure.core.pipeline.policies.HttpCacheBackend
+    :keyword vary_headers: The request headers whose values select the cached response, in addition to the
+     headers listed by the Vary header of the responses. Default value is ("Accept", "Authorization").
+    :paramtype vary_headers: iterable[str]
+    :keyword int max_entry_size: The largest response body cached, in bytes. Default value is 1 MiB.
+    """
+
+    def send(self, request: PipelineRequest[HTTPRequestType]) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
+        """Serves the request from the cache if possible, otherwise sends it to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key, entry, fresh = self._lookup(request)
+        if key is None:
+            return self.next.send(request)
+        if entry is not None and fresh:
+            self._count(hit=True)
+            return self._cached_response(request, entry)
+        if entry is not None:
+            self._add_validators(request, entry)
+        try:
+            response = self.next.send(request)
+        finally:
+            self._remove_validators(request)
+        http_response: Any = response.http_response
+        if entry is not None and http_response.status_code == 304:
+            entry = self._revalidate(key, entry, http_response)
+            self._count(hit=True, revalidated=True)
+            return self._cached_response(request, entry, response.context)
+        self._count(hit=False)
+        if self._is_cacheable(http_response):
+            rest = is_rest(http_response)
+            body = http_response.read() if rest else http_response.body()
+            self._store(key, http_response, body)
+        return response
+
+    def _cached_response(
+        self,
+        request: PipelineRequest[HTTPRequestType],
+        entry: Any,
+        context: Any = None,
+    ) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
+        response_type: Union[Type[RestHttpClientTransportResponse], Type[LegacyHttpClientTransportResponse]]
+        rest = is_rest(request.http_request)
+        if rest:
+            response_type = RestHttpClientTransportResponse
+        else:
+            response_type = LegacyHttpClientTransportResponse
+        http_response: Any = self._to_http_response(entry, request.http_request, response_type)
+        if rest:
+            http_response.read()
+        else:
+            http_response.body()
+        return PipelineResponse(request.http_request, http_response, context or request.context)
@@ -0,0 +1,116 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module provides the async flavor of the opt-in HTTP cache policy.
+"""
+from typing import TypeVar, Any, Type, Union
+
+from azure.core.pipeline import PipelineResponse, PipelineRequest
+from azure.core.pipeline.transport import (
+    AsyncHttpResponse as LegacyAsyncHttpResponse,
+    HttpRequest as LegacyHttpRequest,
+)
+from azure.core.pipeline.transport._base_async import (
+    AsyncHttpClientTransportResponse as LegacyAsyncHttpClientTransportResponse,
+)
+from azure.core.rest import AsyncHttpResponse, HttpRequest
+from .._tools import is_rest
+from ._base_async import AsyncHTTPPolicy
+from ._cache import _HttpCachePolicyBase
+
+AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType", AsyncHttpResponse, LegacyAsyncHttpResponse)
+HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
+
+
+class AsyncHttpCachePolicy(_HttpCachePolicyBase, AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]):
+    """Async flavor of the opt-in cache of the GET responses.
+
+    See :class:`~azure.core.pipeline.policies.HttpCachePolicy` for the caching rules. The backend is called
+    synchronously: prefer the in-memory backend on the event loop.
+
+    :keyword cache: The storage of the cached responses. Defaults to an
+     :class:`~azure.core.pipeline.policies.InMemoryHttpCache` of 128 entries.
+    :paramtype cache: ~azure.core.pipeline.policies.HttpCacheBackend
+    :keyword vary_headers: The request headers whose values select the cached response, in addition to the
+     headers listed by the Vary header of the responses. Default value is ("Accept", "Authorization").
+    :paramtype vary_headers: iterable[str]
+    :keyword int max_entry_size: The largest response body cached, in bytes. Default value is 1 MiB.
+    """
+
+    async def send(
+        self, request: PipelineRequest[HTTPRequestType]
+    ) -> PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]:
+        """Serves the request from the cache if possible, otherwise sends it to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key, entry, fresh = self._lookup(request)
+        if key is None:
+            return await self.next.send(request)
+        if entry is not None and fresh:
+            self._count(hit=True)
+            return await self._cached_response(request, entry)
+        if entry is not None:
+            self._add_validators(request, entry)
+        try:
+            response = await self.next.send(request)
+        finally:
+            self._remove_validators(request)
+        http_response: Any = response.http_response
+        if entry is not None and http_response.status_code == 304:
+            entry = self._revalidate(key, entry, http_response)
+            self._count(hit=True, revalidated=True)
+            return await self._cached_response(request, entry, response.context)
+        self._count(hit=False)
+        if self._is_cacheable(http_response):
+            rest = is_rest(http_response)
+            body = await http_response.read() if rest else http_response.body()
+            self._store(key, http_response, body)
+        return response
+
+    async def _cached_response(
+        self,
+        request: PipelineRequest[HTTPRequestType],
+        entry: Any,
+        context: Any = None,
+    ) -> PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]:
+        from azure.core.rest._http_response_impl_async import RestAsyncHttpClientTransportResponse
+
+        response_type: Union[Type[RestAsyncHttpClientTransportResponse], Type[LegacyAsyncHttpClientTransportResponse]]
+        rest = is_rest(request.http_request)
+        if rest:
+            response_type = RestAsyncHttpClientTransportResponse
+        else:
+            response_type = LegacyAsyncHttpClientTransportResponse
+        http_response: Any = self._to_http_response(entry, request.http_request, response_type)
+        if rest:
+            await http_response.read()
+        else:
+            http_response.body()
+        return PipelineResponse(request.http_request, http_response, context or request.context)
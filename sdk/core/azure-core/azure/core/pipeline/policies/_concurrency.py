@@ -0,0 +1,250 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module provides a client-side adaptive concurrency limit policy.
+"""
+import logging
+import threading
+import time
+from typing import TypeVar, Any, Callable, Dict, List, Optional
+
+from azure.core.pipeline import PipelineResponse, PipelineRequest
+from azure.core.pipeline.transport import (
+    HttpResponse as LegacyHttpResponse,
+    HttpRequest as LegacyHttpRequest,
+)
+from azure.core.rest import HttpResponse, HttpRequest
+from ._base import HTTPPolicy
+from ._utils import get_domain, get_retry_after
+
+HTTPResponseType = TypeVar("HTTPResponseType", HttpResponse, LegacyHttpResponse)
+HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _LimitState:
+    """Concurrency limit and in-flight requests of one key."""
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.waiters: List[Callable[[], Any]] = []
+
+
+class AdaptiveConcurrencyLimiter:
+    """Adaptive concurrency limits, shared by the requests of one or several clients.
+
+    Requests are grouped by key (by default the host of the request). Each key has a concurrency limit,
+    adapted with AIMD (additive increase, multiplicative decrease): every successful response raises the limit
+    by 1/limit (so roughly by one per round of requests), every throttled response (429 or 503) multiplies it
+    by `backoff_ratio`, at most once per round of requests. A `Retry-After` header on a throttled response
+    also holds the new requests of the key until it expires.
+
+    Pass the same limiter to the :class:`~azure.core.pipeline.policies.AdaptiveConcurrencyPolicy` or
+    :class:`~azure.core.pipeline.policies.AsyncAdaptiveConcurrencyPolicy` of several clients to share the limits.
+
+    :keyword int initial_limit: The limit of a key before any response was received. Default value is 16.
+    :keyword int min_limit: The lowest limit. Default value is 1.
+    :keyword int max_limit: The highest limit. Default value is 256.
+    :keyword float backoff_ratio: The ratio applied to the limit on throttling. Default value is 0.5.
+    :keyword throttle_status_codes: The status codes signaling throttling. Default value is {429, 503}.
+    :paramtype throttle_status_codes: set[int]
+    :keyword key: The key of a request. Defaults to the host of the request. Return, for example,
+     the host and the operation to have a limit per operation.
+    :paramtype key: callable[[~azure.core.pipeline.PipelineRequest], str]
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff_ratio: float = 0.5,
+        throttle_status_codes: Optional[set] = None,
+        key: Optional[Callable[[PipelineRequest[Any]], str]] = None,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.throttle_status_codes = throttle_status_codes or {429, 503}
+        self._key = key or (lambda request: get_domain(request.http_request.url))
+        self._states: Dict[str, _LimitState] = {}
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+
+    def key(self, request: PipelineRequest[Any]) -> str:
+        """The key grouping the request with the other requests sharing its limit.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The key.
+        :rtype: str
+        """
+        return self._key(request)
+
+    def get_limit(self, key: str) -> int:
+        """The current concurrency limit of a key.
+
+        :param str key: The key.
+        :return: The maximum number of concurrent requests.
+        :rtype: int
+        """
+        with self._lock:
+            return int(self._state(key).limit)
+
+    def get_in_flight(self, key: str) -> int:
+        """The number of requests of a key currently sent.
+
+        :param str key: The key.
+        :return: The number of requests in flight.
+        :rtype: int
+        """
+        with self._lock:
+            return self._state(key).in_flight
+
+    def _state(self, key: str) -> _LimitState:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _LimitState(self.initial_limit)
+        return state
+
+    def try_acquire(self, key: str, waiter: Optional[Callable[[], Any]] = None) -> Optional[float]:
+        """Take a slot for a request, without blocking.
+
+        :param str key: The key of the request.
+        :param callable waiter: If no slot is free, called (once) when one may have been released.
+        :return: None if a slot was taken. Otherwise the time to wait in seconds if the key is held by a
+         Retry-After, or 0.0 if all the slots are in use.
+        :rtype: float or None
+        """
+        with self._lock:
+            return self._try_acquire(key, waiter)
+
+    def _try_acquire(self, key: str, waiter: Optional[Callable[[], Any]]) -> Optional[float]:
+        state = self._state(key)
+        delay = state.blocked_until - time.monotonic()
+        if delay > 0:
+            return delay
+        if state.in_flight < int(state.limit):
+            state.in_flight += 1
+            return None
+        if waiter is not None:
+            state.waiters.append(waiter)
+        return 0.0
+
+    def acquire(self, key: str) -> float:
+        """Take a slot for a request, blocking until one is available.
+
+        :param str key: The key of the request.
+        :return: The time the request started, to pass to :meth:`release`.
+        :rtype: float
+        """
+        with self._condition:
+            while True:
+                delay = self._try_acquire(key, None)
+                if delay is None:
+                    return time.monotonic()
+                self._condition.wait(delay or None)
+
+    def release(self, key: str, started: float, response: Optional[PipelineResponse[Any, Any]] = None) -> None:
+        """Free the slot of a request and adapt the limit to its response.
+
+        :param str key: The key of the request.
+        :param float started: The time the request started, as returned by :meth:`acquire`.
+        :param response: The response, or None if the request failed without response.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        """
+        retry_after = None
+        throttled = False
+        if response is not None:
+            throttled = response.http_response.status_code in self.throttle_status_codes
+            if throttled:
+                retry_after = get_retry_after(response)
+        with self._condition:
+            state = self._state(key)
+            state.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                # The requests started before the last decrease don't reflect the current limit
+                if started >= state.last_decrease:
+                    state.limit = max(self.min_limit, state.limit * self.backoff_ratio)
+                    state.last_decrease = now
+                if retry_after:
+                    state.blocked_until = max(state.blocked_until, now + retry_after)
+            elif response is not None:
+                state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+            waiters, state.waiters = state.waiters, []
+            self._condition.notify_all()
+        for waiter in waiters:
+            # A failing waiter must not keep the others from being woken up
+            try:
+                waiter()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.warning("A waiter of the concurrency limiter failed", exc_info=True)
+
+
+class AdaptiveConcurrencyPolicy(HTTPPolicy[HTTPRequestType, HTTPResponseType]):
+    """A policy limiting the number of concurrent requests to a host, adapting the limit to throttling.
+
+    Each attempt waits for a slot of the :class:`~azure.core.pipeline.policies.AdaptiveConcurrencyLimiter`
+    before being sent, so add it after the retry policy (e.g. in `per_retry_policies`) to have every retry
+    gated and observed. Share the limiter between clients to limit their requests together.
+
+    :param limiter: The limiter. If omitted, the policy has its own.
+    :type limiter: ~azure.core.pipeline.policies.AdaptiveConcurrencyLimiter
+    """
+
+    def __init__(
+        self, limiter: Optional[AdaptiveConcurrencyLimiter] = None, **kwargs: Any  # pylint: disable=unused-argument
+    ) -> None:
+        super(AdaptiveConcurrencyPolicy, self).__init__()
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+
+    def send(self, request: PipelineRequest[HTTPRequestType]) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
+        """Waits for a slot, then sends the PipelineRequest object to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key = self.limiter.key(request)
+        started = self.limiter.acquire(key)
+        response = None
+        try:
+            response = self.next.send(request)
+        finally:
+            self.limiter.release(key, started, response)
+        return response
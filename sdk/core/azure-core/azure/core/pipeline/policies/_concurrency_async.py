@@ -0,0 +1,121 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module provides the async client-side adaptive concurrency limit policy.
+"""
+import functools
+import time
+from typing import TypeVar, Any, Optional, cast
+
+from azure.core.pipeline import PipelineResponse, PipelineRequest
+from azure.core.pipeline.transport import (
+    AsyncHttpResponse as LegacyAsyncHttpResponse,
+    HttpRequest as LegacyHttpRequest,
+    AsyncHttpTransport,
+)
+from azure.core.rest import AsyncHttpResponse, HttpRequest
+from ._base_async import AsyncHTTPPolicy
+from ._concurrency import AdaptiveConcurrencyLimiter
+
+AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType", AsyncHttpResponse, LegacyAsyncHttpResponse)
+HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
+
+# Polling interval when waiting for a slot outside of asyncio (e.g. trio)
+_POLL_INTERVAL = 0.01
+
+
+def _set_result(future: Any) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AsyncAdaptiveConcurrencyPolicy(AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]):
+    """Async flavor of the adaptive concurrency limit policy.
+
+    Each attempt waits for a slot of the :class:`~azure.core.pipeline.policies.AdaptiveConcurrencyLimiter`
+    before being sent, so add it after the retry policy (e.g. in `per_retry_policies`) to have every retry
+    gated and observed. The limiter can be shared with sync and async clients.
+
+    :param limiter: The limiter. If omitted, the policy has its own.
+    :type limiter: ~azure.core.pipeline.policies.AdaptiveConcurrencyLimiter
+    """
+
+    def __init__(
+        self, limiter: Optional[AdaptiveConcurrencyLimiter] = None, **kwargs: Any  # pylint: disable=unused-argument
+    ) -> None:
+        super(AsyncAdaptiveConcurrencyPolicy, self).__init__()
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+
+    async def _acquire(self, key: str, request: PipelineRequest[HTTPRequestType]) -> float:
+        """Take a slot for the request, waiting until one is available.
+
+        :param str key: The key of the request.
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The time the request started.
+        :rtype: float
+        """
+        try:
+            import asyncio  # pylint: disable=do-not-import-asyncio
+
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        transport = cast(AsyncHttpTransport, request.context.transport)
+        while True:
+            if loop is None:
+                delay = self.limiter.try_acquire(key)
+                if delay is None:
+                    return time.monotonic()
+                await transport.sleep(delay or _POLL_INTERVAL)
+                continue
+            future = loop.create_future()
+            delay = self.limiter.try_acquire(key, functools.partial(loop.call_soon_threadsafe, _set_result, future))
+            if delay is None:
+                return time.monotonic()
+            if delay:
+                await asyncio.sleep(delay)
+            else:
+                await future
+
+    async def send(
+        self, request: PipelineRequest[HTTPRequestType]
+    ) -> PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]:
+        """Waits for a slot, then sends the PipelineRequest object to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key = self.limiter.key(request)
+        started = await self._acquire(key, request)
+        response = None
+        try:
+            response = await self.next.send(request)
+        finally:
+            self.limiter.release(key, started, response)
+        return response
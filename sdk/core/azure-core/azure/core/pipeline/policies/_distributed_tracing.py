@@ -123,14 +123,11 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
             span_impl_type = settings.tracing_implementation()
             namer = ctxt.pop("network_span_namer", self._network_span_namer)
             tracing_attributes = ctxt.pop("tracing_attributes", self._tracing_attributes)
-            span_name = namer(request.http_request)
-
-            span_attributes = {**tracing_attributes, **tracing_options.get("attributes", {})}
 
             if span_impl_type:
                 # If the plugin is enabled, prioritize it over the core tracing.
-                span = span_impl_type(name=span_name, kind=SpanKind.CLIENT)
-                for attr, value in span_attributes.items():
+                span = span_impl_type(name=namer(request.http_request), kind=SpanKind.CLIENT)
+                for attr, value in {**tracing_attributes, **tracing_options.get("attributes", {})}.items():
                     span.add_attribute(attr, value)  # type: ignore
 
                 with change_context(span.span_instance):
@@ -152,19 +149,23 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
                     )
                     return
 
-                otel_span = tracer.start_span(
-                    name=span_name,
-                    kind=SpanKind.CLIENT,
-                    attributes=span_attributes,
-                )
-
-                with tracer.use_span(otel_span, end_on_exit=False):
-                    trace_context_headers = tracer.get_trace_context()
-                    request.http_request.headers.update(trace_context_headers)
+                # pylint: disable=protected-access
+                if settings.tracing_head_sampling() and tracer._is_current_span_sampled_out():
+                    # The head of the trace already decided not to sample it, so no span is created for this call.
+                    # The trace context of the parent is still propagated, for the service to honor the decision.
+                    request.http_request.headers.update(tracer._get_current_trace_context())
+                    otel_span = None
+                else:
+                    otel_span = tracer.start_span(
+                        name=namer(request.http_request),
+                        kind=SpanKind.CLIENT,
+                        attributes={**tracing_attributes, **tracing_options.get("attributes", {})},
+                    )
+                    request.http_request.headers.update(tracer._get_span_trace_context(otel_span))
 
                 request.context[self.TRACING_CONTEXT] = otel_span
-                token = tracer._suppress_auto_http_instrumentation()  # pylint: disable=protected-access
-                request.context[self._SUPPRESSION_TOKEN] = token
+                request.context[self._SUPPRESSION_TOKEN] = tracer._suppress_auto_http_instrumentation()
+                # pylint: enable=protected-access
 
         except Exception:  # pylint: disable=broad-except
             _LOGGER.warning("Unable to start network span.")
@@ -188,7 +189,36 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
             return
 
         span = request.context[self.TRACING_CONTEXT]
-        if not span:
+        if span:
+            self._finish_span(span, request, response, exc_info)
+
+        suppression_token = request.context.get(self._SUPPRESSION_TOKEN)
+        if suppression_token:
+            tracer = get_tracer()
+            if tracer:
+                tracer._detach_from_context(suppression_token)  # pylint: disable=protected-access
+
+    def _finish_span(
+        self,
+        span: Any,
+        request: PipelineRequest[HTTPRequestType],
+        response: Optional[HTTPResponseType] = None,
+        exc_info: Optional[OptExcInfo] = None,
+    ) -> None:
+        """Sets the attributes of the span that is tracing the network and ends it.
+
+        :param span: The span to end, either a plugin span or an OpenTelemetry span
+        :type span: ~azure.core.tracing.AbstractSpan or ~opentelemetry.trace.Span
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param response: The HttpResponse object
+        :type response: ~azure.core.rest.HTTPResponse or ~azure.core.pipeline.transport.HttpResponse
+        :param exc_info: The exception information
+        :type exc_info: tuple
+        """
+        if not hasattr(span, "set_http_attributes") and not span.is_recording():
+            # Native span dropped by the sampler: none of its attributes would be exported.
+            span.end()
             return
 
         http_request: Union[HttpRequest, LegacyHttpRequest] = request.http_request
@@ -228,12 +258,6 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
             else:
                 span.end()
 
-        suppression_token = request.context.get(self._SUPPRESSION_TOKEN)
-        if suppression_token:
-            tracer = get_tracer()
-            if tracer:
-                tracer._detach_from_context(suppression_token)  # pylint: disable=protected-access
-
     def on_response(
         self,
         request: PipelineRequest[HTTPRequestType],
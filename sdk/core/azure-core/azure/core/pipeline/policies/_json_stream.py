@@ -0,0 +1,400 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+Incremental decoding of JSON arrays, used by ContentDecodePolicy to stream list pages.
+"""
+
+import codecs
+import collections
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Deque, Dict, IO, Iterable, Iterator, List, Optional, Union
+
+from azure.core.exceptions import DecodeError
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Next character that may end a value: a string, a container, a number or a literal respectively
+_STRING_SPECIAL = re.compile(r'["\\]')
+_CONTAINER_SPECIAL = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r"[ \t\n\r,\]}]")
+
+# Parser states
+_START = 0
+_MEMBER_FIRST = 1
+_MEMBER_NEXT = 2
+_MEMBER_KEY = 3
+_MEMBER_COLON = 4
+_MEMBER_VALUE = 5
+_ARRAY_OPEN = 6
+_ITEM_FIRST = 7
+_ITEM = 8
+_ITEM_NEXT = 9
+_END = 10
+
+_STREAM_CHUNK_SIZE = 4096
+
+
+class _JsonArrayItemParser:
+    """Push parser yielding the items of one JSON array as soon as each of them is complete.
+
+    Only the item being decoded is buffered. If ``item_path`` is given, the document must be an object
+    and the items are taken from the array stored under that member; every other top-level member is
+    decoded into ``metadata``. If ``item_path`` is None, the document itself must be an array.
+
+    :param item_path: Name of the top-level member holding the array, or None if the document is the array.
+    :type item_path: str or None
+    """
+
+    def __init__(self, item_path: Optional[str] = "value") -> None:
+        self.item_path = item_path
+        self.metadata: Dict[str, Any] = {}
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key: Optional[str] = None
+        # The chunks of the value that is not complete yet, joined once the value is complete
+        self._partial: List[str] = []
+        # Scan of the incomplete value: whether it is a number or a literal, its nesting depth,
+        # whether it is inside a string, and whether the previous chunk ended with a backslash in a string
+        self._scalar = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Feed the next chunk of the body.
+
+        :param bytes data: The next chunk of the body
+        :return: The array items that were completed by this chunk
+        :rtype: list[any]
+        :raises ValueError: If the data is not valid JSON
+        """
+        text = self._text_decoder.decode(data)
+        if self._partial:
+            # Only the new text is scanned while the value is incomplete
+            self._partial.append(text)
+            if self._scan(text, 0) is None:
+                return []
+            self._buffer = "".join(self._partial)
+            self._partial = []
+        else:
+            self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body.
+
+        :return: The remaining array items
+        :rtype: list[any]
+        :raises ValueError: If the document is incomplete or not valid JSON
+        """
+        self._partial.append(self._buffer[self._pos :])
+        self._partial.append(self._text_decoder.decode(b"", final=True))
+        self._buffer = "".join(self._partial)
+        self._partial = []
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != _END:
+            raise ValueError("Unexpected end of JSON document")
+        return items
+
+    def _next_char(self) -> str:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore
+        return self._buffer[self._pos : self._pos + 1]
+
+    def _scan(self, text: str, pos: int) -> Optional[int]:
+        """Continue the scan of the incomplete value, tracking its nesting and strings, to find where it ends.
+
+        :param str text: The text following what was scanned so far
+        :param int pos: The position of the scan in the text
+        :return: The position following the value in the text, or None if the value continues after the text
+        :rtype: int or None
+        """
+        if self._scalar:
+            # A number or a literal is only complete once followed by a delimiter, the next chunk may continue it
+            match = _SCALAR_END.search(text, pos)
+            return match.start() if match else None
+        if self._escape:
+            if pos == len(text):
+                return None
+            # Skip the escaped character
+            pos += 1
+            self._escape = False
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, pos)
+                if not match:
+                    return None
+                pos = match.end()
+                if match.group() == "\\":
+                    if pos == len(text):
+                        self._escape = True
+                        return None
+                    pos += 1
+                    continue
+                self._in_string = False
+            else:
+                match = _CONTAINER_SPECIAL.search(text, pos)
+                if not match:
+                    return None
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                    continue
+                self._depth += 1 if char in "[{" else -1
+            if not self._depth:
+                return pos
+
+    def _decode_value(self, final: bool) -> Any:
+        first = self._next_char()
+        if not first and not final:
+            raise _NeedMoreData()
+        self._scalar = first not in ('"', "[", "{")
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        if self._scan(self._buffer, self._pos) is None and not final:
+            # Keep the start of the value aside until the chunk completing it comes
+            self._partial = [self._buffer[self._pos :]]
+            self._buffer = ""
+            self._pos = 0
+            raise _NeedMoreData()
+        # The value is complete, so it is decoded once
+        value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError("Expecting '{}' at position {}, found {!r}".format(expected, self._pos, char))
+        self._pos += 1
+
+    def _parse(self, final: bool) -> List[Any]:  # pylint: disable=too-many-branches,too-many-statements
+        items: List[Any] = []
+        try:
+            while True:
+                state = self._state
+                if state in (_ITEM, _MEMBER_KEY, _MEMBER_VALUE):
+                    value = self._decode_value(final)
+                    if state == _ITEM:
+                        items.append(value)
+                        self._state = _ITEM_NEXT
+                    elif state == _MEMBER_KEY:
+                        if not isinstance(value, str):
+                            raise ValueError("Expecting property name, found {!r}".format(value))
+                        self._key = value
+                        self._state = _MEMBER_COLON
+                    else:
+                        self.metadata[self._key] = value  # type: ignore
+                        self._state = _MEMBER_NEXT
+                    continue
+
+                char = self._next_char()
+                if not char:
+                    return items
+                if state == _START:
+                    if self.item_path is None:
+                        self._expect(char, "[")
+                        self._state = _ITEM_FIRST
+                    else:
+                        self._expect(char, "{")
+                        self._state = _MEMBER_FIRST
+                elif state == _MEMBER_FIRST:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _END
+                    else:
+                        self._state = _MEMBER_KEY
+                elif state == _MEMBER_NEXT:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _END
+                    else:
+                        self._expect(char, ",")
+                        self._state = _MEMBER_KEY
+                elif state == _MEMBER_COLON:
+                    self._expect(char, ":")
+                    self._state = _ARRAY_OPEN if self._key == self.item_path else _MEMBER_VALUE
+                elif state == _ARRAY_OPEN:
+                    if char == "[":
+                        self._pos += 1
+                        self._state = _ITEM_FIRST
+                    else:
+                        # Not an array (e.g. null), keep it as a regular member
+                        self._state = _MEMBER_VALUE
+                elif state == _ITEM_FIRST:
+                    if char == "]":
+                        self._pos += 1
+                        self._state = _END if self.item_path is None else _MEMBER_NEXT
+                    else:
+                        self._state = _ITEM
+                elif state == _ITEM_NEXT:
+                    if char == "]":
+                        self._pos += 1
+                        self._state = _END if self.item_path is None else _MEMBER_NEXT
+                    else:
+                        self._expect(char, ",")
+                        self._state = _ITEM
+                else:
+                    raise ValueError("Extra data at position {}".format(self._pos))
+        except _NeedMoreData:
+            return items
+
+
+class _NeedMoreData(Exception):
+    """Raised internally when the buffered text does not hold a complete value yet."""
+
+
+def _iter_chunks(data: Union[Iterable[bytes], IO[bytes]]) -> Iterator[bytes]:
+    if hasattr(data, "read"):
+        return iter(lambda: data.read(_STREAM_CHUNK_SIZE), b"")  # type: ignore
+    return iter(data)  # type: ignore
+
+
+class JsonItemIterator(Iterator[Any]):
+    """Iterator over the items of a JSON array, decoded incrementally from a byte stream.
+
+    Once the iterator is exhausted, ``metadata`` holds the other top-level members of the document
+    (e.g. "nextLink").
+
+    :param data: The body, as an iterator of bytes or a file-like object
+    :type data: iterable[bytes] or IO[bytes]
+    :param item_path: Name of the top-level member holding the array, or None if the document is the array.
+    :type item_path: str or None
+    :keyword response: If passed, DecodeError will be annotated with that response
+    :paramtype response: any
+    """
+
+    def __init__(
+        self,
+        data: Union[Iterable[bytes], IO[bytes]],
+        item_path: Optional[str] = "value",
+        *,
+        response: Any = None,
+    ) -> None:
+        self._chunks = _iter_chunks(data)
+        self._parser = _JsonArrayItemParser(item_path)
+        self._pending: Deque[Any] = collections.deque()
+        self._exhausted = False
+        self._response = response
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """The top-level members of the document, except the streamed array.
+
+        :return: The members decoded so far
+        :rtype: dict[str, any]
+        """
+        return self._parser.metadata
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        while not self._pending:
+            if self._exhausted:
+                raise StopIteration
+            try:
+                try:
+                    chunk = next(self._chunks)
+                except StopIteration:
+                    self._exhausted = True
+                    self._pending.extend(self._parser.close())
+                else:
+                    self._pending.extend(self._parser.feed(chunk))
+            except ValueError as err:
+                self._exhausted = True
+                raise DecodeError(
+                    message="JSON is invalid: {}".format(err),
+                    response=self._response,
+                    error=err,
+                ) from err
+        return self._pending.popleft()
+
+
+class AsyncJsonItemIterator(AsyncIterator[Any]):
+    """Async iterator over the items of a JSON array, decoded incrementally from a byte stream.
+
+    Once the iterator is exhausted, ``metadata`` holds the other top-level members of the document
+    (e.g. "nextLink").
+
+    :param data: The body, as an async iterator of bytes
+    :type data: asynciterable[bytes]
+    :param item_path: Name of the top-level member holding the array, or None if the document is the array.
+    :type item_path: str or None
+    :keyword response: If passed, DecodeError will be annotated with that response
+    :paramtype response: any
+    """
+
+    def __init__(
+        self,
+        data: AsyncIterable[bytes],
+        item_path: Optional[str] = "value",
+        *,
+        response: Any = None,
+    ) -> None:
+        self._chunks = data.__aiter__()
+        self._parser = _JsonArrayItemParser(item_path)
+        self._pending: Deque[Any] = collections.deque()
+        self._exhausted = False
+        self._response = response
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """The top-level members of the document, except the streamed array.
+
+        :return: The members decoded so far
+        :rtype: dict[str, any]
+        """
+        return self._parser.metadata
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._pending:
+            if self._exhausted:
+                raise StopAsyncIteration
+            try:
+                try:
+                    chunk = await self._chunks.__anext__()
+                except StopAsyncIteration:
+                    self._exhausted = True
+                    self._pending.extend(self._parser.close())
+                else:
+                    self._pending.extend(self._parser.feed(chunk))
+            except ValueError as err:
+                self._exhausted = True
+                raise DecodeError(
+                    message="JSON is invalid: {}".format(err),
+                    response=self._response,
+                    error=err,
+                ) from err
+        return self._pending.popleft()
@@ -23,11 +23,17 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
-from typing import TypeVar, Any, Dict, Optional, Type, List, Union, cast, IO
+from typing import TypeVar, Any, Dict, Optional, Type, List, Union, cast, IO, Deque, Tuple
 from io import SEEK_SET, UnsupportedOperation
+import collections
+import contextvars
+import copy
 import logging
+import queue
+import threading
 import time
 from enum import Enum
+from urllib.parse import urlparse
 from azure.core.configuration import ConnectionConfiguration
 from azure.core.pipeline import PipelineResponse, PipelineRequest, PipelineContext
 from azure.core.pipeline.transport import (
@@ -71,12 +77,50 @@ class RetryMode(str, Enum, metaclass=CaseInsensitiveEnumMeta):
     Fixed = "fixed"
 
 
+class _HostLatencies:
+    """Sliding window of the latencies observed per host, used to compute the hedging delay.
+
+    :param int window: The number of latencies kept per host.
+    :param int min_samples: The number of latencies needed before a quantile is computed.
+    """
+
+    def __init__(self, window: int = 256, min_samples: int = 20) -> None:
+        self._window = window
+        self._min_samples = min_samples
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, host: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(host)
+            if latencies is None:
+                latencies = self._latencies[host] = collections.deque(maxlen=self._window)
+            latencies.append(latency)
+
+    def quantile(self, host: str, percentile: float) -> Optional[float]:
+        """The latency under which `percentile` percent of the requests to the host completed.
+
+        :param str host: The host.
+        :param float percentile: The percentile, between 0 and 100.
+        :return: The latency in seconds, or None if not enough requests were observed.
+        :rtype: float or None
+        """
+        with self._lock:
+            latencies = self._latencies.get(host)
+            if latencies is None or len(latencies) < self._min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(int(len(ordered) * percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+
 class RetryPolicyBase:
     # pylint: disable=too-many-instance-attributes
     #: Maximum backoff time.
     BACKOFF_MAX = 120
     _SAFE_CODES = set(range(506)) - set([408, 429, 500, 502, 503, 504])
     _RETRY_CODES = set(range(999)) - _SAFE_CODES
+    _HEDGING_METHODS = frozenset(["GET", "HEAD"])
 
     def __init__(self, **kwargs: Any) -> None:
         self.total_retries: int = kwargs.pop("retry_total", 10)
@@ -87,6 +131,10 @@ class RetryPolicyBase:
         self.backoff_max: int = kwargs.pop("retry_backoff_max", self.BACKOFF_MAX)
         self.retry_mode: RetryMode = kwargs.pop("retry_mode", RetryMode.Exponential)
         self.timeout: int = kwargs.pop("timeout", 604800)
+        self.hedging: bool = kwargs.pop("retry_hedging", False)
+        self.hedging_percentile: float = kwargs.pop("retry_hedging_percentile", 95)
+        self.hedging_min_delay: float = kwargs.pop("retry_hedging_min_delay", 0.01)
+        self._latencies = _HostLatencies()
 
         retry_codes = self._RETRY_CODES
         status_codes = kwargs.pop("retry_on_status_codes", [])
@@ -121,6 +169,7 @@ class RetryPolicyBase:
             "max_backoff": options.pop("retry_backoff_max", self.BACKOFF_MAX),
             "methods": options.pop("retry_on_methods", self._method_whitelist),
             "timeout": options.pop("timeout", self.timeout),
+            "hedging": options.pop("retry_hedging", self.hedging),
             "history": [],
         }
 
@@ -389,6 +438,45 @@ class RetryPolicyBase:
                 # transport.connection_config.timeout is something unexpected (not a number)
                 pass
 
+    def _hedging_host(self, settings: Dict[str, Any], request: PipelineRequest[HTTPRequestType]) -> Optional[str]:
+        """The host whose latencies drive the hedging of this request, None if the request is not hedged.
+
+        :param dict settings: The retry settings.
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The host of the request, or None if hedging doesn't apply.
+        :rtype: str or None
+        """
+        if not settings.get("hedging") or request.http_request.method.upper() not in self._HEDGING_METHODS:
+            return None
+        return urlparse(request.http_request.url).netloc
+
+    def _hedging_delay(self, host: str) -> Optional[float]:
+        """How long to wait for a response before sending a duplicate request.
+
+        :param str host: The host of the request.
+        :return: The delay in seconds, or None if the host latencies are not known yet.
+        :rtype: float or None
+        """
+        latency = self._latencies.quantile(host, self.hedging_percentile)
+        if latency is None:
+            return None
+        return max(latency, self.hedging_min_delay)
+
+    @staticmethod
+    def _copy_request(request: PipelineRequest[HTTPRequestType]) -> PipelineRequest[HTTPRequestType]:
+        """Copy a request so that a duplicate can go through the next policies concurrently.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: A PipelineRequest with its own HTTP request and context.
+        :rtype: ~azure.core.pipeline.PipelineRequest
+        """
+        context = PipelineContext(request.context.transport, **request.context.options)
+        for key, value in request.context.items():
+            context[key] = value
+        return PipelineRequest(copy.deepcopy(request.http_request), context)
+
     def _configure_positions(self, request: PipelineRequest[HTTPRequestType], retry_settings: Dict[str, Any]) -> None:
         body_position = None
         file_positions: Optional[Dict[str, int]] = None
@@ -416,6 +504,20 @@ class RetryPolicyBase:
         retry_settings["file_positions"] = file_positions
 
 
+def _close_response(response: Optional[PipelineResponse[Any, Any]]) -> None:
+    """Close the response of the attempt that lost a hedged request.
+
+    :param response: The PipelineResponse object.
+    :type response: ~azure.core.pipeline.PipelineResponse
+    """
+    if response is None:
+        return
+    try:
+        response.http_response.close()
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Failed to close the response of a hedged request", exc_info=True)
+
+
 class RetryPolicy(RetryPolicyBase, HTTPPolicy[HTTPRequestType, HTTPResponseType]):
     """A retry policy.
 
@@ -439,6 +541,15 @@ class RetryPolicy(RetryPolicyBase, HTTPPolicy[HTTPRequestType, HTTPResponseType]
     :keyword int retry_backoff_max: The maximum back off time. Default value is 120 seconds (2 minutes).
     :keyword RetryMode retry_mode: Fixed or exponential delay between attemps, default is exponential.
     :keyword int timeout: Timeout setting for the operation in seconds, default is 604800s (7 days).
+    :keyword bool retry_hedging: Opt-in. Whether to hedge GET and HEAD requests: if no response was received
+     after the `retry_hedging_percentile` latency observed for the host, a duplicate request is sent. Once the
+     host latencies are known, both are sent from background threads and the first successful response is
+     returned, without waiting for a retry if the other attempt fails (e.g. times out on a stalled
+     connection). The other response is closed. Default value is False.
+    :keyword float retry_hedging_percentile: The percentile of the latencies observed for the host after which
+     a request is hedged. Default value is 95.
+    :keyword float retry_hedging_min_delay: The minimum delay in seconds before a request is hedged.
+     Default value is 0.01.
 
     .. admonition:: Example:
 
@@ -511,6 +622,96 @@ class RetryPolicy(RetryPolicyBase, HTTPPolicy[HTTPRequestType, HTTPResponseType]
                 return
         self._sleep_backoff(settings, transport)
 
+    def _send(
+        self, request: PipelineRequest[HTTPRequestType], settings: Dict[str, Any]
+    ) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
+        """Send one attempt to the next policy, hedging it if enabled.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param dict settings: The retry settings.
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        host = self._hedging_host(settings, request)
+        if host is None:
+            return self.next.send(request)
+        delay = self._hedging_delay(host)
+        if delay is None:
+            start = time.perf_counter()
+            response = self.next.send(request)
+            self._latencies.add(host, time.perf_counter() - start)
+            return response
+
+        # The duplicate has its own copy of the request, taken before the next policies start changing it
+        hedge = self._copy_request(request)
+        # (response, None) or (None, error) of each attempt, in the order they complete
+        results: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue()
+        # Once the outcome is decided, the response of an attempt completing afterwards is closed
+        lock = threading.Lock()
+        state = {"decided": False}
+
+        def send_attempt(attempt: PipelineRequest[HTTPRequestType]) -> None:
+            response = None
+            error: Optional[BaseException] = None
+            start = time.perf_counter()
+            try:
+                response = self.next.send(attempt)
+                self._latencies.add(host, time.perf_counter() - start)
+            except BaseException as err:  # pylint: disable=broad-except
+                error = err
+            finally:
+                with lock:
+                    if state["decided"]:
+                        _close_response(response)
+                    else:
+                        results.put((response, error))
+
+        def start_attempt(attempt: PipelineRequest[HTTPRequestType]) -> None:
+            # Each attempt is sent from its own thread with the context of the caller, e.g. its tracing span
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(send_attempt, attempt),
+                name="azure-core-retry-hedge",
+                daemon=True,
+            ).start()
+
+        start_attempt(request)
+        pending = 1
+        # Nothing is left to wait for once the operation times out, even if an attempt never completes
+        deadline = time.monotonic() + settings["timeout"]
+        first_error: Optional[BaseException] = None
+        try:
+            while True:
+                hedged = pending > 1 or first_error is not None
+                try:
+                    response, error = results.get(
+                        timeout=max(deadline - time.monotonic(), 0) if hedged else min(delay, settings["timeout"])
+                    )
+                except queue.Empty:
+                    if hedged or time.monotonic() >= deadline:
+                        raise ServiceResponseTimeoutError(  # pylint: disable=raise-missing-from
+                            "No response to the hedged {} request".format(request.http_request.method)
+                        )
+                    _LOGGER.debug("No response after %.3fs, hedging %s request", delay, hedge.http_request.method)
+                    start_attempt(hedge)
+                    pending += 1
+                    continue
+                pending -= 1
+                if error is None:
+                    # The first response wins
+                    return cast(PipelineResponse[HTTPRequestType, HTTPResponseType], response)
+                first_error = first_error or error
+                # The request failed before it was hedged, or both attempts failed
+                if not pending:
+                    raise first_error
+        finally:
+            with lock:
+                state["decided"] = True
+                # Close the response of the other attempt if it was received in the meantime
+                while not results.empty():
+                    _close_response(results.get_nowait()[0])
+
     def send(self, request: PipelineRequest[HTTPRequestType]) -> PipelineResponse[HTTPRequestType, HTTPResponseType]:
         """Sends the PipelineRequest object to the next policy. Uses retry settings if necessary.
 
@@ -542,7 +743,7 @@ class RetryPolicy(RetryPolicyBase, HTTPPolicy[HTTPRequestType, HTTPResponseType]
             try:
                 self._configure_timeout(request, absolute_timeout, is_response_error)
                 request.context["retry_count"] = len(retry_settings["history"])
-                response = self.next.send(request)
+                response = self._send(request, retry_settings)
                 if self.is_retry(retry_settings, response):
                     retry_active = self.increment(retry_settings, response=response)
                     if retry_active:
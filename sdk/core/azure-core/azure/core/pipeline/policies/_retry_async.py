@@ -26,7 +26,8 @@
 """
 This module is the requests implementation of Pipeline ABC
 """
-from typing import TypeVar, Dict, Any, Optional, cast
+from typing import TypeVar, Dict, Any, Optional, Set, cast
+import inspect
 import logging
 import time
 from azure.core.pipeline import PipelineRequest, PipelineResponse
@@ -50,6 +51,20 @@ HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _close_response(response: PipelineResponse[Any, Any]) -> None:
+    """Close the response of the attempt that lost a hedged request.
+
+    :param response: The PipelineResponse object.
+    :type response: ~azure.core.pipeline.PipelineResponse
+    """
+    try:
+        result = response.http_response.close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Failed to close the response of a hedged request", exc_info=True)
+
+
 class AsyncRetryPolicy(RetryPolicyBase, AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]):
     """Async flavor of the retry policy.
 
@@ -70,6 +85,13 @@ class AsyncRetryPolicy(RetryPolicyBase, AsyncHTTPPolicy[HTTPRequestType, AsyncHT
      seconds. If the backoff_factor is 0.1, then the retry will sleep
      for [0.0s, 0.2s, 0.4s, ...] between retries. The default value is 0.8.
     :keyword int retry_backoff_max: The maximum back off time. Default value is 120 seconds (2 minutes).
+    :keyword bool retry_hedging: Opt-in. Whether to hedge GET and HEAD requests: if no response was received
+     after the `retry_hedging_percentile` latency observed for the host, a duplicate request is sent, the
+     first response wins and the other request is cancelled. Requires asyncio. Default value is False.
+    :keyword float retry_hedging_percentile: The percentile of the latencies observed for the host after which
+     a request is hedged. Default value is 95.
+    :keyword float retry_hedging_min_delay: The minimum delay in seconds before a request is hedged.
+     Default value is 0.01.
 
     .. admonition:: Example:
 
@@ -142,6 +164,76 @@ class AsyncRetryPolicy(RetryPolicyBase, AsyncHTTPPolicy[HTTPRequestType, AsyncHT
                 return
         await self._sleep_backoff(settings, transport)
 
+    async def _timed_send(
+        self, request: PipelineRequest[HTTPRequestType], host: str
+    ) -> PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]:
+        """Send to the next policy, recording the latency for the host.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param str host: The host of the request.
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        start = time.perf_counter()
+        response = await self.next.send(request)
+        self._latencies.add(host, time.perf_counter() - start)
+        return response
+
+    async def _send(
+        self, request: PipelineRequest[HTTPRequestType], settings: Dict[str, Any]
+    ) -> PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]:
+        """Send one attempt to the next policy, hedging it if enabled.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param dict settings: The retry settings.
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        host = self._hedging_host(settings, request)
+        if host is None:
+            return await self.next.send(request)
+        delay = self._hedging_delay(host)
+        if delay is None:
+            return await self._timed_send(request, host)
+        try:
+            import asyncio  # pylint: disable=do-not-import-asyncio
+
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Hedging needs tasks, not supported outside of asyncio (e.g. trio)
+            return await self._timed_send(request, host)
+
+        # The duplicate has its own copy of the request, taken before the next policies start changing it
+        hedge = self._copy_request(request)
+        primary = asyncio.ensure_future(self._timed_send(request, host))
+        pending: Set["asyncio.Future[PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]]"] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            _LOGGER.debug("No response after %.3fs, hedging %s request", delay, request.http_request.method)
+            pending.add(asyncio.ensure_future(self._timed_send(hedge, host)))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = None
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        await _close_response(task.result())
+                if winner is not None:
+                    return winner
+            raise cast(BaseException, error)
+        finally:
+            # Cancel the loser, or both attempts if we were cancelled
+            for task in pending:
+                task.cancel()
+
     async def send(
         self, request: PipelineRequest[HTTPRequestType]
     ) -> PipelineResponse[HTTPRequestType, AsyncHTTPResponseType]:
@@ -175,7 +267,7 @@ class AsyncRetryPolicy(RetryPolicyBase, AsyncHTTPPolicy[HTTPRequestType, AsyncHT
             try:
                 self._configure_timeout(request, absolute_timeout, is_response_error)
                 request.context["retry_count"] = len(retry_settings["history"])
-                response = await self.next.send(request)
+                response = await self._send(request, retry_settings)
                 if self.is_retry(retry_settings, response):
                     retry_active = self.increment(retry_settings, response=response)
                     if retry_active:
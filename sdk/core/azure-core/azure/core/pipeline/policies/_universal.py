@@ -35,7 +35,7 @@ import xml.etree.ElementTree as ET
 import types
 import re
 import uuid
-from typing import IO, cast, Union, Optional, AnyStr, Dict, Any, Set, MutableMapping
+from typing import IO, cast, Union, Optional, AnyStr, Dict, Any, Set, MutableMapping, Iterable, AsyncIterable
 import urllib.parse
 
 from azure.core import __version__ as azcore_version
@@ -43,6 +43,7 @@ from azure.core.exceptions import DecodeError
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from ._base import SansIOHTTPPolicy
+from ._json_stream import JsonItemIterator, AsyncJsonItemIterator
 
 from ..transport import HttpRequest as LegacyHttpRequest
 from ..transport._base import _HttpResponseBase as LegacySansIOHttpResponse
@@ -561,6 +562,11 @@ class ContentDecodePolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
 
     :param response_encoding: The encoding to use if known for this service (will disable auto-detection)
     :type response_encoding: str
+    :keyword stream_json_items: Opt-in streaming of JSON arrays. The name of the top-level member holding the
+     array to stream (e.g. "value" for a list page), or True if the whole document is the array. Requires the
+     request to be sent with `stream=True`. The "deserialized_data" context entry is then an iterator
+     (an async iterator for async responses) yielding the array items as they are decoded from the body.
+    :paramtype stream_json_items: str or bool
     """
 
     # Accept "text" because we're open minded people...
@@ -570,9 +576,14 @@ class ContentDecodePolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
     CONTEXT_NAME = "deserialized_data"
 
     def __init__(
-        self, response_encoding: Optional[str] = None, **kwargs: Any  # pylint: disable=unused-argument
+        self,
+        response_encoding: Optional[str] = None,
+        *,
+        stream_json_items: Optional[Union[str, bool]] = None,
+        **kwargs: Any  # pylint: disable=unused-argument
     ) -> None:
         self._response_encoding = response_encoding
+        self._stream_json_items = stream_json_items
 
     @classmethod
     def deserialize_from_text(
@@ -649,6 +660,53 @@ class ContentDecodePolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
             return data_as_str
         raise DecodeError("Cannot deserialize content-type: {}".format(mime_type))
 
+    @classmethod
+    def iter_json_items(
+        cls,
+        data: Union[Iterable[bytes], IO[bytes]],
+        item_path: Optional[str] = "value",
+        response: Optional[HTTPResponseType] = None,
+    ) -> JsonItemIterator:
+        """Decode the items of a JSON array incrementally, without loading the whole body in memory.
+
+        The body is consumed chunk by chunk, and each array item is yielded as soon as it is decoded, so
+        memory usage scales with the size of one item instead of the size of the page. Once the iterator
+        is exhausted, its `metadata` attribute holds the other top-level members of the document
+        (e.g. "nextLink").
+
+        :param data: The body, as an iterator of bytes (e.g. `response.iter_bytes()`) or a file-like object.
+        :type data: iterable[bytes] or IO[bytes]
+        :param item_path: Name of the top-level member holding the array, or None if the document is the array.
+        :type item_path: str or None
+        :param response: If passed, exception will be annotated with that response
+        :type response: any
+        :returns: An iterator of the decoded array items
+        :rtype: iterator[any]
+        """
+        return JsonItemIterator(data, item_path, response=response)
+
+    @classmethod
+    def aiter_json_items(
+        cls,
+        data: AsyncIterable[bytes],
+        item_path: Optional[str] = "value",
+        response: Optional[HTTPResponseType] = None,
+    ) -> AsyncJsonItemIterator:
+        """Decode the items of a JSON array incrementally from an async stream of bytes.
+
+        See :meth:`iter_json_items`.
+
+        :param data: The body, as an async iterator of bytes (e.g. `response.iter_bytes()`).
+        :type data: asynciterable[bytes]
+        :param item_path: Name of the top-level member holding the array, or None if the document is the array.
+        :type item_path: str or None
+        :param response: If passed, exception will be annotated with that response
+        :type response: any
+        :returns: An async iterator of the decoded array items
+        :rtype: asynciterator[any]
+        """
+        return AsyncJsonItemIterator(data, item_path, response=response)
+
     @classmethod
     def deserialize_from_http_generics(
         cls,
@@ -694,11 +752,18 @@ class ContentDecodePolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
 
         :param request: The PipelineRequest object.
         :type request: ~azure.core.pipeline.PipelineRequest
+        :raises ValueError: If the JSON items are streamed from a request not sent with `stream=True`.
         """
         options = request.context.options
         response_encoding = options.pop("response_encoding", self._response_encoding)
         if response_encoding:
             request.context["response_encoding"] = response_encoding
+        stream_json_items = options.pop("stream_json_items", self._stream_json_items)
+        if stream_json_items:
+            # A response that is not streamed is read in full before the policy gets it, so nothing is gained
+            if not options.get("stream", True):
+                raise ValueError("stream_json_items requires the request to be sent with stream=True.")
+            request.context["stream_json_items"] = stream_json_items
 
     def on_response(
         self,
@@ -719,6 +784,10 @@ class ContentDecodePolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
         :raises xml.etree.ElementTree.ParseError: If bytes is not valid XML
         :raises ~azure.core.exceptions.DecodeError: If deserialization fails
         """
+        stream_json_items = request.context.get("stream_json_items")
+        if stream_json_items and self._stream_items(response, stream_json_items):
+            return
+
         # If response was asked as stream, do NOT read anything and quit now
         if response.context.options.get("stream", True):
             return
@@ -729,6 +798,37 @@ class ContentDecodePolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
             response.http_response, response_encoding
         )
 
+    def _stream_items(
+        self,
+        response: PipelineResponse[HTTPRequestType, HTTPResponseType],
+        stream_json_items: Union[str, bool],
+    ) -> bool:
+        """Store an iterator over the JSON array items in the context, if the response supports it.
+
+        :param response: The PipelineResponse object.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        :param stream_json_items: The member holding the array, or True if the document is the array.
+        :type stream_json_items: str or bool
+        :return: True if the items are streamed, False if the response must be decoded as usual.
+        :rtype: bool
+        """
+        http_response = response.http_response
+        # Only the azure.core.rest responses expose their body as an iterator of bytes
+        if not hasattr(http_response, "iter_bytes") or not 200 <= http_response.status_code < 300:
+            return False
+        if http_response.content_type:
+            mime_type = http_response.content_type.split(";")[0].strip().lower()
+            if not self.JSON_REGEXP.match(mime_type):
+                return False
+
+        item_path = None if stream_json_items is True else cast(str, stream_json_items)
+        data = http_response.iter_bytes()
+        if hasattr(data, "__aiter__"):
+            response.context[self.CONTEXT_NAME] = self.aiter_json_items(data, item_path, response=http_response)
+        else:
+            response.context[self.CONTEXT_NAME] = self.iter_json_items(data, item_path, response=http_response)
+        return True
+
 
 class ProxyPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseType]):
     """A proxy policy.
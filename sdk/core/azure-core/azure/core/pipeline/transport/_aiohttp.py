@@ -35,6 +35,8 @@ from typing import (
     Union,
     Type,
     MutableMapping,
+    Dict,
+    Iterable,
 )
 from types import TracebackType
 from collections.abc import AsyncIterator
@@ -45,6 +47,7 @@ import codecs
 import aiohttp
 import aiohttp.client_exceptions
 from multidict import CIMultiDict
+from yarl import URL
 
 from azure.core.configuration import ConnectionConfiguration
 from azure.core.exceptions import (
@@ -127,6 +130,8 @@ class AioHttpTransport(AsyncHttpTransport):
         self._use_env_settings = kwargs.pop("use_env_settings", True)
         # See https://github.com/Azure/azure-sdk-for-python/issues/25640 to understand why we track this
         self._has_been_opened = False
+        self._created_connections = 0
+        self._wait_time = 0.0
 
     async def __aenter__(self):
         await self.open()
@@ -155,6 +160,7 @@ class AioHttpTransport(AsyncHttpTransport):
                     "trust_env": self._use_env_settings,
                     "cookie_jar": jar,
                     "auto_decompress": False,
+                    "trace_configs": [self._pool_trace_config()],
                 }
                 if self._loop is not None:
                     clientsession_kwargs["loop"] = self._loop
@@ -171,6 +177,96 @@ class AioHttpTransport(AsyncHttpTransport):
             await self.session.close()
             self.session = None
 
+    def _pool_trace_config(self) -> aiohttp.TraceConfig:
+        """Build the trace configuration feeding the pool statistics.
+
+        :return: The trace configuration.
+        :rtype: ~aiohttp.TraceConfig
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_queued_start(session, context, params):  # pylint: disable=unused-argument
+            context.queued_start = asyncio.get_running_loop().time()
+
+        async def on_queued_end(session, context, params):  # pylint: disable=unused-argument
+            self._wait_time += asyncio.get_running_loop().time() - context.queued_start
+
+        async def on_create_end(session, context, params):  # pylint: disable=unused-argument
+            self._created_connections += 1
+
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_end.append(on_create_end)
+        return trace_config
+
+    async def warm_up(self, hosts: Iterable[str], *, connections: int = 1) -> int:
+        """Open connections to hosts ahead of the first requests, including the TLS handshakes.
+
+        The connections are put in the connection pool of the session, to be used by the next requests.
+        Warm-up is best effort: the connections failing to open are logged and skipped.
+
+        :param hosts: The hosts, as URLs (e.g. "https://myaccount.blob.core.windows.net") or host names
+         (HTTPS is assumed).
+        :type hosts: iterable[str]
+        :keyword int connections: The number of connections to open per host. Default value is 1.
+        :return: The number of connections opened.
+        :rtype: int
+        """
+        await self.open()
+        session = cast(aiohttp.ClientSession, self.session)
+        ssl = self._build_ssl_config(cert=self.connection_config.cert, verify=self.connection_config.verify)
+        timeout = aiohttp.ClientTimeout(sock_connect=self.connection_config.timeout)
+        loop = asyncio.get_running_loop()
+
+        async def connect(url: URL) -> Optional[Any]:
+            kwargs: Dict[str, Any] = {"loop": loop}
+            # Same connection key as the requests sent by the session
+            if ssl is not True:
+                kwargs["ssl"] = ssl
+            if session.trust_env:
+                try:
+                    kwargs["proxy"], kwargs["proxy_auth"] = aiohttp.helpers.get_env_proxy_for_url(url)
+                except (LookupError, AttributeError):
+                    # No proxy for this URL, or aiohttp < 3.8
+                    pass
+            try:
+                request = aiohttp.ClientRequest("GET", url, **kwargs)
+                return await connector.connect(request, [], timeout)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Failed to warm up a connection to %s: %s", url.host, err)
+                return None
+
+        connector = cast(aiohttp.BaseConnector, session.connector)
+        per_host = min(connections, connector.limit_per_host or connections)
+        urls = [URL(host if "://" in host else "https://" + host) for _ in range(per_host) for host in hosts]
+        if connector.limit:
+            # The connections are held until all are open: stay under the limit of the pool not to wait forever
+            urls = urls[: max(0, connector.limit - len(getattr(connector, "_acquired", ())))]
+        opened = [connection for connection in await asyncio.gather(*[connect(url) for url in urls]) if connection]
+        for connection in opened:
+            connection.release()
+        self._created_connections += len(opened)
+        return len(opened)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Report the state of the connection pool of the session.
+
+        The connections created and the wait time are only tracked on the sessions created by the transport.
+
+        :return: The number of connections `created` by the pool, of `active` and `idle` connections,
+         and the time spent waiting for a connection when the pool was at its limit (`wait_time`, in seconds).
+        :rtype: dict[str, any]
+        """
+        connector = getattr(self.session, "connector", None)
+        # aiohttp doesn't expose the state of the pool
+        idle = getattr(connector, "_conns", {})
+        return {
+            "created": self._created_connections,
+            "active": len(getattr(connector, "_acquired", ())),
+            "idle": sum(len(connections) for connections in idle.values()),
+            "wait_time": self._wait_time,
+        }
+
     def _build_ssl_config(self, cert, verify):
         """Build the SSL configuration.
 
@@ -349,7 +349,11 @@ class HttpRequest:
         :type data: bytes
         """
         if data:
-            self.headers["Content-Length"] = str(len(data))
+            try:
+                length = memoryview(data).nbytes
+            except TypeError:
+                length = len(data)
+            self.headers["Content-Length"] = str(length)
         self.data = data
         self.files = None
 
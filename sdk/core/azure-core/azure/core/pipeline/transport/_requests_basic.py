@@ -24,12 +24,19 @@
 #
 # --------------------------------------------------------------------------
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
+    Any,
+    Dict,
+    Iterable,
     Iterator,
+    List,
     Optional,
     Union,
+    Tuple,
     TypeVar,
     overload,
+    cast,
     TYPE_CHECKING,
     MutableMapping,
 )
@@ -303,6 +310,104 @@ class RequestsTransport(HttpTransport):
             self.session.close()
             self.session = None
 
+    def _connection_pool(self, url: str) -> Any:
+        """Get the urllib3 connection pool the session uses for a URL.
+
+        :param str url: The URL.
+        :return: The connection pool.
+        :rtype: urllib3.HTTPConnectionPool
+        """
+        session = cast(requests.Session, self.session)
+        settings = session.merge_environment_settings(
+            url, {}, None, self.connection_config.verify, self.connection_config.cert
+        )
+        adapter = session.get_adapter(url)
+        try:
+            return adapter.get_connection_with_tls_context(  # type: ignore
+                requests.Request("GET", url).prepare(), settings["verify"], settings["proxies"], settings["cert"]
+            )
+        except AttributeError:
+            # requests < 2.32.2
+            pool = adapter.get_connection(url, settings["proxies"])  # type: ignore
+            adapter.cert_verify(pool, url, settings["verify"], settings["cert"])  # type: ignore
+            return pool
+
+    def warm_up(self, hosts: Iterable[str], *, connections: int = 1) -> int:
+        """Open connections to hosts ahead of the first requests, including the TLS handshakes.
+
+        The connections are put in the connection pools of the session, to be used by the next requests.
+        Warm-up is best effort: the connections failing to open are logged and skipped.
+
+        :param hosts: The hosts, as URLs (e.g. "https://myaccount.blob.core.windows.net") or host names
+         (HTTPS is assumed).
+        :type hosts: iterable[str]
+        :keyword int connections: The number of connections to open per host, up to the pool size of the
+         session (10 by default). Default value is 1.
+        :return: The number of connections opened.
+        :rtype: int
+        """
+        self.open()
+        new_connections: List[Tuple[Any, Any]] = []
+        for host in hosts:
+            url = host if "://" in host else "https://" + host
+            pool = self._connection_pool(url)
+            # urllib3 has no public API to add connections to a pool
+            if not (hasattr(pool, "_get_conn") and hasattr(pool, "_put_conn")):
+                _LOGGER.debug("Cannot warm up the connections to %s with this version of urllib3", url)
+                continue
+            count = min(connections, pool.pool.maxsize) if pool.pool is not None else 0
+            new_connections.extend((pool, pool._get_conn()) for _ in range(count))  # pylint: disable=protected-access
+
+        def connect(connection: Any) -> bool:
+            connection.timeout = self.connection_config.timeout
+            try:
+                connection.connect()
+                return True
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Failed to warm up a connection to %s: %s", connection.host, err)
+                connection.close()
+                return False
+
+        if not new_connections:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(32, len(new_connections))) as executor:
+            results = list(executor.map(connect, [connection for _, connection in new_connections]))
+        for (pool, connection), connected in zip(new_connections, results):
+            # An empty slot lets the pool open a new connection when needed
+            pool._put_conn(connection if connected else None)  # pylint: disable=protected-access
+        return sum(results)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Report the state of the connection pools of the session.
+
+        urllib3 pools don't block when all their connections are in use (they open extra connections instead),
+        so the wait time is always 0 with this transport.
+
+        :return: The number of connections `created` by the pools, of `active` and `idle` connections,
+         and the time spent waiting for a connection (`wait_time`, in seconds).
+        :rtype: dict[str, any]
+        """
+        stats: Dict[str, Any] = {"created": 0, "active": 0, "idle": 0, "wait_time": 0.0}
+        if not self.session:
+            return stats
+        # The same adapter is usually mounted for several prefixes
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            managers: List[Any] = [getattr(adapter, "poolmanager", None)]
+            managers.extend(getattr(adapter, "proxy_manager", {}).values())
+            for manager in managers:
+                if manager is None:
+                    continue
+                for key in list(manager.pools.keys()):
+                    pool = manager.pools.get(key)
+                    if pool is None or pool.pool is None:
+                        continue
+                    queued = list(pool.pool.queue)
+                    stats["created"] += pool.num_connections
+                    stats["active"] += pool.pool.maxsize - len(queued)
+                    stats["idle"] += sum(1 for connection in queued if connection is not None)
+        return stats
+
     @overload
     def send(
         self, request: HttpRequest, *, proxies: Optional[MutableMapping[str, str]] = None, **kwargs
@@ -30,6 +30,8 @@ from ._async_poller import (
     async_poller,
     AsyncLROPoller,
 )
+from ._poller_group import LROPollerGroup
+from ._async_poller_group import AsyncLROPollerGroup
 
 __all__ = [
     "LROPoller",
@@ -39,4 +41,6 @@ __all__ = [
     "AsyncPollingMethod",
     "async_poller",
     "AsyncLROPoller",
+    "LROPollerGroup",
+    "AsyncLROPollerGroup",
 ]
@@ -24,7 +24,7 @@
 #
 # --------------------------------------------------------------------------
 import logging
-from typing import Callable, Any, Tuple, Generic, TypeVar, Generator, Awaitable
+from typing import Callable, Any, Tuple, Generic, TypeVar, Generator, Awaitable, Optional
 
 from ..exceptions import AzureError
 from ._poller import _SansIONoPolling
@@ -173,6 +173,8 @@ class AsyncLROPoller(Generic[PollingReturnType_co], Awaitable[PollingReturnType_
     ):
         self._polling_method = polling_method
         self._done = False
+        # Set by an AsyncLROPollerGroup polling the operation: waits for the group to complete it
+        self._group_wait: Optional[Callable[[], Awaitable[None]]] = None
 
         # This implicit test avoids bringing in an explicit dependency on Model directly
         try:
@@ -246,7 +248,10 @@ class AsyncLROPoller(Generic[PollingReturnType_co], Awaitable[PollingReturnType_
         :raises ~azure.core.exceptions.HttpResponseError: Server problem with the query.
         """
         try:
-            await self._polling_method.run()
+            if self._group_wait is not None:
+                await self._group_wait()
+            else:
+                await self._polling_method.run()
         except AzureError as error:
             if not error.continuation_token:
                 try:
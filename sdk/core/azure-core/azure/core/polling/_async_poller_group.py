@@ -0,0 +1,280 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import functools
+import heapq
+import itertools
+import math
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, cast, TYPE_CHECKING
+
+from ._async_poller import AsyncLROPoller
+from ._poller_group import _can_poll_in_steps
+from .async_base_polling import AsyncLROBasePolling
+
+if TYPE_CHECKING:
+    import asyncio  # pylint: disable=do-not-import-asyncio
+
+
+class AsyncLROPollerGroup:
+    """Polls many long running operations from one asyncio task.
+
+    Awaiting an :class:`~azure.core.polling.AsyncLROPoller` runs the polling loop of its operation, so waiting
+    for many operations concurrently takes a task for each of them. Pollers added to a group are polled by the
+    group instead: it keeps their next polling times in a timer heap, and sends the status requests that are due
+    from a small number of worker tasks. Each operation still waits the delay its service asks for with
+    Retry-After, or the polling interval of its client. Polling times are rounded up to the next multiple of
+    `merge_window`, so operations that are due about at the same time are polled together. Awaiting a poller of
+    the group waits for the group to complete its operation.
+
+    The group polls the operations whose polling method is an
+    :class:`~azure.core.polling.async_base_polling.AsyncLROBasePolling`, such as the AsyncARMPolling of
+    management clients. Pollers with other polling methods, or with one that customizes the polling loop, are
+    polled by a task of their own, and are still reported by :meth:`as_completed` and :meth:`wait_all`.
+
+    .. code-block:: python
+
+        async with AsyncLROPollerGroup() as group:
+            for name in names:
+                group.add(await client.disks.begin_create_or_update(resource_group, name, disk))
+            async for poller in group.as_completed():
+                print((await poller.result()).name)
+
+    :keyword int max_concurrency: The maximum number of status requests sent at the same time. Defaults to 8.
+    :keyword float merge_window: Polling times are rounded up to a multiple of this many seconds. 0 disables
+        rounding. Defaults to 1.
+    """
+
+    def __init__(self, *, max_concurrency: int = 8, merge_window: float = 1.0) -> None:
+        self._max_concurrency = max_concurrency
+        self._merge_window = merge_window
+        self._pollers: List[AsyncLROPoller] = []
+        self._completed: Dict[AsyncLROPoller, "asyncio.Future[None]"] = {}
+        self._errors: Dict[AsyncLROPoller, Exception] = {}
+        self._timers: List[Tuple[float, int, AsyncLROPoller]] = []
+        self._timer_ids = itertools.count()
+        self._in_flight = 0
+        self._wakeup: Optional["asyncio.Event"] = None
+        self._scheduler: Optional["asyncio.Task[None]"] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._waiters: List["asyncio.Queue[AsyncLROPoller]"] = []
+
+    async def __aenter__(self) -> "AsyncLROPollerGroup":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.wait_all()
+
+    @property
+    def pollers(self) -> List[AsyncLROPoller]:
+        """The pollers of the group, in the order they were added.
+
+        :rtype: list[~azure.core.polling.AsyncLROPoller]
+        :return: The pollers of the group.
+        """
+        return list(self._pollers)
+
+    def add(self, poller: AsyncLROPoller) -> AsyncLROPoller:
+        """Add a poller to the group, which starts polling its operation.
+
+        Must be called from a running event loop.
+
+        :param poller: The poller to add.
+        :type poller: ~azure.core.polling.AsyncLROPoller
+        :return: The poller.
+        :rtype: ~azure.core.polling.AsyncLROPoller
+        :raises ValueError: If the poller is already in a group.
+        """
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        # pylint: disable=protected-access
+        if poller._group_wait is not None:
+            raise ValueError("The poller is already in a group")
+        loop = asyncio.get_running_loop()
+        self._pollers.append(poller)
+        self._completed[poller] = loop.create_future()
+        poller._group_wait = functools.partial(self._wait, poller)
+        polling_method = poller.polling_method()
+        if not _can_poll_in_steps(polling_method, AsyncLROBasePolling):
+            task = loop.create_task(self._run(poller))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return poller
+        # The first step runs right away, like "run"
+        self._add_timer(poller, 0)
+        if self._scheduler is None:
+            self._scheduler = loop.create_task(self._schedule())
+        return poller
+
+    async def as_completed(self, timeout: Optional[float] = None) -> AsyncIterator[AsyncLROPoller]:
+        """Yield the pollers of the group as their operations complete, successfully or not.
+
+        Only the pollers in the group when this is called are yielded.
+
+        :param float timeout: The maximum number of seconds to wait for all the operations. Defaults to no limit.
+        :return: An async iterator of the completed pollers.
+        :rtype: AsyncIterator[~azure.core.polling.AsyncLROPoller]
+        :raises TimeoutError: If some operations are not complete after `timeout` seconds.
+        """
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        waiter: "asyncio.Queue[AsyncLROPoller]" = asyncio.Queue()
+        pending = set(self._pollers)
+        done = [poller for poller in self._pollers if self._completed[poller].done()]
+        self._waiters.append(waiter)
+        try:
+            for poller in done:
+                pending.discard(poller)
+                yield poller
+            while pending:
+                remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                try:
+                    poller = await asyncio.wait_for(waiter.get(), remaining)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(  # pylint: disable=raise-missing-from
+                        "{} (of {}) long running operations did not complete".format(len(pending), len(self._pollers))
+                    )
+                if poller in pending:
+                    pending.discard(poller)
+                    yield poller
+        finally:
+            self._waiters.remove(waiter)
+
+    async def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the operations of all the pollers of the group to complete.
+
+        Errors of the operations are not raised: await `result()` on the pollers to get them.
+
+        :param float timeout: The maximum number of seconds to wait. Defaults to no limit.
+        :return: True if all the operations completed, False if some did not after `timeout` seconds.
+        :rtype: bool
+        """
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        pending = [future for future in self._completed.values() if not future.done()]
+        if not pending:
+            return True
+        _, not_done = await asyncio.wait(pending, timeout=timeout)
+        return not not_done
+
+    async def _wait(self, poller: AsyncLROPoller) -> None:
+        """Wait for the group to complete the operation of a poller. Called by `wait` of the poller.
+
+        :param poller: The poller.
+        :type poller: ~azure.core.polling.AsyncLROPoller
+        """
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        # The future is shared by every caller waiting for this poller: cancelling one of them must not cancel it
+        await asyncio.shield(self._completed[poller])
+        error = self._errors.get(poller)
+        if error is not None:
+            raise error
+
+    def _complete(self, poller: AsyncLROPoller, error: Optional[Exception]) -> None:
+        if error is None:
+            poller._done = True  # pylint: disable=protected-access
+        else:
+            self._errors[poller] = error
+        self._completed[poller].set_result(None)
+        for waiter in self._waiters:
+            waiter.put_nowait(poller)
+
+    def _add_timer(self, poller: AsyncLROPoller, delay: float) -> None:
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        due = asyncio.get_running_loop().time() + delay
+        if delay and self._merge_window > 0:
+            due = math.ceil(due / self._merge_window) * self._merge_window
+        heapq.heappush(self._timers, (due, next(self._timer_ids), poller))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self, poller: AsyncLROPoller) -> None:
+        """Poll an operation with the polling loop of its polling method.
+
+        :param poller: The poller of the operation.
+        :type poller: ~azure.core.polling.AsyncLROPoller
+        """
+        try:
+            await poller.polling_method().run()
+        except Exception as error:  # pylint: disable=broad-except
+            self._complete(poller, error)
+        else:
+            self._complete(poller, None)
+
+    async def _schedule(self) -> None:
+        """Hand the operations that are due to the workers, until no operation is left to poll."""
+        import asyncio  # pylint: disable=do-not-import-asyncio
+
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        ready: "asyncio.Queue[AsyncLROPoller]" = asyncio.Queue()
+        workers = [loop.create_task(self._work(ready)) for _ in range(self._max_concurrency)]
+        try:
+            while self._timers or self._in_flight:
+                now = loop.time()
+                if self._timers and self._timers[0][0] <= now:
+                    while self._timers and self._timers[0][0] <= now:
+                        self._in_flight += 1
+                        ready.put_nowait(heapq.heappop(self._timers)[2])
+                    continue
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._timers[0][0] - now if self._timers else None)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self._wakeup = None
+            self._scheduler = None
+
+    async def _work(self, ready: "asyncio.Queue[AsyncLROPoller]") -> None:
+        while True:
+            poller = await ready.get()
+            try:
+                await self._poll(poller)
+            finally:
+                self._in_flight -= 1
+                self._wakeup.set()  # type: ignore[union-attr]
+
+    async def _poll(self, poller: AsyncLROPoller) -> None:
+        """Run one polling step of an operation, then schedule the next one or complete the poller.
+
+        :param poller: The poller of the operation.
+        :type poller: ~azure.core.polling.AsyncLROPoller
+        """
+        polling_method = cast(AsyncLROBasePolling, poller.polling_method())
+        try:
+            delay = await polling_method._poll_once()  # pylint: disable=protected-access
+        except Exception as error:  # pylint: disable=broad-except
+            self._complete(poller, error)
+            return
+        if delay is None:
+            self._complete(poller, None)
+        else:
+            self._add_timer(poller, delay)
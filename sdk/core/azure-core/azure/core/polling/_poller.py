@@ -27,7 +27,8 @@ import base64
 import logging
 import threading
 import uuid
-from typing import TypeVar, Generic, Any, Callable, Optional, Tuple, List
+from contextvars import ContextVar
+from typing import TypeVar, Generic, Any, Callable, Optional, Tuple, List, TYPE_CHECKING
 from azure.core.exceptions import AzureError
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.common import with_current_context
@@ -36,8 +37,14 @@ from azure.core.tracing.common import with_current_context
 PollingReturnType_co = TypeVar("PollingReturnType_co", covariant=True)
 DeserializationCallbackType = Any
 
+if TYPE_CHECKING:
+    from ._poller_group import LROPollerGroup
+
 _LOGGER = logging.getLogger(__name__)
 
+# The LROPollerGroup that pollers created in this context join, set by "with group:".
+_current_poller_group: ContextVar[Optional["LROPollerGroup"]] = ContextVar("current_poller_group", default=None)
+
 
 class PollingMethod(Generic[PollingReturnType_co]):
     """ABC class for polling method."""
@@ -231,10 +238,14 @@ class LROPoller(Generic[PollingReturnType_co]):
         # Prepare thread execution
         self._thread = None
         self._done = threading.Event()
-        self._exception = None
+        self._exception: Optional[Exception] = None
+        self._poller_group = _current_poller_group.get()
         if self._polling_method.finished():
             self._done.set()
-        else:
+            if self._poller_group is not None:
+                self._poller_group._add(self)  # pylint: disable=protected-access
+        # A poller group polls the operations it can step through itself, instead of a thread per poller
+        elif self._poller_group is None or not self._poller_group._add(self):  # pylint: disable=protected-access
             self._thread = threading.Thread(
                 target=with_current_context(self._start),
                 name="LROPoller({})".format(uuid.uuid4()),
@@ -248,21 +259,30 @@ class LROPoller(Generic[PollingReturnType_co]):
         """
         try:
             self._polling_method.run()
-        except AzureError as error:
-            if not error.continuation_token:
-                try:
-                    error.continuation_token = self.continuation_token()
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.warning("Unable to retrieve continuation token.")
-                    error.continuation_token = None
-
-            self._exception = error
         except Exception as error:  # pylint: disable=broad-except
-            self._exception = error
-
+            self._set_exception(error)
         finally:
             self._done.set()
 
+        self._run_callbacks()
+        if self._poller_group is not None:
+            self._poller_group._on_done(self)  # pylint: disable=protected-access
+
+    def _set_exception(self, error: Exception) -> None:
+        """Store the error raised while polling, to raise it from `wait`.
+
+        :param error: The error raised while polling.
+        :type error: Exception
+        """
+        if isinstance(error, AzureError) and not error.continuation_token:
+            try:
+                error.continuation_token = self.continuation_token()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.warning("Unable to retrieve continuation token.")
+                error.continuation_token = None
+        self._exception = error
+
+    def _run_callbacks(self) -> None:
         callbacks, self._callbacks = self._callbacks, []
         while callbacks:
             for call in callbacks:
@@ -337,8 +357,10 @@ class LROPoller(Generic[PollingReturnType_co]):
         :raises ~azure.core.exceptions.HttpResponseError: Server problem with the query.
         """
         if self._thread is None:
-            return
-        self._thread.join(timeout=timeout)
+            # Either finished from the start, or polled by a LROPollerGroup
+            self._done.wait(timeout=timeout)
+        else:
+            self._thread.join(timeout=timeout)
         try:
             # Let's handle possible None in forgiveness here
             # https://github.com/python/mypy/issues/8165
@@ -352,7 +374,9 @@ class LROPoller(Generic[PollingReturnType_co]):
         :returns: 'True' if the process has completed, else 'False'.
         :rtype: bool
         """
-        return self._thread is None or not self._thread.is_alive()
+        if self._thread is None:
+            return self._done.is_set()
+        return not self._thread.is_alive()
 
     def add_done_callback(self, func: Callable) -> None:
         """Add callback function to be run once the long running operation
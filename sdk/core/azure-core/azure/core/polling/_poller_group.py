@@ -0,0 +1,265 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import heapq
+import itertools
+import math
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Token
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple, cast
+
+from ..tracing.common import with_current_context
+from ._poller import LROPoller, _current_poller_group
+from .base_polling import LROBasePolling
+
+# The methods a polling method must not customize for the group to poll it step by step
+_POLLING_LOOP_METHODS = ("run", "_poll", "_poll_once", "_delay", "_sleep")
+
+_Step = Callable[[], Optional[float]]
+
+
+def _can_poll_in_steps(polling_method: Any, base: type) -> bool:
+    """Whether the polling loop of a polling method is the one of `base`, which a poller group can run step by step.
+
+    :param any polling_method: The polling method of a poller.
+    :param type base: LROBasePolling or AsyncLROBasePolling.
+    :return: True if the polling method can be polled with its `_poll_once` method.
+    :rtype: bool
+    """
+    if not isinstance(polling_method, base):
+        return False
+    cls = type(polling_method)
+    return all(
+        getattr(cls, name) is getattr(base, name) and name not in vars(polling_method) for name in _POLLING_LOOP_METHODS
+    )
+
+
+class LROPollerGroup:
+    """Polls many long running operations from one scheduler thread.
+
+    An :class:`~azure.core.polling.LROPoller` polls its operation from its own thread. Pollers created in the
+    ``with`` block of a group join the group instead: the group keeps their next polling times in a timer heap,
+    and sends the status requests that are due from a small pool of worker threads. Each operation still waits
+    the delay its service asks for with Retry-After, or the polling interval of its client. Polling times are
+    rounded up to the next multiple of `merge_window`, so operations that are due about at the same time are
+    polled together.
+
+    The group polls the operations whose polling method is a :class:`~azure.core.polling.base_polling.LROBasePolling`,
+    such as the ARMPolling of management clients. Pollers with other polling methods, or with one that customizes
+    the polling loop, poll from their own thread as usual, and are still reported by :meth:`as_completed` and
+    :meth:`wait_all`.
+
+    .. code-block:: python
+
+        with LROPollerGroup() as group:
+            for name in names:
+                client.disks.begin_create_or_update(resource_group, name, disk)
+            for poller in group.as_completed():
+                print(poller.result().name)
+
+    :keyword int max_workers: The maximum number of threads sending status requests. Defaults to 8.
+    :keyword float merge_window: Polling times are rounded up to a multiple of this many seconds. 0 disables
+        rounding. Defaults to 1.
+    """
+
+    def __init__(self, *, max_workers: int = 8, merge_window: float = 1.0) -> None:
+        self._max_workers = max_workers
+        self._merge_window = merge_window
+        self._condition = threading.Condition()
+        self._pollers: List[LROPoller] = []
+        self._completed: Set[LROPoller] = set()
+        self._pending = 0
+        self._in_flight = 0
+        self._timers: List[Tuple[float, int, LROPoller, _Step]] = []
+        self._timer_ids = itertools.count()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
+        self._waiters: List["queue.Queue[LROPoller]"] = []
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "LROPollerGroup":
+        self._tokens.append(_current_poller_group.set(self))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        _current_poller_group.reset(self._tokens.pop())
+        self.wait_all()
+
+    @property
+    def pollers(self) -> List[LROPoller]:
+        """The pollers of the group, in the order they joined it.
+
+        :rtype: list[~azure.core.polling.LROPoller]
+        :return: The pollers of the group.
+        """
+        with self._condition:
+            return list(self._pollers)
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[LROPoller]:
+        """Yield the pollers of the group as their operations complete, successfully or not.
+
+        Only the pollers in the group when this is called are yielded.
+
+        :param float timeout: The maximum number of seconds to wait for all the operations. Defaults to no limit.
+        :return: An iterator of the completed pollers.
+        :rtype: iterator[~azure.core.polling.LROPoller]
+        :raises TimeoutError: If some operations are not complete after `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiter: "queue.Queue[LROPoller]" = queue.Queue()
+        with self._condition:
+            pending = set(self._pollers)
+            done = [poller for poller in self._pollers if poller in self._completed]
+            self._waiters.append(waiter)
+        try:
+            for poller in done:
+                pending.discard(poller)
+                yield poller
+            while pending:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    poller = waiter.get(timeout=remaining)
+                except queue.Empty:
+                    raise TimeoutError(  # pylint: disable=raise-missing-from
+                        "{} (of {}) long running operations did not complete".format(len(pending), len(self._pollers))
+                    )
+                if poller in pending:
+                    pending.discard(poller)
+                    yield poller
+        finally:
+            with self._condition:
+                self._waiters.remove(waiter)
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the operations of all the pollers of the group to complete.
+
+        Errors of the operations are not raised: call `result()` on the pollers to get them.
+
+        :param float timeout: The maximum number of seconds to wait. Defaults to no limit.
+        :return: True if all the operations completed, False if some did not after `timeout` seconds.
+        :rtype: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def _add(self, poller: LROPoller) -> bool:
+        """Add a poller to the group. Called by the poller when it is created in the context of the group.
+
+        :param poller: The new poller.
+        :type poller: ~azure.core.polling.LROPoller
+        :return: True if the group polls the operation, False if the poller must poll it from its own thread.
+        :rtype: bool
+        """
+        polling_method = poller.polling_method()
+        with self._condition:
+            self._pollers.append(poller)
+            if poller.done():
+                self._complete(poller)
+                return True
+            self._pending += 1
+            if not _can_poll_in_steps(polling_method, LROBasePolling):
+                return False
+            # Same as "run": the status is updated once right away
+            polling_method = cast(LROBasePolling, polling_method)
+            step = with_current_context(polling_method._poll_once)  # pylint: disable=protected-access
+            self._add_timer(poller, step, 0)
+            if self._scheduler is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="LROPollerGroup")
+                self._scheduler = threading.Thread(target=self._schedule, name="LROPollerGroup", daemon=True)
+                self._scheduler.start()
+        return True
+
+    def _on_done(self, poller: LROPoller) -> None:
+        """Called by a poller polling from its own thread when its operation completed.
+
+        :param poller: The completed poller.
+        :type poller: ~azure.core.polling.LROPoller
+        """
+        with self._condition:
+            self._pending -= 1
+            self._complete(poller)
+
+    def _complete(self, poller: LROPoller) -> None:
+        # Called with the condition held
+        self._completed.add(poller)
+        for waiter in self._waiters:
+            waiter.put(poller)
+        self._condition.notify_all()
+
+    def _add_timer(self, poller: LROPoller, step: _Step, delay: float) -> None:
+        # Called with the condition held
+        due = time.monotonic() + delay
+        if delay and self._merge_window > 0:
+            due = math.ceil(due / self._merge_window) * self._merge_window
+        heapq.heappush(self._timers, (due, next(self._timer_ids), poller, step))
+        self._condition.notify_all()
+
+    def _schedule(self) -> None:
+        """Submit the polling steps that are due to the workers, until no operation is left to poll."""
+        with self._condition:
+            while self._timers or self._in_flight:
+                now = time.monotonic()
+                if not self._timers or self._timers[0][0] > now:
+                    self._condition.wait(timeout=self._timers[0][0] - now if self._timers else None)
+                    continue
+                while self._timers and self._timers[0][0] <= now:
+                    _, _, poller, step = heapq.heappop(self._timers)
+                    self._in_flight += 1
+                    self._executor.submit(self._poll, poller, step)  # type: ignore[union-attr]
+            self._executor.shutdown(wait=False)  # type: ignore[union-attr]
+            self._executor = None
+            self._scheduler = None
+
+    def _poll(self, poller: LROPoller, step: _Step) -> None:
+        """Run one polling step of an operation, then schedule the next one or complete the poller.
+
+        :param poller: The poller of the operation.
+        :type poller: ~azure.core.polling.LROPoller
+        :param callable step: The `_poll_once` method of its polling method.
+        """
+        delay: Optional[float] = None
+        try:
+            try:
+                delay = step()
+            except Exception as error:  # pylint: disable=broad-except
+                poller._set_exception(error)  # pylint: disable=protected-access
+            if delay is not None:
+                with self._condition:
+                    self._add_timer(poller, step, delay)
+                return
+            poller._done.set()  # pylint: disable=protected-access
+            try:
+                poller._run_callbacks()  # pylint: disable=protected-access
+            finally:
+                with self._condition:
+                    self._pending -= 1
+                    self._complete(poller)
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
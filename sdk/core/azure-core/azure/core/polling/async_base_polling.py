@@ -23,8 +23,7 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
-from typing import TypeVar, cast, Union
-from ..exceptions import HttpResponseError
+from typing import Optional, TypeVar, cast, Union
 from .base_polling import (
     _failed,
     BadStatus,
@@ -89,21 +88,28 @@ class AsyncLROBasePolling(
     async def run(self) -> None:
         try:
             await self._poll()
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            raise self._as_http_response_error(err) from err
 
-        except BadStatus as err:
-            self._status = "Failed"
-            raise HttpResponseError(response=self._pipeline_response.http_response, error=err) from err
+    async def _poll_once(self) -> Optional[float]:
+        """Run one step of `run`, for a poller driven by a ~azure.core.polling.AsyncLROPollerGroup.
 
-        except BadResponse as err:
-            self._status = "Failed"
-            raise HttpResponseError(
-                response=self._pipeline_response.http_response,
-                message=str(err),
-                error=err,
-            ) from err
+        Updates the status of the operation, and gets the final resource once the operation is finished.
+        Calling this again after the returned delay until it returns None polls as `run` does.
 
-        except OperationFailed as err:
-            raise HttpResponseError(response=self._pipeline_response.http_response, error=err) from err
+        :return: The delay in seconds before the next step, or None if polling is done.
+        :rtype: float or None
+        :raises ~azure.core.exceptions.HttpResponseError: If the operation failed, as `run` does.
+        """
+        try:
+            if not self.finished():
+                await self.update_status()
+            if not self.finished():
+                return self._extract_delay()
+            await self._finish_polling()
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            raise self._as_http_response_error(err) from err
+        return None
 
     async def _poll(self) -> None:
         """Poll status of operation so long as operation is incomplete and
@@ -118,7 +124,14 @@ class AsyncLROBasePolling(
         while not self.finished():
             await self._delay()
             await self.update_status()
+        await self._finish_polling()
+
+    async def _finish_polling(self) -> None:
+        """Check the final status of the operation and get the final resource if needed.
 
+        :raises ~azure.core.polling.base_polling.OperationFailed: If operation status 'Failed' or 'Canceled'.
+        :raises ~azure.core.polling.base_polling.BadStatus: If response status invalid.
+        """
         if _failed(self.status()):
             raise OperationFailed("Operation failed or canceled")
 
@@ -747,6 +747,20 @@ class _SansIOLROBasePolling(
             return delay
         return self._timeout
 
+    def _as_http_response_error(self, err: Exception) -> HttpResponseError:
+        """Convert an error raised while polling into the error raised by `run`.
+
+        :param err: A BadStatus, BadResponse or OperationFailed error.
+        :type err: Exception
+        :return: The error to raise from `err`.
+        :rtype: ~azure.core.exceptions.HttpResponseError
+        """
+        if isinstance(err, (BadStatus, BadResponse)):
+            self._status = "Failed"
+        if isinstance(err, BadResponse):
+            return HttpResponseError(response=self._pipeline_response.http_response, message=str(err), error=err)
+        return HttpResponseError(response=self._pipeline_response.http_response, error=err)
+
 
 class LROBasePolling(
     _SansIOLROBasePolling[
@@ -796,6 +810,8 @@ class LROBasePolling(
             "_sleep",
             "_delay",
             "_poll",
+            "_poll_once",
+            "_finish_polling",
         ]:
             return getattr(super(LROBasePolling, self), name)
         return super().__getattribute__(name)
@@ -803,21 +819,28 @@ class LROBasePolling(
     def run(self) -> None:
         try:
             self._poll()
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            raise self._as_http_response_error(err) from err
 
-        except BadStatus as err:
-            self._status = "Failed"
-            raise HttpResponseError(response=self._pipeline_response.http_response, error=err) from err
+    def _poll_once(self) -> Optional[float]:
+        """Run one step of `run`, for a poller driven by a ~azure.core.polling.LROPollerGroup.
 
-        except BadResponse as err:
-            self._status = "Failed"
-            raise HttpResponseError(
-                response=self._pipeline_response.http_response,
-                message=str(err),
-                error=err,
-            ) from err
+        Updates the status of the operation, and gets the final resource once the operation is finished.
+        Calling this again after the returned delay until it returns None polls as `run` does.
 
-        except OperationFailed as err:
-            raise HttpResponseError(response=self._pipeline_response.http_response, error=err) from err
+        :return: The delay in seconds before the next step, or None if polling is done.
+        :rtype: float or None
+        :raises ~azure.core.exceptions.HttpResponseError: If the operation failed, as `run` does.
+        """
+        try:
+            if not self.finished():
+                self.update_status()
+            if not self.finished():
+                return self._extract_delay()
+            self._finish_polling()
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            raise self._as_http_response_error(err) from err
+        return None
 
     def _poll(self) -> None:
         """Poll status of operation so long as operation is incomplete and
@@ -832,7 +855,14 @@ class LROBasePolling(
         while not self.finished():
             self._delay()
             self.update_status()
+        self._finish_polling()
 
+    def _finish_polling(self) -> None:
+        """Check the final status of the operation and get the final resource if needed.
+
+        :raises ~azure.core.polling.base_polling.OperationFailed: If operation status 'Failed' or 'Canceled'.
+        :raises ~azure.core.polling.base_polling.BadStatus: If response status invalid.
+        """
         if _failed(self.status()):
             raise OperationFailed("Operation failed or canceled")
 
@@ -79,8 +79,8 @@ FileType = Union[
 
 FilesType = Union[Mapping[str, FileType], Sequence[Tuple[str, FileType]]]
 
-ContentTypeBase = Union[str, bytes, Iterable[bytes]]
-ContentType = Union[str, bytes, Iterable[bytes], AsyncIterable[bytes]]
+ContentTypeBase = Union[str, bytes, bytearray, memoryview, Iterable[bytes]]
+ContentType = Union[str, bytes, bytearray, memoryview, Iterable[bytes], AsyncIterable[bytes]]
 
 DataType = Optional[Union[bytes, Dict[str, Union[str, int]]]]
 
@@ -127,6 +127,27 @@ def set_xml_body(content):
     return headers, body
 
 
+def _byte_view(content: Any) -> Optional[memoryview]:
+    """Return a flat unsigned-byte view over a buffer-protocol object, or None.
+
+    The view shares memory with ``content``; a copy is only made when the buffer is
+    not C-contiguous.
+
+    :param any content: The object to view.
+    :return: A one-dimensional memoryview of format "B", or None if content does not support the buffer protocol.
+    :rtype: memoryview or None
+    """
+    try:
+        view = memoryview(content)
+    except TypeError:
+        return None
+    if not view.c_contiguous:
+        return memoryview(view.tobytes())
+    if view.format == "B" and view.ndim == 1:
+        return view
+    return view.cast("B")
+
+
 def set_content_body(
     content: Any,
 ) -> Tuple[MutableMapping[str, str], Optional[ContentTypeBase]]:
@@ -143,11 +164,20 @@ def set_content_body(
         if body:
             headers["Content-Length"] = str(len(body))
         return headers, body
+    if not hasattr(content, "read"):
+        # bytearray, memoryview, array.array, mmap and other buffer-protocol objects
+        # are sent as a flat byte view instead of being iterated or copied into bytes
+        view = _byte_view(content)
+        if view is not None:
+            if view.nbytes:
+                headers["Content-Length"] = str(view.nbytes)
+            return headers, view
     if any(hasattr(content, attr) for attr in ["read", "__iter__", "__aiter__"]):
         return headers, content
     raise TypeError(
         "Unexpected type for 'content': '{}'. ".format(type(content))
-        + "We expect 'content' to either be str, bytes, a open file-like object or an iterable/asynciterable."
+        + "We expect 'content' to either be str, bytes, a bytes-like object, a open file-like object "
+        + "or an iterable/asynciterable."
     )
 
 
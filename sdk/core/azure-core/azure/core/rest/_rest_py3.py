@@ -38,6 +38,7 @@ from typing import (
     AsyncContextManager,
 )
 
+from ..exceptions import ResponseNotReadError
 from ..utils._utils import case_insensitive_dict
 
 from ._helpers import (
@@ -51,7 +52,38 @@ from ._helpers import (
     set_content_body,
 )
 
-ContentType = Union[str, bytes, Iterable[bytes], AsyncIterable[bytes]]
+ContentType = Union[str, bytes, bytearray, memoryview, Iterable[bytes], AsyncIterable[bytes]]
+
+
+async def _single_chunk(content: bytes) -> AsyncIterator[bytes]:
+    yield content
+
+
+class _ReadIntoState:
+    """Where `readinto` stopped in the body of a response.
+
+    :param chunks: The iterator, or async iterator, of the chunks of the body.
+    :type chunks: iterator[bytes] or asynciterator[bytes]
+    """
+
+    def __init__(self, chunks: Any) -> None:
+        self.chunks = chunks
+        # The part of the last chunk not copied yet
+        self.pending: memoryview = memoryview(b"")
+
+    def copy_pending(self, target: memoryview, filled: int) -> int:
+        """Copy the pending bytes into the free part of a buffer.
+
+        :param memoryview target: The buffer.
+        :param int filled: The number of bytes already in the buffer.
+        :return: The number of bytes copied.
+        :rtype: int
+        """
+        count = min(len(target) - filled, len(self.pending))
+        target[filled : filled + count] = self.pending[:count]
+        self.pending = self.pending[count:]
+        return count
+
 
 ################################## CLASSES ######################################
 
@@ -76,9 +108,9 @@ class HttpRequest(HttpRequestBackcompatMixin):
     :keyword any json: A JSON serializable object. We handle JSON-serialization for your
      object, so use this for more complicated data structures than `data`.
     :keyword content: Content you want in your request body. Think of it as the kwarg you should input
-     if your data doesn't fit into `json`, `data`, or `files`. Accepts a bytes type, or a generator
-     that yields bytes.
-    :paramtype content: str or bytes or iterable[bytes] or asynciterable[bytes]
+     if your data doesn't fit into `json`, `data`, or `files`. Accepts a bytes type, a bytes-like object
+     such as bytearray or memoryview (sent as a view, without copying), or a generator that yields bytes.
+    :paramtype content: str or bytes or bytearray or memoryview or iterable[bytes] or asynciterable[bytes]
     :keyword dict data: Form data you want in your request body. Use for form-encoded data, i.e.
      HTML forms.
     :keyword mapping files: Files you want to in your request body. Use for uploading files with
@@ -331,6 +363,9 @@ class HttpResponse(_HttpResponseBase):
     <HttpResponse: 200 OK>
     """
 
+    # Set by the first call to readinto
+    _readinto_state: Optional[_ReadIntoState] = None
+
     @abc.abstractmethod
     def __enter__(self) -> "HttpResponse": ...
 
@@ -364,6 +399,54 @@ class HttpResponse(_HttpResponseBase):
         :rtype: Iterator[str]
         """
 
+    def readinto(self, buffer: Any) -> int:
+        """Read the next bytes of the (decompressed) body into a caller-provided buffer.
+
+        The buffer can be any writable bytes-like object (bytearray, memoryview, mmap, ...).
+        Bytes are copied straight from the transport chunks into it, so large downloads can
+        reuse one buffer instead of allocating a new bytes object per chunk.
+
+        :param buffer: The writable bytes-like object to fill.
+        :type buffer: bytearray or memoryview
+        :return: The number of bytes written into buffer. 0 means the body is exhausted.
+        :rtype: int
+        """
+        target = memoryview(buffer).cast("B")
+        state = self._readinto_state
+        if state is None:
+            try:
+                chunks: Iterator[Any] = iter((self.content,))
+            except ResponseNotReadError:
+                chunks = self.iter_bytes()
+            state = self._readinto_state = _ReadIntoState(chunks)
+        filled = 0
+        while filled < len(target):
+            if not state.pending:
+                try:
+                    state.pending = memoryview(next(state.chunks)).cast("B")
+                except StopIteration:
+                    break
+            filled += state.copy_pending(target, filled)
+        return filled
+
+    def iter_bytes_into(self, buffer: Any) -> Iterator[memoryview]:
+        """Iterates over the (decompressed) body, filling the caller-provided buffer each time.
+
+        Each yielded memoryview is a slice of buffer and is only valid until the next
+        iteration, since the buffer is overwritten.
+
+        :param buffer: The writable bytes-like object to fill.
+        :type buffer: bytearray or memoryview
+        :return: An iterator of memoryview slices over buffer
+        :rtype: Iterator[memoryview]
+        """
+        target = memoryview(buffer).cast("B")
+        while True:
+            count = self.readinto(target)
+            if not count:
+                return
+            yield target[:count]
+
     def __repr__(self) -> str:
         content_type_str = ", Content-Type: {}".format(self.content_type) if self.content_type else ""
         return "<HttpResponse: {} {}{}>".format(self.status_code, self.reason, content_type_str)
@@ -384,6 +467,9 @@ class AsyncHttpResponse(_HttpResponseBase, AsyncContextManager["AsyncHttpRespons
     <AsyncHttpResponse: 200 OK>
     """
 
+    # Set by the first call to readinto
+    _readinto_state: Optional[_ReadIntoState] = None
+
     @abc.abstractmethod
     async def read(self) -> bytes:
         """Read the response's bytes into memory.
@@ -414,5 +500,55 @@ class AsyncHttpResponse(_HttpResponseBase, AsyncContextManager["AsyncHttpRespons
         # getting around mypy behavior, see https://github.com/python/mypy/issues/10732
         yield  # pylint: disable=unreachable
 
+    async def readinto(self, buffer: Any) -> int:
+        """Read the next bytes of the (decompressed) body into a caller-provided buffer.
+
+        The buffer can be any writable bytes-like object (bytearray, memoryview, mmap, ...).
+        Bytes are copied straight from the transport chunks into it, so large downloads can
+        reuse one buffer instead of allocating a new bytes object per chunk.
+
+        :param buffer: The writable bytes-like object to fill.
+        :type buffer: bytearray or memoryview
+        :return: The number of bytes written into buffer. 0 means the body is exhausted.
+        :rtype: int
+        """
+        target = memoryview(buffer).cast("B")
+        state = self._readinto_state
+        if state is None:
+            try:
+                content = self.content
+            except ResponseNotReadError:
+                chunks: Any = self.iter_bytes()
+            else:
+                chunks = _single_chunk(content)
+            state = self._readinto_state = _ReadIntoState(chunks)
+        filled = 0
+        while filled < len(target):
+            if not state.pending:
+                try:
+                    state.pending = memoryview(await state.chunks.__anext__()).cast("B")
+                except StopAsyncIteration:
+                    break
+            filled += state.copy_pending(target, filled)
+        return filled
+
+    async def iter_bytes_into(self, buffer: Any) -> AsyncIterator[memoryview]:
+        """Asynchronously iterates over the (decompressed) body, filling the caller-provided buffer each time.
+
+        Each yielded memoryview is a slice of buffer and is only valid until the next
+        iteration, since the buffer is overwritten.
+
+        :param buffer: The writable bytes-like object to fill.
+        :type buffer: bytearray or memoryview
+        :return: An async iterator of memoryview slices over buffer
+        :rtype: AsyncIterator[memoryview]
+        """
+        target = memoryview(buffer).cast("B")
+        while True:
+            count = await self.readinto(target)
+            if not count:
+                return
+            yield target[:count]
+
     @abc.abstractmethod
     async def close(self) -> None: ...
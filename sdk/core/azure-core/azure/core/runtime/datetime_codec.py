@@ -0,0 +1,146 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""Parsing of the date-time formats used by Azure services.
+
+Timestamps are often the most frequent values of a payload (blob listings, table entities, monitor rows,
+activity logs), and the same timestamp tends to repeat within a response. The parsers keep a bounded cache of the
+values they parsed last, and use a compiled parser for ISO-8601 when one is available: `ciso8601
+<https://pypi.org/project/ciso8601/>`_ if it is installed, otherwise ``datetime.fromisoformat`` on Python 3.11+.
+"""
+import datetime
+import email.utils
+import functools
+import re
+import sys
+from typing import Callable, Optional
+
+try:
+    from ciso8601 import parse_datetime as _ciso8601_parse_datetime  # type: ignore
+except ImportError:
+    _ciso8601_parse_datetime = None
+
+_COMPILED_PARSER: Optional[Callable[[str], datetime.datetime]] = _ciso8601_parse_datetime
+if _COMPILED_PARSER is None and sys.version_info >= (3, 11):
+    _COMPILED_PARSER = datetime.datetime.fromisoformat
+
+_ISO8601 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:[.,](\d+))?(?:(Z)|([-+])(\d{2})(?::?(\d{2}))?)?\Z",
+    re.IGNORECASE,
+)
+
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+_CACHE_SIZE = 1024
+
+__all__ = ["parse_iso8601", "parse_rfc1123"]
+
+
+def _parse_iso8601(match: "re.Match[str]") -> datetime.datetime:
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    tzinfo: Optional[datetime.tzinfo] = None
+    if utc:
+        tzinfo = datetime.timezone.utc
+    elif sign:
+        offset = datetime.timedelta(hours=int(offset_hours), minutes=int(offset_minutes or 0))
+        tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond, tzinfo=tzinfo
+    )
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def parse_iso8601(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 date-time, as in ``2024-01-01T12:00:00.1234567Z``.
+
+    The date and time down to the seconds are required. Fractional seconds are truncated to microseconds and the
+    time zone is optional: a value without one is returned as a naive datetime.
+
+    :param str value: The date-time to parse.
+    :return: The parsed date-time.
+    :rtype: ~datetime.datetime
+    :raises ValueError: If the value is not an ISO-8601 date-time.
+    :raises OverflowError: If the value is out of the range of datetime once converted to UTC.
+    """
+    # The compiled parsers accept more shapes than services send (dates only, basic format, a space before the
+    # time zone, ...), so the shape is checked first and every environment accepts the same values
+    match = _ISO8601.match(value)
+    if not match:
+        raise ValueError("Invalid datetime string: " + value)
+    if _COMPILED_PARSER is not None:
+        try:
+            result = _COMPILED_PARSER(value)
+        except ValueError:
+            result = _parse_iso8601(match)
+    else:
+        result = _parse_iso8601(match)
+    if result.tzinfo is not None and result.year in (1, 9999):
+        result.utctimetuple()  # raises OverflowError if the value in UTC is out of range
+    return result
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def parse_rfc1123(value: str) -> datetime.datetime:
+    """Parse an RFC-1123 date-time, as in ``Mon, 01 Jan 2024 12:00:00 GMT``.
+
+    Other formats accepted by :func:`email.utils.parsedate_tz` are parsed by it.
+
+    :param str value: The date-time to parse.
+    :return: The parsed date-time, timezone-aware.
+    :rtype: ~datetime.datetime
+    :raises ValueError: If the value is not an RFC-1123 date-time.
+    """
+    parts = value.split(" ")
+    if len(parts) == 6 and parts[5] == "GMT" and parts[2] in _MONTHS:
+        try:
+            hour, minute, second = parts[4].split(":")
+            return datetime.datetime(
+                int(parts[3]),
+                _MONTHS[parts[2]],
+                int(parts[1]),
+                int(hour),
+                int(minute),
+                int(second),
+                tzinfo=datetime.timezone.utc,
+            )
+        except ValueError:
+            pass
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        raise ValueError("Invalid datetime string: " + value)
+    return datetime.datetime(*parsed[:6], tzinfo=datetime.timezone(datetime.timedelta(seconds=parsed[9] or 0)))
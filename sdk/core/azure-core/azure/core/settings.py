@@ -425,6 +425,9 @@ class Settings:
     :type tracing_enabled: PrioritizedSetting
     :cvar tracing_implementation: The tracing implementation to use (AZURE_SDK_TRACING_IMPLEMENTATION)
     :type tracing_implementation: PrioritizedSetting
+    :cvar tracing_head_sampling: Whether native tracing skips the spans of calls whose parent span was not
+        sampled, instead of asking the sampler for each of them (AZURE_TRACING_HEAD_SAMPLING)
+    :type tracing_head_sampling: PrioritizedSetting
 
     :Example:
 
@@ -523,6 +526,13 @@ class Settings:
         default=None,
     )
 
+    tracing_head_sampling: PrioritizedSetting[Union[str, bool], bool] = PrioritizedSetting(
+        "tracing_head_sampling",
+        env_var="AZURE_TRACING_HEAD_SAMPLING",
+        convert=convert_bool,
+        default=False,
+    )
+
     azure_cloud: PrioritizedSetting[Union[str, AzureClouds], AzureClouds] = PrioritizedSetting(
         "azure_cloud",
         env_var="AZURE_CLOUD",
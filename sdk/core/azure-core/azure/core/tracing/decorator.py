@@ -124,7 +124,6 @@ def distributed_trace(
 
             # Assume this will be popped in DistributedTracingPolicy.
             func_tracing_attributes = kwargs.get("tracing_attributes", tracing_attributes)
-            span_attributes = {**func_tracing_attributes, **tracing_options.get("attributes", {})}
 
             span_impl_type = settings.tracing_implementation()
 
@@ -133,7 +132,7 @@ def distributed_trace(
                 # Plugin path
                 with change_context(passed_in_parent):
                     with span_impl_type(name=name, kind=kind) as span:
-                        for key, value in span_attributes.items():
+                        for key, value in {**func_tracing_attributes, **tracing_options.get("attributes", {})}.items():
                             span.add_attribute(key, value)  # type: ignore
                         return func(*args, **kwargs)
             else:
@@ -150,16 +149,23 @@ def distributed_trace(
                 if not method_tracer:
                     return func(*args, **kwargs)
 
+                # The head of the trace already decided not to sample it: the span would be dropped as well.
+                # pylint: disable-next=protected-access
+                if settings.tracing_head_sampling() and method_tracer._is_current_span_sampled_out():
+                    return func(*args, **kwargs)
+
                 span_suppression_token = _in_span_context.set(True)
                 try:
                     with method_tracer.start_as_current_span(
                         name=name,
                         kind=kind,
-                        attributes=span_attributes,
+                        attributes={**func_tracing_attributes, **tracing_options.get("attributes", {})},
                     ) as span:
                         try:
                             return func(*args, **kwargs)
                         except Exception as err:  # pylint: disable=broad-except
+                            if not span.is_recording():
+                                raise
                             ex_type = type(err)
                             module = ex_type.__module__ if ex_type.__module__ != "builtins" else ""
                             error_type = f"{module}.{ex_type.__qualname__}" if module else ex_type.__qualname__
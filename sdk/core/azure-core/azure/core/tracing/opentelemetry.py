@@ -5,7 +5,7 @@
 from __future__ import annotations
 from contextlib import contextmanager
 from contextvars import Token
-from typing import Any, Optional, Dict, Sequence, cast, Callable, Iterator, TYPE_CHECKING
+from typing import Any, Optional, Dict, Sequence, Tuple, cast, Callable, Iterator, TYPE_CHECKING
 
 from opentelemetry import context as otel_context_module, trace
 from opentelemetry.trace import (
@@ -15,7 +15,7 @@ from opentelemetry.trace import (
     StatusCode,
 )
 from opentelemetry.trace.propagation import get_current_span as get_current_span_otel
-from opentelemetry.propagate import extract, inject
+from opentelemetry.propagate import extract, get_global_textmap, inject
 
 try:
     from opentelemetry.context import _SUPPRESS_HTTP_INSTRUMENTATION_KEY  # type: ignore[attr-defined]
@@ -59,6 +59,9 @@ class OpenTelemetryTracer:
     :paramtype attributes: Mapping[str, AttributeValue]
     """
 
+    # The last context passed to `_get_current_trace_context`, with the propagator and the headers it injected.
+    _last_trace_context: Tuple[Any, Any, Dict[str, str]] = (None, None, {})
+
     def __init__(
         self,
         *,
@@ -255,6 +258,50 @@ class OpenTelemetryTracer:
         inject(trace_context)
         return trace_context
 
+    @classmethod
+    def _get_span_trace_context(cls, span: Span) -> Dict[str, str]:
+        """Returns the Trace Context header values associated with the given span.
+
+        Equivalent to calling `get_trace_context` inside `use_span(span)`, without activating the span.
+
+        :param span: The span to get the trace context of
+        :type span: ~opentelemetry.trace.Span
+        :return: A key value pair dictionary
+        :rtype: dict[str, str]
+        """
+        trace_context: Dict[str, str] = {}
+        inject(trace_context, context=trace.set_span_in_context(span))
+        return trace_context
+
+    @classmethod
+    def _get_current_trace_context(cls) -> Dict[str, str]:
+        """Returns the Trace Context header values associated with the current context.
+
+        Same as `get_trace_context`, but the headers are injected again only when the current context or the global
+        propagator changed since the last call. Calls made under the same parent span reuse its headers.
+
+        :return: A key value pair dictionary
+        :rtype: dict[str, str]
+        """
+        context = otel_context_module.get_current()
+        propagator = get_global_textmap()
+        last_context, last_propagator, trace_context = cls._last_trace_context
+        if context is not last_context or propagator is not last_propagator:
+            trace_context = {}
+            inject(trace_context, context=context)
+            cls._last_trace_context = (context, propagator, trace_context)
+        return dict(trace_context)
+
+    @classmethod
+    def _is_current_span_sampled_out(cls) -> bool:
+        """Whether the current span belongs to a trace that its head decided not to sample.
+
+        :return: True if there is a valid current span and its sampled flag is not set
+        :rtype: bool
+        """
+        span_context = get_current_span_otel().get_span_context()
+        return span_context.is_valid and not span_context.trace_flags.sampled
+
     @classmethod
     def _suppress_auto_http_instrumentation(cls) -> Token:
         """Enabled automatic HTTP instrumentation suppression.
@@ -5,6 +5,7 @@
 # -------------------------------------------------------------------------
 import asyncio
 import base64
+import copy
 import sys
 import time
 from unittest.mock import Mock, patch, AsyncMock, create_autospec
@@ -640,3 +641,132 @@ async def test_async_bearer_policy_on_challenge_caches_token(http_request):
 
     # Verify the Authorization header was set correctly
     assert request.http_request.headers["Authorization"] == "Bearer claims_token"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_bearer_policy_concurrent_refreshes_are_deduplicated(http_request):
+    get_token_calls = 0
+
+    async def get_token(*_, **__):
+        nonlocal get_token_calls
+        get_token_calls += 1
+        await asyncio.sleep(0.05)
+        return AccessToken("token", int(time.time() + 3600))
+
+    credential = Mock(spec_set=["get_token"], get_token=get_token)
+    policies = [
+        AsyncBearerTokenCredentialPolicy(credential, "scope"),
+        Mock(send=lambda _: get_completed_future(Mock())),
+    ]
+    pipeline = AsyncPipeline(transport=Mock(), policies=policies)
+    await asyncio.gather(*(pipeline.run(http_request("GET", "https://spam.eggs")) for _ in range(5)))
+    assert get_token_calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_bearer_policy_background_refresh(http_request):
+    now = int(time.time())
+    release = asyncio.Event()
+    tokens = [AccessTokenInfo("new", now + 3600), AccessTokenInfo("old", now + 3600, refresh_on=now - 1)]
+    get_token_calls = 0
+
+    async def get_token_info(*_, **__):
+        nonlocal get_token_calls
+        get_token_calls += 1
+        token = tokens.pop()
+        if token.token == "new":
+            await release.wait()
+        return token
+
+    sent = []
+
+    def send(request):
+        sent.append(request.http_request.headers["Authorization"])
+        return get_completed_future(Mock())
+
+    credential = Mock(spec_set=["get_token_info"], get_token_info=get_token_info)
+    policy = AsyncBearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    pipeline = AsyncPipeline(transport=Mock(), policies=[policy, Mock(send=send)])
+
+    # No token yet: the request waits for one
+    await pipeline.run(http_request("GET", "https://spam.eggs"))
+    # The token is due for refresh: requests don't wait, a single background refresh is started
+    for _ in range(3):
+        await pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert sent == ["Bearer old"] * 4
+
+    release.set()
+    await policy._refresh_task
+    assert get_token_calls == 2
+    await pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert sent[-1] == "Bearer new"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_bearer_policy_background_refresh_failure_throttled(http_request):
+    now = int(time.time())
+    credential = Mock(
+        spec_set=["get_token"],
+        get_token=AsyncMock(
+            side_effect=[AccessToken("old", now + 200), ValueError("unavailable"), AccessToken("new", now + 3600)]
+        ),
+    )
+    policy = AsyncBearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    pipeline = AsyncPipeline(transport=Mock(), policies=[policy, Mock(send=lambda _: get_completed_future(Mock()))])
+
+    await pipeline.run(http_request("GET", "https://spam.eggs"))
+    await pipeline.run(http_request("GET", "https://spam.eggs"))
+    await policy._refresh_task
+    assert policy._token.token == "old"
+
+    # The refresh failed moments ago: the cached token is used without asking the credential again
+    for _ in range(3):
+        await pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert credential.get_token.call_count == 2
+
+    policy._last_refresh_failure -= 60
+    await pipeline.run(http_request("GET", "https://spam.eggs"))
+    await policy._refresh_task
+    assert policy._token.token == "new"
+    assert credential.get_token.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bearer_policy_deepcopy_during_background_refresh():
+    now = int(time.time())
+    release = asyncio.Event()
+
+    async def get_token(*_, **__):
+        await release.wait()
+        return AccessToken("new", now + 3600)
+
+    policy = AsyncBearerTokenCredentialPolicy(Mock(spec_set=["get_token"], get_token=get_token), "scope")
+    policy._token = AccessToken("old", now + 200)
+    policy._refresh_task = asyncio.ensure_future(policy._request_token("scope"))
+    async with policy._lock:
+        policy_copy = copy.deepcopy(policy)
+    assert policy_copy._token.token == "old"
+    assert policy_copy._refresh_task is None
+    assert policy_copy._lock is not policy._lock
+
+    release.set()
+    await policy._refresh_task
+
+
+@pytest.mark.trio
+async def test_bearer_policy_background_refresh_trio():
+    now = int(time.time())
+    credential = Mock(
+        spec_set=["get_token"],
+        get_token=AsyncMock(side_effect=[AccessToken("old", now + 200), AccessToken("new", now + 3600)]),
+    )
+    policy = AsyncBearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    request = PipelineRequest(HttpRequest("GET", "https://spam.eggs"), PipelineContext(None))
+
+    await policy.on_request(request)
+    # No background task under trio, the token is refreshed inline
+    await policy.on_request(request)
+    assert request.http_request.headers["Authorization"] == "Bearer new"
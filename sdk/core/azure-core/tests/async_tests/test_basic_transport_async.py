@@ -1093,3 +1093,28 @@ async def test_aiohttp_timeout_request(http_request):
         stream_request = http_request("GET", f"http://localhost:12345/streams/basic")
         with pytest.raises(ServiceRequestTimeoutError) as err:
             await transport.send(stream_request, stream=True)
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+@pytest.mark.asyncio
+async def test_aiohttp_warm_up_and_pool_stats(port, http_request):
+    async with AioHttpTransport() as transport:
+        assert await transport.warm_up(["http://localhost:{}".format(port)], connections=3) == 3
+        assert transport.pool_stats() == {"created": 3, "active": 0, "idle": 3, "wait_time": 0.0}
+
+        # The requests use the warmed up connections
+        await transport.send(http_request("GET", "http://localhost:{}/basic/string".format(port)))
+        stats = transport.pool_stats()
+        assert stats["created"] == 3
+        assert stats["idle"] == 3
+
+        assert await transport.warm_up(["http://localhost:1"]) == 0
+
+    # Requests wait for a connection when the pool is at its limit
+    async with AioHttpTransport() as transport:
+        transport.session.connector._limit = 1
+        await asyncio.gather(
+            *[transport.send(http_request("GET", "http://localhost:{}/basic/string".format(port))) for _ in range(3)]
+        )
+        assert transport.pool_stats()["created"] == 1
+        assert transport.pool_stats()["wait_time"] > 0
@@ -0,0 +1,48 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the async adaptive concurrency policy."""
+import asyncio
+from unittest.mock import Mock
+import pytest
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.policies import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyPolicy,
+)
+from azure.core.pipeline.transport import HttpResponse, AsyncHttpTransport
+from utils import HTTP_REQUESTS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_concurrency_is_limited(http_request):
+    in_flight = []
+    peak = []
+    status_codes = [429]
+
+    async def send(request, **kwargs):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        response = HttpResponse(request, None)
+        response.status_code = status_codes.pop() if status_codes else 200
+        response.headers = {}
+        return response
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    transport = Mock(spec_set=AsyncHttpTransport, send=Mock(wraps=send))
+    pipeline = AsyncPipeline(transport, [AsyncAdaptiveConcurrencyPolicy(limiter)])
+
+    await pipeline.run(http_request("GET", "http://localhost/"))
+    assert limiter.get_limit("localhost") == 2
+
+    await asyncio.gather(*[pipeline.run(http_request("GET", "http://localhost/")) for _ in range(12)])
+    assert len(peak) == 13
+    # The limit grows back from 2 while the requests succeed
+    assert max(peak[1:3]) == 2
+    assert max(peak[1:]) <= 4
+    assert limiter.get_in_flight("localhost") == 0
+    assert limiter.get_limit("localhost") == 4
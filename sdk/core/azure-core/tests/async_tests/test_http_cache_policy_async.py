@@ -0,0 +1,50 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the async HTTP cache policy."""
+from http.client import HTTPResponse
+from unittest.mock import Mock
+import pytest
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.policies import AsyncHttpCachePolicy
+from azure.core.pipeline.transport import AsyncHttpTransport
+from azure.core.pipeline.transport._base_async import AsyncHttpClientTransportResponse
+from azure.core.rest._http_response_impl_async import RestAsyncHttpClientTransportResponse
+from azure.core.utils._pipeline_transport_rest_shared import BytesIOSocket
+from utils import create_transport_response, request_and_responses_product
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "http_request,http_response",
+    request_and_responses_product([AsyncHttpClientTransportResponse, RestAsyncHttpClientTransportResponse]),
+)
+async def test_revalidate_with_etag(http_request, http_response):
+    requests = []
+
+    async def send(request, **kwargs):
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"1"':
+            data = b'HTTP/1.1 304 Not Modified\r\nETag: "1"\r\nContent-Length: 0\r\n\r\n'
+        else:
+            data = b'HTTP/1.1 200 OK\r\nETag: "1"\r\nContent-Length: 5\r\n\r\nhello'
+        internal_response = HTTPResponse(BytesIOSocket(data))
+        internal_response.begin()
+        response = create_transport_response(http_response, request, internal_response)
+        if hasattr(response, "read"):
+            await response.read()
+        return response
+
+    policy = AsyncHttpCachePolicy()
+    transport = Mock(spec_set=AsyncHttpTransport, send=Mock(wraps=send))
+    pipeline = AsyncPipeline(transport, [policy])
+
+    for _ in range(3):
+        response = await pipeline.run(http_request("GET", "http://localhost/"))
+        http_response_ = response.http_response
+        body = await http_response_.read() if hasattr(http_response_, "read") else http_response_.body()
+        assert body == b"hello"
+    assert len(requests) == 3
+    assert requests[-1]["If-None-Match"] == '"1"'
+    assert (policy.hits, policy.misses, policy.revalidated) == (2, 1, 2)
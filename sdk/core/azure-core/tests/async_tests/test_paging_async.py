@@ -24,6 +24,7 @@
 #
 # --------------------------------------------------------------------------
 
+import asyncio
 from typing import AsyncIterator, TypeVar, List
 
 from azure.core.async_paging import AsyncItemPaged, AsyncList
@@ -117,3 +118,50 @@ class TestPaging:
         with pytest.raises(HttpResponseError) as err:
             await pager.__anext__()
         assert err.value.continuation_token == "foo"
+
+    @pytest.mark.asyncio
+    async def test_by_page_prefetch(self):
+        fetched = []
+
+        async def get_next(continuation_token=None):
+            fetched.append(continuation_token)
+            if not continuation_token:
+                return {"nextLink": "page2", "value": ["value1.0", "value1.1"]}
+            else:
+                return {"nextLink": None, "value": ["value2.0", "value2.1"]}
+
+        async def extract_data(response):
+            return response["nextLink"], AsyncList(response["value"])
+
+        pager = AsyncItemPaged(get_next, extract_data).by_page(prefetch_pages=1)
+        page1 = await pager.__anext__()
+        assert pager.continuation_token == "page2"
+        # Let the background task fetch the next page
+        await asyncio.sleep(0.01)
+        assert fetched == [None, "page2"]
+        assert ["value1.0", "value1.1"] == await _as_list(page1)
+
+        page2 = await pager.__anext__()
+        assert pager.continuation_token is None
+        assert ["value2.0", "value2.1"] == await _as_list(page2)
+        with pytest.raises(StopAsyncIteration):
+            await pager.__anext__()
+
+        pager = AsyncItemPaged(get_next, extract_data, prefetch_pages=2)
+        assert ["value1.0", "value1.1", "value2.0", "value2.1"] == await _as_list(pager)
+
+    @pytest.mark.asyncio
+    async def test_by_page_prefetch_error(self):
+        async def get_next(continuation_token=None):
+            if not continuation_token:
+                return {"nextLink": "page2", "value": ["value1.0", "value1.1"]}
+            raise HttpResponseError()
+
+        async def extract_data(response):
+            return response["nextLink"], AsyncList(response["value"])
+
+        pager = AsyncItemPaged(get_next, extract_data).by_page(prefetch_pages=1)
+        assert ["value1.0", "value1.1"] == await _as_list(await pager.__anext__())
+        with pytest.raises(HttpResponseError) as err:
+            await pager.__anext__()
+        assert err.value.continuation_token == "page2"
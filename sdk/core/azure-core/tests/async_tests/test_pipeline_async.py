@@ -409,3 +409,42 @@ async def test_default_ssl_context():
 
     req = HttpRequest("GET", "https://bing.com")
     await pipeline.run(req)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_pipeline_profiler(http_request):
+    class MockTransport(AsyncHttpTransport):
+        def __init__(self):
+            self._count = 0
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+        async def close(self):
+            pass
+
+        async def open(self):
+            pass
+
+        async def send(self, request, **kwargs):
+            self._count += 1
+            response = Mock(status_code=503 if self._count == 1 else 200, headers={"Content-Length": "5"})
+            return response
+
+    profiles = []
+    client = AsyncPipelineClient(
+        "http://localhost",
+        transport=MockTransport(),
+        policies=[UserAgentPolicy("test"), AsyncRetryPolicy(retry_backoff_factor=0)],
+        pipeline_profiler=profiles.append,
+    )
+    response = await client._pipeline.run(http_request("GET", "http://localhost/"))
+    assert response.http_response.status_code == 200
+
+    profile = profiles[0]
+    assert [name for name, _ in profile.policy_times] == ["UserAgentPolicy", "AsyncRetryPolicy"]
+    assert profile.total_time == pytest.approx(sum(time for _, time in profile.policy_times) + profile.transport_time)
+    assert profile.retry_count == 1
+    assert profile.response_bytes == 10
+    assert profile.status_code == 200
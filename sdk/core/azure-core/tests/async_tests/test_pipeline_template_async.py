@@ -0,0 +1,57 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the precompiled async pipeline templates."""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+import pytest
+from azure.core import AsyncPipelineClient
+from azure.core.pipeline import AsyncPipelineTemplate
+from azure.core.pipeline.policies import AsyncRetryPolicy, HeadersPolicy, UserAgentPolicy
+from azure.core.pipeline.transport import HttpResponse, AsyncHttpTransport
+from utils import HTTP_REQUESTS
+
+
+def _mock_transport(sent):
+    async def send(request, **kwargs):
+        sent.append(request)
+        await asyncio.sleep(0)
+        response = HttpResponse(request, None)
+        response.status_code = 200
+        response.headers = {}
+        return response
+
+    return AsyncMock(spec_set=AsyncHttpTransport, send=Mock(wraps=send))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_pipelines_share_transport(http_request):
+    sent = []
+    transport = _mock_transport(sent)
+    headers_policy = HeadersPolicy({"x-shared": "yes"})
+    template = AsyncPipelineTemplate(transport, [headers_policy, AsyncRetryPolicy(), UserAgentPolicy("template")])
+
+    pipelines = [
+        template.create_pipeline(),
+        template.create_pipeline(overrides={UserAgentPolicy: UserAgentPolicy("tenant")}),
+    ]
+    assert pipelines[0]._impl_policies[0]._policy is headers_policy
+    assert pipelines[0]._impl_policies[1] is not pipelines[1]._impl_policies[1]
+
+    await asyncio.gather(*(pipeline.run(http_request("GET", "http://localhost/")) for pipeline in pipelines))
+    assert transport.send.call_count == 2
+    assert all(request.headers["x-shared"] == "yes" for request in sent)
+    assert sorted("tenant" in request.headers["User-Agent"] for request in sent) == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_closing_a_pipeline_keeps_the_transport_open():
+    transport = _mock_transport([])
+    async with AsyncPipelineTemplate(transport, [HeadersPolicy()]) as template:
+        async with AsyncPipelineClient("http://localhost", pipeline=template.create_pipeline()):
+            pass
+        transport.open.assert_awaited_once_with()
+        transport.__aexit__.assert_not_called()
+    transport.__aexit__.assert_awaited_once()
@@ -0,0 +1,239 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+from requests import Response
+
+from azure.core import AsyncPipelineClient
+from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline import AsyncPipeline, PipelineContext, PipelineResponse
+from azure.core.pipeline.transport import AsyncHttpTransport
+from azure.core.polling import AsyncLROPoller, AsyncLROPollerGroup, AsyncNoPolling
+from azure.core.polling.async_base_polling import AsyncLROBasePolling
+from azure.core.rest import HttpRequest
+from azure.core.rest._requests_asyncio import RestAsyncioRequestsTransportResponse
+
+
+async def _response(request, status_code, body, headers=None):
+    response = Response()
+    response._content_consumed = True
+    response._content = json.dumps(body).encode("ascii")
+    response.status_code = status_code
+    response.headers = {"content-type": "application/json"}
+    response.headers.update(headers or {})
+    response.reason = "OK"
+    http_response = RestAsyncioRequestsTransportResponse(request=request, internal_response=response)
+    await http_response.read()
+    return http_response
+
+
+class OperationsTransport(AsyncHttpTransport):
+    """Serves PUT operations: "/resources/<name>" is monitored with "/operations/<name>".
+
+    The status of an operation is the first of its `statuses`, until only its last one is left.
+    """
+
+    def __init__(self, retry_after=None):
+        self.statuses = {}
+        self.retry_after = retry_after
+        self.requests = []
+        self.concurrent = self.max_concurrent = 0
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def send(self, request, **kwargs):
+        kind, name = request.url.split("/")[-2:]
+        self.requests.append(request.url)
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.concurrent -= 1
+        if kind == "resources":
+            return await _response(request, 200, {"name": name})
+        statuses = self.statuses[name]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else None
+        return await _response(request, 200, {"status": status}, headers)
+
+    async def begin(self, client, name, statuses, polling_method=None):
+        self.statuses[name] = list(statuses)
+        request = HttpRequest(
+            "PUT", "http://example.org/resources/" + name, headers={"x-ms-client-request-id": "request-" + name}
+        )
+        initial_response = PipelineResponse(
+            request,
+            await _response(
+                request, 201, {"status": "InProgress"}, {"operation-location": "http://example.org/operations/" + name}
+            ),
+            PipelineContext(None),
+        )
+        return AsyncLROPoller(
+            client,
+            initial_response,
+            lambda pipeline_response: pipeline_response.http_response.json(),
+            AsyncLROBasePolling(0) if polling_method is None else polling_method,
+        )
+
+
+@pytest.fixture
+def transport():
+    return OperationsTransport()
+
+
+@pytest.fixture
+def client(transport):
+    return AsyncPipelineClient("http://example.org", pipeline=AsyncPipeline(transport))
+
+
+@pytest.mark.asyncio
+async def test_group_polls_operations(client, transport):
+    names = ["op{}".format(i) for i in range(20)]
+    async with AsyncLROPollerGroup(max_concurrency=4, merge_window=0) as group:
+        pollers = [
+            group.add(await transport.begin(client, name, ["InProgress", "InProgress", "Succeeded"])) for name in names
+        ]
+        completed = [poller async for poller in group.as_completed()]
+
+    assert group.pollers == pollers
+    assert sorted(completed, key=pollers.index) == pollers
+    assert [await poller.result() for poller in pollers] == [{"name": name} for name in names]
+    assert all(poller.done() and poller.status() == "Succeeded" for poller in pollers)
+    for name in names:
+        assert transport.requests.count("http://example.org/operations/" + name) == 3
+        assert transport.requests.count("http://example.org/resources/" + name) == 1
+    assert transport.max_concurrent <= 4
+    if group._scheduler is not None:
+        await group._scheduler
+    assert group._scheduler is None
+
+
+@pytest.mark.asyncio
+async def test_poll_once_steps_as_run(client, transport):
+    transport.retry_after = 3
+    polling_method = AsyncLROBasePolling(0)
+    polling_method._sleep = mock.AsyncMock()
+    run_result = await (await transport.begin(client, "run", ["InProgress", "InProgress", "Succeeded"], polling_method))
+
+    polling_method = AsyncLROBasePolling(0)
+    await transport.begin(client, "steps", ["InProgress", "InProgress", "Succeeded"], polling_method)
+    assert await polling_method._poll_once() == 3
+    assert await polling_method._poll_once() == 3
+    assert await polling_method._poll_once() is None
+
+    assert polling_method.resource() == {"name": "steps"} != run_result
+    assert [url.rsplit("/", 1)[0] for url in transport.requests if url.endswith("steps")] == [
+        url.rsplit("/", 1)[0] for url in transport.requests if url.endswith("run")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_merge_window():
+    group = AsyncLROPollerGroup(merge_window=0.5)
+    with mock.patch.object(asyncio.get_running_loop(), "time", return_value=10.2):
+        group._add_timer(mock.Mock(), 1)
+        group._add_timer(mock.Mock(), 0)
+    assert sorted(due for due, _, _ in group._timers) == [10.2, 11.5]
+
+
+@pytest.mark.asyncio
+async def test_failed_operation(client, transport):
+    async with AsyncLROPollerGroup(merge_window=0) as group:
+        failed = group.add(await transport.begin(client, "failed", ["InProgress", "Failed"]))
+        succeeded = group.add(await transport.begin(client, "succeeded", ["Succeeded"]))
+    assert await group.wait_all()
+    assert {poller async for poller in group.as_completed()} == {failed, succeeded}
+    assert await succeeded.result() == {"name": "succeeded"}
+    with pytest.raises(HttpResponseError) as error:
+        await failed.result()
+    assert error.value.continuation_token == failed.continuation_token()
+    assert not failed.done()
+
+
+@pytest.mark.asyncio
+async def test_add_twice(client, transport):
+    poller = await transport.begin(client, "op", ["Succeeded"])
+    async with AsyncLROPollerGroup() as group:
+        group.add(poller)
+        with pytest.raises(ValueError):
+            AsyncLROPollerGroup().add(poller)
+    assert await poller == {"name": "op"}
+
+
+@pytest.mark.asyncio
+async def test_custom_polling_loop_uses_task(client, transport):
+    class CustomPolling(AsyncLROBasePolling):
+        async def _delay(self):
+            pass
+
+    custom = await transport.begin(client, "custom", ["InProgress", "Succeeded"], CustomPolling(0))
+    no_polling = await transport.begin(client, "none", ["InProgress"], AsyncNoPolling())
+    grouped = await transport.begin(client, "grouped", ["InProgress", "Succeeded"])
+    async with AsyncLROPollerGroup(merge_window=0) as group:
+        for poller in (custom, no_polling, grouped):
+            group.add(poller)
+        assert len(group._tasks) == 2
+        assert [poller for _, _, poller in group._timers] == [grouped]
+        assert {poller async for poller in group.as_completed()} == {custom, no_polling, grouped}
+
+    assert await custom.result() == {"name": "custom"}
+    assert await grouped.result() == {"name": "grouped"}
+    assert no_polling.done()
+
+
+@pytest.mark.asyncio
+async def test_timeout(client, transport):
+    transport.retry_after = 0.1
+    async with AsyncLROPollerGroup(merge_window=0) as group:
+        poller = group.add(await transport.begin(client, "op", ["InProgress"]))
+        with pytest.raises(TimeoutError):
+            async for _ in group.as_completed(timeout=0.05):
+                pass
+        assert not await group.wait_all(timeout=0.05)
+        assert not poller.done()
+        transport.statuses["op"] = ["Succeeded"]
+    assert await poller.result() == {"name": "op"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait(client, transport):
+    transport.retry_after = 0.1
+    async with AsyncLROPollerGroup(merge_window=0) as group:
+        poller = group.add(await transport.begin(client, "op", ["InProgress", "InProgress", "Succeeded"]))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(poller.result(), 0.05)
+    assert await poller.result() == {"name": "op"}
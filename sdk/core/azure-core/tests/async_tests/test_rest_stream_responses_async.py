@@ -71,6 +71,47 @@ async def test_iter_bytes(client):
         assert raw == b"Hello, world!"
 
 
+@pytest.mark.asyncio
+async def test_readinto(client):
+    request = HttpRequest("GET", "/streams/basic")
+
+    async with client.send_request(request, stream=True) as response:
+        buffer = bytearray(5)
+        parts = []
+        while True:
+            count = await response.readinto(buffer)
+            if not count:
+                break
+            parts.append(bytes(buffer[:count]))
+        assert b"".join(parts) == b"Hello, world!"
+        assert all(len(part) == 5 for part in parts[:-1])
+        assert await response.readinto(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_readinto_after_read(client):
+    request = HttpRequest("GET", "/streams/basic")
+    async with client.send_request(request, stream=True) as response:
+        await response.read()
+        buffer = bytearray(64)
+        assert await response.readinto(memoryview(buffer)[:7]) == 7
+        assert await response.readinto(buffer) == 6
+        assert buffer[:6] == b"world!"
+
+
+@pytest.mark.asyncio
+async def test_iter_bytes_into(client):
+    request = HttpRequest("GET", "/streams/basic")
+
+    async with client.send_request(request, stream=True) as response:
+        buffer = bytearray(4)
+        raw = b""
+        async for view in response.iter_bytes_into(buffer):
+            assert view.obj is buffer
+            raw += view
+        assert raw == b"Hello, world!"
+
+
 @pytest.mark.skip(reason="We've gotten rid of iter_text for now")
 @pytest.mark.asyncio
 async def test_iter_text(client):
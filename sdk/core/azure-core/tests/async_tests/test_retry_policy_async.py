@@ -314,3 +314,46 @@ async def test_does_not_sleep_after_timeout(combinations, http_request):
         await pipeline.run(http_request("GET", "http://localhost/"))
 
     assert transport.sleep.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_retry_hedging(http_request):
+    slow_calls = set()
+    calls = []
+    cancelled = []
+
+    async def send(request, **kwargs):
+        calls.append(request)
+        call = len(calls)
+        if call in slow_calls:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(call)
+                raise
+        response = HttpResponse(request, None)
+        response.status_code = 200
+        response.headers = {"x-call": str(call)}
+        return response
+
+    transport = Mock(spec_set=AsyncHttpTransport, send=Mock(wraps=send))
+    pipeline = AsyncPipeline(transport, [AsyncRetryPolicy(retry_hedging=True)])
+
+    # Not hedged until enough latencies are known for the host
+    for _ in range(20):
+        await pipeline.run(http_request("GET", "http://localhost/"))
+    assert len(calls) == 20
+
+    slow_calls.add(21)
+    start = time.perf_counter()
+    response = await pipeline.run(http_request("GET", "http://localhost/"))
+    assert time.perf_counter() - start < 0.9
+    assert response.http_response.headers["x-call"] == "22"
+    # The loser is cancelled
+    await asyncio.sleep(0)
+    assert cancelled == [21]
+
+    slow_calls.add(23)
+    await pipeline.run(http_request("HEAD", "http://localhost/"), retry_hedging=False)
+    assert len(calls) == 23
@@ -18,7 +18,9 @@ from azure.core.pipeline.transport import HttpTransport
 from azure.core.settings import settings
 from azure.core.tracing import SpanKind
 from azure.core.tracing.decorator_async import distributed_trace_async
-from opentelemetry.trace import StatusCode as OtelStatusCode
+from azure.core.tracing.opentelemetry import OpenTelemetryTracer
+from opentelemetry import trace
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags, StatusCode as OtelStatusCode
 
 from tracing_common import FakeSpan
 from utils import HTTP_REQUESTS
@@ -337,6 +339,39 @@ class TestAsyncDecoratorNativeTracing:
             finished_spans = tracing_helper.exporter.get_finished_spans()
             assert len(finished_spans) == 0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+    async def test_decorator_sampled_out(self, tracing_helper, http_request):
+        """Test that a decorated method whose span was dropped by the sampler still runs and raises."""
+        client = MockClient(http_request)
+        parent = NonRecordingSpan(SpanContext(0x1234, 0x5678, is_remote=True, trace_flags=TraceFlags(0)))
+        with trace.use_span(parent):
+            assert await client.get_foo() == 5
+            with pytest.raises(ValueError):
+                await client.raising_exception()
+
+        assert len(tracing_helper.exporter.get_finished_spans()) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+    async def test_decorator_head_sampling(self, tracing_helper, http_request):
+        """Test that no span is started for a method whose parent was not sampled when head sampling is enabled."""
+        client = MockClient(http_request)
+        settings.tracing_head_sampling = True
+        parent = NonRecordingSpan(SpanContext(0x1234, 0x5678, is_remote=True, trace_flags=TraceFlags(0)))
+        try:
+            with mock.patch.object(OpenTelemetryTracer, "start_as_current_span") as start_span:
+                with trace.use_span(parent):
+                    assert await client.get_foo() == 5
+            start_span.assert_not_called()
+
+            with tracing_helper.tracer.start_as_current_span("Root"):
+                await client.get_foo()
+        finally:
+            settings.tracing_head_sampling.unset_value()
+
+        assert [span.name for span in tracing_helper.exporter.get_finished_spans()] == ["MockClient.get_foo", "Root"]
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
     async def test_tracing_impl_takes_precedence(self, tracing_implementation, http_request):
@@ -187,3 +187,22 @@ def test_repr(http_response):
 
     class_name = "AsyncHttpResponse" if is_rest(http_response) else "AioHttpTransportResponse"
     assert repr(res) == f"<{class_name}: 200 OK, Content-Type: text/plain>"
+
+
+@pytest.mark.asyncio
+async def test_aiter_json_items():
+    from azure.core.exceptions import DecodeError
+    from azure.core.pipeline.policies import ContentDecodePolicy
+
+    async def chunks(body):
+        for i in range(0, len(body), 3):
+            yield body[i : i + 3]
+
+    items = ContentDecodePolicy.aiter_json_items(
+        chunks('{"value": [{"id": 1}, 2.5, "é"], "nextLink": "next"}'.encode("utf-8"))
+    )
+    assert [item async for item in items] == [{"id": 1}, 2.5, "é"]
+    assert items.metadata == {"nextLink": "next"}
+
+    with pytest.raises(DecodeError):
+        [item async for item in ContentDecodePolicy.aiter_json_items(chunks(b'{"value": [1, 2'))]
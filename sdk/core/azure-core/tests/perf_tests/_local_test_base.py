@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import time
+import tracemalloc
+
+from devtools_testutils.perfstress_tests import PerfStressTest
+from requests import Response
+
+from azure.core.pipeline.transport import HttpTransport, AsyncHttpTransport
+from azure.core.rest._requests_basic import RestRequestsTransportResponse
+from azure.core.rest._requests_asyncio import RestAsyncioRequestsTransportResponse
+
+# Number of operations run under tracemalloc with --allocations
+_ALLOCATION_RUNS = 100
+
+
+def _internal_response(body, content_type, headers):
+    response = Response()
+    response._content_consumed = True
+    response._content = body
+    response.status_code = 200
+    response.reason = "OK"
+    response.headers["Content-Type"] = content_type
+    response.headers["Content-Length"] = str(len(body))
+    response.headers.update(headers)
+    return response
+
+
+class LocalTransport(HttpTransport):
+    """A transport answering every request with the response returned by `respond(request)`, without network.
+
+    `respond` returns the body, and optionally the content type and headers, of the response to a request.
+    """
+
+    def __init__(self, respond):
+        self._respond = respond
+
+    def send(self, request, **kwargs):
+        response = RestRequestsTransportResponse(
+            request=request, internal_response=_internal_response(*_parse_answer(self._respond(request)))
+        )
+        response.read()
+        return response
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+class AsyncLocalTransport(AsyncHttpTransport):
+    """The async version of `LocalTransport`."""
+
+    def __init__(self, respond):
+        self._respond = respond
+
+    async def send(self, request, **kwargs):
+        response = RestAsyncioRequestsTransportResponse(
+            request=request, internal_response=_internal_response(*_parse_answer(self._respond(request)))
+        )
+        await response.read()
+        return response
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def __aexit__(self, *args):
+        pass
+
+
+def _parse_answer(answer):
+    if isinstance(answer, tuple):
+        body, content_type, headers = (answer + ({},))[:3]
+    else:
+        body, content_type, headers = answer, "application/json", {}
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode("utf-8")
+    return body, content_type, headers
+
+
+class _LocalTest(PerfStressTest):
+    """Base class of the tests running azure-core code in process, with canned responses instead of a service.
+
+    Tests implement `run_local_sync` and `run_local_async` instead of `run_sync` and `run_async`. Besides the
+    operations per second reported by perfstress, each test prints at cleanup the p50 and p99 latencies of its
+    operations, warm-up included. With `--allocations`, the peak memory allocated by one operation, measured
+    with tracemalloc over separate runs, is printed at setup.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        self._latencies = []
+
+    def run_local_sync(self):
+        raise NotImplementedError()
+
+    async def run_local_async(self):
+        raise NotImplementedError()
+
+    def run_sync(self):
+        start = time.perf_counter_ns()
+        self.run_local_sync()
+        self._latencies.append(time.perf_counter_ns() - start)
+
+    async def run_async(self):
+        start = time.perf_counter_ns()
+        await self.run_local_async()
+        self._latencies.append(time.perf_counter_ns() - start)
+
+    async def global_setup(self):
+        await super().global_setup()
+        if not self.args.allocations:
+            return
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(_ALLOCATION_RUNS):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                if self.args.sync:
+                    self.run_local_sync()
+                else:
+                    await self.run_local_async()
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+        peaks.sort()
+        print("{}: p50 {} bytes allocated per operation".format(type(self).__name__, peaks[len(peaks) // 2]))
+
+    async def cleanup(self):
+        if self._latencies:
+            latencies = sorted(self._latencies)
+            print(
+                "{}: {} operations, p50 {:.1f} us, p99 {:.1f} us".format(
+                    type(self).__name__,
+                    len(latencies),
+                    latencies[len(latencies) // 2] / 1000,
+                    latencies[min(len(latencies) * 99 // 100, len(latencies) - 1)] / 1000,
+                )
+            )
+        await super().cleanup()
+
+    @staticmethod
+    def add_arguments(parser):
+        super(_LocalTest, _LocalTest).add_arguments(parser)
+        parser.add_argument(
+            "--allocations",
+            action="store_true",
+            help="Print the memory allocated by one operation, measured with tracemalloc at setup.",
+        )
@@ -0,0 +1,83 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+from xml.sax.saxutils import escape
+
+from azure.core.pipeline import Pipeline, AsyncPipeline
+from azure.core.pipeline.policies import ContentDecodePolicy
+from azure.core.rest import HttpRequest
+
+from ._local_test_base import _LocalTest, LocalTransport, AsyncLocalTransport
+
+
+def _items(count):
+    return [
+        {
+            "name": "blob-{:06d}".format(index),
+            "properties": {
+                "lastModified": "Wed, 07 Aug 2024 10:{:02d}:00 GMT".format(index % 60),
+                "etag": '"0x8DC{:012X}"'.format(index),
+                "contentLength": index * 512,
+                "contentType": "application/octet-stream",
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def _json_body(count):
+    return json.dumps({"value": _items(count), "nextLink": None}).encode("utf-8")
+
+
+def _xml_body(count):
+    blobs = "".join(
+        "<Blob><Name>{}</Name><Properties>{}</Properties></Blob>".format(
+            escape(item["name"]),
+            "".join("<{0}>{1}</{0}>".format(key, escape(str(value))) for key, value in item["properties"].items()),
+        )
+        for item in _items(count)
+    )
+    return '<?xml version="1.0" encoding="utf-8"?><EnumerationResults><Blobs>{}</Blobs></EnumerationResults>'.format(
+        blobs
+    ).encode("utf-8")
+
+
+class ContentDecodeTest(_LocalTest):
+    """Receives a large JSON or XML listing through a pipeline with `ContentDecodePolicy`, without network.
+
+    The transport answers a listing of `count` blobs; the policy decodes it into the response context.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        if self.args.format == "json":
+            answer = (_json_body(self.args.count), "application/json")
+        else:
+            answer = (_xml_body(self.args.count), "application/xml")
+        self.pipeline = Pipeline(LocalTransport(lambda request: answer), policies=[ContentDecodePolicy()])
+        self.async_pipeline = AsyncPipeline(
+            AsyncLocalTransport(lambda request: answer), policies=[ContentDecodePolicy()]
+        )
+
+    @staticmethod
+    def _request():
+        return HttpRequest("GET", "https://account.blob.core.windows.net/container?restype=container&comp=list")
+
+    def run_local_sync(self):
+        response = self.pipeline.run(self._request(), stream=False)
+        assert response.context[ContentDecodePolicy.CONTEXT_NAME] is not None
+
+    async def run_local_async(self):
+        response = await self.async_pipeline.run(self._request(), stream=False)
+        assert response.context[ContentDecodePolicy.CONTEXT_NAME] is not None
+
+    @staticmethod
+    def add_arguments(parser):
+        super(ContentDecodeTest, ContentDecodeTest).add_arguments(parser)
+        parser.add_argument(
+            "--format", choices=["json", "xml"], default="json", help="Format of the listing. Defaults to json."
+        )
+        parser.add_argument("--count", type=int, default=5000, help="Number of blobs in the listing. Defaults to 5000.")
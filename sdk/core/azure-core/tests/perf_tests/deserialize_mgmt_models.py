@@ -0,0 +1,111 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import importlib
+import re
+
+from devtools_testutils.perfstress_tests import PerfStressTest
+
+# Package to benchmark: (models module, list result model)
+_PACKAGES = {
+    "network": ("azure.mgmt.network.models", "VirtualNetworkListResult"),
+    "compute": ("azure.mgmt.compute.v2024_11_01.models", "VirtualMachineListResult"),
+    "web": ("azure.mgmt.web.v2024_11_01.models", "WebAppCollection"),
+}
+
+_FLATTEN = re.compile(r"(?<!\\)\.")
+
+_SAMPLES = {
+    "str": "value",
+    "int": 1,
+    "long": 1,
+    "float": 1.5,
+    "bool": True,
+    "decimal": "1.5",
+    "iso-8601": "2024-01-01T12:00:00.000Z",
+    "rfc-1123": "Mon, 01 Jan 2024 12:00:00 GMT",
+    "unix-time": 1704110400,
+    "date": "2024-01-01",
+    "time": "12:00:00",
+    "duration": "PT1H",
+    "bytearray": "dmFsdWU=",
+    "base64": "dmFsdWU",
+    "object": {"key": "value"},
+}
+
+
+def _sample(classes, data_type, depth):
+    """Build the JSON an ARM service would send for a data type, with every property set."""
+    if data_type in _SAMPLES:
+        return _SAMPLES[data_type]
+    if data_type.startswith("["):
+        item = _sample(classes, data_type[1:-1], depth)
+        return None if item is None else [item, item]
+    if data_type.startswith("{"):
+        item = _sample(classes, data_type[1:-1], depth)
+        return None if item is None else {"key": item}
+    model = classes[data_type]
+    if not hasattr(model, "_attribute_map"):
+        return next(iter(model)).value  # Enum
+    if depth == 0:
+        return None
+    data = {}
+    for attr, attr_desc in model._attribute_map.items():  # pylint: disable=protected-access
+        if not attr_desc["key"] or model._validation.get(attr, {}).get("constant"):  # pylint: disable=protected-access
+            continue
+        value = _sample(classes, attr_desc["type"], depth - 1)
+        if value is None:
+            continue
+        *path, key = [part.replace("\\.", ".") for part in _FLATTEN.split(attr_desc["key"])]
+        working_data = data
+        for part in path:
+            working_data = working_data.setdefault(part, {})
+        working_data[key] = value
+    return data
+
+
+class DeserializeMgmtModelsTest(PerfStressTest):
+    """Deserializes a page of `count` resources of a management package with the generated `Deserializer`.
+
+    The page is synthesized from the models' attribute maps with every property set, flattened properties
+    included, so it measures the deserializer the way a full list response of a large ARM service does.
+    No request is sent. Needs azure-mgmt-network, azure-mgmt-compute or azure-mgmt-web installed.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        module_name, self.list_model = _PACKAGES[self.args.package]
+        models = importlib.import_module(module_name)
+        classes = {k: getattr(models, k) for k in models.__all__}
+        classes = {k: v for k, v in classes.items() if isinstance(v, type)}
+        # The module vendored by the package, whatever its generator version named it
+        serialization = importlib.import_module(classes[self.list_model].__bases__[0].__module__)
+        # The deserializer is built once, as a generated client does
+        self.deserializer = serialization.Deserializer(classes)
+        item_type = classes[self.list_model]._attribute_map["value"]["type"][1:-1]  # pylint: disable=protected-access
+        item = _sample(classes, item_type, self.args.depth)
+        self.page = {"value": [item] * self.args.count, "nextLink": "https://management.azure.com/next"}
+
+    def run_sync(self):
+        self.deserializer(self.list_model, self.page)
+
+    async def run_async(self):
+        self.deserializer(self.list_model, self.page)
+
+    @staticmethod
+    def add_arguments(parser):
+        super(DeserializeMgmtModelsTest, DeserializeMgmtModelsTest).add_arguments(parser)
+        parser.add_argument(
+            "--package",
+            choices=sorted(_PACKAGES),
+            default="network",
+            help="Management package whose models are deserialized. Defaults to network.",
+        )
+        parser.add_argument(
+            "--count", type=int, default=1000, help="Number of resources in the page. Defaults to 1000."
+        )
+        parser.add_argument(
+            "--depth", type=int, default=3, help="Depth of nested models set in each resource. Defaults to 3."
+        )
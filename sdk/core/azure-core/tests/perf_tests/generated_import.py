@@ -0,0 +1,66 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import subprocess
+import sys
+
+from devtools_testutils.perfstress_tests import PerfStressTest
+
+# Package to benchmark: (import statement, statement touching one model)
+_PACKAGES = {
+    "network": ("from azure.mgmt.network import models", "models.VirtualNetwork"),
+    "datafactory": ("from azure.mgmt.datafactory import DataFactoryManagementClient, models", "models.Factory"),
+    "synapse-artifacts": ("from azure.synapse.artifacts import ArtifactsClient, models", "models.Workspace"),
+    "web": ("from azure.mgmt.web import WebSiteManagementClient, models", "models.Site"),
+}
+
+_SCRIPT = """
+import json, time, tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+{}
+print(json.dumps([time.perf_counter() - start, tracemalloc.get_traced_memory()[0]]))
+"""
+
+
+class GeneratedImportTest(PerfStressTest):
+    """Imports a large generated client library in a fresh interpreter.
+
+    Models and operation groups of generated packages are imported on first access, so importing the client
+    does not execute their multi-megabyte `_models_py3.py`. Pass `--models` to also touch one model, which
+    imports the models the way importing the package used to. Each run starts a new interpreter, so interpreter
+    startup is part of the measured time; the time and memory of the import alone are printed at setup.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        statements = _PACKAGES[self.args.package]
+        self.script = _SCRIPT.format("\n".join(statements if self.args.models else statements[:1]))
+
+    def _import(self):
+        return subprocess.run([sys.executable, "-c", self.script], check=True, stdout=subprocess.PIPE).stdout
+
+    async def global_setup(self):
+        await super().global_setup()
+        seconds, retained = json.loads(self._import())
+        print("Import of {}: {:.0f} ms, {} KiB".format(self.args.package, seconds * 1000, retained // 1024))
+
+    def run_sync(self):
+        self._import()
+
+    async def run_async(self):
+        self._import()
+
+    @staticmethod
+    def add_arguments(parser):
+        super(GeneratedImportTest, GeneratedImportTest).add_arguments(parser)
+        parser.add_argument(
+            "--package",
+            choices=sorted(_PACKAGES),
+            default="network",
+            help="Generated package to import. Defaults to network.",
+        )
+        parser.add_argument("--models", action="store_true", help="Also touch one model of the package.")
@@ -0,0 +1,123 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import datetime
+import json
+from typing import Dict, List, Optional
+
+from modeltypes._utils import model_base, serialization
+
+from ._local_test_base import _LocalTest
+
+
+# Models of generated msrest-style packages, serialized with `Serializer` and `Deserializer`
+class Disk(serialization.Model):
+    _attribute_map = {
+        "name": {"key": "name", "type": "str"},
+        "size_gb": {"key": "properties.diskSizeGB", "type": "int"},
+        "time_created": {"key": "properties.timeCreated", "type": "iso-8601"},
+        "tags": {"key": "tags", "type": "{str}"},
+    }
+
+    def __init__(self, *, name=None, size_gb=None, time_created=None, tags=None, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.size_gb = size_gb
+        self.time_created = time_created
+        self.tags = tags
+
+
+class DiskList(serialization.Model):
+    _attribute_map = {
+        "value": {"key": "value", "type": "[Disk]"},
+        "next_link": {"key": "nextLink", "type": "str"},
+    }
+
+    def __init__(self, *, value=None, next_link=None, **kwargs):
+        super().__init__(**kwargs)
+        self.value = value
+        self.next_link = next_link
+
+
+_MODELS = {"Disk": Disk, "DiskList": DiskList}
+
+
+# The same models for generated TypeSpec packages, based on `_model_base.Model`
+class DiskProperties(model_base.Model):
+    disk_size_gb: Optional[int] = model_base.rest_field(name="diskSizeGB")
+    time_created: Optional[datetime.datetime] = model_base.rest_field(name="timeCreated", format="rfc3339")
+
+
+class TypedDisk(model_base.Model):
+    name: Optional[str] = model_base.rest_field()
+    properties: Optional[DiskProperties] = model_base.rest_field()
+    tags: Optional[Dict[str, str]] = model_base.rest_field()
+
+
+class TypedDiskList(model_base.Model):
+    value: List[TypedDisk] = model_base.rest_field()
+    next_link: Optional[str] = model_base.rest_field(name="nextLink")
+
+
+class ModelSerializationTest(_LocalTest):
+    """Deserializes, or with `--serialize` serializes, a list of `count` resources with the generated code.
+
+    `--runtime serialization` uses the `Serializer` and `Deserializer` of msrest-style generated packages;
+    `--runtime model-base` uses the models of TypeSpec generated packages, and reads every field of the
+    deserialized models since they decode their fields on access.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        self.data = {
+            "value": [
+                {
+                    "name": "disk{}".format(index),
+                    "properties": {"diskSizeGB": index, "timeCreated": "2024-08-07T10:11:12.1234567Z"},
+                    "tags": {"environment": "perf", "index": str(index)},
+                }
+                for index in range(self.args.count)
+            ],
+            "nextLink": "https://example.org/disks?page=2",
+        }
+        self.serializer = serialization.Serializer(_MODELS)
+        self.deserializer = serialization.Deserializer(_MODELS)
+        if self.args.runtime == "serialization":
+            self.model = self.deserializer("DiskList", self.data)
+        else:
+            self.model = TypedDiskList(self.data)
+
+    def _run(self):
+        if self.args.runtime == "serialization":
+            if self.args.serialize:
+                self.serializer.body(self.model, "DiskList")
+            else:
+                self.deserializer("DiskList", self.data)
+        elif self.args.serialize:
+            json.dumps(self.model, cls=model_base.SdkJSONEncoder, exclude_readonly=True)
+        else:
+            disks = TypedDiskList(self.data)
+            for disk in disks.value:
+                _ = disk.name, disk.properties.disk_size_gb, disk.properties.time_created, disk.tags
+
+    def run_local_sync(self):
+        self._run()
+
+    async def run_local_async(self):
+        self._run()
+
+    @staticmethod
+    def add_arguments(parser):
+        super(ModelSerializationTest, ModelSerializationTest).add_arguments(parser)
+        parser.add_argument(
+            "--runtime",
+            choices=["serialization", "model-base"],
+            default="serialization",
+            help="Runtime of the models: msrest-style serialization or model-base. Defaults to serialization.",
+        )
+        parser.add_argument("--serialize", action="store_true", help="Serialize the models instead.")
+        parser.add_argument(
+            "--count", type=int, default=1000, help="Number of resources in the list. Defaults to 1000."
+        )
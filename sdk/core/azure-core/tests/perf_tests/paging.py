@@ -0,0 +1,87 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+
+from azure.core.async_paging import AsyncItemPaged, AsyncList
+from azure.core.paging import ItemPaged
+from azure.core.pipeline import Pipeline, AsyncPipeline
+from azure.core.pipeline.policies import ContentDecodePolicy, RequestIdPolicy, UserAgentPolicy
+from azure.core.rest import HttpRequest
+
+from ._local_test_base import _LocalTest, LocalTransport, AsyncLocalTransport
+
+_URL = "https://example.org/resources?api-version=2024-01-01"
+
+
+class PagingTest(_LocalTest):
+    """Lists `count` items in pages of `page-size` items with `ItemPaged`, as generated list operations do.
+
+    Every page is requested through a pipeline whose transport answers a canned JSON page, without network.
+    Pass `--prefetch-pages` to fetch the next pages while the items of the current one are consumed.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        page_count = max(-(-self.args.count // self.args.page_size), 1)
+        self.pages = []
+        for page in range(page_count):
+            start = page * self.args.page_size
+            items = [
+                {"id": "/resources/item{}".format(index), "name": "item{}".format(index), "properties": {"n": index}}
+                for index in range(start, min(start + self.args.page_size, self.args.count))
+            ]
+            next_link = "{}&page={}".format(_URL, page + 1) if page + 1 < page_count else None
+            self.pages.append(json.dumps({"value": items, "nextLink": next_link}).encode("utf-8"))
+        policies = [RequestIdPolicy(), UserAgentPolicy(sdk_moniker="core-perf"), ContentDecodePolicy()]
+        self.pipeline = Pipeline(LocalTransport(self._respond), policies=policies)
+        self.async_pipeline = AsyncPipeline(AsyncLocalTransport(self._respond), policies=policies)
+
+    def _respond(self, request):
+        _, _, page = request.url.partition("&page=")
+        return self.pages[int(page or 0)]
+
+    @staticmethod
+    def _extract_data(pipeline_response):
+        deserialized = pipeline_response.http_response.json()
+        return deserialized["nextLink"] or None, iter(deserialized["value"])
+
+    def _items(self):
+        def get_next(next_link=None):
+            return self.pipeline.run(HttpRequest("GET", next_link or _URL), stream=False)
+
+        return ItemPaged(get_next, self._extract_data, prefetch_pages=self.args.prefetch_pages)
+
+    def _async_items(self):
+        async def extract_data(pipeline_response):
+            next_link, items = self._extract_data(pipeline_response)
+            return next_link, AsyncList(list(items))
+
+        async def get_next(next_link=None):
+            return await self.async_pipeline.run(HttpRequest("GET", next_link or _URL), stream=False)
+
+        return AsyncItemPaged(get_next, extract_data, prefetch_pages=self.args.prefetch_pages)
+
+    def run_local_sync(self):
+        count = sum(1 for _ in self._items())
+        assert count == self.args.count
+
+    async def run_local_async(self):
+        count = 0
+        async for _ in self._async_items():
+            count += 1
+        assert count == self.args.count
+
+    @staticmethod
+    def add_arguments(parser):
+        super(PagingTest, PagingTest).add_arguments(parser)
+        parser.add_argument("--count", type=int, default=1000, help="Number of items to list. Defaults to 1000.")
+        parser.add_argument("--page-size", type=int, default=100, help="Number of items per page. Defaults to 100.")
+        parser.add_argument(
+            "--prefetch-pages",
+            type=int,
+            default=0,
+            help="Number of pages to fetch ahead of the items consumed. Defaults to 0.",
+        )
@@ -0,0 +1,117 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import time
+
+from devtools_testutils.perfstress_tests import PerfStressTest
+
+from azure.core import PipelineClient, AsyncPipelineClient
+from azure.core.credentials import AccessToken
+from azure.core.pipeline import Pipeline, AsyncPipeline, PipelineTemplate, AsyncPipelineTemplate
+from azure.core.pipeline.transport import RequestsTransport, AioHttpTransport
+from azure.core.pipeline.policies import (
+    AsyncBearerTokenCredentialPolicy,
+    AsyncRedirectPolicy,
+    AsyncRetryPolicy,
+    BearerTokenCredentialPolicy,
+    ContentDecodePolicy,
+    CustomHookPolicy,
+    DistributedTracingPolicy,
+    HeadersPolicy,
+    HttpLoggingPolicy,
+    NetworkTraceLoggingPolicy,
+    ProxyPolicy,
+    RedirectPolicy,
+    RequestIdPolicy,
+    RetryPolicy,
+    SensitiveHeaderCleanupPolicy,
+    UserAgentPolicy,
+)
+
+_SCOPE = "https://storage.azure.com/.default"
+
+
+class _Credential:
+    def get_token(self, *scopes, **kwargs):
+        return AccessToken("token", int(time.time()) + 3600)
+
+
+class _AsyncCredential:
+    async def get_token(self, *scopes, **kwargs):
+        return AccessToken("token", int(time.time()) + 3600)
+
+
+def _policies(auth_policy, retry_policy_type, redirect_policy_type):
+    # The policies of a generated client
+    return [
+        RequestIdPolicy(),
+        HeadersPolicy(),
+        UserAgentPolicy(sdk_moniker="core-perf"),
+        ProxyPolicy(),
+        ContentDecodePolicy(),
+        redirect_policy_type(),
+        retry_policy_type(),
+        auth_policy,
+        CustomHookPolicy(),
+        NetworkTraceLoggingPolicy(),
+        DistributedTracingPolicy(),
+        SensitiveHeaderCleanupPolicy(),
+        HttpLoggingPolicy(),
+    ]
+
+
+class PipelineConstructionTest(PerfStressTest):
+    """Creates a client with its own credential per operation, as a multi-tenant service does.
+
+    No request is sent. Without `--use-template` the client builds its pipeline (policies and transport wiring)
+    the usual way; with it, the pipeline is cloned from a template sharing the transport.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        self.transport = RequestsTransport()
+        self.async_transport = AioHttpTransport()
+        self.template = PipelineTemplate(
+            self.transport,
+            _policies(BearerTokenCredentialPolicy(_Credential(), _SCOPE), RetryPolicy, RedirectPolicy),
+        )
+        self.async_template = AsyncPipelineTemplate(
+            self.async_transport,
+            _policies(
+                AsyncBearerTokenCredentialPolicy(_AsyncCredential(), _SCOPE), AsyncRetryPolicy, AsyncRedirectPolicy
+            ),
+        )
+
+    def run_sync(self):
+        auth_policy = BearerTokenCredentialPolicy(_Credential(), _SCOPE)
+        if self.args.use_template:
+            pipeline = self.template.create_pipeline(overrides={BearerTokenCredentialPolicy: auth_policy})
+        else:
+            pipeline = Pipeline(self.transport, _policies(auth_policy, RetryPolicy, RedirectPolicy))
+        PipelineClient("https://account.blob.core.windows.net", pipeline=pipeline)
+
+    async def run_async(self):
+        auth_policy = AsyncBearerTokenCredentialPolicy(_AsyncCredential(), _SCOPE)
+        if self.args.use_template:
+            pipeline = self.async_template.create_pipeline(overrides={AsyncBearerTokenCredentialPolicy: auth_policy})
+        else:
+            pipeline = AsyncPipeline(
+                self.async_transport, _policies(auth_policy, AsyncRetryPolicy, AsyncRedirectPolicy)
+            )
+        AsyncPipelineClient("https://account.blob.core.windows.net", pipeline=pipeline)
+
+    async def close(self):
+        self.transport.close()
+        await self.async_transport.close()
+        await super().close()
+
+    @staticmethod
+    def add_arguments(parser):
+        super(PipelineConstructionTest, PipelineConstructionTest).add_arguments(parser)
+        parser.add_argument(
+            "--use-template",
+            action="store_true",
+            help="Clone the pipeline from a PipelineTemplate instead of building it.",
+        )
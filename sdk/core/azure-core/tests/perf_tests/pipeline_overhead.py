@@ -0,0 +1,72 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+from azure.core.pipeline import Pipeline, AsyncPipeline
+from azure.core.pipeline import policies
+from azure.core.rest import HttpRequest
+
+from ._local_test_base import _LocalTest, LocalTransport, AsyncLocalTransport
+
+# The policies of a generated client, in their usual order: (sync policy, async policy)
+_POLICIES = {
+    "RequestIdPolicy": (policies.RequestIdPolicy, policies.RequestIdPolicy),
+    "HeadersPolicy": (policies.HeadersPolicy, policies.HeadersPolicy),
+    "UserAgentPolicy": (policies.UserAgentPolicy, policies.UserAgentPolicy),
+    "ProxyPolicy": (policies.ProxyPolicy, policies.ProxyPolicy),
+    "ContentDecodePolicy": (policies.ContentDecodePolicy, policies.ContentDecodePolicy),
+    "RedirectPolicy": (policies.RedirectPolicy, policies.AsyncRedirectPolicy),
+    "RetryPolicy": (policies.RetryPolicy, policies.AsyncRetryPolicy),
+    "CustomHookPolicy": (policies.CustomHookPolicy, policies.CustomHookPolicy),
+    "NetworkTraceLoggingPolicy": (policies.NetworkTraceLoggingPolicy, policies.NetworkTraceLoggingPolicy),
+    "DistributedTracingPolicy": (policies.DistributedTracingPolicy, policies.DistributedTracingPolicy),
+    "SensitiveHeaderCleanupPolicy": (policies.SensitiveHeaderCleanupPolicy, policies.SensitiveHeaderCleanupPolicy),
+    "HttpLoggingPolicy": (policies.HttpLoggingPolicy, policies.HttpLoggingPolicy),
+}
+
+_BODY = {"id": "00000000-0000-0000-0000-000000000000", "name": "resource", "properties": {"size": 42}}
+
+
+class PipelineOverheadTest(_LocalTest):
+    """Sends a GET request through a pipeline whose transport answers a small JSON body, without network.
+
+    Run it with `--policies` none, then with one policy or all of them, to measure what each policy adds to
+    every request.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        if self.args.policies == "all":
+            names = list(_POLICIES)
+        elif self.args.policies == "none":
+            names = []
+        else:
+            names = self.args.policies.split(",")
+        try:
+            sync_policies = [_POLICIES[name][0](sdk_moniker="core-perf") for name in names]
+            async_policies = [_POLICIES[name][1](sdk_moniker="core-perf") for name in names]
+        except KeyError as exc:
+            raise ValueError("Unknown policy {}. Valid policies are: {}".format(exc, ", ".join(_POLICIES))) from exc
+        self.pipeline = Pipeline(LocalTransport(lambda request: _BODY), policies=sync_policies)
+        self.async_pipeline = AsyncPipeline(AsyncLocalTransport(lambda request: _BODY), policies=async_policies)
+
+    @staticmethod
+    def _request():
+        return HttpRequest("GET", "https://example.org/resources/resource?api-version=2024-01-01")
+
+    def run_local_sync(self):
+        self.pipeline.run(self._request())
+
+    async def run_local_async(self):
+        await self.async_pipeline.run(self._request())
+
+    @staticmethod
+    def add_arguments(parser):
+        super(PipelineOverheadTest, PipelineOverheadTest).add_arguments(parser)
+        parser.add_argument(
+            "--policies",
+            default="none",
+            help="'none' (the default), 'all', or a comma-separated list of policies, such as "
+            "'RetryPolicy,HttpLoggingPolicy'. Async pipelines use the async version of retry and redirect.",
+        )
@@ -0,0 +1,113 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+from devtools_testutils.perfstress_tests import PerfStressTest
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON
+
+from azure.core.pipeline import Pipeline, AsyncPipeline
+from azure.core.pipeline.policies import DistributedTracingPolicy, RequestIdPolicy, UserAgentPolicy
+from azure.core.pipeline.transport import HttpTransport, AsyncHttpTransport
+from azure.core.rest import HttpRequest
+from azure.core.settings import settings
+from azure.core.tracing.decorator import distributed_trace
+from azure.core.tracing.decorator_async import distributed_trace_async
+
+
+class _Response:
+    status_code = 200
+    headers = {"x-ms-request-id": "00000000-0000-0000-0000-000000000000"}
+
+
+class _Transport(HttpTransport):
+    def send(self, request, **kwargs):
+        return _Response()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+class _AsyncTransport(AsyncHttpTransport):
+    async def send(self, request, **kwargs):
+        return _Response()
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def __aexit__(self, *args):
+        pass
+
+
+def _policies():
+    return [RequestIdPolicy(), UserAgentPolicy(sdk_moniker="core-perf"), DistributedTracingPolicy()]
+
+
+class _Client:
+    def __init__(self):
+        self.pipeline = Pipeline(_Transport(), policies=_policies())
+        self.async_pipeline = AsyncPipeline(_AsyncTransport(), policies=_policies())
+
+    @staticmethod
+    def _request():
+        return HttpRequest("GET", "https://account.blob.core.windows.net/container/blob?comp=metadata")
+
+    @distributed_trace
+    def get_properties(self, **kwargs):
+        return self.pipeline.run(self._request(), **kwargs)
+
+    @distributed_trace_async
+    async def get_properties_async(self, **kwargs):
+        return await self.async_pipeline.run(self._request(), **kwargs)
+
+
+class TracingOverheadTest(PerfStressTest):
+    """Runs a traced client operation sending one request through a pipeline with `DistributedTracingPolicy`.
+
+    The transport returns a canned response, so this measures the cost of tracing the operation and its network
+    call. With `--tracing on` every span is sampled and recorded (but not exported); with `sampled-out` the sampler
+    drops every span; with `off` tracing is disabled. Pass `--head-sampling` to skip the spans of calls whose
+    parent was not sampled instead of asking the sampler for each of them.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        trace.set_tracer_provider(
+            TracerProvider(sampler=ALWAYS_OFF if self.args.tracing == "sampled-out" else ALWAYS_ON)
+        )
+        settings.tracing_enabled = self.args.tracing != "off"
+        settings.tracing_head_sampling = self.args.head_sampling
+        self.client = _Client()
+
+    def run_sync(self):
+        self.client.get_properties()
+
+    async def run_async(self):
+        await self.client.get_properties_async()
+
+    @staticmethod
+    def add_arguments(parser):
+        super(TracingOverheadTest, TracingOverheadTest).add_arguments(parser)
+        parser.add_argument(
+            "--tracing",
+            choices=["on", "off", "sampled-out"],
+            default="on",
+            help="Whether spans are sampled, dropped by the sampler, or tracing is disabled. Defaults to on.",
+        )
+        parser.add_argument(
+            "--head-sampling",
+            action="store_true",
+            help="Skip the spans of calls whose parent was not sampled (settings.tracing_head_sampling).",
+        )
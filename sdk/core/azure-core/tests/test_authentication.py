@@ -5,6 +5,9 @@
 # -------------------------------------------------------------------------
 from collections import namedtuple
 import base64
+import copy
+import pickle
+import threading
 import time
 from itertools import product
 from requests import Response
@@ -837,3 +840,115 @@ def test_bearer_policy_on_challenge_caches_token_with_claims(http_request):
 
     # Verify the Authorization header was set correctly
     assert request.http_request.headers["Authorization"] == "Bearer claims_token"
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_bearer_policy_concurrent_refreshes_are_deduplicated(http_request):
+    calls = []
+    release = threading.Event()
+
+    def get_token(*_, **__):
+        calls.append(1)
+        release.wait(5)
+        return AccessToken("token", int(time.time() + 3600))
+
+    credential = Mock(spec_set=["get_token"], get_token=get_token)
+    pipeline = Pipeline(transport=Mock(), policies=[BearerTokenCredentialPolicy(credential, "scope")])
+    threads = [
+        threading.Thread(target=pipeline.run, args=(http_request("GET", "https://spam.eggs"),)) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_bearer_policy_background_refresh(http_request):
+    now = int(time.time())
+    refreshed = threading.Event()
+    release = threading.Event()
+    tokens = [AccessTokenInfo("new", now + 3600), AccessTokenInfo("old", now + 3600, refresh_on=now - 1)]
+
+    def get_token_info(*_, **__):
+        token = tokens.pop()
+        if token.token == "new":
+            release.wait(5)
+            refreshed.set()
+        return token
+
+    credential = Mock(spec_set=["get_token_info"], get_token_info=Mock(wraps=get_token_info))
+    sent = []
+    transport = Mock(send=lambda request, **_: sent.append(request.headers["Authorization"]) or Mock())
+    policy = BearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    pipeline = Pipeline(transport=transport, policies=[policy])
+
+    # No token yet: the request waits for one
+    pipeline.run(http_request("GET", "https://spam.eggs"))
+    # The token is due for refresh: requests don't wait, a single background refresh is started
+    for _ in range(3):
+        pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert sent == ["Bearer old"] * 4
+    release.set()
+    assert refreshed.wait(5)
+    for _ in range(10):
+        if policy._token.token == "new":
+            break
+        time.sleep(0.01)
+    assert credential.get_token_info.call_count == 2
+
+    pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert sent[-1] == "Bearer new"
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_bearer_policy_background_refresh_failure_keeps_token(http_request):
+    now = int(time.time())
+    credential = Mock(
+        spec_set=["get_token"],
+        get_token=Mock(
+            side_effect=[AccessToken("old", now + 200), ValueError("unavailable"), AccessToken("new", now + 3600)]
+        ),
+    )
+    policy = BearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    pipeline = Pipeline(transport=Mock(), policies=[policy])
+
+    pipeline.run(http_request("GET", "https://spam.eggs"))
+    pipeline.run(http_request("GET", "https://spam.eggs"))
+    for _ in range(100):
+        if not policy._background_refresh_lock.locked():
+            break
+        time.sleep(0.01)
+    assert policy._token.token == "old"
+
+    # The refresh failed moments ago: the cached token is used without asking the credential again
+    pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert not policy._background_refresh_lock.locked()
+    assert credential.get_token.call_count == 2
+
+    # A token about to expire is not used anymore: the request waits for a new one
+    policy._token = AccessToken("old", int(time.time()) + 10)
+    pipeline.run(http_request("GET", "https://spam.eggs"))
+    assert policy._token.token == "new"
+    assert credential.get_token.call_count == 3
+
+
+def test_bearer_policy_deepcopy_and_pickle():
+    policy = BearerTokenCredentialPolicy(Mock(spec_set=["get_token"]), "scope", background_refresh=True)
+    policy._token = AccessToken("token", int(time.time()) + 3600)
+    policy._background_refresh_lock.acquire()
+
+    policy_copy = copy.deepcopy(policy)
+    assert policy_copy._token.token == "token"
+    assert policy_copy._token_lock is not policy._token_lock
+    assert not policy_copy._background_refresh_lock.locked()
+
+    # mocks can't be pickled
+    policy = BearerTokenCredentialPolicy(None, "scope")
+    policy_copy = pickle.loads(pickle.dumps(policy))
+    assert policy_copy._scopes == ("scope",)
+    with policy_copy._token_lock:
+        assert policy_copy._background_refresh_lock.acquire(blocking=False)
@@ -1322,3 +1322,33 @@ def test_close_too_soon_works_fine(caplog, port, http_request):
     result = transport.send(request)
 
     assert result  # No exception is good enough here
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_warm_up_and_pool_stats(port, http_request):
+    with RequestsTransport() as transport:
+        assert transport.pool_stats() == {"created": 0, "active": 0, "idle": 0, "wait_time": 0.0}
+
+        assert transport.warm_up(["http://localhost:{}".format(port)], connections=3) == 3
+        assert transport.pool_stats() == {"created": 3, "active": 0, "idle": 3, "wait_time": 0.0}
+
+        # The requests use the warmed up connections
+        transport.send(http_request("GET", "http://localhost:{}/basic/string".format(port)))
+        stats = transport.pool_stats()
+        assert stats["created"] == 3
+        assert stats["idle"] == 3
+
+        # Failures are skipped
+        assert transport.warm_up(["http://localhost:1"]) == 0
+
+
+def test_warm_up_failures_are_skipped(caplog):
+    with RequestsTransport() as transport:
+        with caplog.at_level(logging.DEBUG, logger="azure.core.pipeline.transport._requests_basic"):
+            assert transport.warm_up(["http://localhost:1"]) == 0
+        assert [record.levelno for record in caplog.records] == [logging.DEBUG]
+        assert caplog.records[0].exc_info is None
+
+        # A pool without the urllib3 methods adding connections is left alone
+        with mock.patch.object(transport, "_connection_pool", return_value=mock.Mock(spec=[])):
+            assert transport.warm_up(["http://localhost:1"]) == 0
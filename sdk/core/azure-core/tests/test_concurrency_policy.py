@@ -0,0 +1,148 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the adaptive concurrency policy."""
+import threading
+import time
+from unittest.mock import Mock
+import pytest
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import (
+    AdaptiveConcurrencyLimiter,
+    AdaptiveConcurrencyPolicy,
+    RetryPolicy,
+)
+from azure.core.pipeline.transport import HttpResponse, HttpTransport
+from utils import HTTP_REQUESTS
+
+
+def _response(request, status_code=200, headers=None):
+    response = HttpResponse(request, None)
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_limiter_arguments():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=2)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(min_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(backoff_ratio=1)
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_limit_adapts_to_throttling(http_request):
+    status_codes = []
+
+    def send(request, **kwargs):
+        return _response(request, status_codes.pop(0) if status_codes else 200)
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=10)
+    transport = Mock(spec_set=HttpTransport, send=Mock(wraps=send))
+    pipeline = Pipeline(transport, [AdaptiveConcurrencyPolicy(limiter)])
+
+    status_codes.append(429)
+    pipeline.run(http_request("GET", "http://localhost/"))
+    assert limiter.get_limit("localhost") == 4
+    assert limiter.get_in_flight("localhost") == 0
+
+    status_codes.append(503)
+    pipeline.run(http_request("GET", "http://localhost/"))
+    assert limiter.get_limit("localhost") == 2
+
+    # Other hosts have their own limit
+    assert limiter.get_limit("example.org") == 8
+
+    # Additive increase, capped
+    for _ in range(100):
+        pipeline.run(http_request("GET", "http://localhost/"))
+    assert limiter.get_limit("localhost") == 10
+
+    status_codes.extend([429] * 10)
+    for _ in range(10):
+        pipeline.run(http_request("GET", "http://localhost/"))
+    assert limiter.get_limit("localhost") == 1
+
+
+def test_decrease_once_per_round():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    response = Mock()
+    response.http_response = _response(None, 429)
+    started = [limiter.acquire("key") for _ in range(4)]
+    for start in started:
+        limiter.release("key", start, response)
+    # The requests already in flight when the first throttled response arrived don't decrease the limit
+    assert limiter.get_limit("key") == 4
+
+
+def test_retry_after_holds_requests():
+    limiter = AdaptiveConcurrencyLimiter()
+    response = Mock()
+    response.http_response = _response(None, 503, {"Retry-After": "0.2"})
+    limiter.release("key", limiter.acquire("key"), response)
+    assert limiter.try_acquire("key") > 0
+    start = time.monotonic()
+    limiter.acquire("key")
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_concurrency_is_limited(http_request):
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def send(request, **kwargs):
+        with lock:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.remove(request)
+        return _response(request)
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    transport = Mock(spec_set=HttpTransport, send=Mock(wraps=send))
+    pipeline = Pipeline(transport, [RetryPolicy(), AdaptiveConcurrencyPolicy(limiter)])
+
+    threads = [
+        threading.Thread(target=pipeline.run, args=(http_request("GET", "http://localhost/"),)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(peak) == 8
+    assert max(peak) == 2
+    assert limiter.get_in_flight("localhost") == 0
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_slot_released_on_error(http_request):
+    transport = Mock(spec_set=HttpTransport, send=Mock(side_effect=ValueError))
+    policy = AdaptiveConcurrencyPolicy()
+    pipeline = Pipeline(transport, [policy])
+    with pytest.raises(ValueError):
+        pipeline.run(http_request("GET", "http://localhost/"))
+    assert policy.limiter.get_in_flight("localhost") == 0
+    assert policy.limiter.get_limit("localhost") == 16
+
+
+def test_release_wakes_every_waiter():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    assert limiter.try_acquire("localhost") is None
+    woken = []
+
+    def failing_waiter():
+        woken.append("failing")
+        raise RuntimeError("waiter failed")
+
+    assert limiter.try_acquire("localhost", failing_waiter) == 0.0
+    assert limiter.try_acquire("localhost", lambda: woken.append("next")) == 0.0
+
+    limiter.release("localhost", 0.0)
+    assert woken == ["failing", "next"]
+    assert limiter.try_acquire("localhost") is None
@@ -0,0 +1,98 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import datetime
+
+import pytest
+
+from azure.core.runtime import datetime_codec
+from azure.core.runtime.datetime_codec import parse_iso8601, parse_rfc1123
+
+UTC = datetime.timezone.utc
+
+
+@pytest.fixture(params=["compiled", "regex"])
+def parser(request, monkeypatch):
+    if request.param == "regex":
+        monkeypatch.setattr(datetime_codec, "_COMPILED_PARSER", None)
+    elif datetime_codec._COMPILED_PARSER is None:
+        pytest.skip("No compiled ISO-8601 parser on this Python")
+    parse_iso8601.cache_clear()
+    yield parse_iso8601
+    parse_iso8601.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-01T12:00:00Z", datetime.datetime(2024, 1, 1, 12, tzinfo=UTC)),
+        ("2024-01-01t12:00:00z", datetime.datetime(2024, 1, 1, 12, tzinfo=UTC)),
+        ("2024-01-01T12:00:00.5Z", datetime.datetime(2024, 1, 1, 12, 0, 0, 500000, tzinfo=UTC)),
+        ("2024-01-01T12:00:00.1234567Z", datetime.datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=UTC)),
+        ("2024-01-01T12:00:00,5Z", datetime.datetime(2024, 1, 1, 12, 0, 0, 500000, tzinfo=UTC)),
+        ("2024-01-01T12:00:00+05:30", datetime.datetime(2024, 1, 1, 6, 30, tzinfo=UTC)),
+        ("2024-01-01T12:00:00-0530", datetime.datetime(2024, 1, 1, 17, 30, tzinfo=UTC)),
+        ("2024-01-01T12:00:00+05", datetime.datetime(2024, 1, 1, 7, tzinfo=UTC)),
+        ("2024-01-01T12:00:00", datetime.datetime(2024, 1, 1, 12)),
+        ("9999-12-31T23:59:59.9999999Z", datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=UTC)),
+    ],
+)
+def test_parse_iso8601(parser, value, expected):
+    result = parser(value)
+    assert result == expected
+    assert (result.tzinfo is None) == (expected.tzinfo is None)
+    assert result.utcoffset() == expected.utcoffset() or result.astimezone(UTC) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01",
+        "2024-01-01T12",
+        "20240101T120000Z",
+        "2024-01-01 12:00:00Z",
+        "2024-01-01T12:00:00.Z",
+        "2024-01-01T12:00:00 Z",
+        "2024-01-01T12:00:00+05:30:15",
+        "2024-02-30T00:00:00Z",
+        "garbage",
+        "",
+    ],
+)
+def test_parse_iso8601_invalid(parser, value):
+    with pytest.raises(ValueError):
+        parser(value)
+
+
+@pytest.mark.parametrize("value", ["9999-12-31T23:59:59-01:00", "0001-01-01T00:00:00+01:00"])
+def test_parse_iso8601_out_of_range(parser, value):
+    with pytest.raises(OverflowError):
+        parser(value)
+
+
+def test_parse_iso8601_cache():
+    parse_iso8601.cache_clear()
+    assert parse_iso8601("2024-01-01T12:00:00Z") is parse_iso8601("2024-01-01T12:00:00Z")
+    assert parse_iso8601.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Mon, 01 Jan 2024 12:00:00 GMT", datetime.datetime(2024, 1, 1, 12, tzinfo=UTC)),
+        ("Mon, 1 Jan 2024 12:00:00 GMT", datetime.datetime(2024, 1, 1, 12, tzinfo=UTC)),
+        ("Mon, 01 Jan 2024 12:00:00 +0100", datetime.datetime(2024, 1, 1, 11, tzinfo=UTC)),
+        ("01 Jan 2024 12:00:00 GMT", datetime.datetime(2024, 1, 1, 12, tzinfo=UTC)),
+    ],
+)
+def test_parse_rfc1123(value, expected):
+    result = parse_rfc1123(value)
+    assert result == expected
+    assert result.tzinfo is not None
+
+
+@pytest.mark.parametrize("value", ["Mon, 01 Foo 2024 12:00:00 GMT", "garbage", ""])
+def test_parse_rfc1123_invalid(value):
+    with pytest.raises(ValueError):
+        parse_rfc1123(value)
@@ -0,0 +1,195 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the HTTP cache policy."""
+from http.client import HTTPResponse
+from unittest.mock import Mock
+import pytest
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import (
+    FileHttpCache,
+    HttpCachePolicy,
+    InMemoryHttpCache,
+    RetryPolicy,
+)
+from azure.core.pipeline.transport import HttpTransport
+from azure.core.utils._pipeline_transport_rest_shared import BytesIOSocket
+from utils import HTTP_CLIENT_TRANSPORT_RESPONSES, create_transport_response, request_and_responses_product
+
+
+class _Service:
+    """Answers with a body and an ETag, and 304 when the ETag matches."""
+
+    def __init__(self, http_response, headers=None):
+        self.http_response = http_response
+        self.headers = headers or {}
+        self.etag = '"1"'
+        self.body = b'{"value": 1}'
+        self.requests = []
+        self.unavailable = 0
+
+    def send(self, request, **kwargs):
+        self.requests.append(dict(request.headers))
+        headers = dict(self.headers, ETag=self.etag)
+        if self.unavailable:
+            self.unavailable -= 1
+            status, body = "503 Service Unavailable", b""
+        elif request.headers.get("If-None-Match") == self.etag:
+            status, body = "304 Not Modified", b""
+        else:
+            status, body = "200 OK", self.body
+            headers["Content-Type"] = "application/json"
+        lines = ["HTTP/1.1 " + status] + ["{}: {}".format(name, value) for name, value in headers.items()]
+        lines.append("Content-Length: {}".format(len(body)))
+        internal_response = HTTPResponse(BytesIOSocket(("\r\n".join(lines) + "\r\n\r\n").encode() + body))
+        internal_response.begin()
+        response = create_transport_response(self.http_response, request, internal_response)
+        if hasattr(response, "read"):
+            response.read()
+        return response
+
+
+def _pipeline(service, **kwargs):
+    policy = HttpCachePolicy(**kwargs)
+    transport = Mock(spec_set=HttpTransport, send=Mock(wraps=service.send))
+    return Pipeline(transport, [policy]), policy
+
+
+def _body(response):
+    http_response = response.http_response
+    return http_response.read() if hasattr(http_response, "read") else http_response.body()
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
+def test_revalidate_with_etag(http_request, http_response):
+    service = _Service(http_response)
+    pipeline, policy = _pipeline(service)
+
+    response = pipeline.run(http_request("GET", "http://localhost/config"))
+    assert _body(response) == b'{"value": 1}'
+    assert (policy.hits, policy.misses) == (0, 1)
+
+    response = pipeline.run(http_request("GET", "http://localhost/config"))
+    assert service.requests[-1]["If-None-Match"] == '"1"'
+    assert response.http_response.status_code == 200
+    assert response.http_response.headers["ETag"] == '"1"'
+    assert _body(response) == b'{"value": 1}'
+    assert isinstance(response.http_response.request, http_request)
+    assert (policy.hits, policy.misses, policy.revalidated) == (1, 1, 1)
+
+    service.etag, service.body = '"2"', b'{"value": 2}'
+    response = pipeline.run(http_request("GET", "http://localhost/config"))
+    assert _body(response) == b'{"value": 2}'
+    assert (policy.hits, policy.misses) == (1, 2)
+
+    # Bypass
+    pipeline.run(http_request("GET", "http://localhost/config"), http_cache=False)
+    assert "If-None-Match" not in service.requests[-1]
+    pipeline.run(http_request("GET", "http://localhost/config", headers={"If-None-Match": "*"}))
+    assert (policy.hits, policy.misses) == (1, 2)
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
+def test_revalidate_after_retry(http_request, http_response):
+    service = _Service(http_response)
+    policy = HttpCachePolicy()
+    transport = Mock(spec_set=HttpTransport, send=Mock(wraps=service.send), sleep=Mock())
+    pipeline = Pipeline(transport, [RetryPolicy(retry_backoff_factor=0), policy])
+
+    pipeline.run(http_request("GET", "http://localhost/config"))
+    service.unavailable = 1
+    request = http_request("GET", "http://localhost/config")
+    response = pipeline.run(request)
+
+    # The validators of the first attempt are not taken for conditions of the caller on the retry
+    assert [headers.get("If-None-Match") for headers in service.requests[1:]] == ['"1"', '"1"']
+    assert response.http_response.status_code == 200
+    assert _body(response) == b'{"value": 1}'
+    assert (policy.hits, policy.revalidated) == (1, 1)
+    assert "If-None-Match" not in request.headers
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
+def test_bypass_after_retry(http_request, http_response):
+    service = _Service(http_response, {"Cache-Control": "max-age=60"})
+    policy = HttpCachePolicy()
+    transport = Mock(spec_set=HttpTransport, send=Mock(wraps=service.send), sleep=Mock())
+    pipeline = Pipeline(transport, [RetryPolicy(retry_backoff_factor=0), policy])
+
+    pipeline.run(http_request("GET", "http://localhost/config"))
+    service.body = b'{"value": 2}'
+    service.unavailable = 1
+    response = pipeline.run(http_request("GET", "http://localhost/config"), http_cache=False)
+
+    # The retry bypasses the cache as well, and the option is not passed to the transport
+    assert _body(response) == b'{"value": 2}'
+    assert len(service.requests) == 3
+    assert all("http_cache" not in call.kwargs for call in transport.send.call_args_list)
+    assert policy.hits == 0
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
+def test_fresh_response_served_without_request(http_request, http_response):
+    service = _Service(http_response, {"Cache-Control": "max-age=60"})
+    pipeline, policy = _pipeline(service)
+
+    pipeline.run(http_request("GET", "http://localhost/config"))
+    response = pipeline.run(http_request("GET", "http://localhost/config"))
+    assert _body(response) == b'{"value": 1}'
+    assert len(service.requests) == 1
+    assert policy.hits == 1
+
+    # Variants are selected on the vary headers
+    pipeline.run(http_request("GET", "http://localhost/config", headers={"Authorization": "Bearer other"}))
+    assert len(service.requests) == 2
+
+    # Changes invalidate the cached response
+    pipeline.run(http_request("PUT", "http://localhost/config"))
+    pipeline.run(http_request("GET", "http://localhost/config", headers={"Authorization": "Bearer other"}))
+    assert len(service.requests) == 4
+    assert "If-None-Match" not in service.requests[-1]
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
+def test_no_store(http_request, http_response):
+    service = _Service(http_response, {"Cache-Control": "no-store"})
+    pipeline, policy = _pipeline(service)
+    pipeline.run(http_request("GET", "http://localhost/config"))
+    pipeline.run(http_request("GET", "http://localhost/config"))
+    assert "If-None-Match" not in service.requests[-1]
+    assert (policy.hits, policy.misses) == (0, 2)
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
+def test_file_cache(http_request, http_response, tmp_path):
+    service = _Service(http_response)
+    cache = FileHttpCache(str(tmp_path), max_entries=2)
+    pipeline, policy = _pipeline(service, cache=cache)
+    pipeline.run(http_request("GET", "http://localhost/config"))
+
+    # A new policy on the same directory
+    pipeline, policy = _pipeline(service, cache=FileHttpCache(str(tmp_path), max_entries=2))
+    response = pipeline.run(http_request("GET", "http://localhost/config"))
+    assert _body(response) == b'{"value": 1}'
+    assert policy.revalidated == 1
+
+    for name in ("a", "b", "c"):
+        pipeline.run(http_request("GET", "http://localhost/" + name))
+    assert len(cache) == 2
+    assert cache.get("GET http://localhost/config") is None
+    assert cache.get("GET http://localhost/c")["body"] == b'{"value": 1}'
+
+
+def test_in_memory_cache_lru():
+    cache = InMemoryHttpCache(max_entries=2)
+    cache.set("a", {"body": b"a"})
+    cache.set("b", {"body": b"b"})
+    cache.get("a")
+    cache.set("c", {"body": b"c"})
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,89 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import copy
+import datetime
+import pickle
+from typing import Any, Dict, List, Optional
+
+from modeltypes._utils.model_base import Model, rest_field
+
+
+class Event(Model):
+    when: datetime.datetime = rest_field()
+    times: List[datetime.datetime] = rest_field()
+    payload: bytes = rest_field(format="base64")
+    tags: Dict[str, Any] = rest_field()
+    name: Optional[str] = rest_field()
+
+
+_RAW = {
+    "when": "2024-01-01T12:00:00Z",
+    "times": ["2024-01-01T12:00:00Z", "2024-01-02T12:00:00Z"],
+    "payload": "d2FsbC1l",
+    "tags": {"color": "rust"},
+    "name": "wall-e",
+}
+
+
+def test_decoded_value_is_reused():
+    event = Event(_RAW)
+    assert event.when == datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+    assert event.when is event.when
+    assert event.payload == b"wall-e"
+    assert event.payload is event.payload
+    assert "_decoded" not in vars(event)
+
+
+def test_decoded_value_follows_writes():
+    event = Event(_RAW)
+    assert event.when.day == 1
+
+    event.when = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+    assert event.when.day == 2
+    event["when"] = "2024-01-03T00:00:00Z"
+    assert event.when.day == 3
+    event.update({"when": "2024-01-04T00:00:00Z"})
+    assert event.when.day == 4
+    event.pop("when")
+    assert event.when is None
+    event.setdefault("when", "2024-01-05T00:00:00Z")
+    assert event.when.day == 5
+    event.when = None
+    assert event.when is None
+    event["when"] = "2024-01-06T00:00:00Z"
+    event.clear()
+    assert event.when is None
+
+
+def test_decoded_list_is_not_shared():
+    event = Event(_RAW)
+    times = event.times
+    assert [t.day for t in times] == [1, 2]
+    times.append(None)
+    assert [t.day for t in event.times] == [1, 2]
+    assert event.times is not event.times
+
+    event["times"].append("2024-01-03T12:00:00Z")
+    assert [t.day for t in event.times] == [1, 2, 3]
+
+
+def test_mutable_value_is_not_cached():
+    event = Event(_RAW)
+    event.tags["color"] = "blue"
+    assert event.tags == {"color": "rust"}
+    event["tags"]["color"] = "blue"
+    assert event.tags == {"color": "blue"}
+
+
+def test_model_copies_after_read():
+    event = Event(_RAW)
+    assert event.when.day == 1
+    assert copy.copy(event).when == event.when
+    for clone in (copy.deepcopy(event), pickle.loads(pickle.dumps(event))):
+        assert clone == event
+        assert clone.when.day == 1
+        clone["when"] = "2024-01-02T00:00:00Z"
+        assert clone.when.day == 2
+    assert event.when.day == 1
@@ -130,3 +130,77 @@ class TestPaging(object):
         with pytest.raises(HttpResponseError) as err:
             next(pager)
         assert err.value.continuation_token == "foo"
+
+    def test_by_page_prefetch(self):
+        import threading
+
+        fetched = []
+        fetched_page3 = threading.Event()
+
+        def get_next(continuation_token=None):
+            fetched.append(continuation_token)
+            if not continuation_token:
+                return {"nextLink": "page2", "value": ["value1.0", "value1.1"]}
+            elif continuation_token == "page2":
+                return {"nextLink": "page3", "value": ["value2.0", "value2.1"]}
+            else:
+                fetched_page3.set()
+                return {"nextLink": None, "value": ["value3.0"]}
+
+        def extract_data(response):
+            return response["nextLink"], iter(response["value"])
+
+        pager = ItemPaged(get_next, extract_data).by_page(prefetch_pages=2)
+        page1 = next(pager)
+        # The following pages are fetched in the background while the first one is consumed
+        assert fetched_page3.wait(timeout=5)
+        assert pager.continuation_token == "page2"
+        assert list(page1) == ["value1.0", "value1.1"]
+        assert list(next(pager)) == ["value2.0", "value2.1"]
+        assert pager.continuation_token == "page3"
+        assert list(next(pager)) == ["value3.0"]
+        assert pager.continuation_token is None
+        with pytest.raises(StopIteration):
+            next(pager)
+        assert fetched == [None, "page2", "page3"]
+
+        # Set on the ItemPaged, used for item iteration
+        pager = ItemPaged(get_next, extract_data, prefetch_pages=1)
+        assert list(pager) == ["value1.0", "value1.1", "value2.0", "value2.1", "value3.0"]
+
+    def test_by_page_prefetch_context(self):
+        import contextvars
+
+        caller = contextvars.ContextVar("caller", default=None)
+        seen = []
+
+        def get_next(continuation_token=None):
+            seen.append(caller.get())
+            if not continuation_token:
+                return {"nextLink": "page2", "value": ["value1.0"]}
+            return {"nextLink": None, "value": ["value2.0"]}
+
+        def extract_data(response):
+            return response["nextLink"], iter(response["value"])
+
+        caller.set("span")
+        # The pages fetched in the background see the context of the caller, e.g. its tracing span
+        assert list(ItemPaged(get_next, extract_data, prefetch_pages=1)) == ["value1.0", "value2.0"]
+        assert seen == ["span", "span"]
+
+    def test_by_page_prefetch_error(self):
+        def get_next(continuation_token=None):
+            if not continuation_token:
+                return {"nextLink": "page2", "value": ["value1.0", "value1.1"]}
+            raise HttpResponseError()
+
+        def extract_data(response):
+            return response["nextLink"], iter(response["value"])
+
+        pager = ItemPaged(get_next, extract_data).by_page(prefetch_pages=1)
+        assert list(next(pager)) == ["value1.0", "value1.1"]
+        with pytest.raises(HttpResponseError) as err:
+            next(pager)
+        assert err.value.continuation_token == "page2"
+        with pytest.raises(StopIteration):
+            next(pager)
@@ -55,7 +55,7 @@ from azure.core.pipeline.transport import (
     HttpTransport,
     RequestsTransport,
 )
-from utils import HTTP_REQUESTS, is_rest
+from utils import HTTP_REQUESTS, HTTP_RESPONSES, is_rest, create_http_response, request_and_responses_product
 
 from azure.core.exceptions import AzureError
 from azure.core.pipeline._base import cleanup_kwargs_for_transport
@@ -505,3 +505,81 @@ def test_cleanup_kwargs():
     cleanup_kwargs_for_transport(kwargs)
     assert "insecure_domain_change" not in kwargs
     assert "enable_cae" not in kwargs
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_RESPONSES))
+def test_pipeline_profiler(http_request, http_response):
+    class MockTransport(HttpTransport):
+        def __init__(self):
+            self._count = 0
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+        def close(self):
+            pass
+
+        def open(self):
+            pass
+
+        def send(self, request, **kwargs):
+            self._count += 1
+            response = create_http_response(http_response, request, None)
+            response.status_code = 503 if self._count == 1 else 200
+            response.headers = {"Content-Length": "5"}
+            return response
+
+    profiles = []
+    request = http_request("POST", "http://localhost/", headers={"Content-Length": "5"})
+    pipeline = Pipeline(
+        MockTransport(), [UserAgentPolicy(), RetryPolicy(retry_backoff_factor=0)], profiler=profiles.append
+    )
+    response = pipeline.run(request)
+    assert response.http_response.status_code == 200
+    assert "pipeline_profile" in response.context
+
+    assert len(profiles) == 1
+    profile = profiles[0]
+    assert profile.method == "POST"
+    assert profile.url == "http://localhost/"
+    assert [name for name, _ in profile.policy_times] == ["UserAgentPolicy", "RetryPolicy"]
+    assert all(time >= 0 for _, time in profile.policy_times)
+    assert profile.total_time == pytest.approx(sum(time for _, time in profile.policy_times) + profile.transport_time)
+    assert profile.transport_calls == 2
+    assert profile.retry_count == 1
+    assert profile.request_bytes == 10
+    assert profile.response_bytes == 10
+    assert profile.status_code == 200
+    assert profile.error is None
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_pipeline_profiler_error(http_request):
+    class BrokenSender(HttpTransport):
+        def send(self, request, **config):
+            raise ValueError("Broken")
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+    def broken_profiler(profile):
+        raise RuntimeError("Profilers must not fail the request")
+
+    profiles = []
+    for policies in ([], [SansIOHTTPPolicy()]):
+        pipeline = Pipeline(BrokenSender(), policies, profiler=profiles.append)
+        with pytest.raises(ValueError):
+            pipeline.run(http_request("GET", "/"))
+        assert isinstance(profiles[-1].error, ValueError)
+        assert profiles[-1].transport_calls == 1
+        assert profiles[-1].status_code is None
+
+    pipeline = Pipeline(BrokenSender(), [SansIOHTTPPolicy()], profiler=broken_profiler)
+    with pytest.raises(ValueError):
+        pipeline.run(http_request("GET", "/"))
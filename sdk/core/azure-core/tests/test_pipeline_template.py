@@ -0,0 +1,134 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the precompiled pipeline templates."""
+from unittest.mock import MagicMock, Mock
+import pytest
+from azure.core import PipelineClient
+from azure.core.pipeline import Pipeline, PipelineTemplate
+from azure.core.pipeline.policies import (
+    BearerTokenCredentialPolicy,
+    HeadersPolicy,
+    HTTPPolicy,
+    RetryPolicy,
+    SansIOHTTPPolicy,
+    UserAgentPolicy,
+)
+from azure.core.pipeline.transport import HttpResponse, HttpTransport
+from utils import HTTP_REQUESTS
+
+
+class _HeaderPolicy(HTTPPolicy):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def send(self, request):
+        request.http_request.headers["x-test"] = self.value
+        return self.next.send(request)
+
+
+def _mock_transport(sent):
+    def send(request, **kwargs):
+        sent.append(request)
+        response = HttpResponse(request, None)
+        response.status_code = 200
+        response.headers = {}
+        return response
+
+    return MagicMock(spec_set=HttpTransport, send=Mock(wraps=send))
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_pipelines_share_transport_and_sansio_policies(http_request):
+    sent = []
+    transport = _mock_transport(sent)
+    headers_policy = HeadersPolicy({"x-shared": "yes"})
+    retry_policy = RetryPolicy(retry_total=1)
+    template = PipelineTemplate(transport, [headers_policy, None, retry_policy])
+    assert template.policies == (headers_policy, retry_policy)
+    assert template.transport is transport
+
+    first = template.create_pipeline()
+    second = template.create_pipeline()
+    assert first._transport is second._transport
+    # SansIO policies are shared through new runners, other policies are copied
+    assert first._impl_policies[0]._policy is headers_policy
+    assert second._impl_policies[0]._policy is headers_policy
+    assert first._impl_policies[0] is not second._impl_policies[0]
+    assert first._impl_policies[1] is not retry_policy
+    assert first._impl_policies[1] is not second._impl_policies[1]
+    assert first._impl_policies[1].total_retries == 1
+
+    first.run(http_request("GET", "http://localhost/"))
+    second.run(http_request("GET", "http://localhost/"))
+    assert transport.send.call_count == 2
+    assert all(request.headers["x-shared"] == "yes" for request in sent)
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_overrides(http_request):
+    sent = []
+    template = PipelineTemplate(_mock_transport(sent), [UserAgentPolicy("template"), _HeaderPolicy("template")])
+
+    template.create_pipeline(overrides={_HeaderPolicy: _HeaderPolicy("tenant")}).run(
+        http_request("GET", "http://localhost/")
+    )
+    template.create_pipeline().run(http_request("GET", "http://localhost/"))
+    template.create_pipeline(overrides={UserAgentPolicy: None}).run(http_request("GET", "http://localhost/"))
+    assert [request.headers["x-test"] for request in sent] == ["tenant", "template", "template"]
+    assert "template" in sent[0].headers["User-Agent"]
+    assert "User-Agent" not in sent[2].headers
+
+
+def test_override_credential():
+    credential = Mock(spec_set=["get_token"])
+    template = PipelineTemplate(_mock_transport([]), [BearerTokenCredentialPolicy(credential, "scope"), RetryPolicy()])
+    tenant_policy = BearerTokenCredentialPolicy(Mock(spec_set=["get_token"]), "scope")
+    pipeline = template.create_pipeline(overrides={BearerTokenCredentialPolicy: tenant_policy})
+    assert pipeline._impl_policies[0] is not tenant_policy
+    assert pipeline._impl_policies[0]._credential is tenant_policy._credential
+
+
+def test_closing_a_pipeline_keeps_the_transport_open():
+    transport = _mock_transport([])
+    template = PipelineTemplate(transport, [HeadersPolicy()])
+    with PipelineClient("http://localhost", pipeline=template.create_pipeline()):
+        pass
+    transport.open.assert_called_once_with()
+    transport.__exit__.assert_not_called()
+    transport.close.assert_not_called()
+
+    template.close()
+    transport.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_from_pipeline(http_request):
+    sent = []
+    profiles = []
+    transport = _mock_transport(sent)
+    headers_policy = HeadersPolicy({"x-shared": "yes"})
+    pipeline = Pipeline(transport, [headers_policy, RetryPolicy()], profiler=profiles.append)
+    template = PipelineTemplate.from_pipeline(pipeline)
+    assert template.policies[0] is headers_policy
+    assert isinstance(template.policies[1], RetryPolicy)
+
+    template.create_pipeline().run(http_request("GET", "http://localhost/"))
+    assert sent[0].headers["x-shared"] == "yes"
+    assert profiles[0].policy_names == ["HeadersPolicy", "RetryPolicy"]
+
+
+def test_custom_sansio_policy_is_not_copied():
+    calls = []
+
+    class CountingPolicy(SansIOHTTPPolicy):
+        def on_request(self, request):
+            calls.append(self)
+
+    policy = CountingPolicy()
+    template = PipelineTemplate(_mock_transport([]), [policy])
+    for _ in range(3):
+        template.create_pipeline().run(HTTP_REQUESTS[0]("GET", "http://localhost/"))
+    assert calls == [policy, policy, policy]
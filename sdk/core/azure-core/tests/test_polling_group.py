@@ -0,0 +1,223 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import json
+import threading
+from unittest import mock
+
+import pytest
+from requests import Response
+
+from azure.core import PipelineClient
+from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline import Pipeline, PipelineContext, PipelineResponse
+from azure.core.pipeline.transport import HttpTransport
+from azure.core.polling import LROPoller, LROPollerGroup, NoPolling
+from azure.core.polling.base_polling import LROBasePolling
+from azure.core.rest import HttpRequest
+from azure.core.rest._requests_basic import RestRequestsTransportResponse
+
+
+def _response(request, status_code, body, headers=None):
+    response = Response()
+    response._content_consumed = True
+    response._content = json.dumps(body).encode("ascii")
+    response.status_code = status_code
+    response.headers = {"content-type": "application/json"}
+    response.headers.update(headers or {})
+    response.reason = "OK"
+    http_response = RestRequestsTransportResponse(request=request, internal_response=response)
+    http_response.read()
+    return http_response
+
+
+class OperationsTransport(HttpTransport):
+    """Serves PUT operations: "/resources/<name>" is monitored with "/operations/<name>".
+
+    The status of an operation is the first of its `statuses`, until only its last one is left.
+    """
+
+    def __init__(self, retry_after=None):
+        self.statuses = {}
+        self.retry_after = retry_after
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+    def send(self, request, **kwargs):
+        kind, name = request.url.split("/")[-2:]
+        with self._lock:
+            self.requests.append(request.url)
+            if kind == "resources":
+                return _response(request, 200, {"name": name})
+            statuses = self.statuses[name]
+            status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else None
+        return _response(request, 200, {"status": status}, headers)
+
+    def begin(self, client, name, statuses, polling_method=None):
+        self.statuses[name] = list(statuses)
+        request = HttpRequest(
+            "PUT", "http://example.org/resources/" + name, headers={"x-ms-client-request-id": "request-" + name}
+        )
+        initial_response = PipelineResponse(
+            request,
+            _response(
+                request, 201, {"status": "InProgress"}, {"operation-location": "http://example.org/operations/" + name}
+            ),
+            PipelineContext(None),
+        )
+        return LROPoller(
+            client,
+            initial_response,
+            lambda pipeline_response: pipeline_response.http_response.json(),
+            LROBasePolling(0) if polling_method is None else polling_method,
+        )
+
+
+@pytest.fixture
+def transport():
+    return OperationsTransport()
+
+
+@pytest.fixture
+def client(transport):
+    return PipelineClient("http://example.org", pipeline=Pipeline(transport))
+
+
+def test_group_polls_operations(client, transport):
+    names = ["op{}".format(i) for i in range(20)]
+    with LROPollerGroup(max_workers=4, merge_window=0) as group:
+        pollers = [transport.begin(client, name, ["InProgress", "InProgress", "Succeeded"]) for name in names]
+        assert all(poller._thread is None for poller in pollers)
+        completed = list(group.as_completed())
+
+    assert group.pollers == pollers
+    assert sorted(completed, key=pollers.index) == pollers
+    assert [poller.result() for poller in pollers] == [{"name": name} for name in names]
+    assert all(poller.done() and poller.status() == "Succeeded" for poller in pollers)
+    for name in names:
+        assert transport.requests.count("http://example.org/operations/" + name) == 3
+        assert transport.requests.count("http://example.org/resources/" + name) == 1
+    scheduler = group._scheduler
+    if scheduler is not None:
+        scheduler.join()
+    assert group._scheduler is None and group._executor is None
+
+
+def test_poller_outside_group_uses_thread(client, transport):
+    with LROPollerGroup(merge_window=0):
+        pass
+    poller = transport.begin(client, "op", ["Succeeded"])
+    assert poller._thread is not None
+    assert poller.result() == {"name": "op"}
+
+
+def test_poll_once_steps_as_run(client, transport):
+    transport.retry_after = 3
+    polling_method = LROBasePolling(0)
+    polling_method._sleep = lambda delay: None
+    run_result = transport.begin(client, "run", ["InProgress", "InProgress", "Succeeded"], polling_method).result()
+
+    polling_method = LROBasePolling(0)
+    with LROPollerGroup() as group:
+        with mock.patch.object(group, "_add_timer"):
+            poller = transport.begin(client, "steps", ["InProgress", "InProgress", "Succeeded"], polling_method)
+            assert polling_method._poll_once() == 3
+            assert polling_method._poll_once() == 3
+            assert polling_method._poll_once() is None
+            group._pending -= 1
+
+    assert polling_method.resource() == {"name": "steps"} != run_result
+    assert [url.rsplit("/", 1)[0] for url in transport.requests if url.endswith("steps")] == [
+        url.rsplit("/", 1)[0] for url in transport.requests if url.endswith("run")
+    ]
+
+
+def test_merge_window():
+    group = LROPollerGroup(merge_window=0.5)
+    with group._condition, mock.patch("azure.core.polling._poller_group.time.monotonic", return_value=10.2):
+        group._add_timer(mock.Mock(), mock.Mock(), 1)
+        group._add_timer(mock.Mock(), mock.Mock(), 0)
+    assert sorted(due for due, _, _, _ in group._timers) == [10.2, 11.5]
+
+
+def test_failed_operation(client, transport):
+    with LROPollerGroup(merge_window=0) as group:
+        failed = transport.begin(client, "failed", ["InProgress", "Failed"])
+        succeeded = transport.begin(client, "succeeded", ["Succeeded"])
+    assert group.wait_all()
+    assert set(group.as_completed()) == {failed, succeeded}
+    assert succeeded.result() == {"name": "succeeded"}
+    with pytest.raises(HttpResponseError) as error:
+        failed.result()
+    assert error.value.continuation_token == failed.continuation_token()
+    assert failed.done()
+
+
+def test_callbacks(client, transport):
+    called = threading.Event()
+    with LROPollerGroup(merge_window=0):
+        poller = transport.begin(client, "op", ["InProgress", "Succeeded"])
+        poller.add_done_callback(lambda polling_method: called.set())
+    assert called.is_set()
+
+
+def test_custom_polling_loop_uses_thread(client, transport):
+    class CustomPolling(LROBasePolling):
+        def _delay(self):
+            pass
+
+    with LROPollerGroup(merge_window=0) as group:
+        custom = transport.begin(client, "custom", ["InProgress", "Succeeded"], CustomPolling(0))
+        no_polling = transport.begin(client, "none", ["InProgress"], NoPolling())
+        grouped = transport.begin(client, "grouped", ["InProgress", "Succeeded"])
+        assert custom._thread is not None
+        assert no_polling._thread is None and no_polling.done()
+        assert grouped._thread is None
+        assert set(group.as_completed()) == {custom, no_polling, grouped}
+
+    assert custom.result() == {"name": "custom"}
+    assert grouped.result() == {"name": "grouped"}
+
+
+def test_timeout(client, transport):
+    transport.retry_after = 0.1
+    with LROPollerGroup(merge_window=0) as group:
+        poller = transport.begin(client, "op", ["InProgress"])
+        with pytest.raises(TimeoutError):
+            list(group.as_completed(timeout=0.05))
+        assert not group.wait_all(timeout=0.05)
+        assert not poller.done()
+        transport.statuses["op"] = ["Succeeded"]
+    assert poller.result() == {"name": "op"}
@@ -7,6 +7,7 @@
 
 # NOTE: These tests are heavily inspired from the httpx test suite: https://github.com/encode/httpx/tree/master/tests
 # Thank you httpx for your wonderful tests!
+import array
 import io
 import pytest
 import sys
@@ -174,6 +175,34 @@ def test_bytes_content():
     assert request.content == b"Hello, world!"
 
 
+def test_bytes_like_content():
+    data = bytearray(b"Hello, world!")
+    request = HttpRequest("PUT", "http://example.org", content=data)
+    assert request.headers == {"Content-Length": "13"}
+    assert isinstance(request.content, memoryview)
+    assert request.content.obj is data
+    assert request.content == b"Hello, world!"
+
+    view = memoryview(data)[7:]
+    request = HttpRequest("PUT", "http://example.org", content=view)
+    assert request.headers == {"Content-Length": "6"}
+    assert request.content == b"world!"
+
+    # multi-byte items are sent as their raw bytes, without a copy
+    words = array.array("H", [1, 2, 3])
+    request = HttpRequest("PUT", "http://example.org", content=words)
+    assert request.headers == {"Content-Length": str(3 * words.itemsize)}
+    assert request.content.obj is words
+    assert request.content == words.tobytes()
+
+    # strided views are copied into contiguous bytes
+    view = memoryview(data)[::2]
+    request = HttpRequest("PUT", "http://example.org", content=view)
+    assert request.headers == {"Content-Length": "7"}
+    assert request.content.c_contiguous
+    assert request.content == b"Hlo ol!"
+
+
 def test_iterator_content(assert_iterator_body):
     # NOTE: in httpx, content reads out the actual value. Don't do that (yet) in azure rest
     def hello_world():
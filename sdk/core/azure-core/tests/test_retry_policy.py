@@ -314,3 +314,105 @@ def test_does_not_sleep_after_timeout(combinations, http_request):
         pipeline.run(http_request("GET", "http://localhost/"))
 
     assert transport.sleep.call_count == 1
+
+
+@pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_RESPONSES))
+def test_retry_hedging(http_request, http_response):
+    import contextvars
+    import threading
+
+    caller = contextvars.ContextVar("caller", default=None)
+    slow_calls = {}
+    calls = []
+    callers = []
+    threads = []
+
+    class Interrupted(BaseException):
+        pass
+
+    def send(request, **kwargs):
+        calls.append(request)
+        callers.append(caller.get())
+        threads.append(threading.current_thread())
+        number = len(calls)
+        outcome = slow_calls.get(number)
+        if outcome == "interrupt":
+            raise Interrupted()
+        if outcome:
+            time.sleep(0.3)
+            if outcome == "fail":
+                raise ServiceResponseError("timed out")
+        response = create_http_response(http_response, request, None)
+        response.status_code = 200
+        response.headers = {"x-call": str(number)}
+        return response
+
+    transport = Mock(spec=HttpTransport, send=Mock(side_effect=send))
+    retry_policy = RetryPolicy(retry_hedging=True)
+    pipeline = Pipeline(transport, [retry_policy])
+
+    # Not hedged until enough latencies are known for the host: sent on the calling thread
+    for _ in range(20):
+        pipeline.run(http_request("GET", "http://localhost/"))
+    assert len(calls) == 20
+    assert all(thread is threading.current_thread() for thread in threads)
+
+    # Fast requests are not hedged, they are sent from another thread with the context of the caller
+    caller.set("span")
+    pipeline.run(http_request("GET", "http://localhost/"))
+    time.sleep(0.1)
+    assert len(calls) == 21
+    assert threads[20] is not threading.current_thread()
+    assert callers[20] == "span"
+
+    # A slow request is duplicated and the first response wins
+    slow_calls[22] = "slow"
+    start = time.perf_counter()
+    response = pipeline.run(http_request("GET", "http://localhost/"))
+    assert time.perf_counter() - start < 0.3
+    assert response.http_response.headers["x-call"] == "23"
+    assert len(calls) == 23
+    assert callers[21:] == ["span", "span"]
+    assert calls[22] is not calls[21]
+    assert calls[22].url == calls[21].url
+    time.sleep(0.4)
+
+    # The duplicate is used when the request fails, without retrying
+    slow_calls[24] = "fail"
+    response = pipeline.run(http_request("GET", "http://localhost/"))
+    assert response.http_response.headers["x-call"] == "25"
+    time.sleep(0.4)
+    assert len(calls) == 25
+
+    # Any error of the attempts is reported, instead of waiting forever for a response
+    slow_calls[26] = "fail"
+    slow_calls[27] = "interrupt"
+    with pytest.raises(Interrupted):
+        pipeline.run(http_request("GET", "http://localhost/"), retry_total=0)
+    assert len(calls) == 27
+
+    # Only idempotent reads are hedged
+    slow_calls[28] = "slow"
+    pipeline.run(http_request("POST", "http://localhost/"))
+    assert len(calls) == 28
+
+    # Per call opt-out
+    slow_calls[29] = "slow"
+    pipeline.run(http_request("GET", "http://localhost/"), retry_hedging=False)
+    assert len(calls) == 29
+
+
+def test_host_latencies():
+    from azure.core.pipeline.policies._retry import _HostLatencies
+
+    latencies = _HostLatencies(window=100, min_samples=10)
+    for i in range(9):
+        latencies.add("host", i)
+    assert latencies.quantile("host", 95) is None
+    assert latencies.quantile("other", 95) is None
+    for i in range(9, 200):
+        latencies.add("host", i)
+    # Only the last 100 latencies are kept
+    assert latencies.quantile("host", 50) == 150
+    assert latencies.quantile("host", 95) == 195
+    assert latencies.quantile("host", 100) == 199
@@ -0,0 +1,125 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import xml.etree.ElementTree as ET
+
+from modeltypes._utils.serialization import (
+    Deserializer,
+    Model,
+    attribute_key_extractor,
+    rest_key_case_insensitive_extractor,
+    rest_key_extractor,
+)
+
+
+class Owner(Model):
+    _attribute_map = {
+        "name": {"key": "name", "type": "str"},
+    }
+
+    def __init__(self, *, name=None, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+
+
+class Pet(Model):
+    _validation = {
+        "id": {"readonly": True},
+    }
+
+    _attribute_map = {
+        "id": {"key": "id", "type": "str"},
+        "name": {"key": "name", "type": "str"},
+        "age": {"key": "properties.age", "type": "int"},
+        "owners": {"key": "properties.owners", "type": "[Owner]"},
+        "dotted": {"key": "properties.tag\\.name", "type": "str"},
+        "additional_properties": {"key": "", "type": "{object}"},
+    }
+
+    def __init__(self, *, name=None, age=None, owners=None, dotted=None, additional_properties=None, **kwargs):
+        super().__init__(**kwargs)
+        self.id = None
+        self.name = name
+        self.age = age
+        self.owners = owners
+        self.dotted = dotted
+        self.additional_properties = additional_properties
+
+
+_MODELS = {"Owner": Owner, "Pet": Pet}
+
+_PET = {
+    "id": "/pets/wall-e",
+    "name": "wall-e",
+    "properties": {"age": 2, "owners": [{"name": "eve"}], "tag.name": "robot"},
+    "color": "rust",
+}
+
+
+def _check(pet):
+    assert pet.id == "/pets/wall-e"
+    assert pet.name == "wall-e"
+    assert pet.age == 2
+    assert [owner.name for owner in pet.owners] == ["eve"]
+    assert pet.dotted == "robot"
+
+
+def test_deserialize_flattened_model_reuses_plan():
+    deserializer = Deserializer(_MODELS)
+    for _ in range(2):
+        pet = deserializer("Pet", _PET)
+        _check(pet)
+        assert pet.additional_properties == {"color": "rust"}
+    assert {key[0] for key in deserializer._plans} == {Pet, Owner}
+
+
+def test_deserialize_missing_flattened_properties():
+    pet = Deserializer(_MODELS)("Pet", {"name": "wall-e", "properties": None})
+    assert pet.name == "wall-e"
+    assert pet.age is None
+    assert pet.owners is None
+
+
+def test_deserialize_plan_follows_key_extractors():
+    deserializer = Deserializer(_MODELS)
+    deserializer.additional_properties_detection = False
+    assert deserializer("Pet", {"name": "wall-e"}).name == "wall-e"
+
+    deserializer.key_extractors = [attribute_key_extractor]
+    pet = deserializer("Pet", {"name": "wall-e", "age": 2, "owners": [{"name": "eve"}]})
+    assert pet.age == 2
+    assert [owner.name for owner in pet.owners] == ["eve"]
+
+    deserializer.key_extractors = [rest_key_extractor, rest_key_case_insensitive_extractor]
+    pet = deserializer("Pet", {"NAME": "wall-e", "Properties": {"Age": 2}})
+    assert pet.name == "wall-e"
+    assert pet.age == 2
+    assert len({key[1] for key in deserializer._plans}) == 3
+
+
+def test_deserialize_from_dict():
+    pet = Pet.from_dict({"name": "wall-e", "age": 2, "owners": [{"name": "eve"}], "dotted": "robot"})
+    assert pet.age == 2
+    assert pet.dotted == "robot"
+    _check(Pet.from_dict(_PET, key_extractors=[rest_key_extractor]))
+
+
+def test_deserialize_xml():
+    class XmlPet(Model):
+        _attribute_map = {
+            "name": {"key": "Name", "type": "str", "xml": {"name": "Name"}},
+            "age": {"key": "Age", "type": "int", "xml": {"attr": True}},
+        }
+        _xml_map = {"name": "Pet"}
+
+        def __init__(self, *, name=None, age=None, **kwargs):
+            super().__init__(**kwargs)
+            self.name = name
+            self.age = age
+
+    deserializer = Deserializer({"XmlPet": XmlPet})
+    for _ in range(2):
+        pet = deserializer("XmlPet", ET.fromstring('<Pet Age="2"><Name>wall-e</Name></Pet>'))
+        assert pet.name == "wall-e"
+        assert pet.age == 2
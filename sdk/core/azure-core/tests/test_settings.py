@@ -175,7 +175,7 @@ class TestConverters(object):
             m.convert_azure_cloud(10)
 
 
-_standard_settings = ["log_level", "tracing_enabled"]
+_standard_settings = ["log_level", "tracing_enabled", "tracing_head_sampling"]
 
 
 class TestStandardSettings(object):
@@ -217,6 +217,7 @@ class TestStandardSettings(object):
         assert val.log_level == logging.INFO
         assert val.tracing_enabled is None
         assert val.tracing_implementation is None
+        assert val.tracing_head_sampling is False
         assert val.azure_cloud == AzureClouds.AZURE_PUBLIC_CLOUD
 
     def test_tracing_setting(self):
@@ -192,6 +192,24 @@ def test_get_trace_context():
         assert trace_context["traceparent"].split("-")[2] == format_span_id(span_context.span_id)
 
 
+def test_get_span_trace_context():
+    """Test that the trace context of a span and of the current context match the one of get_trace_context."""
+    tracer = get_tracer()
+    assert tracer
+
+    span = tracer.start_span(name="foo-span")
+    with tracer.use_span(span, end_on_exit=False):
+        trace_context = tracer.get_trace_context()
+        assert tracer._get_current_trace_context() == trace_context
+        assert tracer._get_current_trace_context() == trace_context
+    assert tracer._get_span_trace_context(span) == trace_context
+    assert tracer._get_current_trace_context() == {}
+
+    with tracer.start_as_current_span(name="bar-span"):
+        assert tracer._get_current_trace_context() == tracer.get_trace_context() != trace_context
+    span.end()
+
+
 def test_with_current_context_util_function(tracing_helper):
     result = []
     tracer = get_tracer()
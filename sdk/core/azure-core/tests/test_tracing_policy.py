@@ -14,8 +14,10 @@ from azure.core.pipeline.transport import HttpTransport, RequestsTransport
 from azure.core.settings import settings
 from azure.core.tracing._models import SpanKind
 from azure.core.tracing._abstract_span import HttpSpanMixin
+from azure.core.tracing.opentelemetry import OpenTelemetryTracer, _SUPPRESS_HTTP_INSTRUMENTATION_KEY
 import pytest
-from opentelemetry.trace import format_span_id, format_trace_id
+from opentelemetry import context as otel_context, trace
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags, format_span_id, format_trace_id
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
 
 from utils import HTTP_RESPONSES, HTTP_REQUESTS, create_http_response, request_and_responses_product
@@ -141,7 +143,6 @@ class TestTracingPolicyPluginImplementation:
     @pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_RESPONSES))
     def test_distributed_tracing_policy_exception(self, caplog, tracing_implementation, http_request, http_response):
         """Test policy with an exception during on_request before span is created, and be sure policy ignores it"""
-
         def bad_namer(http_request):
             path = urllib.parse.urlparse(http_request.url).path
             return f"{http_request.method} {path}"
@@ -618,6 +619,75 @@ class TestTracingPolicyNativeTracing:
         assert len(finished_spans) == 1
         assert finished_spans[0].name == "Root"
 
+    @pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_RESPONSES))
+    def test_distributed_tracing_policy_sampled_out(self, tracing_helper, http_request, http_response):
+        """Test that no attributes are set on a span that the sampler dropped."""
+        parent = NonRecordingSpan(SpanContext(0x1234, 0x5678, is_remote=True, trace_flags=TraceFlags(0)))
+        with trace.use_span(parent):
+            policy = DistributedTracingPolicy()
+
+            request = http_request("GET", "http://localhost/temp?query=query")
+            pipeline_request = PipelineRequest(request, PipelineContext(None))
+            policy.on_request(pipeline_request)
+
+            traceparent = request.headers.get("traceparent")
+            assert traceparent.startswith("00-{}-".format(format_trace_id(0x1234)))
+            assert traceparent.endswith("-00")
+
+            response = create_http_response(http_response, request, None)
+            response.headers = request.headers
+            response.status_code = 500
+
+            with mock.patch.object(policy, "_set_http_client_span_attributes") as set_attributes:
+                policy.on_response(pipeline_request, PipelineResponse(request, response, PipelineContext(None)))
+                policy.on_request(pipeline_request)
+                try:
+                    raise ValueError("Transport trouble")
+                except ValueError:
+                    policy.on_exception(pipeline_request)
+            set_attributes.assert_not_called()
+
+        assert len(tracing_helper.exporter.get_finished_spans()) == 0
+
+    @pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_RESPONSES))
+    def test_distributed_tracing_policy_head_sampling(self, tracing_helper, http_request, http_response):
+        """Test that no span is started for a call whose parent was not sampled when head sampling is enabled."""
+        settings.tracing_head_sampling = True
+        parent = NonRecordingSpan(SpanContext(0x1234, 0x5678, is_remote=True, trace_flags=TraceFlags(0)))
+        try:
+            with trace.use_span(parent), mock.patch.object(OpenTelemetryTracer, "start_span") as start_span:
+                policy = DistributedTracingPolicy()
+
+                request = http_request("GET", "http://localhost/temp?query=query")
+                pipeline_request = PipelineRequest(request, PipelineContext(None))
+                pipeline_request.context.options["tracing_attributes"] = {"foo": "bar"}
+                policy.on_request(pipeline_request)
+                assert "tracing_attributes" not in pipeline_request.context.options
+                assert request.headers.get("traceparent") == "00-{}-{}-00".format(
+                    format_trace_id(0x1234), format_span_id(0x5678)
+                )
+
+                response = create_http_response(http_response, request, None)
+                response.headers = request.headers
+                assert otel_context.get_value(_SUPPRESS_HTTP_INSTRUMENTATION_KEY)
+                policy.on_response(pipeline_request, PipelineResponse(request, response, PipelineContext(None)))
+                assert not otel_context.get_value(_SUPPRESS_HTTP_INSTRUMENTATION_KEY)
+            start_span.assert_not_called()
+
+            # A sampled parent still gets its network span.
+            with tracing_helper.tracer.start_as_current_span("Root"):
+                request = http_request("GET", "http://localhost/temp?query=query")
+                pipeline_request = PipelineRequest(request, PipelineContext(None))
+                policy.on_request(pipeline_request)
+                response = create_http_response(http_response, request, None)
+                response.headers = request.headers
+                policy.on_response(pipeline_request, PipelineResponse(request, response, PipelineContext(None)))
+        finally:
+            settings.tracing_head_sampling.unset_value()
+
+        finished_spans = tracing_helper.exporter.get_finished_spans()
+        assert [span.name for span in finished_spans] == ["GET", "Root"]
+
     @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
     def test_suppress_http_auto_instrumentation(self, port, tracing_helper, http_request):
         """Test that automatic HTTP instrumentation is suppressed when a request is made through the pipeline."""
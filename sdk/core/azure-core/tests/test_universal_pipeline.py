@@ -24,6 +24,8 @@
 # THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import io
+import json
 import logging
 import pickle
 
@@ -381,3 +383,116 @@ def test_json_regex():
     assert not ContentDecodePolicy.JSON_REGEXP.match("application/not-json")
     assert not ContentDecodePolicy.JSON_REGEXP.match("application/iamjson")
     assert not ContentDecodePolicy.JSON_REGEXP.match("fake/json")
+
+
+def _chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_iter_json_items(chunk_size):
+    body = (
+        '﻿{"value": [{"name": "a", "tags": {"k": "é"}}, 12, -3.5e2, true, null, "x", [1, [2]]],'
+        ' "nextLink": "http://next"}'
+    ).encode("utf-8")
+    items = ContentDecodePolicy.iter_json_items(_chunked(body, chunk_size))
+    assert list(items) == [{"name": "a", "tags": {"k": "é"}}, 12, -350.0, True, None, "x", [1, [2]]]
+    assert items.metadata == {"nextLink": "http://next"}
+
+    body = b' [ {"id": 1} , {"id": 2} ] '
+    assert list(ContentDecodePolicy.iter_json_items(_chunked(body, chunk_size), item_path=None)) == [
+        {"id": 1},
+        {"id": 2},
+    ]
+
+    # Members before the array, missing array, and file-like input
+    items = ContentDecodePolicy.iter_json_items(io.BytesIO(b'{"count": 0, "value": []}'))
+    assert list(items) == []
+    assert items.metadata == {"count": 0}
+    items = ContentDecodePolicy.iter_json_items([b'{"value": null, "nextLink": null}'])
+    assert list(items) == []
+    assert items.metadata == {"value": None, "nextLink": None}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"value": [1, 2', b'{"value": [1 2]}', b'{"value": [1]} extra', b"[1]", b'{"value": [1],}', b""],
+)
+def test_iter_json_items_invalid(body):
+    with pytest.raises(DecodeError):
+        list(ContentDecodePolicy.iter_json_items(_chunked(body, 2)))
+
+
+def test_content_decode_policy_stream_json_items():
+    from azure.core.rest import HttpRequest
+    from azure.core.rest._http_response_impl import HttpResponseImpl
+
+    body = b'{"value": [{"id": 1}, {"id": 2}], "nextLink": "next"}'
+    request = HttpRequest("GET", "http://localhost/")
+
+    def build_response(status_code=200, content_type="application/json"):
+        return HttpResponseImpl(
+            request=request,
+            internal_response=mock.Mock(),
+            status_code=status_code,
+            reason="OK",
+            content_type=content_type,
+            headers={},
+            stream_download_generator=lambda **kwargs: iter(_chunked(body, 5)),
+        )
+
+    policy = ContentDecodePolicy()
+    pipeline_request = PipelineRequest(request, PipelineContext(None, stream=True, stream_json_items="value"))
+    policy.on_request(pipeline_request)
+    assert "stream_json_items" not in pipeline_request.context.options
+
+    response = PipelineResponse(request, build_response(), pipeline_request.context)
+    policy.on_response(pipeline_request, response)
+    items = response.context["deserialized_data"]
+    assert list(items) == [{"id": 1}, {"id": 2}]
+    assert items.metadata == {"nextLink": "next"}
+
+    # Not JSON or not successful: left to the caller
+    for http_response in (build_response(content_type="application/xml"), build_response(status_code=404)):
+        pipeline_request = PipelineRequest(request, PipelineContext(None, stream=True, stream_json_items="value"))
+        policy.on_request(pipeline_request)
+        response = PipelineResponse(request, http_response, pipeline_request.context)
+        policy.on_response(pipeline_request, response)
+        assert "deserialized_data" not in response.context
+
+
+def test_content_decode_policy_stream_json_items_requires_stream():
+    from azure.core.rest import HttpRequest
+
+    request = HttpRequest("GET", "http://localhost/")
+    policy = ContentDecodePolicy(stream_json_items="value")
+    with pytest.raises(ValueError, match="stream=True"):
+        policy.on_request(PipelineRequest(request, PipelineContext(None, stream=False)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+def test_iter_json_items_split_strings(chunk_size):
+    # Escapes, brackets and quotes inside strings, split at every position across the chunks
+    item = {"a": 'x\\"]}[{', "b": ["\\\\", '"', "é"], "c": {"d": [1, {"e": "}"}]}}
+    body = json.dumps({"value": [item, "s\\"], "nextLink": None}).encode("utf-8")
+    items = ContentDecodePolicy.iter_json_items(_chunked(body, chunk_size))
+    assert list(items) == [item, "s\\"]
+    assert items.metadata == {"nextLink": None}
+
+
+def test_iter_json_items_decodes_each_item_once(monkeypatch):
+    from azure.core.pipeline.policies import _json_stream
+
+    calls = []
+    raw_decode = json.JSONDecoder.raw_decode
+
+    def counting_raw_decode(self, s, idx=0):
+        calls.append(idx)
+        return raw_decode(self, s, idx)
+
+    monkeypatch.setattr(_json_stream.json.JSONDecoder, "raw_decode", counting_raw_decode)
+    item = {"data": ["x" * 10] * 1000}
+    body = json.dumps({"value": [item, item]}).encode("utf-8")
+    assert list(ContentDecodePolicy.iter_json_items(_chunked(body, 64))) == [item, item]
+    # One call for the "value" key and one per item, however many chunks an item spans
+    assert len(calls) == 3
@@ -23,9 +23,12 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
-from typing import Mapping, MutableMapping, Optional, Type, Union, cast, Dict, Any
+from typing import Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union, cast, Dict, Any
+import functools
 import re
 import logging
+import types
+import weakref
 from azure.core import AzureClouds
 
 
@@ -41,13 +44,18 @@ _CHILDREN_RE = re.compile(
 
 _ARMNAME_RE = re.compile("^[^<>%&:\\?/]{1,260}$")
 
+# The number of resource ids whose parts and validity are kept by parse_resource_id and is_valid_resource_id
+_CACHE_SIZE = 4096
+
 
 __all__ = [
     "parse_resource_id",
+    "parse_resource_ids",
     "resource_id",
     "is_valid_resource_id",
     "is_valid_resource_name",
     "get_arm_endpoints",
+    "ResourceId",
 ]
 
 
@@ -78,6 +86,16 @@ def parse_resource_id(rid: str) -> Mapping[str, Union[str, int]]:
 
     :rtype: dict[str,str]
     """
+    return dict(_parse_resource_id_cached(rid))
+
+
+def _parse_resource_id(rid: str) -> Dict[str, Union[str, int]]:
+    """Parses a resource_id into its various parts, as parse_resource_id does.
+
+    :param str rid: The resource id being parsed
+    :return: The parts of the resource id
+    :rtype: dict[str, str]
+    """
     if not rid:
         return {}
     match = _ARMID_RE.match(rid)
@@ -94,6 +112,10 @@ def parse_resource_id(rid: str) -> Mapping[str, Union[str, int]]:
     return {key: value for key, value in final_result.items() if value is not None}
 
 
+# Shared by all the callers of parse_resource_id: parse_resource_id returns copies
+_parse_resource_id_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_parse_resource_id)
+
+
 def _populate_alternate_kwargs(
     kwargs: MutableMapping[str, Union[None, str, int]]
 ) -> Mapping[str, Union[None, str, int]]:
@@ -190,17 +212,33 @@ def is_valid_resource_id(rid: str, exception_type: Optional[Type[BaseException]]
     :returns: A boolean describing whether the id is valid.
     :rtype: bool
     """
-    is_valid: bool = False
-    try:
-        # Ideally, we would make a TypedDict here, but keeping this file simple for now.
-        is_valid = rid and resource_id(**parse_resource_id(rid)).lower() == rid.lower()  # type: ignore
-    except KeyError:
-        pass
+    is_valid = bool(rid) and _is_valid_resource_id_cached(rid)
     if not is_valid and exception_type:
         raise exception_type()
     return is_valid
 
 
+def _is_valid_resource_id(rid: str, parts: Mapping[str, Union[str, int]]) -> bool:
+    """Whether a resource id is the one built back from its parts.
+
+    :param str rid: The resource id being validated.
+    :param parts: The parts of the resource id, as returned by parse_resource_id.
+    :type parts: Mapping[str, Union[str, int]]
+    :return: A boolean describing whether the id is valid.
+    :rtype: bool
+    """
+    try:
+        # Ideally, we would make a TypedDict here, but keeping this file simple for now.
+        return resource_id(**parts).lower() == rid.lower()  # type: ignore
+    except KeyError:
+        return False
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _is_valid_resource_id_cached(rid: str) -> bool:
+    return _is_valid_resource_id(rid, _parse_resource_id_cached(rid))
+
+
 def is_valid_resource_name(rname: str, exception_type: Optional[Type[BaseException]] = None) -> bool:
     """Validates the given resource name to ARM guidelines, individual services may be more restrictive.
 
@@ -245,3 +283,153 @@ def get_arm_endpoints(cloud_setting: AzureClouds) -> Dict[str, Any]:
             "credential_scopes": ["https://management.azure.com/.default"],
         }
     raise ValueError("Unknown cloud setting: {}".format(cloud_setting))
+
+
+class ResourceId:
+    """An ARM resource id, parsed on first use.
+
+    Creating a ResourceId for a string that already has a live ResourceId returns that same instance, so the
+    resource ids of an inventory are parsed once however many times they are looked up. Resource ids compare
+    and hash case insensitively, as ARM does, and can be used as dictionary keys and set members to diff
+    the resources of two listings.
+
+    .. code-block:: python
+
+        current = set(parse_resource_ids(resource.id for resource in client.resources.list()))
+        for rid in current - expected:
+            print(rid.resource_group, rid.resource_type, rid.resource_name)
+
+    :param rid: The resource id. Ids that are not valid are accepted: their only part is their `name`.
+    :type rid: str or ~azure.mgmt.core.tools.ResourceId
+    """
+
+    __slots__ = ("_id", "_key", "_parts", "_valid", "__weakref__")
+
+    _interned: "weakref.WeakValueDictionary[str, ResourceId]" = weakref.WeakValueDictionary()
+
+    _id: str
+    _key: str
+    _parts: Optional[Mapping[str, Union[str, int]]]
+    _valid: Optional[bool]
+
+    def __new__(cls, rid: Union[str, "ResourceId"]) -> "ResourceId":
+        if isinstance(rid, ResourceId):
+            return rid
+        instance = cls._interned.get(rid)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._id = rid
+            instance._key = rid.lower()
+            instance._parts = None
+            instance._valid = None
+            cls._interned[rid] = instance
+        return instance
+
+    @classmethod
+    def from_parts(cls, **kwargs: Optional[str]) -> "ResourceId":
+        """Create a resource id from the given parts, with the same keywords as `resource_id`.
+
+        :return: The resource id built from the given parts.
+        :rtype: ~azure.mgmt.core.tools.ResourceId
+        """
+        return cls(resource_id(**kwargs))
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return (ResourceId, (self._id,))
+
+    def __str__(self) -> str:
+        return self._id
+
+    def __repr__(self) -> str:
+        return "ResourceId({!r})".format(self._id)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ResourceId):
+            return NotImplemented
+        return self is other or self._key == other._key
+
+    @property
+    def parts(self) -> Mapping[str, Union[str, int]]:
+        """The parts of the resource id, with the keys returned by `parse_resource_id`.
+
+        :rtype: Mapping[str, Union[str, int]]
+        :return: A read-only mapping of the parts of the resource id.
+        """
+        if self._parts is None:
+            self._parts = types.MappingProxyType(_parse_resource_id(self._id))
+        return self._parts
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the resource id is valid, as checked by `is_valid_resource_id`.
+
+        :rtype: bool
+        :return: True if the resource id is valid.
+        """
+        if self._valid is None:
+            self._valid = bool(self._id) and _is_valid_resource_id(self._id, self.parts)
+        return self._valid
+
+    @property
+    def subscription(self) -> Optional[str]:
+        """The subscription id, if any.
+
+        :rtype: str or None
+        :return: The subscription id.
+        """
+        return cast(Optional[str], self.parts.get("subscription"))
+
+    @property
+    def resource_group(self) -> Optional[str]:
+        """The name of the resource group, if any.
+
+        :rtype: str or None
+        :return: The name of the resource group.
+        """
+        return cast(Optional[str], self.parts.get("resource_group"))
+
+    @property
+    def resource_namespace(self) -> Optional[str]:
+        """The namespace of the resource provider (i.e. Microsoft.Compute), if any.
+
+        :rtype: str or None
+        :return: The namespace of the resource provider.
+        """
+        return cast(Optional[str], self.parts.get("resource_namespace"))
+
+    @property
+    def resource_type(self) -> Optional[str]:
+        """The type of the target resource (not the parent), if any.
+
+        :rtype: str or None
+        :return: The type of the resource.
+        """
+        return cast(Optional[str], self.parts.get("resource_type"))
+
+    @property
+    def resource_name(self) -> Optional[str]:
+        """The name of the target resource (not the parent), if any.
+
+        :rtype: str or None
+        :return: The name of the resource.
+        """
+        return cast(Optional[str], self.parts.get("resource_name"))
+
+
+def parse_resource_ids(rids: Iterable[Union[str, ResourceId]]) -> List[ResourceId]:
+    """Parses many resource ids.
+
+    Ids that are repeated, or that already have a live ResourceId, are parsed once and share their ResourceId.
+
+    :param rids: The resource ids being parsed
+    :type rids: iterable[str]
+    :returns: The parsed resource ids, in the same order.
+    :rtype: list[~azure.mgmt.core.tools.ResourceId]
+    """
+    resource_ids = [ResourceId(rid) for rid in rids]
+    for rid in resource_ids:
+        rid.parts  # pylint: disable=pointless-statement
+    return resource_ids
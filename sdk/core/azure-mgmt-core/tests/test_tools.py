@@ -23,13 +23,16 @@
 #
 # --------------------------------------------------------------------------
 
+import pickle
 import unittest
 
 from azure.mgmt.core.tools import (
     parse_resource_id,
+    parse_resource_ids,
     is_valid_resource_id,
     resource_id,
     is_valid_resource_name,
+    ResourceId,
 )
 
 
@@ -362,6 +365,65 @@ class TestTools(unittest.TestCase):
         for test in valid_names:
             assert is_valid_resource_name(test)
 
+    def test_parse_resource_id_returns_copies(self):
+        rid = "/subscriptions/fakesub/resourcegroups/testgroup/providers/Microsoft.Storage/storageAccounts/foo"
+        parts = parse_resource_id(rid)
+        parts["name"] = "bar"
+        assert parse_resource_id(rid)["name"] == "foo"
+        assert is_valid_resource_id(rid)
+        assert not is_valid_resource_id(rid + "/")
+        with self.assertRaises(ValueError):
+            is_valid_resource_id(rid + "/", ValueError)
+
+    def test_resource_id(self):
+        rid = (
+            "/subscriptions/fakesub/resourcegroups/testgroup/providers"
+            "/Microsoft.Storage/storageAccounts/foo/providers/Microsoft.Authorization/locks/bar"
+        )
+        resource = ResourceId(rid)
+        assert resource._parts is None
+        assert resource.parts == parse_resource_id(rid)
+        assert resource.is_valid
+        assert resource.subscription == "fakesub"
+        assert resource.resource_group == "testgroup"
+        assert resource.resource_namespace == "Microsoft.Storage"
+        assert resource.resource_type == "locks"
+        assert resource.resource_name == "bar"
+        assert str(resource) == rid
+        assert repr(resource) == "ResourceId({!r})".format(rid)
+        with self.assertRaises(TypeError):
+            resource.parts["name"] = "baz"
+
+        assert ResourceId(rid) is resource
+        assert ResourceId(resource) is resource
+        assert ResourceId(rid.upper()) is not resource
+        assert ResourceId(rid.upper()) == resource
+        assert len({resource, ResourceId(rid.upper())}) == 1
+        assert resource != rid
+        assert pickle.loads(pickle.dumps(resource)) is resource
+
+        invalid = ResourceId("foo")
+        assert not invalid.is_valid
+        assert invalid.parts == {"name": "foo"}
+        assert invalid.resource_group is None
+        assert not ResourceId("").is_valid
+
+    def test_resource_id_from_parts(self):
+        resource = ResourceId.from_parts(
+            subscription="mySub", resource_group="myRg", namespace="Microsoft.Provider1", type="type1", name="name1"
+        )
+        assert str(resource) == "/subscriptions/mySub/resourceGroups/myRg/providers/Microsoft.Provider1/type1/name1"
+        assert resource.resource_name == "name1"
+
+    def test_parse_resource_ids(self):
+        rids = ["/subscriptions/mySub/resourceGroups/rg{}".format(i % 3) for i in range(6)]
+        resources = parse_resource_ids(rids)
+        assert [str(resource) for resource in resources] == rids
+        assert resources[0] is resources[3]
+        assert all(resource._parts is not None for resource in resources)
+        assert [resource.resource_group for resource in resources] == ["rg0", "rg1", "rg2"] * 2
+        assert set(parse_resource_ids(rid.upper() for rid in rids)) == set(resources)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -18,31 +18,6 @@ from azure.mgmt.core.policies import ARMAutoResourceProviderRegistrationPolicy
 from . import models as _models
 from ._configuration import DataFactoryManagementClientConfiguration
 from ._serialization import Deserializer, Serializer
-from .operations import (
-    ActivityRunsOperations,
-    ChangeDataCaptureOperations,
-    CredentialOperationsOperations,
-    DataFlowDebugSessionOperations,
-    DataFlowsOperations,
-    DatasetsOperations,
-    ExposureControlOperations,
-    FactoriesOperations,
-    GlobalParametersOperations,
-    IntegrationRuntimeNodesOperations,
-    IntegrationRuntimeObjectMetadataOperations,
-    IntegrationRuntimesOperations,
-    LinkedServicesOperations,
-    ManagedPrivateEndpointsOperations,
-    ManagedVirtualNetworksOperations,
-    Operations,
-    PipelineRunsOperations,
-    PipelinesOperations,
-    PrivateEndPointConnectionsOperations,
-    PrivateEndpointConnectionOperations,
-    PrivateLinkResourcesOperations,
-    TriggerRunsOperations,
-    TriggersOperations,
-)
 
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
@@ -151,10 +126,38 @@ class DataFactoryManagementClient:  # pylint: disable=too-many-instance-attribut
             ]
         self._client: ARMPipelineClient = ARMPipelineClient(base_url=base_url, policies=_policies, **kwargs)
 
-        client_models = {k: v for k, v in _models.__dict__.items() if isinstance(v, type)}
+        client_models = {k: getattr(_models, k) for k in _models.__all__}
+        client_models = {k: v for k, v in client_models.items() if isinstance(v, type)}
         self._serialize = Serializer(client_models)
         self._deserialize = Deserializer(client_models)
         self._serialize.client_side_validation = False
+        # Operation groups and models are imported with the first client rather than with the package
+        from .operations import (  # pylint: disable=import-outside-toplevel
+            ActivityRunsOperations,
+            ChangeDataCaptureOperations,
+            CredentialOperationsOperations,
+            DataFlowDebugSessionOperations,
+            DataFlowsOperations,
+            DatasetsOperations,
+            ExposureControlOperations,
+            FactoriesOperations,
+            GlobalParametersOperations,
+            IntegrationRuntimeNodesOperations,
+            IntegrationRuntimeObjectMetadataOperations,
+            IntegrationRuntimesOperations,
+            LinkedServicesOperations,
+            ManagedPrivateEndpointsOperations,
+            ManagedVirtualNetworksOperations,
+            Operations,
+            PipelineRunsOperations,
+            PipelinesOperations,
+            PrivateEndPointConnectionsOperations,
+            PrivateEndpointConnectionOperations,
+            PrivateLinkResourcesOperations,
+            TriggerRunsOperations,
+            TriggersOperations,
+        )
+
         self.operations = Operations(self._client, self._config, self._serialize, self._deserialize)
         self.factories = FactoriesOperations(self._client, self._config, self._serialize, self._deserialize)
         self.exposure_control = ExposureControlOperations(
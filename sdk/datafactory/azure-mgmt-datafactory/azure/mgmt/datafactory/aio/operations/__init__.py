@@ -7,34 +7,35 @@
 # --------------------------------------------------------------------------
 # pylint: disable=wrong-import-position
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
 
-from ._operations import Operations  # type: ignore
-from ._factories_operations import FactoriesOperations  # type: ignore
-from ._exposure_control_operations import ExposureControlOperations  # type: ignore
-from ._integration_runtimes_operations import IntegrationRuntimesOperations  # type: ignore
-from ._integration_runtime_object_metadata_operations import IntegrationRuntimeObjectMetadataOperations  # type: ignore
-from ._integration_runtime_nodes_operations import IntegrationRuntimeNodesOperations  # type: ignore
-from ._linked_services_operations import LinkedServicesOperations  # type: ignore
-from ._datasets_operations import DatasetsOperations  # type: ignore
-from ._pipelines_operations import PipelinesOperations  # type: ignore
-from ._pipeline_runs_operations import PipelineRunsOperations  # type: ignore
-from ._activity_runs_operations import ActivityRunsOperations  # type: ignore
-from ._triggers_operations import TriggersOperations  # type: ignore
-from ._trigger_runs_operations import TriggerRunsOperations  # type: ignore
-from ._data_flows_operations import DataFlowsOperations  # type: ignore
-from ._data_flow_debug_session_operations import DataFlowDebugSessionOperations  # type: ignore
-from ._managed_virtual_networks_operations import ManagedVirtualNetworksOperations  # type: ignore
-from ._managed_private_endpoints_operations import ManagedPrivateEndpointsOperations  # type: ignore
-from ._credential_operations_operations import CredentialOperationsOperations  # type: ignore
-from ._private_end_point_connections_operations import PrivateEndPointConnectionsOperations  # type: ignore
-from ._private_endpoint_connection_operations import PrivateEndpointConnectionOperations  # type: ignore
-from ._private_link_resources_operations import PrivateLinkResourcesOperations  # type: ignore
-from ._global_parameters_operations import GlobalParametersOperations  # type: ignore
-from ._change_data_capture_operations import ChangeDataCaptureOperations  # type: ignore
+    from ._operations import Operations  # type: ignore
+    from ._factories_operations import FactoriesOperations  # type: ignore
+    from ._exposure_control_operations import ExposureControlOperations  # type: ignore
+    from ._integration_runtimes_operations import IntegrationRuntimesOperations  # type: ignore
+    from ._integration_runtime_object_metadata_operations import IntegrationRuntimeObjectMetadataOperations  # type: ignore
+    from ._integration_runtime_nodes_operations import IntegrationRuntimeNodesOperations  # type: ignore
+    from ._linked_services_operations import LinkedServicesOperations  # type: ignore
+    from ._datasets_operations import DatasetsOperations  # type: ignore
+    from ._pipelines_operations import PipelinesOperations  # type: ignore
+    from ._pipeline_runs_operations import PipelineRunsOperations  # type: ignore
+    from ._activity_runs_operations import ActivityRunsOperations  # type: ignore
+    from ._triggers_operations import TriggersOperations  # type: ignore
+    from ._trigger_runs_operations import TriggerRunsOperations  # type: ignore
+    from ._data_flows_operations import DataFlowsOperations  # type: ignore
+    from ._data_flow_debug_session_operations import DataFlowDebugSessionOperations  # type: ignore
+    from ._managed_virtual_networks_operations import ManagedVirtualNetworksOperations  # type: ignore
+    from ._managed_private_endpoints_operations import ManagedPrivateEndpointsOperations  # type: ignore
+    from ._credential_operations_operations import CredentialOperationsOperations  # type: ignore
+    from ._private_end_point_connections_operations import PrivateEndPointConnectionsOperations  # type: ignore
+    from ._private_endpoint_connection_operations import PrivateEndpointConnectionOperations  # type: ignore
+    from ._private_link_resources_operations import PrivateLinkResourcesOperations  # type: ignore
+    from ._global_parameters_operations import GlobalParametersOperations  # type: ignore
+    from ._change_data_capture_operations import ChangeDataCaptureOperations  # type: ignore
 
 from ._patch import __all__ as _patch_all
 from ._patch import *
@@ -67,3 +68,44 @@ __all__ = [
 ]
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+# Each operation group is imported when it is first accessed (PEP 562), not with the package.
+_LAZY_IMPORTS = {
+    "Operations": "._operations",
+    "FactoriesOperations": "._factories_operations",
+    "ExposureControlOperations": "._exposure_control_operations",
+    "IntegrationRuntimesOperations": "._integration_runtimes_operations",
+    "IntegrationRuntimeObjectMetadataOperations": "._integration_runtime_object_metadata_operations",
+    "IntegrationRuntimeNodesOperations": "._integration_runtime_nodes_operations",
+    "LinkedServicesOperations": "._linked_services_operations",
+    "DatasetsOperations": "._datasets_operations",
+    "PipelinesOperations": "._pipelines_operations",
+    "PipelineRunsOperations": "._pipeline_runs_operations",
+    "ActivityRunsOperations": "._activity_runs_operations",
+    "TriggersOperations": "._triggers_operations",
+    "TriggerRunsOperations": "._trigger_runs_operations",
+    "DataFlowsOperations": "._data_flows_operations",
+    "DataFlowDebugSessionOperations": "._data_flow_debug_session_operations",
+    "ManagedVirtualNetworksOperations": "._managed_virtual_networks_operations",
+    "ManagedPrivateEndpointsOperations": "._managed_private_endpoints_operations",
+    "CredentialOperationsOperations": "._credential_operations_operations",
+    "PrivateEndPointConnectionsOperations": "._private_end_point_connections_operations",
+    "PrivateEndpointConnectionOperations": "._private_endpoint_connection_operations",
+    "PrivateLinkResourcesOperations": "._private_link_resources_operations",
+    "GlobalParametersOperations": "._global_parameters_operations",
+    "ChangeDataCaptureOperations": "._change_data_capture_operations",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -62,6 +62,7 @@ from ._models import (
     ObjectReplicationPolicy,
     ObjectReplicationRule,
     ImmutabilityPolicy,
+    DirectoryTransferResult,
 )
 from ._list_blobs_helper import BlobPrefix
 
@@ -261,4 +262,5 @@ __all__ = [
     'ObjectReplicationPolicy',
     'ObjectReplicationRule',
     'Services',
+    'DirectoryTransferResult',
 ]
@@ -5,6 +5,7 @@
 # --------------------------------------------------------------------------
 # pylint: disable=too-many-lines, docstring-keyword-should-match-keyword-only
 
+import os
 import warnings
 from datetime import datetime
 from functools import partial
@@ -20,6 +21,7 @@ from azure.core.pipeline import Pipeline
 from azure.core.tracing.decorator import distributed_trace
 from ._blob_client_helpers import (
     _abort_copy_options,
+    _allocate_file,
     _append_block_from_url_options,
     _append_block_options,
     _clear_page_options,
@@ -34,6 +36,8 @@ from ._blob_client_helpers import (
     _get_blob_tags_options,
     _get_block_list_result,
     _get_page_ranges_options,
+    _map_file,
+    _open_partial_file,
     _parse_url,
     _quick_query_options,
     _resize_blob_options,
@@ -65,6 +69,7 @@ from ._models import BlobBlock, BlobProperties, BlobQueryError, BlobType, PageRa
 from ._quick_query_helper import BlobQueryReader
 from ._shared.base_client import parse_connection_str, StorageAccountHostsMixin, TransportWrapper
 from ._shared.response_handlers import process_storage_error, return_response_headers
+from ._shared.uploads import BufferStream
 from ._serialize import (
     get_access_conditions,
     get_api_version,
@@ -501,7 +506,7 @@ class BlobClient(StorageAccountHostsMixin, StorageEncryptionMixin):  # pylint: d
         :keyword ~azure.storage.blob.ContentSettings content_settings:
             ContentSettings object used to set blob properties. Used to set content type, encoding,
             language, disposition, md5, and cache control.
-        :keyword bool validate_content:
+        :keyword validate_content:
             If true, calculates an MD5 hash for each chunk of the blob. The storage
             service checks the hash of the content that has arrived with the hash
             that was sent. This is primarily valuable for detecting bitflips on
@@ -510,6 +515,14 @@ class BlobClient(StorageAccountHostsMixin, StorageEncryptionMixin):  # pylint: d
             blob. Also note that if enabled, the memory-efficient upload algorithm
             will not be used because computing the MD5 hash requires buffering
             entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+
+            Pass 'crc64' to calculate a CRC64 instead of an MD5 hash, which is faster and
+            requires the azure-storage-extensions package. The CRC64 of the whole blob is then
+            composed from the CRC64 of its chunks and returned as `content_crc64` in the returned dict.
+
+            .. versionadded:: 12.28.0
+                CRC64 validation with `validate_content='crc64'`.
+        :paramtype validate_content: bool or str
         :keyword lease:
             Required if the blob has an active lease. If specified, upload_blob only succeeds if the
             blob's lease is active and matches this ID. Value can be a BlobLeaseClient object
@@ -633,6 +646,36 @@ class BlobClient(StorageAccountHostsMixin, StorageEncryptionMixin):  # pylint: d
             return upload_page_blob(**options)
         return upload_append_blob(**options)
 
+    @distributed_trace
+    def upload_blob_from_path(
+        self, file_path: str,
+        blob_type: Union[str, BlobType] = BlobType.BLOCKBLOB,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Creates a new blob from a local file, or updates the content of an existing blob.
+
+        The file is memory-mapped, and its chunks are uploaded as views of the mapping: they are neither
+        read into memory nor copied, and the parallel uploads share no stream. With client-side encryption,
+        the file is read as a stream instead.
+
+        .. versionadded:: 12.28.0
+
+        :param str file_path: The path of the file to upload.
+        :param ~azure.storage.blob.BlobType blob_type: The type of the blob. This can be
+            either BlockBlob, PageBlob or AppendBlob. The default value is BlockBlob.
+        :keyword Any kwargs:
+            The keyword arguments of :func:`upload_blob`, except `length`, which is the size of the file.
+        :return: Blob-updated property Dict (Etag and last modified)
+        :rtype: Dict[str, Any]
+        """
+        with open(file_path, 'rb') as file:
+            length = os.fstat(file.fileno()).st_size
+            if not length or self.key_encryption_key:
+                # An empty file cannot be memory-mapped, and client-side encryption copies the chunks anyway
+                return self.upload_blob(file, blob_type=blob_type, length=length, **kwargs)
+            with _map_file(file, length) as view, BufferStream(view) as stream:
+                return self.upload_blob(stream, blob_type=blob_type, length=length, **kwargs)
+
     @overload
     def download_blob(
         self, offset: Optional[int] = None,
@@ -679,7 +722,7 @@ class BlobClient(StorageAccountHostsMixin, StorageEncryptionMixin):  # pylint: d
 
             This keyword argument was introduced in API version '2019-12-12'.
 
-        :keyword bool validate_content:
+        :keyword validate_content:
             If true, calculates an MD5 hash for each chunk of the blob. The storage
             service checks the hash of the content that has arrived with the hash
             that was sent. This is primarily valuable for detecting bitflips on
@@ -688,6 +731,14 @@ class BlobClient(StorageAccountHostsMixin, StorageEncryptionMixin):  # pylint: d
             blob. Also note that if enabled, the memory-efficient upload algorithm
             will not be used because computing the MD5 hash requires buffering
             entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+
+            Pass 'crc64' to calculate a CRC64 instead of an MD5 hash, which is faster and
+            requires the azure-storage-extensions package. The CRC64 of the whole blob is then
+            composed from the CRC64 of its chunks and available as `content_crc64` on the StorageStreamDownloader.
+
+            .. versionadded:: 12.28.0
+                CRC64 validation with `validate_content='crc64'`.
+        :paramtype validate_content: bool or str
         :keyword lease:
             Required if the blob has an active lease. If specified, download_blob only
             succeeds if the blob's lease is active and matches this ID. Value can be a
@@ -778,6 +829,45 @@ class BlobClient(StorageAccountHostsMixin, StorageEncryptionMixin):  # pylint: d
             **kwargs)
         return StorageStreamDownloader(**options)
 
+    @distributed_trace
+    def download_blob_to_path(
+        self, file_path: str,
+        offset: Optional[int] = None,
+        length: Optional[int] = None,
+        **kwargs: Any
+    ) -> int:
+        """Downloads a blob, or a range of it, to a local file.
+
+        The blob is downloaded to a temporary file next to `file_path`, with the `.partial` suffix, which replaces
+        the file once the download completes. If the download fails, the temporary file is removed and the file
+        is left untouched. The temporary file is allocated at the size of the download and memory-mapped. Each chunk
+        is written to its own range of the mapping, so the chunks downloaded in parallel are written without a lock.
+        Where the disk space cannot be allocated ahead, the chunks are written to the file instead.
+
+        .. versionadded:: 12.28.0
+
+        :param str file_path: The path of the file to download to.
+        :param int offset:
+            Start of byte range to use for downloading a section of the blob.
+            Must be set if length is provided.
+        :param int length:
+            Number of bytes to read from the stream. This is optional, but
+            should be supplied for optimal performance.
+        :keyword Any kwargs:
+            The keyword arguments of :func:`download_blob`, except `encoding`.
+        :return: The number of bytes downloaded.
+        :rtype: int
+        """
+        downloader = self.download_blob(offset=offset, length=length, **kwargs)
+        with _open_partial_file(file_path) as file:
+            if not downloader.size:
+                # An empty file cannot be memory-mapped
+                return 0
+            if not _allocate_file(file, downloader.size):
+                return downloader.readinto(file)
+            with _map_file(file, downloader.size, writable=True) as view:
+                return downloader._readinto(buffer=view)  # pylint: disable=protected-access
+
     @distributed_trace
     def query_blob(self, query_expression: str, **kwargs: Any) -> BlobQueryReader:
         """Enables users to select/project on blob/or blob snapshot data by providing simple query expressions.
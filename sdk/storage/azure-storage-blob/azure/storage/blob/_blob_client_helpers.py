@@ -5,10 +5,14 @@
 # --------------------------------------------------------------------------
 # pylint: disable=too-many-lines
 
+import errno
+import mmap
+import os
+from contextlib import contextmanager
 from io import BytesIO
 from typing import (
     Any, AnyStr, AsyncGenerator, AsyncIterable, cast,
-    Dict, IO, Iterable, List, Optional, Tuple, Union,
+    Dict, IO, Iterable, Iterator, List, Optional, Tuple, Union,
     TYPE_CHECKING
 )
 from urllib.parse import quote, unquote, urlparse
@@ -62,6 +66,9 @@ if TYPE_CHECKING:
     from ._models import ContentSettings
     from ._shared.models import StorageConfiguration
 
+# Suffix of the temporary file a blob is downloaded to before it replaces the target
+_PARTIAL_SUFFIX = '.partial'
+
 
 def _parse_url(
     account_url: str,
@@ -188,6 +195,83 @@ def _upload_blob_options(  # pylint:disable=too-many-statements
         raise ValueError(f"Unsupported BlobType: {blob_type}")
     return kwargs
 
+
+def _allocate_file(file: IO[bytes], length: int) -> bool:
+    """Extend an open file to `length` bytes, allocating their disk space so that the file can be memory-mapped.
+
+    Writing through a mapping to a page the file system cannot allocate, on a full disk for example, kills the
+    process with SIGBUS instead of raising an error: the space is allocated beforehand with posix_fallocate, which
+    raises OSError when the disk is full. Windows allocates the space of a file extended by truncate.
+
+    :param IO[bytes] file: The file, opened for writing.
+    :param int length: The size of the file.
+    :return: False if the space of the file cannot be allocated ahead of the writes, in which case it must not be
+        written through a mapping.
+    :rtype: bool
+    """
+    if os.name == 'nt':
+        file.truncate(length)
+        return True
+    if not hasattr(os, 'posix_fallocate'):
+        return False
+    try:
+        os.posix_fallocate(file.fileno(), 0, length)
+    except OSError as error:
+        # The file system does not support allocating space
+        if error.errno in (errno.EINVAL, errno.EOPNOTSUPP):
+            return False
+        raise
+    return True
+
+
+@contextmanager
+def _map_file(file: IO[bytes], length: int, writable: bool = False) -> Iterator[memoryview]:
+    """Memory-map the first `length` bytes of an open file.
+
+    :param IO[bytes] file: The file, opened for reading, or for reading and writing if `writable`.
+    :param int length: The number of bytes to map, which must not be 0.
+    :param bool writable: Whether the writes to the mapping are written to the file.
+    :return: A view of the mapping, released on exit.
+    :rtype: Iterator[memoryview]
+    """
+    mapping = mmap.mmap(file.fileno(), length, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+    view = memoryview(mapping)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapping.close()
+        except BufferError:
+            # A mapping written to must be closed before its file is replaced: the users of a writable view release
+            # the views they take of it. An upload error may still reference the chunks it sent, which are views of
+            # a read-only mapping: it is closed once they are released.
+            if writable:
+                raise
+
+
+@contextmanager
+def _open_partial_file(file_path: str) -> Iterator[IO[bytes]]:
+    """Open a temporary file next to `file_path`, which replaces it once the block exits without error.
+
+    The temporary file is removed on error, so a failed download leaves neither a partly written file nor a
+    truncated target.
+
+    :param str file_path: The path of the file to write.
+    :return: The temporary file, opened for reading and writing.
+    :rtype: Iterator[IO[bytes]]
+    """
+    partial_path = file_path + _PARTIAL_SUFFIX
+    try:
+        with open(partial_path, 'wb+') as file:
+            yield file
+        os.replace(partial_path, file_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+
 def _upload_blob_from_url_options(source_url: str, **kwargs: Any) -> Dict[str, Any]:
     metadata = kwargs.pop('metadata', None)
     headers = kwargs.pop('headers', {})
@@ -25,7 +25,7 @@ from ._encryption import StorageEncryptionMixin
 from ._generated import AzureBlobStorage
 from ._generated.models import KeyInfo, StorageServiceProperties
 from ._list_blobs_helper import FilteredBlobPaged
-from ._models import BlobProperties, ContainerProperties, ContainerPropertiesPaged, CorsRule
+from ._models import BlobProperties, ContainerProperties, ContainerPropertiesPaged, CorsRule, DirectoryTransferResult
 from ._serialize import get_api_version
 from ._shared.base_client import parse_connection_str, parse_query, StorageAccountHostsMixin, TransportWrapper
 from ._shared.models import LocationMode
@@ -711,6 +711,62 @@ class BlobServiceClient(StorageAccountHostsMixin, StorageEncryptionMixin):
         except HttpResponseError as error:
             process_storage_error(error)
 
+    @distributed_trace
+    def upload_directory(
+        self, container: Union[ContainerProperties, str],
+        source: str,
+        prefix: Optional[str] = None,
+        **kwargs: Any
+    ) -> DirectoryTransferResult:
+        """Uploads the files of a local directory tree as block blobs under a virtual directory of a container.
+
+        All the files share `max_concurrency` connections. See
+        :func:`~azure.storage.blob.ContainerClient.upload_directory` for the keyword arguments.
+
+        .. versionadded:: 12.28.0
+
+        :param container:
+            The container to upload to. This can either be the name of the container,
+            or an instance of ContainerProperties.
+        :type container: str or ~azure.storage.blob.ContainerProperties
+        :param str source: The local directory to upload.
+        :param str prefix:
+            The virtual directory to upload the files to. Defaults to the root of the container.
+        :return: The counts of transferred, skipped and failed files, and the throughput of the upload.
+        :rtype: ~azure.storage.blob.DirectoryTransferResult
+        """
+        container_client = self.get_container_client(container)
+        kwargs.setdefault('merge_span', True)
+        return container_client.upload_directory(source, prefix, **kwargs)
+
+    @distributed_trace
+    def download_directory(
+        self, container: Union[ContainerProperties, str],
+        destination: str,
+        prefix: Optional[str] = None,
+        **kwargs: Any
+    ) -> DirectoryTransferResult:
+        """Downloads the blobs of a virtual directory of a container to a local directory tree.
+
+        All the blobs share `max_concurrency` connections. See
+        :func:`~azure.storage.blob.ContainerClient.download_directory` for the keyword arguments.
+
+        .. versionadded:: 12.28.0
+
+        :param container:
+            The container to download from. This can either be the name of the container,
+            or an instance of ContainerProperties.
+        :type container: str or ~azure.storage.blob.ContainerProperties
+        :param str destination: The local directory to download the blobs to.
+        :param str prefix:
+            The virtual directory to download. Defaults to the whole container.
+        :return: The counts of transferred, skipped and failed files, and the throughput of the download.
+        :rtype: ~azure.storage.blob.DirectoryTransferResult
+        """
+        container_client = self.get_container_client(container)
+        kwargs.setdefault('merge_span', True)
+        return container_client.download_directory(destination, prefix, **kwargs)
+
     def get_container_client(self, container: Union[ContainerProperties, str]) -> ContainerClient:
         """Get a client to interact with the specified container.
 
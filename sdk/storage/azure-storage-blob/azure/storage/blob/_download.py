@@ -4,11 +4,13 @@
 # license information.
 # --------------------------------------------------------------------------
 import codecs
+import os
+import stat
 import sys
 import threading
 import time
 import warnings
-from io import BytesIO, StringIO
+from io import BufferedRandom, BufferedWriter, BytesIO, FileIO, StringIO
 from typing import (
     Any, Callable, cast, Dict, Generator,
     Generic, IO, Iterator, List, Optional,
@@ -20,6 +22,7 @@ from azure.core.tracing.common import with_current_context
 
 from ._shared.request_handlers import validate_and_format_range_headers
 from ._shared.response_handlers import parse_length_from_content_range, process_storage_error
+from ._shared.validation import CRC64_HEADER, ContentCrc64, decode_crc64, encode_crc64, is_crc64
 from ._deserialize import deserialize_blob_properties, get_page_ranges_result
 from ._encryption import (
     adjust_blob_size_for_encryption,
@@ -81,6 +84,41 @@ def process_content(data: Any, start_offset: int, end_offset: int, encryption: D
     return content
 
 
+def get_range_validation(validate_content: Union[bool, str, None], range_validation: Optional[str]) -> Dict[str, Any]:
+    # The service returns the CRC64 or the MD5 of the ranges under 4MB
+    if is_crc64(validate_content):
+        return {'range_get_content_crc64': range_validation}
+    return {'range_get_content_md5': range_validation}
+
+
+def add_content_crc64(content_crc64: ContentCrc64, offset: int, content: bytes, response: Any) -> None:
+    # The content validation checked the content against the CRC64 the service returned for the range,
+    # which is reused rather than computed again
+    crc64 = response.response.headers.get(CRC64_HEADER)
+    if crc64:
+        content_crc64.add(offset, len(content), decode_crc64(crc64))
+    else:
+        content_crc64.add_data(offset, content)
+
+
+def get_file_descriptor(stream: Any) -> Optional[int]:
+    # A regular file can take the chunks downloaded in parallel as positional writes to its descriptor,
+    # which need no lock as they do not move the position of the file. os.pwrite is only available on POSIX.
+    # Other streams with a descriptor, like gzip, bz2 or lzma files, transform what is written to them and
+    # expose the descriptor of the file underneath, so they are written to through their own write.
+    if not hasattr(os, 'pwrite') or type(stream) not in (FileIO, BufferedWriter, BufferedRandom):
+        return None
+    try:
+        descriptor = stream.fileno()
+        if not stat.S_ISREG(os.fstat(descriptor).st_mode):
+            return None
+        # Write out what the stream buffers before it is written to underneath
+        stream.flush()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return descriptor
+
+
 class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
@@ -90,13 +128,15 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
         current_progress: int,
         start_range: int,
         end_range: int,
-        validate_content: bool,
+        validate_content: Union[bool, str],
         encryption_options: Dict[str, Any],
         encryption_data: Optional["_EncryptionData"] = None,
         stream: Any = None,
         parallel: Optional[int] = None,
         non_empty_ranges: Optional[List[Dict[str, Any]]] = None,
         progress_hook: Optional[Callable[[int, Optional[int]], None]] = None,
+        content_crc64: Optional[ContentCrc64] = None,
+        buffer: Optional[memoryview] = None,
         **kwargs: Any
     ) -> None:
         self.client = client
@@ -108,15 +148,19 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
         self.start_index = start_range
         self.end_index = end_range
 
-        # The destination that we will write to
+        # The destination that we will write to: a stream, or a writable buffer of the download range, such as a
+        # memory-mapped file, where each chunk is written to its own offset, so parallel chunks need no lock.
+        # Parallel chunks are written to a regular file at their own offset too, and to other streams under a lock.
         self.stream = stream
-        self.stream_lock = threading.Lock() if parallel else None
+        self.buffer = buffer
+        self.file_descriptor = get_file_descriptor(stream) if parallel and buffer is None else None
+        self.stream_lock = threading.Lock() if parallel and buffer is None and self.file_descriptor is None else None
         self.progress_lock = threading.Lock() if parallel else None
         self.progress_hook = progress_hook
 
         # For a parallel download, the stream is always seekable, so we note down the current position
         # in order to seek to the right place when out-of-order chunks come in
-        self.stream_start = stream.tell() if parallel else 0
+        self.stream_start = stream.tell() if parallel and stream is not None else 0
 
         # Download progress so far
         self.progress_total = current_progress
@@ -127,6 +171,7 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
 
         # Parameters for each get operation
         self.validate_content = validate_content
+        self.content_crc64 = content_crc64
         self.request_options = kwargs
 
     def _calculate_range(self, chunk_start: int) -> Tuple[int, int]:
@@ -165,13 +210,32 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
             self.progress_hook(self.progress_total, self.total_size)
 
     def _write_to_stream(self, chunk_data: bytes, chunk_start: int) -> None:
-        if self.stream_lock:
+        if self.buffer is not None:
+            position = chunk_start - self.start_index
+            self.buffer[position:position + len(chunk_data)] = chunk_data
+        elif self.file_descriptor is not None:
+            self._write_to_file(chunk_data, chunk_start)
+        elif self.stream_lock:
             with self.stream_lock:  # pylint: disable=not-context-manager
                 self.stream.seek(self.stream_start + (chunk_start - self.start_index))
                 self.stream.write(chunk_data)
         else:
             self.stream.write(chunk_data)
 
+    def _write_to_file(self, chunk_data: bytes, chunk_start: int) -> None:
+        data = memoryview(chunk_data)
+        offset = self.stream_start + (chunk_start - self.start_index)
+        while data:
+            written = os.pwrite(cast(int, self.file_descriptor), data, offset)
+            data = data[written:]
+            offset += written
+
+    def complete_stream(self) -> None:
+        # The positional writes leave the position of the stream where the download started, so move it past
+        # the data as a write of the download would have done
+        if self.file_descriptor is not None:
+            self.stream.seek(self.stream_start + (self.end_index - self.start_index))
+
     def _do_optimize(self, given_range_start: int, given_range_end: int) -> bool:
         # If we have no page range list stored, then assume there's data everywhere for that page blob
         # or it's a block blob or append blob
@@ -209,6 +273,8 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
         if self._do_optimize(download_range[0], download_range[1]):
             content_length = download_range[1] - download_range[0] + 1
             chunk_data = b"\x00" * content_length
+            if self.content_crc64 is not None:
+                self.content_crc64.add_data(download_range[0], chunk_data)
         else:
             range_header, range_validation = validate_and_format_range_headers(
                 download_range[0],
@@ -223,7 +289,7 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
                 try:
                     _, response = self.client.download(
                         range=range_header,
-                        range_get_content_md5=range_validation,
+                        **get_range_validation(self.validate_content, range_validation),
                         validate_content=self.validate_content,
                         data_stream_total=self.total_size,
                         download_stream_current=self.progress_total,
@@ -241,6 +307,8 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
                         raise HttpResponseError(error, error=error) from error
                     time.sleep(1)
             content_length = response.content_length
+            if self.content_crc64 is not None:
+                add_content_crc64(self.content_crc64, download_range[0], chunk_data, response)
 
             # This makes sure that if_match is set so that we can validate
             # that subsequent downloads are to an unmodified blob
@@ -328,7 +396,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         config: "StorageConfiguration" = None,  # type: ignore [assignment]
         start_range: Optional[int] = None,
         end_range: Optional[int] = None,
-        validate_content: bool = None,  # type: ignore [assignment]
+        validate_content: Union[bool, str] = None,  # type: ignore [assignment]
         encryption_options: Dict[str, Any] = None,  # type: ignore [assignment]
         max_concurrency: int = 1,
         name: str = None,  # type: ignore [assignment]
@@ -349,6 +417,11 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         self._encoding = encoding
         self._validate_content = validate_content
         self._encryption_options = encryption_options or {}
+        # Composes the CRC64 of the content downloaded with CRC64 validation, see content_crc64
+        self._content_crc64: Optional[ContentCrc64] = None
+        if is_crc64(validate_content) and \
+                self._encryption_options.get("key") is None and self._encryption_options.get("resolver") is None:
+            self._content_crc64 = ContentCrc64()
         self._progress_hook = kwargs.pop('progress_hook', None)
         self._request_options = kwargs
         self._response = None
@@ -419,6 +492,23 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
     def __len__(self):
         return self.size
 
+    @property
+    def content_crc64(self) -> Optional[bytearray]:
+        """The CRC64 of the content, when downloaded with `validate_content='crc64'`.
+
+        It is composed from the CRC64 the service returned for each range of the download, so the whole
+        content can be checked, for example against the `content_crc64` returned by `upload_blob`, without
+        another pass over the data. It is None until the whole content has been downloaded, without CRC64
+        validation, or with client-side encryption.
+
+        :return: The eight bytes of the CRC64, or None.
+        :rtype: bytearray or None
+        """
+        if self._content_crc64 is None:
+            return None
+        crc64 = self._content_crc64.compose(self._download_start, self.size)
+        return None if crc64 is None else bytearray(encode_crc64(crc64))
+
     def _get_encryption_data_request(self) -> None:
         # Save current request cls
         download_cls = self._request_options.pop('cls', None)
@@ -455,7 +545,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
             try:
                 location_mode, response = cast(Tuple[Optional[str], Any], self._clients.blob.download(
                     range=range_header,
-                    range_get_content_md5=range_validation,
+                    **get_range_validation(self._validate_content, range_validation),
                     validate_content=self._validate_content,
                     data_stream_total=None,
                     download_stream_current=0,
@@ -521,6 +611,8 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
                 time.sleep(1)
         self._download_offset += len(self._current_content)
         self._raw_download_offset += response.content_length
+        if self._content_crc64 is not None:
+            add_content_crc64(self._content_crc64, self._download_start, self._current_content, response)
 
         # get page ranges to optimize downloading sparse page blob
         if response.properties.blob_type == 'PageBlob':
@@ -585,6 +677,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
                 start_range=start,
                 end_range=end,
                 validate_content=self._validate_content,
+                content_crc64=self._content_crc64,
                 encryption_options=self._encryption_options,
                 encryption_data=self._encryption_data,
                 use_location=self._location_mode,
@@ -691,6 +784,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
                 stream=output_stream,
                 parallel=parallel,
                 validate_content=self._validate_content,
+                content_crc64=self._content_crc64,
                 encryption_options=self._encryption_options,
                 encryption_data=self._encryption_data,
                 use_location=self._location_mode,
@@ -772,6 +866,19 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         :return: The number of bytes read.
         :rtype: int
         """
+        return self._readinto(stream=stream)
+
+    def _readinto(self, stream: Any = None, buffer: Optional[memoryview] = None) -> int:
+        """Download the contents of this blob to a stream, or into a writable buffer.
+
+        The buffer, of the remaining size of the download, such as a memory-mapped file, gets each chunk written to
+        its own offset, so the chunks downloaded in parallel are written without a lock.
+
+        :param IO[bytes] stream: The stream to download to, if no buffer is given.
+        :param memoryview buffer: The buffer to download into.
+        :return: The number of bytes read.
+        :rtype: int
+        """
         if self._text_mode:
             raise ValueError("Stream has been partially read in text mode. readinto is not supported in text mode.")
         if self._encoding:
@@ -779,7 +886,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
 
         # The stream must be seekable if parallel download is required
         parallel = self._max_concurrency > 1
-        if parallel:
+        if parallel and buffer is None:
             error_message = "Target stream handle must be seekable."
             if sys.version_info >= (3,) and not stream.seekable():
                 raise ValueError(error_message)
@@ -798,7 +905,12 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         # Write the current content to the user stream
         current_remaining = len(self._current_content) - self._current_content_offset
         start = self._current_content_offset
-        count = stream.write(cast(bytes, self._current_content[start:start + current_remaining]))
+        current_content = cast(bytes, self._current_content[start:start + current_remaining])
+        if buffer is not None:
+            buffer[:len(current_content)] = current_content
+            count = len(current_content)
+        else:
+            count = stream.write(current_content)
 
         self._current_content_offset += count
         self._read_offset += count
@@ -821,24 +933,32 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
             start_range=data_start,
             end_range=data_end,
             stream=stream,
+            buffer=None if buffer is None else buffer[count:],
             parallel=parallel,
             validate_content=self._validate_content,
+            content_crc64=self._content_crc64,
             encryption_options=self._encryption_options,
             encryption_data=self._encryption_data,
             use_location=self._location_mode,
             progress_hook=self._progress_hook,
             **self._request_options
         )
-        if parallel:
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(self._max_concurrency) as executor:
-                list(executor.map(
-                        with_current_context(downloader.process_chunk),
-                        downloader.get_chunk_offsets()
-                    ))
-        else:
-            for chunk in downloader.get_chunk_offsets():
-                downloader.process_chunk(chunk)
+        try:
+            if parallel:
+                import concurrent.futures
+                with concurrent.futures.ThreadPoolExecutor(self._max_concurrency) as executor:
+                    list(executor.map(
+                            with_current_context(downloader.process_chunk),
+                            downloader.get_chunk_offsets()
+                        ))
+                downloader.complete_stream()
+            else:
+                for chunk in downloader.get_chunk_offsets():
+                    downloader.process_chunk(chunk)
+        finally:
+            if downloader.buffer is not None:
+                # The buffer may map a file, which cannot be closed while views of it exist
+                downloader.buffer.release()
 
         self._complete_read()
         return remaining_size
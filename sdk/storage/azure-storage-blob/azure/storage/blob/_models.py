@@ -1505,3 +1505,47 @@ class BlobQueryError(object):
         self.is_fatal = is_fatal
         self.description = description
         self.position = position
+
+
+class DirectoryTransferResult(DictMixin):
+    """The result of a directory transfer, returned by upload_directory and download_directory.
+
+    Files that failed to transfer do not stop the transfer of the others: their errors are
+    recorded in `failures`. Run the transfer again with the same journal to retry them.
+    """
+
+    files_transferred: int
+    """The number of files transferred."""
+    files_skipped: int
+    """The number of files skipped, because they were unchanged or already in the journal."""
+    bytes_transferred: int
+    """The number of bytes transferred."""
+    elapsed: float
+    """The duration of the transfer, in seconds."""
+    failures: Dict[str, Exception]
+    """The errors of the files that failed to transfer, by blob name."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.files_transferred = kwargs.get('files_transferred', 0)
+        self.files_skipped = kwargs.get('files_skipped', 0)
+        self.bytes_transferred = kwargs.get('bytes_transferred', 0)
+        self.elapsed = kwargs.get('elapsed', 0.0)
+        self.failures = kwargs.get('failures') or {}
+
+    @property
+    def files_failed(self) -> int:
+        """The number of files that failed to transfer.
+
+        :return: The number of failures.
+        :rtype: int
+        """
+        return len(self.failures)
+
+    @property
+    def throughput(self) -> float:
+        """The average throughput of the transfer, in bytes per second.
+
+        :return: The bytes transferred per second.
+        :rtype: float
+        """
+        return self.bytes_transferred / self.elapsed if self.elapsed else 0.0
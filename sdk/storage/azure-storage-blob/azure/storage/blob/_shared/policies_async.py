@@ -16,6 +16,7 @@ from azure.core.pipeline.policies import AsyncBearerTokenCredentialPolicy, Async
 from .authentication import AzureSigningError, StorageHttpChallenge
 from .constants import DEFAULT_OAUTH_SCOPE
 from .policies import encode_base64, is_retry, StorageContentValidation, StorageRetryPolicy
+from .validation import CRC64, CRC64_HEADER, encode_crc64_header, get_content_crc64, get_validation_algorithm
 
 if TYPE_CHECKING:
     from azure.core.credentials_async import AsyncTokenCredential
@@ -37,17 +38,24 @@ async def retry_hook(settings, **kwargs):
 
 
 async def is_checksum_retry(response):
-    # retry if invalid content md5
-    if response.context.get("validate_content", False) and response.http_response.headers.get("content-md5"):
+    # retry if invalid content md5 or crc64
+    algorithm = get_validation_algorithm(response.context.get("validate_content", False))
+    header = CRC64_HEADER if algorithm == CRC64 else "content-md5"
+    if algorithm and response.http_response.headers.get(header):
         if hasattr(response.http_response, "load_body"):
             try:
                 await response.http_response.load_body()  # Load the body in memory and close the socket
             except (StreamClosedError, StreamConsumedError):
                 pass
-        computed_md5 = response.http_request.headers.get("content-md5", None) or encode_base64(
-            StorageContentValidation.get_content_md5(response.http_response.body())
-        )
-        if response.http_response.headers["content-md5"] != computed_md5:
+        if algorithm == CRC64:
+            computed = response.http_request.headers.get(CRC64_HEADER, None) or encode_crc64_header(
+                get_content_crc64(response.http_response.body())
+            )
+        else:
+            computed = response.http_request.headers.get("content-md5", None) or encode_base64(
+                StorageContentValidation.get_content_md5(response.http_response.body())
+            )
+        if response.http_response.headers[header] != computed:
             return True
     return False
 
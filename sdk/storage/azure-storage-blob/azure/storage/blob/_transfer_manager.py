@@ -0,0 +1,506 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent import futures
+from math import ceil
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Tuple,
+    TYPE_CHECKING
+)
+
+from azure.core import MatchConditions
+from azure.core.tracing.common import with_current_context
+
+from ._models import ContentSettings, DirectoryTransferResult
+
+if TYPE_CHECKING:
+    from ._container_client import ContainerClient
+    from ._models import BlobProperties
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+_SKIP_UNCHANGED_MODES = ('size', 'mtime', 'md5')
+_HASH_READ_SIZE = 4 * 1024 * 1024
+
+
+class TransferItem(object):
+    """A file to transfer: a local path and the name of its blob."""
+
+    __slots__ = ('name', 'path', 'size', 'mtime', 'blob', 'md5')
+
+    def __init__(
+        self, name: str,
+        path: str,
+        size: int,
+        mtime: Optional[float] = None,
+        blob: Optional["BlobProperties"] = None
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.blob = blob
+        self.md5: Optional[bytes] = None
+
+
+class TransferBudget(object):
+    """A number of connections shared by the files of a transfer.
+
+    A file takes one connection to start, and as many more as are free, up to what its chunks
+    can use, to transfer its chunks in parallel.
+
+    :param int slots: The total number of connections.
+    """
+
+    def __init__(self, slots: int) -> None:
+        self._free = slots
+        self._condition = threading.Condition()
+
+    def acquire(self, wanted: int) -> int:
+        with self._condition:
+            self._condition.wait_for(lambda: self._free > 0)
+            slots = min(wanted, self._free)
+            self._free -= slots
+            return slots
+
+    def release(self, slots: int) -> None:
+        with self._condition:
+            self._free += slots
+            self._condition.notify_all()
+
+
+class TransferJournal(object):
+    """The files transferred so far, recorded one JSON line per file.
+
+    A transfer run again with the same journal skips the files it already transferred, if they
+    did not change since.
+
+    :param str path: The path of the journal file, created if it does not exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.isfile(path):
+            with open(path, 'r', encoding='utf-8') as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry['name']] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # The last line may be incomplete if the previous transfer was interrupted
+                        continue
+        self._file = open(path, 'a', encoding='utf-8')  # pylint: disable=consider-using-with
+
+    def record(self, item: TransferItem, etag: Optional[str]) -> None:
+        entry = {'name': item.name, 'size': item.size, 'mtime': item.mtime, 'etag': etag}
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        self.entries[item.name] = entry
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class TransferState(object):
+    """The counters, progress and journal of a transfer, updated by its workers.
+
+    :param int total: The number of bytes of the files to transfer.
+    :param progress_hook: The callback receiving the aggregate progress of the transfer.
+    :type progress_hook: Callable[[int, Optional[int]], None] or None
+    :param journal: The journal recording the transferred files.
+    :type journal: ~azure.storage.blob._transfer_manager.TransferJournal or None
+    """
+
+    def __init__(
+        self, total: int,
+        progress_hook: Optional[Callable[[int, Optional[int]], Any]],
+        journal: Optional[TransferJournal]
+    ) -> None:
+        self.result = DirectoryTransferResult()
+        self._total = total
+        self._current = 0
+        self._progress_hook = progress_hook
+        self._journal = journal
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    def _advance(self, count: int) -> Optional[Tuple[int, int]]:
+        # Called with the lock held
+        self._current += count
+        return (self._current, self._total) if self._progress_hook else None
+
+    def _file_progress(self, last: List[int], current: int) -> Optional[Tuple[int, int]]:
+        with self._lock:
+            delta, last[0] = current - last[0], current
+            return self._advance(delta) if delta > 0 else None
+
+    def _skip(self, item: TransferItem) -> Optional[Tuple[int, int]]:
+        with self._lock:
+            self.result.files_skipped += 1
+            return self._advance(item.size)
+
+    def file_progress_hook(self) -> Optional[Callable[[int, Optional[int]], None]]:
+        """The progress hook to pass to the transfer of one file.
+
+        :return: A callback adding the progress of the file to the aggregate progress, or None.
+        :rtype: Callable[[int, Optional[int]], None] or None
+        """
+        if not self._progress_hook:
+            return None
+        last = [0]
+
+        def progress_hook(current: int, _total: Optional[int]) -> None:
+            progress = self._file_progress(last, current)
+            if progress:
+                self._progress_hook(*progress)  # type: ignore [misc]
+
+        return progress_hook
+
+    def skipped(self, item: TransferItem) -> None:
+        progress = self._skip(item)
+        if progress:
+            self._progress_hook(*progress)  # type: ignore [misc]
+
+    def transferred(self, item: TransferItem, etag: Optional[str]) -> None:
+        with self._lock:
+            self.result.files_transferred += 1
+            self.result.bytes_transferred += item.size
+            if self._journal:
+                self._journal.record(item, etag)
+
+    def failed(self, item: TransferItem, error: Exception) -> None:
+        _LOGGER.warning("Failed to transfer %r: %s", item.name, error)
+        with self._lock:
+            self.result.failures[item.name] = error
+
+    def finish(self, skipped: int) -> DirectoryTransferResult:
+        self.result.files_skipped += skipped
+        self.result.elapsed = time.monotonic() - self._start
+        return self.result
+
+
+def validate_skip_unchanged(skip_unchanged: Optional[str]) -> None:
+    if skip_unchanged is not None and skip_unchanged not in _SKIP_UNCHANGED_MODES:
+        raise ValueError("skip_unchanged must be one of {} or None.".format(', '.join(_SKIP_UNCHANGED_MODES)))
+
+
+def directory_prefix(prefix: Optional[str]) -> str:
+    """The prefix of the blob names of a virtual directory: empty, or ending with a '/'.
+
+    :param str prefix: The virtual directory, with or without its trailing '/'.
+    :return: The prefix of the blob names.
+    :rtype: str
+    """
+    if not prefix or prefix.endswith('/'):
+        return prefix or ''
+    return prefix + '/'
+
+
+def connections_for(size: int, single_transfer_size: int, chunk_size: int) -> int:
+    """The number of connections a blob of `size` bytes can use.
+
+    :param int size: The size of the blob.
+    :param int single_transfer_size: The size up to which the blob is transferred in one request.
+    :param int chunk_size: The size of the chunks of larger blobs.
+    :return: The number of chunks of the blob, or 1.
+    :rtype: int
+    """
+    if size <= single_transfer_size:
+        return 1
+    return max(1, ceil(size / chunk_size))
+
+
+def file_md5(item: TransferItem) -> bytes:
+    if item.md5 is None:
+        md5 = hashlib.md5()
+        with open(item.path, 'rb') as stream:
+            for block in iter(lambda: stream.read(_HASH_READ_SIZE), b''):
+                md5.update(block)
+        item.md5 = md5.digest()
+    return item.md5
+
+
+def is_unchanged(item: TransferItem, skip_unchanged: Optional[str], upload: bool) -> bool:
+    """Whether the destination of a file is the same as its source, as far as `skip_unchanged` compares them.
+
+    :param item: The file, with the properties of its blob if the blob exists.
+    :type item: ~azure.storage.blob._transfer_manager.TransferItem
+    :param str skip_unchanged: 'size', 'mtime' or 'md5'.
+    :param bool upload: Whether the local file is the source.
+    :return: True if the file does not need to be transferred.
+    :rtype: bool
+    """
+    blob = item.blob
+    if not skip_unchanged or blob is None or item.mtime is None or blob.size != item.size:
+        return False
+    if skip_unchanged == 'mtime':
+        blob_mtime = blob.last_modified.timestamp()
+        return blob_mtime >= item.mtime if upload else item.mtime >= blob_mtime
+    if skip_unchanged == 'md5':
+        content_md5 = blob.content_settings.content_md5
+        return content_md5 is not None and bytes(content_md5) == file_md5(item)
+    return True
+
+
+def plan_upload(
+    source: str,
+    prefix: str,
+    blobs: Optional[Dict[str, "BlobProperties"]],
+    journal: Optional[TransferJournal]
+) -> Tuple[List[TransferItem], int]:
+    """The files of a local directory to upload, largest first.
+
+    :param str source: The local directory.
+    :param str prefix: The prefix of the blob names.
+    :param blobs: The existing blobs by name, if the files are compared with them.
+    :type blobs: dict[str, ~azure.storage.blob.BlobProperties] or None
+    :param journal: The journal of a previous transfer.
+    :type journal: ~azure.storage.blob._transfer_manager.TransferJournal or None
+    :return: The files to upload, and the number of files skipped because they are in the journal.
+    :rtype: tuple[list[~azure.storage.blob._transfer_manager.TransferItem], int]
+    """
+    if not os.path.isdir(source):
+        raise ValueError("The directory '{}' does not exist.".format(source))
+    items = []
+    skipped = 0
+    for root, _, files in os.walk(source):
+        for file_name in files:
+            path = os.path.join(root, file_name)
+            stat = os.stat(path)
+            name = prefix + os.path.relpath(path, source).replace(os.sep, '/')
+            entry = journal.entries.get(name) if journal else None
+            if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                skipped += 1
+                continue
+            items.append(TransferItem(
+                name, path, stat.st_size, stat.st_mtime, blobs.get(name) if blobs is not None else None))
+    items.sort(key=lambda item: item.size, reverse=True)
+    return items, skipped
+
+
+def plan_download(
+    destination: str,
+    prefix: str,
+    blobs: Iterable["BlobProperties"],
+    journal: Optional[TransferJournal]
+) -> Tuple[List[TransferItem], int, Dict[str, Exception]]:
+    """The blobs of a virtual directory to download, largest first.
+
+    :param str destination: The local directory.
+    :param str prefix: The prefix of the blob names.
+    :param blobs: The blobs of the virtual directory.
+    :type blobs: Iterable[~azure.storage.blob.BlobProperties]
+    :param journal: The journal of a previous transfer.
+    :type journal: ~azure.storage.blob._transfer_manager.TransferJournal or None
+    :return: The blobs to download, the number of blobs skipped because they are in the journal, and
+        the errors of the blobs whose name is not a valid path in the destination.
+    :rtype: tuple[list[~azure.storage.blob._transfer_manager.TransferItem], int, dict[str, Exception]]
+    """
+    root = os.path.abspath(destination)
+    items = []
+    skipped = 0
+    failures: Dict[str, Exception] = {}
+    for blob in blobs:
+        relative = blob.name[len(prefix):]
+        if not relative or relative.endswith('/'):
+            continue
+        path = os.path.normpath(os.path.join(root, *relative.split('/')))
+        if os.path.commonpath([root, path]) != root or path == root:
+            failures[blob.name] = ValueError(
+                "The blob name '{}' is not a path in the directory '{}'.".format(blob.name, destination))
+            continue
+        try:
+            stat = os.stat(path)
+            size, mtime = stat.st_size, stat.st_mtime
+        except OSError:
+            size, mtime = -1, None
+        entry = journal.entries.get(blob.name) if journal else None
+        if entry and entry['etag'] == blob.etag and size == blob.size:
+            skipped += 1
+            continue
+        item = TransferItem(blob.name, path, blob.size, mtime, blob)
+        if size != blob.size:
+            # Only compare the files that exist with the size of their blob
+            item.mtime = None
+        items.append(item)
+    items.sort(key=lambda item: item.size, reverse=True)
+    return items, skipped, failures
+
+
+def upload_file(
+    container_client: "ContainerClient",
+    item: TransferItem,
+    connections: int,
+    state: TransferState,
+    skip_unchanged: Optional[str],
+    **kwargs: Any
+) -> None:
+    if skip_unchanged == 'md5':
+        content_settings = copy.copy(kwargs.get('content_settings')) or ContentSettings()
+        content_settings.content_md5 = bytearray(file_md5(item))
+        kwargs['content_settings'] = content_settings
+    response = container_client.get_blob_client(item.name).upload_blob_from_path(
+        item.path,
+        max_concurrency=connections,
+        progress_hook=state.file_progress_hook(),
+        **kwargs)
+    state.transferred(item, response.get('etag'))
+
+
+def download_file(
+    container_client: "ContainerClient",
+    item: TransferItem,
+    connections: int,
+    state: TransferState,
+    overwrite: bool,
+    **kwargs: Any
+) -> None:
+    if not overwrite and os.path.exists(item.path):
+        raise ValueError("The file '{}' already exists.".format(item.path))
+    blob = item.blob
+    os.makedirs(os.path.dirname(item.path), exist_ok=True)
+    # The blob replaces the file only once it is completely downloaded
+    container_client.get_blob_client(item.name).download_blob_to_path(
+        item.path,
+        max_concurrency=connections,
+        progress_hook=state.file_progress_hook(),
+        etag=blob.etag,  # type: ignore [union-attr]
+        match_condition=MatchConditions.IfNotModified,
+        **kwargs)
+    last_modified = blob.last_modified.timestamp()  # type: ignore [union-attr]
+    os.utime(item.path, (last_modified, last_modified))
+    state.transferred(item, blob.etag)  # type: ignore [union-attr]
+
+
+def run_transfers(
+    items: List[TransferItem],
+    max_concurrency: int,
+    transfer: Callable[[TransferItem, int], None],
+    connections: Callable[[TransferItem], int],
+    state: TransferState,
+    skip_unchanged: Optional[str],
+    upload: bool
+) -> None:
+    """Transfer files from `max_concurrency` threads sharing `max_concurrency` connections.
+
+    :param items: The files to transfer.
+    :type items: list[~azure.storage.blob._transfer_manager.TransferItem]
+    :param int max_concurrency: The number of connections of the transfer.
+    :param transfer: Transfers a file with a number of connections.
+    :type transfer: Callable[[~azure.storage.blob._transfer_manager.TransferItem, int], None]
+    :param connections: The number of connections a file can use.
+    :type connections: Callable[[~azure.storage.blob._transfer_manager.TransferItem], int]
+    :param state: The state of the transfer.
+    :type state: ~azure.storage.blob._transfer_manager.TransferState
+    :param str skip_unchanged: How to compare the files with their destination, or None.
+    :param bool upload: Whether the local files are the sources.
+    """
+    budget = TransferBudget(max_concurrency)
+    pending = iter(items)
+    lock = threading.Lock()
+
+    def worker() -> None:
+        while True:
+            with lock:
+                item = next(pending, None)
+            if item is None:
+                return
+            try:
+                if is_unchanged(item, skip_unchanged, upload):
+                    state.skipped(item)
+                    continue
+                slots = budget.acquire(min(connections(item), max_concurrency))
+                try:
+                    transfer(item, slots)
+                finally:
+                    budget.release(slots)
+            except Exception as error:  # pylint: disable=broad-except
+                state.failed(item, error)
+
+    with futures.ThreadPoolExecutor(max_concurrency) as executor:
+        running = [executor.submit(with_current_context(worker)) for _ in range(min(max_concurrency, len(items)))]
+        for future in running:
+            future.result()
+
+
+def upload_directory(
+    container_client: "ContainerClient",
+    source: str,
+    prefix: Optional[str] = None,
+    **kwargs: Any
+) -> DirectoryTransferResult:
+    skip_unchanged = kwargs.pop('skip_unchanged', None)
+    validate_skip_unchanged(skip_unchanged)
+    journal_path = kwargs.pop('journal_path', None)
+    max_concurrency = kwargs.pop('max_concurrency', None) or DEFAULT_MAX_CONCURRENCY
+    progress_hook = kwargs.pop('progress_hook', None)
+    kwargs.setdefault('overwrite', skip_unchanged is not None)
+    prefix = directory_prefix(prefix)
+    config = container_client._config  # pylint: disable=protected-access
+
+    blobs = None
+    if skip_unchanged:
+        blobs = {blob.name: blob for blob in container_client.list_blobs(
+            name_starts_with=prefix, timeout=kwargs.get('timeout'))}
+    journal = TransferJournal(journal_path) if journal_path else None
+    try:
+        items, skipped = plan_upload(source, prefix, blobs, journal)
+        state = TransferState(sum(item.size for item in items), progress_hook, journal)
+        run_transfers(
+            items,
+            max_concurrency,
+            lambda item, slots: upload_file(container_client, item, slots, state, skip_unchanged, **kwargs),
+            lambda item: connections_for(item.size, config.max_single_put_size, config.max_block_size),
+            state,
+            skip_unchanged,
+            upload=True)
+    finally:
+        if journal:
+            journal.close()
+    return state.finish(skipped)
+
+
+def download_directory(
+    container_client: "ContainerClient",
+    destination: str,
+    prefix: Optional[str] = None,
+    **kwargs: Any
+) -> DirectoryTransferResult:
+    skip_unchanged = kwargs.pop('skip_unchanged', None)
+    validate_skip_unchanged(skip_unchanged)
+    journal_path = kwargs.pop('journal_path', None)
+    max_concurrency = kwargs.pop('max_concurrency', None) or DEFAULT_MAX_CONCURRENCY
+    progress_hook = kwargs.pop('progress_hook', None)
+    overwrite = kwargs.pop('overwrite', skip_unchanged is not None)
+    prefix = directory_prefix(prefix)
+    config = container_client._config  # pylint: disable=protected-access
+
+    blobs = container_client.list_blobs(name_starts_with=prefix, timeout=kwargs.get('timeout'))
+    journal = TransferJournal(journal_path) if journal_path else None
+    try:
+        items, skipped, failures = plan_download(destination, prefix, blobs, journal)
+        state = TransferState(sum(item.size for item in items), progress_hook, journal)
+        state.result.failures.update(failures)
+        run_transfers(
+            items,
+            max_concurrency,
+            lambda item, slots: download_file(container_client, item, slots, state, overwrite, **kwargs),
+            lambda item: connections_for(item.size, config.max_single_get_size, config.max_chunk_get_size),
+            state,
+            skip_unchanged,
+            upload=False)
+    finally:
+        if journal:
+            journal.close()
+    return state.finish(skipped)
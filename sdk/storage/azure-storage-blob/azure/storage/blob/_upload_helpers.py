@@ -28,10 +28,12 @@ from ._shared.response_handlers import process_storage_error, return_response_he
 from ._shared.uploads import (
     AppendBlobChunkUploader,
     BlockBlobChunkUploader,
+    BufferStream,
     PageBlobChunkUploader,
     upload_data_chunks,
     upload_substream_blocks
 )
+from ._shared.validation import ContentCrc64, encode_crc64, is_crc64
 
 if TYPE_CHECKING:
     from ._generated.operations import AppendBlobOperations, BlockBlobOperations, PageBlobOperations
@@ -55,6 +57,17 @@ def _convert_mod_error(error):
     raise overwrite_error
 
 
+def _set_content_crc64(
+    response: Optional[Dict[str, Any]],
+    content_crc64: Optional[ContentCrc64]
+) -> Optional[Dict[str, Any]]:
+    # With CRC64 validation, return the CRC64 of the whole content, composed from the CRC64 of its chunks,
+    # instead of the CRC64 of the last request
+    if content_crc64 is not None and response is not None:
+        response['content_crc64'] = bytearray(encode_crc64(content_crc64.compose()))  # type: ignore [arg-type]
+    return response
+
+
 def _any_conditions(modified_access_conditions=None, **kwargs):  # pylint: disable=unused-argument
     return any([
         modified_access_conditions.if_modified_since,
@@ -91,20 +104,28 @@ def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statements
         immutability_policy_mode = None if immutability_policy is None else immutability_policy.policy_mode
         legal_hold = kwargs.pop('legal_hold', None)
         progress_hook = kwargs.pop('progress_hook', None)
+        content_crc64 = ContentCrc64() if is_crc64(validate_content) else None
 
         # Do single put if the size is smaller than or equal config.max_single_put_size
         if adjusted_count is not None and (adjusted_count <= blob_settings.max_single_put_size):
             data = stream.read(length or -1)
-            if not isinstance(data, bytes):
+            if not isinstance(data, (bytes, memoryview)):
                 raise TypeError('Blob data should be of type bytes.')
 
             if encryption_options.get('key'):
+                if not isinstance(data, bytes):
+                    raise TypeError('Blob data should be of type bytes.')
                 encryption_data, data = encrypt_blob(data, encryption_options['key'], encryption_options['version'])
                 headers['x-ms-meta-encryptiondata'] = encryption_data
 
+            computed_crc64 = None
+            if content_crc64 is not None:
+                computed_crc64 = encode_crc64(content_crc64.add_data(0, data))
+
             response = client.upload(
                 body=data,  # type: ignore [arg-type]
                 content_length=adjusted_count,
+                transactional_content_crc64=computed_crc64,
                 blob_http_headers=blob_headers,
                 headers=headers,
                 cls=return_response_headers,
@@ -121,9 +142,10 @@ def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statements
             if progress_hook:
                 progress_hook(adjusted_count, adjusted_count)
 
-            return cast(Dict[str, Any], response)
+            return cast(Dict[str, Any], _set_content_crc64(response, content_crc64))
 
-        use_original_upload_path = blob_settings.use_byte_buffer or \
+        # A BufferStream is cut into chunks without copying, so it does not need the memory-efficient substreams
+        use_original_upload_path = blob_settings.use_byte_buffer or isinstance(stream, BufferStream) or \
             validate_content or encryption_options.get('required') or \
             blob_settings.max_block_size < blob_settings.min_large_block_upload_threshold or \
             hasattr(stream, 'seekable') and not stream.seekable() or \
@@ -158,6 +180,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statements
                 max_concurrency=max_concurrency,
                 stream=stream,
                 validate_content=validate_content,
+                content_crc64=content_crc64,
                 progress_hook=progress_hook,
                 encryptor=encryptor,
                 padder=padder,
@@ -180,7 +203,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statements
 
         block_lookup = BlockLookupList(committed=[], uncommitted=[], latest=[])
         block_lookup.latest = block_ids
-        return cast(Dict[str, Any], client.commit_block_list(
+        response = cast(Dict[str, Any], client.commit_block_list(
             block_lookup,
             blob_http_headers=blob_headers,
             cls=return_response_headers,
@@ -192,6 +215,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statements
             immutability_policy_mode=immutability_policy_mode,
             legal_hold=legal_hold,
             **kwargs))
+        return cast(Dict[str, Any], _set_content_crc64(response, content_crc64))
     except HttpResponseError as error:
         try:
             process_storage_error(error)
@@ -237,6 +261,7 @@ def upload_page_blob(
 
         blob_tags_string = kwargs.pop('blob_tags_string', None)
         progress_hook = kwargs.pop('progress_hook', None)
+        content_crc64 = ContentCrc64() if is_crc64(validate_content) else None
 
         response = cast(Dict[str, Any], client.create(
             content_length=0,
@@ -258,7 +283,7 @@ def upload_page_blob(
                 kwargs['padder'] = padder
 
         kwargs['modified_access_conditions'] = ModifiedAccessConditions(if_match=response['etag'])
-        return cast(Dict[str, Any], upload_data_chunks(
+        return cast(Dict[str, Any], _set_content_crc64(upload_data_chunks(
             service=client,
             uploader_class=PageBlobChunkUploader,
             total_size=length,
@@ -266,9 +291,10 @@ def upload_page_blob(
             stream=stream,
             max_concurrency=max_concurrency,
             validate_content=validate_content,
+            content_crc64=content_crc64,
             progress_hook=progress_hook,
             headers=headers,
-            **kwargs))
+            **kwargs), content_crc64))
 
     except HttpResponseError as error:
         try:
@@ -300,6 +326,7 @@ def upload_append_blob(  # pylint: disable=unused-argument
             append_position=None)
         blob_tags_string = kwargs.pop('blob_tags_string', None)
         progress_hook = kwargs.pop('progress_hook', None)
+        content_crc64 = ContentCrc64() if is_crc64(validate_content) else None
 
         try:
             if overwrite:
@@ -309,7 +336,7 @@ def upload_append_blob(  # pylint: disable=unused-argument
                     headers=headers,
                     blob_tags_string=blob_tags_string,
                     **kwargs)
-            return cast(Dict[str, Any], upload_data_chunks(
+            return cast(Dict[str, Any], _set_content_crc64(upload_data_chunks(
                 service=client,
                 uploader_class=AppendBlobChunkUploader,
                 total_size=length,
@@ -317,10 +344,11 @@ def upload_append_blob(  # pylint: disable=unused-argument
                 stream=stream,
                 max_concurrency=max_concurrency,
                 validate_content=validate_content,
+                content_crc64=content_crc64,
                 append_position_access_conditions=append_conditions,
                 progress_hook=progress_hook,
                 headers=headers,
-                **kwargs))
+                **kwargs), content_crc64))
         except HttpResponseError as error:
             if error.response.status_code != 404:  # type: ignore [union-attr]
                 raise
@@ -338,7 +366,7 @@ def upload_append_blob(  # pylint: disable=unused-argument
                 headers=headers,
                 blob_tags_string=blob_tags_string,
                 **kwargs)
-            return cast(Dict[str, Any], upload_data_chunks(
+            return cast(Dict[str, Any], _set_content_crc64(upload_data_chunks(
                 service=client,
                 uploader_class=AppendBlobChunkUploader,
                 total_size=length,
@@ -346,9 +374,10 @@ def upload_append_blob(  # pylint: disable=unused-argument
                 stream=stream,
                 max_concurrency=max_concurrency,
                 validate_content=validate_content,
+                content_crc64=content_crc64,
                 append_position_access_conditions=append_conditions,
                 progress_hook=progress_hook,
                 headers=headers,
-                **kwargs))
+                **kwargs), content_crc64))
     except HttpResponseError as error:
         process_storage_error(error)
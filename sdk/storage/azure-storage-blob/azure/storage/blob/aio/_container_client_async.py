@@ -38,7 +38,7 @@ from .._encryption import StorageEncryptionMixin
 from .._generated.aio import AzureBlobStorage
 from .._generated.models import SignedIdentifier
 from .._list_blobs_helper import IgnoreListBlobsDeserializer
-from .._models import ContainerProperties, BlobType, BlobProperties, FilteredBlob
+from .._models import ContainerProperties, BlobType, BlobProperties, DirectoryTransferResult, FilteredBlob
 from .._serialize import get_modify_conditions, get_container_cpk_scope_info, get_api_version, get_access_conditions
 from .._shared.base_client import StorageAccountHostsMixin
 from .._shared.base_client_async import AsyncStorageAccountHostsMixin, AsyncTransportWrapper, parse_connection_str
@@ -49,6 +49,7 @@ from .._shared.response_handlers import (
     return_headers_and_deserialized,
     return_response_headers
 )
+from ._transfer_manager_async import download_directory, upload_directory
 
 if TYPE_CHECKING:
     from azure.core.credentials import AzureNamedKeyCredential, AzureSasCredential
@@ -1337,6 +1338,120 @@ class ContainerClient(AsyncStorageAccountHostsMixin, StorageAccountHostsMixin, S
             encoding=encoding,
             **kwargs)
 
+    @distributed_trace_async
+    async def upload_directory(
+        self, source: str,
+        prefix: Optional[str] = None,
+        **kwargs: Any
+    ) -> DirectoryTransferResult:
+        """Uploads the files of a local directory tree as block blobs under a virtual directory.
+
+        Each file is uploaded to the blob named after its path relative to `source`, under `prefix`.
+        All the files share `max_concurrency` connections: small files are uploaded in parallel, and
+        a large file also uploads its blocks in parallel on the connections that are free when it starts.
+        Larger files are uploaded first.
+
+        A file that fails to upload does not stop the others: its error is recorded in the returned
+        result. With a journal, uploading the directory again only uploads the files that failed, did
+        not upload yet, or changed since.
+
+        .. versionadded:: 12.28.0
+
+        :param str source: The local directory to upload.
+        :param str prefix:
+            The virtual directory to upload the files to, such as 'photos/2024'. The blob names are the
+            relative paths of the files, with '/' separators, after the prefix. Defaults to the root of
+            the container.
+        :keyword str skip_unchanged:
+            Skips the files whose blob already exists and is unchanged: 'size' compares the sizes,
+            'mtime' also requires the blob to be modified after the file, and 'md5' also compares the
+            MD5 hash of the file with the content MD5 of the blob, which the upload sets. Changed files
+            are overwritten. Defaults to None, uploading every file.
+        :keyword str journal_path:
+            The path of a file recording the uploaded files, to resume an interrupted upload.
+            It is created if it does not exist.
+        :keyword bool overwrite:
+            Whether to overwrite the existing blobs. Defaults to False, unless `skip_unchanged` is set.
+        :keyword int max_concurrency:
+            The maximum number of parallel connections of the whole upload. Defaults to 8.
+        :keyword progress_hook:
+            An async callback to track the progress of the upload. The signature is
+            function(current: int, total: Optional[int]) where current is the number of bytes uploaded
+            or skipped so far, and total is the size of all the files to upload.
+        :paramtype progress_hook: Callable[[int, Optional[int]], Awaitable[None]]
+        :keyword int timeout:
+            Sets the server-side timeout for the operation in seconds. For more details see
+            https://learn.microsoft.com/rest/api/storageservices/setting-timeouts-for-blob-service-operations.
+            This value is not tracked or validated on the client. To configure client-side network timesouts
+            see `here <https://github.com/Azure/azure-sdk-for-python/tree/main/sdk/storage/azure-storage-blob
+            #other-client--per-operation-configuration>`__. This method makes multiple calls to the service and
+            the timeout will apply to each call individually.
+
+        The other keyword arguments, such as `metadata`, `content_settings` or `standard_blob_tier`, are
+        passed to the upload of each file. See :func:`~azure.storage.blob.aio.BlobClient.upload_blob`.
+
+        :return: The counts of transferred, skipped and failed files, and the throughput of the upload.
+        :rtype: ~azure.storage.blob.DirectoryTransferResult
+        """
+        return await upload_directory(self, source, prefix, **kwargs)
+
+    @distributed_trace_async
+    async def download_directory(
+        self, destination: str,
+        prefix: Optional[str] = None,
+        **kwargs: Any
+    ) -> DirectoryTransferResult:
+        """Downloads the blobs of a virtual directory to a local directory tree.
+
+        Each blob is downloaded to the file named after its name relative to `prefix`, under
+        `destination`. Missing directories are created. All the blobs share `max_concurrency`
+        connections: small blobs are downloaded in parallel, and a large blob also downloads its
+        chunks in parallel on the connections that are free when it starts. Larger blobs are
+        downloaded first. A file is written under a temporary name, and renamed once complete; its
+        modification time is set to the last modified time of its blob.
+
+        A blob that fails to download does not stop the others: its error is recorded in the returned
+        result. With a journal, downloading the directory again only downloads the blobs that failed,
+        did not download yet, or changed since.
+
+        .. versionadded:: 12.28.0
+
+        :param str destination: The local directory to download the blobs to.
+        :param str prefix:
+            The virtual directory to download, such as 'photos/2024'. Defaults to the whole container.
+        :keyword str skip_unchanged:
+            Skips the blobs whose file already exists and is unchanged: 'size' compares the sizes,
+            'mtime' also requires the file to be modified after the blob, and 'md5' also compares the
+            MD5 hash of the file with the content MD5 of the blob. Changed files are overwritten.
+            Defaults to None, downloading every blob.
+        :keyword str journal_path:
+            The path of a file recording the downloaded blobs, to resume an interrupted download.
+            It is created if it does not exist.
+        :keyword bool overwrite:
+            Whether to overwrite the existing files. Defaults to False, unless `skip_unchanged` is set.
+        :keyword int max_concurrency:
+            The maximum number of parallel connections of the whole download. Defaults to 8.
+        :keyword progress_hook:
+            An async callback to track the progress of the download. The signature is
+            function(current: int, total: Optional[int]) where current is the number of bytes downloaded
+            or skipped so far, and total is the size of all the blobs to download.
+        :paramtype progress_hook: Callable[[int, Optional[int]], Awaitable[None]]
+        :keyword int timeout:
+            Sets the server-side timeout for the operation in seconds. For more details see
+            https://learn.microsoft.com/rest/api/storageservices/setting-timeouts-for-blob-service-operations.
+            This value is not tracked or validated on the client. To configure client-side network timesouts
+            see `here <https://github.com/Azure/azure-sdk-for-python/tree/main/sdk/storage/azure-storage-blob
+            #other-client--per-operation-configuration>`__. This method makes multiple calls to the service and
+            the timeout will apply to each call individually.
+
+        The other keyword arguments, such as `validate_content` or `cpk`, are passed to the download of
+        each blob. See :func:`~azure.storage.blob.aio.BlobClient.download_blob`.
+
+        :return: The counts of transferred, skipped and failed files, and the throughput of the download.
+        :rtype: ~azure.storage.blob.DirectoryTransferResult
+        """
+        return await download_directory(self, destination, prefix, **kwargs)
+
     @distributed_trace_async
     async def delete_blobs(
         self, *blobs: Union[str, Dict[str, Any], BlobProperties],
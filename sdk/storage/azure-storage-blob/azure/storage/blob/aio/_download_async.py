@@ -23,8 +23,9 @@ from azure.core.exceptions import DecodeError, HttpResponseError, IncompleteRead
 
 from .._shared.request_handlers import validate_and_format_range_headers
 from .._shared.response_handlers import parse_length_from_content_range, process_storage_error
+from .._shared.validation import ContentCrc64, encode_crc64, is_crc64
 from .._deserialize import deserialize_blob_properties, get_page_ranges_result
-from .._download import process_range_and_offset, _ChunkDownloader
+from .._download import add_content_crc64, get_range_validation, process_range_and_offset, _ChunkDownloader
 from .._encryption import (
     adjust_blob_size_for_encryption,
     decrypt_blob,
@@ -73,7 +74,7 @@ async def process_content(data: Any, start_offset: int, end_offset: int, encrypt
 class _AsyncChunkDownloader(_ChunkDownloader):
     def __init__(self, **kwargs: Any) -> None:
         super(_AsyncChunkDownloader, self).__init__(**kwargs)
-        self.stream_lock_async = asyncio.Lock() if kwargs.get('parallel') else None
+        self.stream_lock_async = asyncio.Lock() if self.stream_lock is not None else None
         self.progress_lock_async = asyncio.Lock() if kwargs.get('parallel') else None
 
     async def process_chunk(self, chunk_start: int) -> None:
@@ -100,7 +101,12 @@ class _AsyncChunkDownloader(_ChunkDownloader):
                 self.progress_total, self.total_size)
 
     async def _write_to_stream(self, chunk_data: bytes, chunk_start: int) -> None:
-        if self.stream_lock_async:
+        if self.buffer is not None:
+            position = chunk_start - self.start_index
+            self.buffer[position:position + len(chunk_data)] = chunk_data
+        elif self.file_descriptor is not None:
+            self._write_to_file(chunk_data, chunk_start)
+        elif self.stream_lock_async:
             async with self.stream_lock_async:
                 self.stream.seek(self.stream_start + (chunk_start - self.start_index))
                 self.stream.write(chunk_data)
@@ -119,6 +125,8 @@ class _AsyncChunkDownloader(_ChunkDownloader):
         if self._do_optimize(download_range[0], download_range[1]):
             content_length = download_range[1] - download_range[0] + 1
             chunk_data = b"\x00" * content_length
+            if self.content_crc64 is not None:
+                self.content_crc64.add_data(download_range[0], chunk_data)
         else:
             range_header, range_validation = validate_and_format_range_headers(
                 download_range[0],
@@ -132,7 +140,7 @@ class _AsyncChunkDownloader(_ChunkDownloader):
                 try:
                     _, response = await cast(Awaitable[Any], self.client.download(
                         range=range_header,
-                        range_get_content_md5=range_validation,
+                        **get_range_validation(self.validate_content, range_validation),
                         validate_content=self.validate_content,
                         data_stream_total=self.total_size,
                         download_stream_current=self.progress_total,
@@ -150,6 +158,8 @@ class _AsyncChunkDownloader(_ChunkDownloader):
                         raise HttpResponseError(error, error=error) from error
                     await asyncio.sleep(1)
             content_length = response.content_length
+            if self.content_crc64 is not None:
+                add_content_crc64(self.content_crc64, download_range[0], chunk_data, response)
 
             # This makes sure that if_match is set so that we can validate
             # that subsequent downloads are to an unmodified blob
@@ -237,7 +247,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         config: "StorageConfiguration" = None,  # type: ignore [assignment]
         start_range: Optional[int] = None,
         end_range: Optional[int] = None,
-        validate_content: bool = None,  # type: ignore [assignment]
+        validate_content: Union[bool, str] = None,  # type: ignore [assignment]
         encryption_options: Dict[str, Any] = None,  # type: ignore [assignment]
         max_concurrency: int = 1,
         name: str = None,  # type: ignore [assignment]
@@ -258,6 +268,11 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         self._encoding = encoding
         self._validate_content = validate_content
         self._encryption_options = encryption_options or {}
+        # Composes the CRC64 of the content downloaded with CRC64 validation, see content_crc64
+        self._content_crc64: Optional[ContentCrc64] = None
+        if is_crc64(validate_content) and \
+                self._encryption_options.get("key") is None and self._encryption_options.get("resolver") is None:
+            self._content_crc64 = ContentCrc64()
         self._progress_hook = kwargs.pop('progress_hook', None)
         self._request_options = kwargs
         self._response = None
@@ -289,6 +304,23 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
     def __len__(self):
         return self.size
 
+    @property
+    def content_crc64(self) -> Optional[bytearray]:
+        """The CRC64 of the content, when downloaded with `validate_content='crc64'`.
+
+        It is composed from the CRC64 the service returned for each range of the download, so the whole
+        content can be checked, for example against the `content_crc64` returned by `upload_blob`, without
+        another pass over the data. It is None until the whole content has been downloaded, without CRC64
+        validation, or with client-side encryption.
+
+        :return: The eight bytes of the CRC64, or None.
+        :rtype: bytearray or None
+        """
+        if self._content_crc64 is None:
+            return None
+        crc64 = self._content_crc64.compose(self._download_start, self.size)
+        return None if crc64 is None else bytearray(encode_crc64(crc64))
+
     async def _get_encryption_data_request(self) -> None:
         # Save current request cls
         download_cls = self._request_options.pop('cls', None)
@@ -366,7 +398,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
             try:
                 location_mode, response = cast(Tuple[Optional[str], Any], await self._clients.blob.download(
                     range=range_header,
-                    range_get_content_md5=range_validation,
+                    **get_range_validation(self._validate_content, range_validation),
                     validate_content=self._validate_content,
                     data_stream_total=None,
                     download_stream_current=0,
@@ -431,6 +463,8 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
                 await asyncio.sleep(1)
         self._download_offset += len(self._current_content)
         self._raw_download_offset += response.content_length
+        if self._content_crc64 is not None:
+            add_content_crc64(self._content_crc64, self._download_start, self._current_content, response)
 
         # get page ranges to optimize downloading sparse page blob
         if response.properties.blob_type == 'PageBlob':
@@ -491,6 +525,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
                 start_range=start,
                 end_range=end,
                 validate_content=self._validate_content,
+                content_crc64=self._content_crc64,
                 encryption_options=self._encryption_options,
                 encryption_data=self._encryption_data,
                 use_location=self._location_mode,
@@ -597,6 +632,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
                 stream=output_stream,
                 parallel=parallel,
                 validate_content=self._validate_content,
+                content_crc64=self._content_crc64,
                 encryption_options=self._encryption_options,
                 encryption_data=self._encryption_data,
                 use_location=self._location_mode,
@@ -695,6 +731,19 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         :return: The number of bytes read.
         :rtype: int
         """
+        return await self._readinto(stream=stream)
+
+    async def _readinto(self, stream: Any = None, buffer: Optional[memoryview] = None) -> int:
+        """Download the contents of this blob to a stream, or into a writable buffer.
+
+        The buffer, of the remaining size of the download, such as a memory-mapped file, gets each chunk written to
+        its own offset, so the chunks downloaded in parallel are written without a lock.
+
+        :param IO[bytes] stream: The stream to download to, if no buffer is given.
+        :param memoryview buffer: The buffer to download into.
+        :return: The number of bytes read.
+        :rtype: int
+        """
         if self._text_mode:
             raise ValueError("Stream has been partially read in text mode. readinto is not supported in text mode.")
         if self._encoding:
@@ -702,7 +751,7 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
 
         # the stream must be seekable if parallel download is required
         parallel = self._max_concurrency > 1
-        if parallel:
+        if parallel and buffer is None:
             error_message = "Target stream handle must be seekable."
             if sys.version_info >= (3,) and not stream.seekable():
                 raise ValueError(error_message)
@@ -721,7 +770,12 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
         # Write the current content to the user stream
         current_remaining = len(self._current_content) - self._current_content_offset
         start = self._current_content_offset
-        count = stream.write(cast(bytes, self._current_content[start:start + current_remaining]))
+        current_content = cast(bytes, self._current_content[start:start + current_remaining])
+        if buffer is not None:
+            buffer[:len(current_content)] = current_content
+            count = len(current_content)
+        else:
+            count = stream.write(current_content)
 
         self._current_content_offset += count
         self._read_offset += count
@@ -744,8 +798,10 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
             start_range=data_start,
             end_range=data_end,
             stream=stream,
+            buffer=None if buffer is None else buffer[count:],
             parallel=parallel,
             validate_content=self._validate_content,
+            content_crc64=self._content_crc64,
             encryption_options=self._encryption_options,
             encryption_data=self._encryption_data,
             use_location=self._location_mode,
@@ -753,36 +809,42 @@ class StorageStreamDownloader(Generic[T]):  # pylint: disable=too-many-instance-
             **self._request_options
         )
 
-        dl_tasks = downloader.get_chunk_offsets()
-        running_futures = {
-            asyncio.ensure_future(downloader.process_chunk(d))
-            for d in islice(dl_tasks, 0, self._max_concurrency)
-        }
-        while running_futures:
-            # Wait for some download to finish before adding a new one
-            done, running_futures = await asyncio.wait(
-                running_futures, return_when=asyncio.FIRST_COMPLETED)
-            try:
-                for task in done:
-                    task.result()
-            except HttpResponseError as error:
-                process_storage_error(error)
-            try:
-                for _ in range(0, len(done)):
-                    next_chunk = next(dl_tasks)
-                    running_futures.add(asyncio.ensure_future(downloader.process_chunk(next_chunk)))
-            except StopIteration:
-                break
-
-        if running_futures:
-            # Wait for the remaining downloads to finish
-            done, _running_futures = await asyncio.wait(running_futures)
-            try:
-                for task in done:
-                    task.result()
-            except HttpResponseError as error:
-                process_storage_error(error)
+        try:
+            dl_tasks = downloader.get_chunk_offsets()
+            running_futures = {
+                asyncio.ensure_future(downloader.process_chunk(d))
+                for d in islice(dl_tasks, 0, self._max_concurrency)
+            }
+            while running_futures:
+                # Wait for some download to finish before adding a new one
+                done, running_futures = await asyncio.wait(
+                    running_futures, return_when=asyncio.FIRST_COMPLETED)
+                try:
+                    for task in done:
+                        task.result()
+                except HttpResponseError as error:
+                    process_storage_error(error)
+                try:
+                    for _ in range(0, len(done)):
+                        next_chunk = next(dl_tasks)
+                        running_futures.add(asyncio.ensure_future(downloader.process_chunk(next_chunk)))
+                except StopIteration:
+                    break
+
+            if running_futures:
+                # Wait for the remaining downloads to finish
+                done, _running_futures = await asyncio.wait(running_futures)
+                try:
+                    for task in done:
+                        task.result()
+                except HttpResponseError as error:
+                    process_storage_error(error)
 
+            downloader.complete_stream()
+        finally:
+            if downloader.buffer is not None:
+                # The buffer may map a file, which cannot be closed while views of it exist
+                downloader.buffer.release()
         self._complete_read()
         return remaining_size
 
@@ -0,0 +1,244 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import copy
+import os
+from typing import Any, Awaitable, Callable, List, Optional, TYPE_CHECKING
+
+from azure.core import MatchConditions
+
+from .._models import ContentSettings, DirectoryTransferResult
+from .._transfer_manager import (
+    DEFAULT_MAX_CONCURRENCY,
+    TransferItem,
+    TransferJournal,
+    TransferState,
+    connections_for,
+    directory_prefix,
+    file_md5,
+    is_unchanged,
+    plan_download,
+    plan_upload,
+    validate_skip_unchanged
+)
+
+if TYPE_CHECKING:
+    from ._container_client_async import ContainerClient
+
+
+class AsyncTransferState(TransferState):
+    """The counters, progress and journal of a transfer, with an async progress hook."""
+
+    def file_progress_hook(  # type: ignore [override]
+        self
+    ) -> Optional[Callable[[int, Optional[int]], Awaitable[None]]]:
+        if not self._progress_hook:
+            return None
+        last = [0]
+
+        async def progress_hook(current: int, _total: Optional[int]) -> None:
+            progress = self._file_progress(last, current)
+            if progress:
+                await self._progress_hook(*progress)  # type: ignore [misc]
+
+        return progress_hook
+
+    async def skipped(self, item: TransferItem) -> None:  # type: ignore [override]
+        progress = self._skip(item)
+        if progress:
+            await self._progress_hook(*progress)  # type: ignore [misc]
+
+
+class AsyncTransferBudget(object):
+    """A number of connections shared by the files of a transfer.
+
+    :param int slots: The total number of connections.
+    """
+
+    def __init__(self, slots: int) -> None:
+        self._free = slots
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, wanted: int) -> int:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._free > 0)
+            slots = min(wanted, self._free)
+            self._free -= slots
+            return slots
+
+    async def release(self, slots: int) -> None:
+        async with self._condition:
+            self._free += slots
+            self._condition.notify_all()
+
+
+async def upload_file(
+    container_client: "ContainerClient",
+    item: TransferItem,
+    connections: int,
+    state: AsyncTransferState,
+    skip_unchanged: Optional[str],
+    **kwargs: Any
+) -> None:
+    if skip_unchanged == 'md5':
+        content_settings = copy.copy(kwargs.get('content_settings')) or ContentSettings()
+        md5 = await asyncio.get_running_loop().run_in_executor(None, file_md5, item)
+        content_settings.content_md5 = bytearray(md5)
+        kwargs['content_settings'] = content_settings
+    response = await container_client.get_blob_client(item.name).upload_blob_from_path(
+        item.path,
+        max_concurrency=connections,
+        progress_hook=state.file_progress_hook(),
+        **kwargs)
+    state.transferred(item, response.get('etag'))
+
+
+async def download_file(
+    container_client: "ContainerClient",
+    item: TransferItem,
+    connections: int,
+    state: AsyncTransferState,
+    overwrite: bool,
+    **kwargs: Any
+) -> None:
+    if not overwrite and os.path.exists(item.path):
+        raise ValueError("The file '{}' already exists.".format(item.path))
+    blob = item.blob
+    os.makedirs(os.path.dirname(item.path), exist_ok=True)
+    # The blob replaces the file only once it is completely downloaded
+    await container_client.get_blob_client(item.name).download_blob_to_path(
+        item.path,
+        max_concurrency=connections,
+        progress_hook=state.file_progress_hook(),
+        etag=blob.etag,  # type: ignore [union-attr]
+        match_condition=MatchConditions.IfNotModified,
+        **kwargs)
+    last_modified = blob.last_modified.timestamp()  # type: ignore [union-attr]
+    os.utime(item.path, (last_modified, last_modified))
+    state.transferred(item, blob.etag)  # type: ignore [union-attr]
+
+
+async def run_transfers(
+    items: List[TransferItem],
+    max_concurrency: int,
+    transfer: Callable[[TransferItem, int], Awaitable[None]],
+    connections: Callable[[TransferItem], int],
+    state: AsyncTransferState,
+    skip_unchanged: Optional[str],
+    upload: bool
+) -> None:
+    """Transfer files from `max_concurrency` tasks sharing `max_concurrency` connections.
+
+    :param items: The files to transfer.
+    :type items: list[~azure.storage.blob._transfer_manager.TransferItem]
+    :param int max_concurrency: The number of connections of the transfer.
+    :param transfer: Transfers a file with a number of connections.
+    :type transfer: Callable[[~azure.storage.blob._transfer_manager.TransferItem, int], Awaitable[None]]
+    :param connections: The number of connections a file can use.
+    :type connections: Callable[[~azure.storage.blob._transfer_manager.TransferItem], int]
+    :param state: The state of the transfer.
+    :type state: ~azure.storage.blob.aio._transfer_manager_async.AsyncTransferState
+    :param str skip_unchanged: How to compare the files with their destination, or None.
+    :param bool upload: Whether the local files are the sources.
+    """
+    budget = AsyncTransferBudget(max_concurrency)
+    pending = iter(items)
+    loop = asyncio.get_running_loop()
+
+    async def worker() -> None:
+        for item in pending:
+            try:
+                if skip_unchanged == 'md5':
+                    # Hash the local file without blocking the loop
+                    unchanged = await loop.run_in_executor(None, is_unchanged, item, skip_unchanged, upload)
+                else:
+                    unchanged = is_unchanged(item, skip_unchanged, upload)
+                if unchanged:
+                    await state.skipped(item)
+                    continue
+                slots = await budget.acquire(min(connections(item), max_concurrency))
+                try:
+                    await transfer(item, slots)
+                finally:
+                    await budget.release(slots)
+            except Exception as error:  # pylint: disable=broad-except
+                state.failed(item, error)
+
+    await asyncio.gather(*[worker() for _ in range(min(max_concurrency, len(items)))])
+
+
+async def upload_directory(
+    container_client: "ContainerClient",
+    source: str,
+    prefix: Optional[str] = None,
+    **kwargs: Any
+) -> DirectoryTransferResult:
+    skip_unchanged = kwargs.pop('skip_unchanged', None)
+    validate_skip_unchanged(skip_unchanged)
+    journal_path = kwargs.pop('journal_path', None)
+    max_concurrency = kwargs.pop('max_concurrency', None) or DEFAULT_MAX_CONCURRENCY
+    progress_hook = kwargs.pop('progress_hook', None)
+    kwargs.setdefault('overwrite', skip_unchanged is not None)
+    prefix = directory_prefix(prefix)
+    config = container_client._config  # pylint: disable=protected-access
+
+    blobs = None
+    if skip_unchanged:
+        blobs = {blob.name: blob async for blob in container_client.list_blobs(
+            name_starts_with=prefix, timeout=kwargs.get('timeout'))}
+    journal = TransferJournal(journal_path) if journal_path else None
+    try:
+        items, skipped = plan_upload(source, prefix, blobs, journal)
+        state = AsyncTransferState(sum(item.size for item in items), progress_hook, journal)
+        await run_transfers(
+            items,
+            max_concurrency,
+            lambda item, slots: upload_file(container_client, item, slots, state, skip_unchanged, **kwargs),
+            lambda item: connections_for(item.size, config.max_single_put_size, config.max_block_size),
+            state,
+            skip_unchanged,
+            upload=True)
+    finally:
+        if journal:
+            journal.close()
+    return state.finish(skipped)
+
+
+async def download_directory(
+    container_client: "ContainerClient",
+    destination: str,
+    prefix: Optional[str] = None,
+    **kwargs: Any
+) -> DirectoryTransferResult:
+    skip_unchanged = kwargs.pop('skip_unchanged', None)
+    validate_skip_unchanged(skip_unchanged)
+    journal_path = kwargs.pop('journal_path', None)
+    max_concurrency = kwargs.pop('max_concurrency', None) or DEFAULT_MAX_CONCURRENCY
+    progress_hook = kwargs.pop('progress_hook', None)
+    overwrite = kwargs.pop('overwrite', skip_unchanged is not None)
+    prefix = directory_prefix(prefix)
+    config = container_client._config  # pylint: disable=protected-access
+
+    blobs = [blob async for blob in container_client.list_blobs(
+        name_starts_with=prefix, timeout=kwargs.get('timeout'))]
+    journal = TransferJournal(journal_path) if journal_path else None
+    try:
+        items, skipped, failures = plan_download(destination, prefix, blobs, journal)
+        state = AsyncTransferState(sum(item.size for item in items), progress_hook, journal)
+        state.result.failures.update(failures)
+        await run_transfers(
+            items,
+            max_concurrency,
+            lambda item, slots: download_file(container_client, item, slots, state, overwrite, **kwargs),
+            lambda item: connections_for(item.size, config.max_single_get_size, config.max_chunk_get_size),
+            state,
+            skip_unchanged,
+            upload=False)
+    finally:
+        if journal:
+            journal.close()
+    return state.finish(skipped)
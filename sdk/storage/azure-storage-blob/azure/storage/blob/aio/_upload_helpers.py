@@ -28,11 +28,13 @@ from .._shared.response_handlers import process_storage_error, return_response_h
 from .._shared.uploads_async import (
     AppendBlobChunkUploader,
     BlockBlobChunkUploader,
+    BufferStream,
     PageBlobChunkUploader,
     upload_data_chunks,
     upload_substream_blocks
 )
-from .._upload_helpers import _any_conditions, _convert_mod_error
+from .._shared.validation import ContentCrc64, encode_crc64, is_crc64
+from .._upload_helpers import _any_conditions, _convert_mod_error, _set_content_crc64
 
 if TYPE_CHECKING:
     from .._generated.aio.operations import AppendBlobOperations, BlockBlobOperations, PageBlobOperations
@@ -67,13 +69,14 @@ async def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statem
         immutability_policy_mode = None if immutability_policy is None else immutability_policy.policy_mode
         legal_hold = kwargs.pop('legal_hold', None)
         progress_hook = kwargs.pop('progress_hook', None)
+        content_crc64 = ContentCrc64() if is_crc64(validate_content) else None
 
         # Do single put if the size is smaller than config.max_single_put_size
         if adjusted_count is not None and (adjusted_count <= blob_settings.max_single_put_size):
             data = stream.read(length or -1)
             if inspect.isawaitable(data):
                 data = await data
-            if not isinstance(data, bytes):
+            if not isinstance(data, (bytes, memoryview)):
                 raise TypeError('Blob data should be of type bytes.')
 
             if encryption_options.get('key'):
@@ -82,9 +85,14 @@ async def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statem
                 encryption_data, data = encrypt_blob(data, encryption_options['key'], encryption_options['version'])
                 headers['x-ms-meta-encryptiondata'] = encryption_data
 
+            computed_crc64 = None
+            if content_crc64 is not None:
+                computed_crc64 = encode_crc64(content_crc64.add_data(0, data))
+
             response = cast(Dict[str, Any], await client.upload(
                 body=data,  # type: ignore [arg-type]
                 content_length=adjusted_count,
+                transactional_content_crc64=computed_crc64,
                 blob_http_headers=blob_headers,
                 headers=headers,
                 cls=return_response_headers,
@@ -101,9 +109,10 @@ async def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statem
             if progress_hook:
                 await progress_hook(adjusted_count, adjusted_count)
 
-            return response
+            return cast(Dict[str, Any], _set_content_crc64(response, content_crc64))
 
-        use_original_upload_path = blob_settings.use_byte_buffer or \
+        # A BufferStream is cut into chunks without copying, so it does not need the memory-efficient substreams
+        use_original_upload_path = blob_settings.use_byte_buffer or isinstance(stream, BufferStream) or \
             validate_content or encryption_options.get('required') or \
             blob_settings.max_block_size < blob_settings.min_large_block_upload_threshold or \
             hasattr(stream, 'seekable') and not stream.seekable() or \
@@ -138,6 +147,7 @@ async def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statem
                 max_concurrency=max_concurrency,
                 stream=stream,
                 validate_content=validate_content,
+                content_crc64=content_crc64,
                 progress_hook=progress_hook,
                 encryptor=encryptor,
                 padder=padder,
@@ -160,7 +170,7 @@ async def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statem
 
         block_lookup = BlockLookupList(committed=[], uncommitted=[], latest=[])
         block_lookup.latest = block_ids
-        return cast(Dict[str, Any], await client.commit_block_list(
+        response = cast(Dict[str, Any], await client.commit_block_list(
             block_lookup,
             blob_http_headers=blob_headers,
             cls=return_response_headers,
@@ -172,6 +182,7 @@ async def upload_block_blob(  # pylint: disable=too-many-locals, too-many-statem
             immutability_policy_mode=immutability_policy_mode,
             legal_hold=legal_hold,
             **kwargs))
+        return cast(Dict[str, Any], _set_content_crc64(response, content_crc64))
     except HttpResponseError as error:
         try:
             process_storage_error(error)
@@ -217,6 +228,7 @@ async def upload_page_blob(
 
         blob_tags_string = kwargs.pop('blob_tags_string', None)
         progress_hook = kwargs.pop('progress_hook', None)
+        content_crc64 = ContentCrc64() if is_crc64(validate_content) else None
 
         response = cast(Dict[str, Any], await client.create(
             content_length=0,
@@ -238,7 +250,7 @@ async def upload_page_blob(
                 kwargs['padder'] = padder
 
         kwargs['modified_access_conditions'] = ModifiedAccessConditions(if_match=response['etag'])
-        return cast(Dict[str, Any], await upload_data_chunks(
+        return cast(Dict[str, Any], _set_content_crc64(await upload_data_chunks(
             service=client,
             uploader_class=PageBlobChunkUploader,
             total_size=length,
@@ -246,9 +258,10 @@ async def upload_page_blob(
             stream=stream,
             max_concurrency=max_concurrency,
             validate_content=validate_content,
+            content_crc64=content_crc64,
             progress_hook=progress_hook,
             headers=headers,
-            **kwargs))
+            **kwargs), content_crc64))
 
     except HttpResponseError as error:
         try:
@@ -280,6 +293,7 @@ async def upload_append_blob(  # pylint: disable=unused-argument
             append_position=None)
         blob_tags_string = kwargs.pop('blob_tags_string', None)
         progress_hook = kwargs.pop('progress_hook', None)
+        content_crc64 = ContentCrc64() if is_crc64(validate_content) else None
 
         try:
             if overwrite:
@@ -289,7 +303,7 @@ async def upload_append_blob(  # pylint: disable=unused-argument
                     headers=headers,
                     blob_tags_string=blob_tags_string,
                     **kwargs)
-            return cast(Dict[str, Any], await upload_data_chunks(
+            return cast(Dict[str, Any], _set_content_crc64(await upload_data_chunks(
                 service=client,
                 uploader_class=AppendBlobChunkUploader,
                 total_size=length,
@@ -297,10 +311,11 @@ async def upload_append_blob(  # pylint: disable=unused-argument
                 stream=stream,
                 max_concurrency=max_concurrency,
                 validate_content=validate_content,
+                content_crc64=content_crc64,
                 append_position_access_conditions=append_conditions,
                 progress_hook=progress_hook,
                 headers=headers,
-                **kwargs))
+                **kwargs), content_crc64))
         except HttpResponseError as error:
             if error.response.status_code != 404:  # type: ignore [union-attr]
                 raise
@@ -318,7 +333,7 @@ async def upload_append_blob(  # pylint: disable=unused-argument
                 headers=headers,
                 blob_tags_string=blob_tags_string,
                 **kwargs)
-            return cast(Dict[str, Any], await upload_data_chunks(
+            return cast(Dict[str, Any], _set_content_crc64(await upload_data_chunks(
                 service=client,
                 uploader_class=AppendBlobChunkUploader,
                 total_size=length,
@@ -326,9 +341,10 @@ async def upload_append_blob(  # pylint: disable=unused-argument
                 stream=stream,
                 max_concurrency=max_concurrency,
                 validate_content=validate_content,
+                content_crc64=content_crc64,
                 append_position_access_conditions=append_conditions,
                 progress_hook=progress_hook,
                 headers=headers,
-                **kwargs))
+                **kwargs), content_crc64))
     except HttpResponseError as error:
         process_storage_error(error)
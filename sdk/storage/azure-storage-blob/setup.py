@@ -86,5 +86,8 @@ setup(
         "aio": [
             "azure-core[aio]>=1.30.0",
         ],
+        "extensions": [
+            "azure-storage-extensions>=1.0.0b1",
+        ],
     },
 )
@@ -0,0 +1,43 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import tempfile
+
+from devtools_testutils.perfstress_tests import RandomStream
+
+from ._test_base import _ContainerTest
+
+
+class DownloadToFileTest(_ContainerTest):
+    """Downloads a blob of `size` bytes into a file on local disk with `readinto`.
+
+    The chunks downloaded in parallel are written to the file at their own offsets, without a lock,
+    so the throughput should scale with `max-concurrency` until the network or the disk is saturated.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        blob_name = "downloadtest"
+        self.blob_client = self.container_client.get_blob_client(blob_name)
+        self.async_blob_client = self.async_container_client.get_blob_client(blob_name)
+
+    async def global_setup(self):
+        await super().global_setup()
+        data = RandomStream(self.args.size)
+        await self.async_blob_client.upload_blob(data, length=self.args.size, overwrite=True)
+
+    def run_sync(self):
+        with tempfile.TemporaryFile() as fp:
+            stream = self.blob_client.download_blob(max_concurrency=self.args.max_concurrency)
+            stream.readinto(fp)
+
+    async def run_async(self):
+        with tempfile.TemporaryFile() as fp:
+            stream = await self.async_blob_client.download_blob(max_concurrency=self.args.max_concurrency)
+            await stream.readinto(fp)
+
+    async def close(self):
+        await self.async_blob_client.close()
+        await super().close()
@@ -0,0 +1,60 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import os
+import threading
+
+from devtools_testutils.perfstress_tests import get_random_bytes
+
+from ._test_base import _BlobTest
+
+
+class UploadFromPipeTest(_BlobTest):
+    """Uploads `size` bytes read from a pipe, written by another thread in pieces of `pipe-write-size`.
+
+    A pipe cannot seek and returns short reads, so the upload assembles each block from many reads.
+    """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        self.data = get_random_bytes(self.args.pipe_write_size)
+
+    def _open_pipe(self):
+        read_fd, write_fd = os.pipe()
+
+        def write():
+            with open(write_fd, 'wb', buffering=0) as pipe:
+                remaining = self.args.size
+                while remaining > 0:
+                    remaining -= pipe.write(self.data[:remaining])
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        return open(read_fd, 'rb', buffering=0), writer
+
+    def run_sync(self):
+        pipe, writer = self._open_pipe()
+        with pipe:
+            self.blob_client.upload_blob(
+                pipe,
+                length=self.args.size,
+                overwrite=True,
+                max_concurrency=self.args.max_concurrency)
+        writer.join()
+
+    async def run_async(self):
+        pipe, writer = self._open_pipe()
+        with pipe:
+            await self.async_blob_client.upload_blob(
+                pipe,
+                length=self.args.size,
+                overwrite=True,
+                max_concurrency=self.args.max_concurrency)
+        writer.join()
+
+    @staticmethod
+    def add_arguments(parser):
+        super(UploadFromPipeTest, UploadFromPipeTest).add_arguments(parser)
+        parser.add_argument('--pipe-write-size', nargs='?', type=int, help='Size of the writes to the pipe. Defaults to 65536.', default=64*1024)
@@ -0,0 +1,260 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import bz2
+import errno
+import gzip
+import lzma
+import mmap
+import os
+from io import BytesIO
+
+import pytest
+from azure.core.exceptions import ServiceResponseError
+from azure.storage.blob import _blob_client
+from azure.storage.blob._blob_client_helpers import _map_file
+from azure.storage.blob._download import get_file_descriptor
+
+from test_helpers import InMemoryBlobService, _in_memory_blob_client
+
+
+def _write(path, content):
+    with open(path, 'wb') as stream:
+        stream.write(content)
+
+
+def _fail_after_first_chunk(handle):
+    def handle_or_fail(request):
+        if request.method == 'GET' and not request.headers['x-ms-range'].startswith('bytes=0-'):
+            raise ServiceResponseError('The connection was reset.')
+        return handle(request)
+    return handle_or_fail
+
+
+def _read(path):
+    with open(path, 'rb') as stream:
+        return stream.read()
+
+
+class TestBlobPathTransfers(object):
+
+    @pytest.mark.parametrize('size', [1000, 5000])
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_upload_blob_from_path(self, tmp_path, size, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(size)
+        path = str(tmp_path / 'source')
+        _write(path, data)
+
+        response = _in_memory_blob_client(service).upload_blob_from_path(path, max_concurrency=max_concurrency)
+
+        assert response['etag']
+        assert service.blobs['/container/blob'] == data
+        # The chunks are sent as views of the memory-mapped file
+        uploads = [request for request in service.requests if 'comp=blocklist' not in request.url]
+        assert uploads and all(isinstance(request.body, memoryview) for request in uploads)
+
+    def test_upload_blob_from_path_with_md5(self, tmp_path):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        path = str(tmp_path / 'source')
+        _write(path, data)
+
+        _in_memory_blob_client(service).upload_blob_from_path(path, validate_content=True, max_concurrency=2)
+
+        assert service.blobs['/container/blob'] == data
+        blocks = [request for request in service.requests if 'comp=block&' in request.url]
+        assert all(request.headers['Content-MD5'] for request in blocks)
+
+    def test_upload_blob_from_empty_path(self, tmp_path):
+        service = InMemoryBlobService()
+        path = str(tmp_path / 'empty')
+        _write(path, b'')
+
+        _in_memory_blob_client(service).upload_blob_from_path(path)
+
+        assert service.blobs['/container/blob'] == b''
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_download_blob_to_path(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+        path = str(tmp_path / 'target')
+        # A longer existing file is truncated to the size of the blob
+        _write(path, b'x' * 10000)
+
+        count = client.download_blob_to_path(path, max_concurrency=max_concurrency)
+
+        assert count == 5000
+        assert _read(path) == data
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_download_blob_range_to_path(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+        path = str(tmp_path / 'target')
+
+        count = client.download_blob_to_path(path, offset=100, length=3000, max_concurrency=max_concurrency)
+
+        assert count == 3000
+        assert _read(path) == data[100:3100]
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_download_blob_to_path_error_keeps_file(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        client.upload_blob(os.urandom(5000))
+        path = str(tmp_path / 'target')
+        _write(path, b'x' * 100)
+        service.handle = _fail_after_first_chunk(service.handle)
+
+        with pytest.raises(ServiceResponseError):
+            client.download_blob_to_path(path, max_concurrency=max_concurrency)
+
+        # Neither the file nor its temporary copy is partly written
+        assert _read(path) == b'x' * 100
+        assert os.listdir(str(tmp_path)) == ['target']
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_download_blob_to_path_error_closes_mapping(self, tmp_path, monkeypatch, max_concurrency):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        client.upload_blob(os.urandom(5000))
+        service.handle = _fail_after_first_chunk(service.handle)
+        mappings = []
+
+        def map_file(*args, **kwargs):
+            mappings.append(os_mmap(*args, **kwargs))
+            return mappings[-1]
+
+        os_mmap = mmap.mmap
+        monkeypatch.setattr(mmap, 'mmap', map_file)
+        with pytest.raises(ServiceResponseError):
+            client.download_blob_to_path(str(tmp_path / 'target'), max_concurrency=max_concurrency)
+
+        # The mapping is closed before its file is removed, which Windows requires
+        assert len(mappings) == 1 and mappings[0].closed
+
+    def test_map_file_with_views_left(self, tmp_path):
+        with open(str(tmp_path / 'target'), 'wb+') as file:
+            file.truncate(100)
+            with pytest.raises(BufferError):
+                with _map_file(file, 100, writable=True) as view:
+                    chunk = view[10:]  # pylint: disable=unused-variable
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fallocate'), reason='os.posix_fallocate is only available on POSIX')
+    def test_download_blob_to_path_disk_full(self, tmp_path, monkeypatch):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        client.upload_blob(os.urandom(5000))
+        path = str(tmp_path / 'target')
+        _write(path, b'x' * 100)
+
+        def posix_fallocate(descriptor, offset, length):
+            raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+        monkeypatch.setattr(os, 'posix_fallocate', posix_fallocate)
+        with pytest.raises(OSError) as error:
+            client.download_blob_to_path(path)
+
+        assert error.value.errno == errno.ENOSPC
+        assert _read(path) == b'x' * 100
+        assert os.listdir(str(tmp_path)) == ['target']
+
+    @pytest.mark.skipif(os.name == 'nt', reason='Windows allocates the files extended by truncate')
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_download_blob_to_path_without_allocation(self, tmp_path, monkeypatch, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+        path = str(tmp_path / 'target')
+        # The file system cannot allocate the space of the file ahead: the file is written without a mapping
+        monkeypatch.delattr(os, 'posix_fallocate', raising=False)
+        monkeypatch.setattr(_blob_client, '_map_file', None)
+
+        count = client.download_blob_to_path(path, max_concurrency=max_concurrency)
+
+        assert count == 5000
+        assert _read(path) == data
+
+    def test_download_empty_blob_to_path(self, tmp_path):
+        service = InMemoryBlobService()
+        service.blobs['/container/blob'] = b''
+        path = str(tmp_path / 'target')
+        _write(path, b'x' * 100)
+
+        count = _in_memory_blob_client(service).download_blob_to_path(path)
+
+        assert count == 0
+        assert _read(path) == b''
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_readinto_file(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+        path = str(tmp_path / 'target')
+
+        with open(path, 'wb') as stream:
+            stream.write(b'header')
+            count = client.download_blob(max_concurrency=max_concurrency).readinto(stream)
+            assert stream.tell() == 6 + 5000
+            stream.write(b'footer')
+
+        assert count == 5000
+        assert _read(path) == b'header' + data + b'footer'
+
+    @pytest.mark.skipif(not hasattr(os, 'pwrite'), reason='os.pwrite is only available on POSIX')
+    def test_readinto_file_writes_chunks_at_their_offsets(self, tmp_path, monkeypatch):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+        offsets = []
+
+        def pwrite(descriptor, chunk, offset):
+            offsets.append(offset)
+            return os_pwrite(descriptor, chunk[:100], offset)
+
+        os_pwrite = os.pwrite
+        monkeypatch.setattr(os, 'pwrite', pwrite)
+        path = str(tmp_path / 'target')
+        with open(path, 'wb') as stream:
+            client.download_blob(max_concurrency=3).readinto(stream)
+
+        assert _read(path) == data
+        # The chunks following the first GET are written at their offsets, and short writes are continued
+        expected = [offset for start in range(1024, 5000, 512) for offset in range(start, min(start + 512, 5000), 100)]
+        assert sorted(offsets) == expected
+
+    @pytest.mark.skipif(not hasattr(os, 'pwrite'), reason='os.pwrite is only available on POSIX')
+    def test_file_descriptor_of_regular_files_only(self, tmp_path):
+        path = str(tmp_path / 'target')
+        for mode, buffering in (('wb', -1), ('wb', 0), ('w+b', -1)):
+            with open(path, mode, buffering=buffering) as stream:
+                assert get_file_descriptor(stream) == stream.fileno()
+        # These write through the descriptor of the file underneath, but transform what is written to them
+        for module in (gzip, bz2, lzma):
+            with module.open(path, 'wb') as stream:
+                assert get_file_descriptor(stream) is None
+        assert get_file_descriptor(BytesIO()) is None
+
+    def test_readinto_stream_in_parallel(self):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+
+        stream = BytesIO()
+        client.download_blob(max_concurrency=3).readinto(stream)
+
+        assert stream.getvalue() == data
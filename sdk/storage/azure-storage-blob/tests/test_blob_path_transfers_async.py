@@ -0,0 +1,128 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import mmap
+import os
+
+import pytest
+from azure.core.exceptions import ServiceResponseError
+from azure.storage.blob.aio import _blob_client_async
+
+from test_blob_path_transfers import _fail_after_first_chunk, _read, _write
+from test_helpers import InMemoryBlobService
+from test_helpers_async import _in_memory_blob_client
+
+
+class TestBlobPathTransfersAsync(object):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_upload_blob_from_path(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        path = str(tmp_path / 'source')
+        _write(path, data)
+
+        await _in_memory_blob_client(service).upload_blob_from_path(path, max_concurrency=max_concurrency)
+
+        assert service.blobs['/container/blob'] == data
+        blocks = [request for request in service.requests if 'comp=block&' in request.url]
+        assert blocks and all(isinstance(request.body, memoryview) for request in blocks)
+
+    @pytest.mark.asyncio
+    async def test_upload_blob_from_empty_path(self, tmp_path):
+        service = InMemoryBlobService()
+        path = str(tmp_path / 'empty')
+        _write(path, b'')
+
+        await _in_memory_blob_client(service).upload_blob_from_path(path)
+
+        assert service.blobs['/container/blob'] == b''
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_download_blob_to_path(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(data)
+        path = str(tmp_path / 'target')
+        _write(path, b'x' * 10000)
+
+        count = await client.download_blob_to_path(path, offset=100, length=3000, max_concurrency=max_concurrency)
+
+        assert count == 3000
+        assert _read(path) == data[100:3100]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_download_blob_to_path_error_keeps_file(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(os.urandom(5000))
+        path = str(tmp_path / 'target')
+        _write(path, b'x' * 100)
+        service.handle = _fail_after_first_chunk(service.handle)
+
+        with pytest.raises(ServiceResponseError):
+            await client.download_blob_to_path(path, max_concurrency=max_concurrency)
+
+        assert _read(path) == b'x' * 100
+        assert os.listdir(str(tmp_path)) == ['target']
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_download_blob_to_path_error_closes_mapping(self, tmp_path, monkeypatch, max_concurrency):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(os.urandom(5000))
+        service.handle = _fail_after_first_chunk(service.handle)
+        mappings = []
+
+        def map_file(*args, **kwargs):
+            mappings.append(os_mmap(*args, **kwargs))
+            return mappings[-1]
+
+        os_mmap = mmap.mmap
+        monkeypatch.setattr(mmap, 'mmap', map_file)
+        with pytest.raises(ServiceResponseError):
+            await client.download_blob_to_path(str(tmp_path / 'target'), max_concurrency=max_concurrency)
+
+        assert len(mappings) == 1 and mappings[0].closed
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(os.name == 'nt', reason='Windows allocates the files extended by truncate')
+    async def test_download_blob_to_path_without_allocation(self, tmp_path, monkeypatch):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(data)
+        path = str(tmp_path / 'target')
+        monkeypatch.delattr(os, 'posix_fallocate', raising=False)
+        monkeypatch.setattr(_blob_client_async, '_map_file', None)
+
+        count = await client.download_blob_to_path(path, max_concurrency=3)
+
+        assert count == 5000
+        assert _read(path) == data
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_readinto_file(self, tmp_path, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(data)
+        path = str(tmp_path / 'target')
+
+        with open(path, 'wb') as stream:
+            stream.write(b'header')
+            count = await (await client.download_blob(max_concurrency=max_concurrency)).readinto(stream)
+            assert stream.tell() == 6 + 5000
+            stream.write(b'footer')
+
+        assert count == 5000
+        assert _read(path) == b'header' + data + b'footer'
@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+
+import pytest
+from azure.core.exceptions import AzureError
+from azure.storage.blob._shared.validation import ContentCrc64, decode_crc64, get_validation_algorithm
+
+from test_helpers import InMemoryBlobService, _crc64_header, _in_memory_blob_client
+
+try:
+    from azure.storage.extensions import crc64
+except ImportError:
+    crc64 = None
+
+requires_crc64 = pytest.mark.skipif(crc64 is None, reason='CRC64 validation requires azure-storage-extensions')
+
+
+class TestContentValidation(object):
+
+    def test_get_validation_algorithm(self):
+        assert get_validation_algorithm(None) is None
+        assert get_validation_algorithm(False) is None
+        assert get_validation_algorithm(True) == 'md5'
+        assert get_validation_algorithm('MD5') == 'md5'
+        with pytest.raises(ValueError):
+            get_validation_algorithm('sha256')
+
+    @requires_crc64
+    def test_get_validation_algorithm_crc64(self):
+        assert get_validation_algorithm('crc64') == 'crc64'
+        assert get_validation_algorithm('CRC64') == 'crc64'
+
+    @requires_crc64
+    def test_content_crc64_composes_chunks_in_any_order(self):
+        data = os.urandom(10000)
+        content_crc64 = ContentCrc64()
+        for offset in (4096, 8192, 0):
+            content_crc64.add_data(offset, data[offset:offset + 4096])
+
+        assert content_crc64.compose() == crc64.compute(data)
+        assert content_crc64.compose(0, 10000) == crc64.compute(data)
+        assert content_crc64.compose(4096, 5904) == crc64.compute(data[4096:])
+        # The chunks do not cover the range exactly
+        assert content_crc64.compose(0, 9000) is None
+        assert content_crc64.compose(100, 4000) is None
+
+    @requires_crc64
+    def test_upload_blob_single_put(self):
+        service = InMemoryBlobService()
+        data = os.urandom(1000)
+
+        response = _in_memory_blob_client(service).upload_blob(data, validate_content='crc64')
+
+        request = service.requests[0]
+        assert request.headers['x-ms-content-crc64'] == _crc64_header(data)
+        assert 'Content-MD5' not in request.headers
+        assert decode_crc64(response['content_crc64']) == crc64.compute(data)
+
+    @requires_crc64
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_upload_blob_in_blocks(self, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+
+        response = client.upload_blob(data, validate_content='crc64', max_concurrency=max_concurrency)
+
+        assert service.blobs['/container/blob'] == data
+        blocks = [request for request in service.requests if 'comp=block&' in request.url]
+        assert len(blocks) == 10
+        assert all(request.headers['x-ms-content-crc64'] == _crc64_header(request.body) for request in blocks)
+        # The CRC64 of the blob is composed from the CRC64 of the blocks, not the CRC64 of the block list
+        assert decode_crc64(response['content_crc64']) == crc64.compute(data)
+
+    @requires_crc64
+    def test_upload_blob_mismatch(self):
+        service = InMemoryBlobService(corrupt_upload=True)
+
+        with pytest.raises(AzureError, match='CRC64 mismatch'):
+            _in_memory_blob_client(service).upload_blob(os.urandom(100), validate_content='crc64')
+
+    @requires_crc64
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    def test_download_blob(self, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+        service.requests.clear()
+
+        downloader = client.download_blob(validate_content='crc64', max_concurrency=max_concurrency)
+        assert downloader.content_crc64 is None
+        assert downloader.readall() == data
+
+        assert all(request.headers['x-ms-range-get-content-crc64'] == 'true' for request in service.requests)
+        assert all('x-ms-range-get-content-md5' not in request.headers for request in service.requests)
+        assert decode_crc64(downloader.content_crc64) == crc64.compute(data)
+
+    @requires_crc64
+    def test_download_blob_range(self):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        client.upload_blob(data)
+
+        downloader = client.download_blob(offset=100, length=2000, validate_content='crc64')
+
+        assert b''.join(downloader.chunks()) == data[100:2100]
+        assert decode_crc64(downloader.content_crc64) == crc64.compute(data[100:2100])
+
+    @requires_crc64
+    def test_download_blob_mismatch(self):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        client.upload_blob(os.urandom(100))
+        service.corrupt_download = True
+
+        with pytest.raises(AzureError, match='CRC64 mismatch'):
+            client.download_blob(validate_content='crc64').readall()
+
+    def test_md5_validation_unchanged(self):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+
+        response = client.upload_blob(data, validate_content=True)
+        downloader = client.download_blob(validate_content=True)
+
+        assert downloader.readall() == data
+        assert all('x-ms-content-crc64' not in request.headers for request in service.requests)
+        assert response.get('content_crc64') is None
+        assert downloader.content_crc64 is None
@@ -0,0 +1,65 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+
+import pytest
+from azure.core.exceptions import AzureError
+from azure.storage.blob._shared.validation import decode_crc64
+
+from test_content_validation import crc64, requires_crc64
+from test_helpers import InMemoryBlobService, _crc64_header
+from test_helpers_async import _in_memory_blob_client
+
+
+@requires_crc64
+class TestContentValidationAsync(object):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_upload_blob_in_blocks(self, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+
+        response = await _in_memory_blob_client(service).upload_blob(
+            data, validate_content='crc64', max_concurrency=max_concurrency)
+
+        assert service.blobs['/container/blob'] == data
+        blocks = [request for request in service.requests if 'comp=block&' in request.url]
+        assert all(request.headers['x-ms-content-crc64'] == _crc64_header(request.body) for request in blocks)
+        assert decode_crc64(response['content_crc64']) == crc64.compute(data)
+
+    @pytest.mark.asyncio
+    async def test_upload_blob_mismatch(self):
+        service = InMemoryBlobService(corrupt_upload=True)
+
+        with pytest.raises(AzureError, match='CRC64 mismatch'):
+            await _in_memory_blob_client(service).upload_blob(os.urandom(100), validate_content='crc64')
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [1, 3])
+    async def test_download_blob(self, max_concurrency):
+        service = InMemoryBlobService()
+        data = os.urandom(5000)
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(data)
+        service.requests.clear()
+
+        downloader = await client.download_blob(validate_content='crc64', max_concurrency=max_concurrency)
+
+        assert await downloader.readall() == data
+        assert all(request.headers['x-ms-range-get-content-crc64'] == 'true' for request in service.requests)
+        assert decode_crc64(downloader.content_crc64) == crc64.compute(data)
+
+    @pytest.mark.asyncio
+    async def test_download_blob_mismatch(self):
+        service = InMemoryBlobService()
+        client = _in_memory_blob_client(service)
+        await client.upload_blob(os.urandom(100))
+        service.corrupt_download = True
+
+        with pytest.raises(AzureError, match='CRC64 mismatch'):
+            await (await client.download_blob(validate_content='crc64')).readall()
@@ -4,16 +4,22 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import base64
+import re
 import requests
+import struct
 from datetime import datetime, timezone
 from io import IOBase, UnsupportedOperation
 from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 from typing_extensions import Self
 
 from azure.core.pipeline.transport import RequestsTransport, RequestsTransportResponse
 from azure.core.rest import HttpRequest
+from azure.storage.blob import BlobClient
 from azure.storage.blob._serialize import get_api_version
 from requests import Response
+from requests.structures import CaseInsensitiveDict
 from urllib3 import HTTPResponse
 
 
@@ -194,3 +200,95 @@ class MockLegacyTransport(RequestsTransport):
 
     def close(self) -> None:
         pass
+
+
+def _crc64_header(data):
+    # Only the requests validated with CRC64 need the extension
+    from azure.storage.extensions import crc64
+    return base64.b64encode(struct.pack('<Q', crc64.compute(data))).decode('utf-8')
+
+
+class InMemoryBlobService(object):
+    """Stores block blobs in memory, checking and returning their CRC64 as the service does."""
+
+    def __init__(self, corrupt_download=False, corrupt_upload=False):
+        self.blobs = {}
+        self.blocks = {}
+        self.requests = []
+        self.corrupt_download = corrupt_download
+        self.corrupt_upload = corrupt_upload
+
+    def _upload_headers(self, request, body):
+        headers = {}
+        if 'x-ms-content-crc64' in request.headers:
+            headers['x-ms-content-crc64'] = _crc64_header(body + b'!' if self.corrupt_upload else body)
+        return headers
+
+    def handle(self, request):
+        self.requests.append(request)
+        url = urlparse(request.url)
+        name = url.path
+        query = parse_qs(url.query)
+        if request.method == 'PUT':
+            body = bytes(request.body or b'')
+            headers = self._upload_headers(request, body)
+            comp = query.get('comp', [None])[0]
+            if comp == 'block':
+                self.blocks[query['blockid'][0]] = body
+            elif comp == 'blocklist':
+                block_ids = re.findall(r'<Latest>(.*?)</Latest>', body.decode('utf-8'))
+                self.blobs[name] = b''.join(self.blocks.pop(block_id) for block_id in block_ids)
+            else:
+                self.blobs[name] = body
+            return 201, b'', headers
+        if request.method == 'GET':
+            data = self.blobs[name]
+            start, end = re.match(r'bytes=(\d+)-(\d*)', request.headers['x-ms-range']).groups()
+            end = min(int(end) if end else len(data) - 1, len(data) - 1)
+            content = data[int(start):end + 1]
+            headers = {
+                'Content-Range': 'bytes {}-{}/{}'.format(start, end, len(data)),
+                'x-ms-blob-type': 'BlockBlob',
+            }
+            if request.headers.get('x-ms-range-get-content-crc64') == 'true':
+                headers['x-ms-content-crc64'] = _crc64_header(content)
+            if self.corrupt_download:
+                content = content[:-1] + bytes([content[-1] ^ 1])
+            return 206, content, headers
+        raise ValueError('The request is not accepted by InMemoryBlobService.')
+
+    @staticmethod
+    def response_headers(body, headers):
+        headers = dict(headers)
+        headers.setdefault('Content-Length', str(len(body)))
+        headers.setdefault('ETag', '"0x1"')
+        headers.setdefault('Last-Modified', 'Thu, 15 Oct 2026 00:00:00 GMT')
+        return headers
+
+
+class InMemoryBlobTransport(RequestsTransport):
+
+    def __init__(self, service):
+        super(InMemoryBlobTransport, self).__init__()
+        self.service = service
+
+    def send(self, request, **kwargs: Any):
+        status, body, headers = self.service.handle(request)
+        headers = CaseInsensitiveDict(self.service.response_headers(body, headers))
+        return RequestsTransportResponse(
+            request=request,
+            requests_response=MockClientResponse(request.url, body, headers, status, 'OK'))
+
+
+def _in_memory_blob_client(service, **kwargs):
+    return BlobClient(
+        'https://account.blob.core.windows.net',
+        'container',
+        'blob',
+        transport=InMemoryBlobTransport(service),
+        retry_total=0,
+        max_single_put_size=1024,
+        max_block_size=512,
+        max_single_get_size=1024,
+        max_chunk_get_size=512,
+        **kwargs)
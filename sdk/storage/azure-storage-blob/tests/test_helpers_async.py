@@ -14,9 +14,11 @@ from unittest.mock import Mock, AsyncMock
 from azure.core.pipeline.transport import AioHttpTransportResponse, AsyncHttpTransport
 from azure.core.rest import HttpRequest
 from azure.storage.blob._serialize import get_api_version
+from azure.storage.blob.aio import BlobClient
 from aiohttp import ClientResponse
 from aiohttp.streams import StreamReader
 from aiohttp.client_proto import ResponseHandler
+from multidict import CIMultiDict
 
 
 def _build_base_file_share_headers(bearer_token_string: str, content_length: int = 0) -> Dict[str, Any]:
@@ -223,3 +225,46 @@ class MockLegacyTransport(AsyncHttpTransport):
 
     async def close(self):
         pass
+
+
+class AsyncInMemoryBlobTransport(AsyncHttpTransport):
+
+    def __init__(self, service):
+        self.service = service
+
+    async def send(self, request, **kwargs: Any):
+        status, body, headers = self.service.handle(request)
+        headers = CIMultiDict(self.service.response_headers(body, headers))
+        response = AioHttpTransportResponse(
+            request=request,
+            aiohttp_response=MockAioHttpClientResponse(request.url, body, headers, status, 'OK'),
+            decompress=False)
+        if not kwargs.get('stream'):
+            await response.load_body()
+        return response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+def _in_memory_blob_client(service, **kwargs):
+    return BlobClient(
+        'https://account.blob.core.windows.net',
+        'container',
+        'blob',
+        transport=AsyncInMemoryBlobTransport(service),
+        retry_total=0,
+        max_single_put_size=1024,
+        max_block_size=512,
+        max_single_get_size=1024,
+        max_chunk_get_size=512,
+        **kwargs)
@@ -0,0 +1,312 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ServiceResponseError
+from azure.storage.blob import BlobProperties, ContentSettings, DirectoryTransferResult
+from azure.storage.blob._transfer_manager import download_directory, upload_directory
+
+
+class _Config(object):
+    max_single_put_size = 64
+    max_block_size = 16
+    max_single_get_size = 64
+    max_chunk_get_size = 16
+
+
+class _Downloader(object):
+    def __init__(self, data, progress_hook):
+        self._data = data
+        self._progress_hook = progress_hook
+
+    def readinto(self, stream):
+        stream.write(self._data)
+        if self._progress_hook:
+            self._progress_hook(len(self._data), len(self._data))
+        return len(self._data)
+
+
+class _BlobClient(object):
+    def __init__(self, container, name):
+        self._container = container
+        self._name = name
+
+    def upload_blob(self, data, length=None, overwrite=False, max_concurrency=1, progress_hook=None, **kwargs):
+        container = self._container
+        if self._name in container.failing:
+            raise ServiceResponseError("Connection reset")
+        if not overwrite and self._name in container.blobs:
+            raise ResourceExistsError("The specified blob already exists.")
+        with container.connections(max_concurrency, length):
+            content = data.read()
+        assert len(content) == length
+        blob = BlobProperties(name=self._name)
+        blob.size = len(content)
+        blob.last_modified = datetime.now(timezone.utc)
+        blob.etag = '"0x{}"'.format(next(container.etags))
+        blob.content_settings = kwargs.get('content_settings') or ContentSettings()
+        container.blobs[self._name] = (blob, content)
+        container.uploads.append(self._name)
+        if progress_hook:
+            progress_hook(len(content), len(content))
+        return {'etag': blob.etag, 'last_modified': blob.last_modified}
+
+    def upload_blob_from_path(self, file_path, **kwargs):
+        with open(file_path, 'rb') as data:
+            return self.upload_blob(data, length=os.path.getsize(file_path), **kwargs)
+
+    def download_blob_to_path(self, file_path, **kwargs):
+        downloader = self.download_blob(**kwargs)
+        with open(file_path, 'wb') as stream:
+            return downloader.readinto(stream)
+
+    def download_blob(self, max_concurrency=1, progress_hook=None, etag=None, match_condition=None, **kwargs):
+        container = self._container
+        blob, content = container.blobs[self._name]
+        if match_condition == MatchConditions.IfNotModified and etag != blob.etag:
+            raise ResourceModifiedError("The condition specified using HTTP conditional header(s) is not met.")
+        with container.connections(max_concurrency, blob.size):
+            container.downloads.append(self._name)
+        return _Downloader(content, progress_hook)
+
+
+class _ContainerClient(object):
+    """An in-memory container, checking the number of connections the transfers use."""
+
+    def __init__(self, budget=8):
+        self._config = _Config()
+        self.blobs = {}
+        self.uploads = []
+        self.downloads = []
+        self.failing = set()
+        self.etags = iter(range(1, 1000000))
+        self.concurrency = []
+        self._budget = budget
+        self._in_use = 0
+        self._lock = threading.Lock()
+
+    def connections(self, count, size):
+        container = self
+
+        class _Connections(object):
+            def __enter__(self):
+                with container._lock:
+                    container._in_use += count
+                    assert container._in_use <= container._budget
+                    container.concurrency.append((size, count))
+                time.sleep(0.01)
+
+            def __exit__(self, *args):
+                with container._lock:
+                    container._in_use -= count
+
+        return _Connections()
+
+    def get_blob_client(self, name):
+        return _BlobClient(self, name)
+
+    def list_blobs(self, name_starts_with=None, timeout=None):
+        return [blob for name, (blob, _) in sorted(self.blobs.items()) if name.startswith(name_starts_with or '')]
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as stream:
+        stream.write(content)
+
+
+def _tree(root):
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as stream:
+                files[os.path.relpath(path, root).replace(os.sep, '/')] = stream.read()
+    return files
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = str(tmp_path / 'source')
+    _write(os.path.join(root, 'a.txt'), b'a' * 10)
+    _write(os.path.join(root, 'docs', 'b.txt'), b'b' * 20)
+    _write(os.path.join(root, 'docs', 'deep', 'c.bin'), b'c' * 200)
+    return root
+
+
+class TestTransferManager(object):
+
+    def test_upload_directory(self, source):
+        container = _ContainerClient()
+
+        result = upload_directory(container, source, 'backup')
+
+        assert isinstance(result, DirectoryTransferResult)
+        assert sorted(container.blobs) == ['backup/a.txt', 'backup/docs/b.txt', 'backup/docs/deep/c.bin']
+        assert container.blobs['backup/docs/deep/c.bin'][1] == b'c' * 200
+        assert result.files_transferred == 3
+        assert result.files_skipped == 0
+        assert result.files_failed == 0
+        assert result.bytes_transferred == 230
+        assert result.elapsed > 0
+        assert result.throughput == 230 / result.elapsed
+        # The largest file is uploaded first
+        assert container.uploads[0] == 'backup/docs/deep/c.bin'
+
+    def test_upload_directory_shares_connections(self, tmp_path):
+        root = str(tmp_path)
+        _write(os.path.join(root, 'large'), b'x' * 1000)
+        container = _ContainerClient(budget=4)
+
+        # Alone, a large file uploads its blocks on all the connections
+        upload_directory(container, root, max_concurrency=4)
+        assert container.concurrency == [(1000, 4)]
+
+        for index in range(20):
+            _write(os.path.join(root, 'small{}'.format(index)), b'x' * 8)
+        container = _ContainerClient(budget=4)
+
+        # With other files, the container checks they never use more than 4 connections together
+        result = upload_directory(container, root, max_concurrency=4)
+
+        assert result.files_transferred == 21
+        assert result.files_failed == 0
+        assert all(count == 1 for size, count in container.concurrency if size == 8)
+
+    def test_upload_directory_skip_unchanged_size(self, source):
+        container = _ContainerClient()
+        upload_directory(container, source)
+        container.uploads.clear()
+        _write(os.path.join(source, 'a.txt'), b'a' * 11)
+
+        result = upload_directory(container, source, skip_unchanged='size')
+
+        assert container.uploads == ['a.txt']
+        assert container.blobs['a.txt'][1] == b'a' * 11
+        assert result.files_transferred == 1
+        assert result.files_skipped == 2
+
+    def test_upload_directory_skip_unchanged_md5(self, source):
+        container = _ContainerClient()
+        upload_directory(container, source, skip_unchanged='md5')
+        md5 = container.blobs['docs/b.txt'][0].content_settings.content_md5
+        assert bytes(md5) == hashlib.md5(b'b' * 20).digest()
+        container.uploads.clear()
+        # Same size, different content
+        _write(os.path.join(source, 'docs', 'b.txt'), b'B' * 20)
+
+        result = upload_directory(container, source, skip_unchanged='md5')
+
+        assert container.uploads == ['docs/b.txt']
+        assert result.files_skipped == 2
+
+    def test_upload_directory_does_not_overwrite_by_default(self, source):
+        container = _ContainerClient()
+        upload_directory(container, source)
+
+        result = upload_directory(container, source)
+
+        assert result.files_transferred == 0
+        assert sorted(result.failures) == ['a.txt', 'docs/b.txt', 'docs/deep/c.bin']
+        assert all(isinstance(error, ResourceExistsError) for error in result.failures.values())
+
+    def test_upload_directory_resumes_from_journal(self, source, tmp_path):
+        container = _ContainerClient()
+        container.failing.add('docs/b.txt')
+        journal = str(tmp_path / 'journal')
+
+        result = upload_directory(container, source, journal_path=journal)
+        assert result.files_transferred == 2
+        assert list(result.failures) == ['docs/b.txt']
+
+        container.failing.clear()
+        container.uploads.clear()
+        result = upload_directory(container, source, journal_path=journal)
+
+        assert container.uploads == ['docs/b.txt']
+        assert result.files_transferred == 1
+        assert result.files_skipped == 2
+        assert result.files_failed == 0
+
+    def test_upload_directory_progress(self, source):
+        progress = []
+
+        upload_directory(_ContainerClient(), source, max_concurrency=1, progress_hook=lambda *args: progress.append(args))
+
+        assert progress == [(200, 230), (220, 230), (230, 230)]
+
+    def test_upload_directory_invalid_skip_unchanged(self, source):
+        with pytest.raises(ValueError):
+            upload_directory(_ContainerClient(), source, skip_unchanged='ctime')
+
+    def test_download_directory(self, source, tmp_path):
+        container = _ContainerClient()
+        upload_directory(container, source, 'backup/')
+        destination = str(tmp_path / 'destination')
+
+        result = download_directory(container, destination, 'backup')
+
+        assert _tree(destination) == _tree(source)
+        assert result.files_transferred == 3
+        assert result.bytes_transferred == 230
+        blob = container.blobs['backup/docs/b.txt'][0]
+        assert os.path.getmtime(os.path.join(destination, 'docs', 'b.txt')) == blob.last_modified.timestamp()
+
+    def test_download_directory_skip_unchanged_mtime(self, source, tmp_path):
+        container = _ContainerClient()
+        upload_directory(container, source)
+        destination = str(tmp_path / 'destination')
+        download_directory(container, destination)
+        container.downloads.clear()
+        upload_directory(container, source, skip_unchanged='size')
+        container.get_blob_client('a.txt').upload_blob(_Content(b'z' * 10), length=10, overwrite=True)
+
+        result = download_directory(container, destination, skip_unchanged='mtime')
+
+        assert container.downloads == ['a.txt']
+        assert result.files_skipped == 2
+        with open(os.path.join(destination, 'a.txt'), 'rb') as stream:
+            assert stream.read() == b'z' * 10
+
+    def test_download_directory_resumes_from_journal(self, source, tmp_path):
+        container = _ContainerClient()
+        upload_directory(container, source)
+        destination = str(tmp_path / 'destination')
+        journal = str(tmp_path / 'journal')
+        download_directory(container, destination, journal_path=journal)
+        container.downloads.clear()
+
+        result = download_directory(container, destination, journal_path=journal, overwrite=True)
+
+        assert container.downloads == []
+        assert result.files_skipped == 3
+
+    def test_download_directory_rejects_paths_outside_destination(self, tmp_path):
+        container = _ContainerClient()
+        container.get_blob_client('../evil').upload_blob(_Content(b'x'), length=1)
+        container.get_blob_client('good').upload_blob(_Content(b'y'), length=1)
+        destination = str(tmp_path / 'destination')
+
+        result = download_directory(container, destination)
+
+        assert list(result.failures) == ['../evil']
+        assert result.files_transferred == 1
+        assert not os.path.exists(str(tmp_path / 'evil'))
+
+
+class _Content(object):
+    def __init__(self, content):
+        self._content = content
+
+    def read(self):
+        return self._content
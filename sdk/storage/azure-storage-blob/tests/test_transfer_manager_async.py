@@ -0,0 +1,236 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import hashlib
+import os
+from datetime import datetime, timezone
+
+import pytest
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError, ServiceResponseError
+from azure.storage.blob import BlobProperties, ContentSettings
+from azure.storage.blob.aio._transfer_manager_async import download_directory, upload_directory
+
+
+class _Config(object):
+    max_single_put_size = 64
+    max_block_size = 16
+    max_single_get_size = 64
+    max_chunk_get_size = 16
+
+
+class _Downloader(object):
+    def __init__(self, data, progress_hook):
+        self._data = data
+        self._progress_hook = progress_hook
+
+    async def readinto(self, stream):
+        stream.write(self._data)
+        if self._progress_hook:
+            await self._progress_hook(len(self._data), len(self._data))
+        return len(self._data)
+
+
+class _BlobClient(object):
+    def __init__(self, container, name):
+        self._container = container
+        self._name = name
+
+    async def upload_blob(self, data, length=None, overwrite=False, max_concurrency=1, progress_hook=None, **kwargs):
+        container = self._container
+        if self._name in container.failing:
+            raise ServiceResponseError("Connection reset")
+        await container.use_connections(max_concurrency, length)
+        content = data.read()
+        blob = BlobProperties(name=self._name)
+        blob.size = len(content)
+        blob.last_modified = datetime.now(timezone.utc)
+        blob.etag = '"0x{}"'.format(next(container.etags))
+        blob.content_settings = kwargs.get('content_settings') or ContentSettings()
+        container.blobs[self._name] = (blob, content)
+        container.uploads.append(self._name)
+        if progress_hook:
+            await progress_hook(len(content), len(content))
+        return {'etag': blob.etag, 'last_modified': blob.last_modified}
+
+    async def upload_blob_from_path(self, file_path, **kwargs):
+        with open(file_path, 'rb') as data:
+            return await self.upload_blob(data, length=os.path.getsize(file_path), **kwargs)
+
+    async def download_blob_to_path(self, file_path, **kwargs):
+        downloader = await self.download_blob(**kwargs)
+        with open(file_path, 'wb') as stream:
+            return await downloader.readinto(stream)
+
+    async def download_blob(self, max_concurrency=1, progress_hook=None, etag=None, match_condition=None, **kwargs):
+        container = self._container
+        blob, content = container.blobs[self._name]
+        if match_condition == MatchConditions.IfNotModified and etag != blob.etag:
+            raise ResourceModifiedError("The condition specified using HTTP conditional header(s) is not met.")
+        await container.use_connections(max_concurrency, blob.size)
+        container.downloads.append(self._name)
+        return _Downloader(content, progress_hook)
+
+
+class _BlobList(object):
+    def __init__(self, blobs):
+        self._blobs = iter(blobs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._blobs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _ContainerClient(object):
+    """An in-memory container, checking the number of connections the transfers use."""
+
+    def __init__(self, budget=8):
+        self._config = _Config()
+        self.blobs = {}
+        self.uploads = []
+        self.downloads = []
+        self.failing = set()
+        self.etags = iter(range(1, 1000000))
+        self.concurrency = []
+        self._budget = budget
+        self._in_use = 0
+
+    async def use_connections(self, count, size):
+        self._in_use += count
+        assert self._in_use <= self._budget
+        self.concurrency.append((size, count))
+        await asyncio.sleep(0.01)
+        self._in_use -= count
+
+    def get_blob_client(self, name):
+        return _BlobClient(self, name)
+
+    def list_blobs(self, name_starts_with=None, timeout=None):
+        return _BlobList(
+            [blob for name, (blob, _) in sorted(self.blobs.items()) if name.startswith(name_starts_with or '')])
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as stream:
+        stream.write(content)
+
+
+def _tree(root):
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as stream:
+                files[os.path.relpath(path, root).replace(os.sep, '/')] = stream.read()
+    return files
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = str(tmp_path / 'source')
+    _write(os.path.join(root, 'a.txt'), b'a' * 10)
+    _write(os.path.join(root, 'docs', 'b.txt'), b'b' * 20)
+    _write(os.path.join(root, 'docs', 'deep', 'c.bin'), b'c' * 200)
+    return root
+
+
+class TestTransferManagerAsync(object):
+
+    @pytest.mark.asyncio
+    async def test_upload_directory(self, source):
+        container = _ContainerClient()
+
+        result = await upload_directory(container, source, 'backup')
+
+        assert sorted(container.blobs) == ['backup/a.txt', 'backup/docs/b.txt', 'backup/docs/deep/c.bin']
+        assert container.blobs['backup/docs/deep/c.bin'][1] == b'c' * 200
+        assert result.files_transferred == 3
+        assert result.bytes_transferred == 230
+        assert container.uploads[0] == 'backup/docs/deep/c.bin'
+
+    @pytest.mark.asyncio
+    async def test_upload_directory_shares_connections(self, tmp_path):
+        root = str(tmp_path)
+        _write(os.path.join(root, 'large'), b'x' * 1000)
+        container = _ContainerClient(budget=4)
+
+        await upload_directory(container, root, max_concurrency=4)
+        assert container.concurrency == [(1000, 4)]
+
+        for index in range(20):
+            _write(os.path.join(root, 'small{}'.format(index)), b'x' * 8)
+        container = _ContainerClient(budget=4)
+
+        result = await upload_directory(container, root, max_concurrency=4)
+
+        assert result.files_transferred == 21
+        assert result.files_failed == 0
+
+    @pytest.mark.asyncio
+    async def test_upload_directory_skip_unchanged_md5(self, source):
+        container = _ContainerClient()
+        await upload_directory(container, source, skip_unchanged='md5')
+        md5 = container.blobs['docs/b.txt'][0].content_settings.content_md5
+        assert bytes(md5) == hashlib.md5(b'b' * 20).digest()
+        container.uploads.clear()
+        _write(os.path.join(source, 'docs', 'b.txt'), b'B' * 20)
+
+        result = await upload_directory(container, source, skip_unchanged='md5')
+
+        assert container.uploads == ['docs/b.txt']
+        assert result.files_skipped == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_directory_resumes_from_journal(self, source, tmp_path):
+        container = _ContainerClient()
+        container.failing.add('docs/b.txt')
+        journal = str(tmp_path / 'journal')
+
+        result = await upload_directory(container, source, journal_path=journal)
+        assert list(result.failures) == ['docs/b.txt']
+
+        container.failing.clear()
+        container.uploads.clear()
+        result = await upload_directory(container, source, journal_path=journal)
+
+        assert container.uploads == ['docs/b.txt']
+        assert result.files_skipped == 2
+        assert result.files_failed == 0
+
+    @pytest.mark.asyncio
+    async def test_upload_directory_progress(self, source):
+        progress = []
+
+        async def progress_hook(current, total):
+            progress.append((current, total))
+
+        await upload_directory(_ContainerClient(), source, max_concurrency=1, progress_hook=progress_hook)
+
+        assert progress == [(200, 230), (220, 230), (230, 230)]
+
+    @pytest.mark.asyncio
+    async def test_download_directory(self, source, tmp_path):
+        container = _ContainerClient()
+        await upload_directory(container, source, 'backup/')
+        destination = str(tmp_path / 'destination')
+
+        result = await download_directory(container, destination, 'backup')
+
+        assert _tree(destination) == _tree(source)
+        assert result.files_transferred == 3
+        container.downloads.clear()
+
+        result = await download_directory(container, destination, 'backup', skip_unchanged='mtime')
+
+        assert container.downloads == []
+        assert result.files_skipped == 3
@@ -8,10 +8,27 @@
 
 import os
 import unittest
-from io import BytesIO, SEEK_SET
-from threading import Lock
+from io import BytesIO, RawIOBase, SEEK_END, SEEK_SET, StringIO
+from threading import Lock, Thread
 
-from azure.storage.blob._shared.uploads import SubStream
+from azure.storage.blob._shared.uploads import BufferStream, IterStreamer, SubStream, _ChunkUploader
+
+
+class _ShortReadStream(object):
+    # simulates a socket or a pipe returning at most `read_size` bytes per read
+    def __init__(self, data, read_size):
+        self._stream = BytesIO(data)
+        self._read_size = read_size
+        self.reads = 0
+
+    def read(self, size):
+        self.reads += 1
+        return self._stream.read(min(size, self._read_size))
+
+
+def _chunks(stream, chunk_size, total_size=None):
+    uploader = _ChunkUploader(service=None, total_size=total_size, chunk_size=chunk_size, stream=stream, parallel=False)
+    return list(uploader.get_chunk_streams())
 
 
 class StorageBlobUploadChunkingTest(unittest.TestCase):
@@ -105,3 +122,113 @@ class StorageBlobUploadChunkingTest(unittest.TestCase):
         finally:
             wrapped_stream.close()
             substream.close()
+
+    def test_get_chunk_streams_with_short_reads(self):
+        data = os.urandom(1000)
+        stream = _ShortReadStream(data, 7)
+
+        chunks = _chunks(stream, 256)
+
+        assert [index for index, _ in chunks] == [0, 256, 512, 768]
+        # the assembled chunks are uploaded while the next ones are read: they don't share a buffer
+        assert all(isinstance(chunk, memoryview) for _, chunk in chunks)
+        assert len({id(chunk.obj) for _, chunk in chunks}) == len(chunks)
+        assert b"".join(chunk for _, chunk in chunks) == data
+
+    def test_get_chunk_streams_with_short_reads_and_total_size(self):
+        data = os.urandom(1000)
+
+        chunks = _chunks(_ShortReadStream(data, 100), 256, total_size=600)
+
+        assert [len(chunk) for _, chunk in chunks] == [256, 256, 88]
+        assert b"".join(chunk for _, chunk in chunks) == data[:600]
+
+    def test_get_chunk_streams_from_pipe(self):
+        data = os.urandom(3 * 1024 * 1024 + 5)
+        read_fd, write_fd = os.pipe()
+
+        def write():
+            with open(write_fd, 'wb', buffering=0) as pipe:
+                # write in pieces smaller than the pipe buffer, so the reads are short
+                for start in range(0, len(data), 10000):
+                    pipe.write(data[start:start + 10000])
+
+        writer = Thread(target=write)
+        writer.start()
+        try:
+            with open(read_fd, 'rb', buffering=0) as pipe:
+                chunks = _chunks(pipe, 1024 * 1024)
+        finally:
+            writer.join()
+
+        assert [len(chunk) for _, chunk in chunks] == [1024 * 1024] * 3 + [5]
+        assert b"".join(chunk for _, chunk in chunks) == data
+
+    def test_get_chunk_streams_from_raw_stream_without_readinto(self):
+        data = os.urandom(1000)
+
+        class _RawStream(RawIOBase):
+            # a raw stream implementing read only, returning short reads
+            def __init__(self):
+                self._stream = BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def read(self, size=-1):
+                return self._stream.read(min(size, 7))
+
+        chunks = _chunks(_RawStream(), 256)
+
+        assert [len(chunk) for _, chunk in chunks] == [256, 256, 256, 232]
+        assert b"".join(chunk for _, chunk in chunks) == data
+
+    def test_get_chunk_streams_from_generator(self):
+        data = os.urandom(10000)
+        stream = IterStreamer(data[start:start + 10] for start in range(0, len(data), 10))
+
+        chunks = _chunks(stream, 4096)
+
+        assert [len(chunk) for _, chunk in chunks] == [4096, 4096, 1808]
+        assert b"".join(chunk for _, chunk in chunks) == data
+
+    def test_get_chunk_streams_rejects_text(self):
+        with self.assertRaises(TypeError):
+            _chunks(StringIO("abc"), 2)
+
+        class _MixedStream(object):
+            def __init__(self):
+                self._reads = iter([b"a", "bc"])
+
+            def read(self, size):
+                return next(self._reads)
+
+        # the first read is short, the next one returns text
+        with self.assertRaises(TypeError):
+            _chunks(_MixedStream(), 3)
+
+    def test_buffer_stream(self):
+        data = os.urandom(100)
+        stream = BufferStream(bytearray(data))
+
+        assert len(stream) == 100
+        assert stream.read(30) == data[:30]
+        assert stream.seek(-10, SEEK_END) == 90
+        assert stream.read(30) == data[90:]
+        assert stream.read(30) == b""
+        stream.seek(50)
+        assert stream.read() == data[50:]
+        stream.close()
+        with self.assertRaises(ValueError):
+            stream.read(1)
+
+    def test_get_chunk_streams_from_buffer_stream(self):
+        data = bytearray(os.urandom(10000))
+
+        chunks = _chunks(BufferStream(data), 4096, total_size=len(data))
+
+        assert [len(chunk) for _, chunk in chunks] == [4096, 4096, 1808]
+        # the chunks are views of the buffer, not copies
+        assert all(isinstance(chunk, memoryview) for _, chunk in chunks)
+        data[0] ^= 1
+        assert b"".join(chunk for _, chunk in chunks) == data
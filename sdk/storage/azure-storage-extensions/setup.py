@@ -5,6 +5,7 @@
 # --------------------------------------------------------------------------
 
 import os
+import sys
 from setuptools import setup, Extension
 from wheel.bdist_wheel import bdist_wheel
 
@@ -53,8 +54,9 @@ setup(
     ext_modules=[
         Extension(
             'crc64',
-            [os.path.join(package_folder_path, "crc64", "crc64module.c")],
-            define_macros=[("Py_LIMITED_API", "3")],
+            [os.path.join("src", "crc64module.c")],
+            # The wheel is tagged for the building Python and later versions, see bdist_wheel_abi3
+            define_macros=[("Py_LIMITED_API", "0x{:02X}{:02X}0000".format(*sys.version_info[:2]))],
             py_limited_api=True
         ),
     ],
@@ -0,0 +1,246 @@
+// -------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT License. See License.txt in the project root for
+// license information.
+// --------------------------------------------------------------------------
+
+// The CRC64 used by Azure Storage for the x-ms-content-crc64 header: the reflected
+// polynomial 0x9A6C9329AC4BC9B5, with the CRC inverted before and after the data.
+
+#include <Python.h>
+#include <stdint.h>
+
+#define POLY 0x9A6C9329AC4BC9B5ULL
+
+// Bytes processed per table lookup round, see compute_crc64
+#define SLICES 8
+
+// Below this many bytes, the GIL is kept, as releasing it costs more than the computation
+#define RELEASE_GIL_THRESHOLD 8192
+
+// Py_buffer is part of the limited API from Python 3.11: older builds only take bytes
+#if !defined(Py_LIMITED_API) || Py_LIMITED_API >= 0x030B0000
+#define HAVE_BUFFER_PROTOCOL
+#endif
+
+static uint64_t crc_tables[SLICES][256];
+
+static void init_tables(void)
+{
+    for (int n = 0; n < 256; n++) {
+        uint64_t crc = (uint64_t)n;
+        for (int k = 0; k < 8; k++) {
+            crc = (crc & 1) ? (crc >> 1) ^ POLY : crc >> 1;
+        }
+        crc_tables[0][n] = crc;
+    }
+    for (int n = 0; n < 256; n++) {
+        uint64_t crc = crc_tables[0][n];
+        for (int k = 1; k < SLICES; k++) {
+            crc = crc_tables[0][crc & 0xff] ^ (crc >> 8);
+            crc_tables[k][n] = crc;
+        }
+    }
+}
+
+// Slicing-by-8: fold 8 bytes of data into the CRC with 8 independent table lookups.
+static uint64_t compute_crc64(uint64_t crc, const unsigned char *data, Py_ssize_t length)
+{
+    crc = ~crc;
+    while (length && ((uintptr_t)data & 7)) {
+        crc = crc_tables[0][(crc ^ *data++) & 0xff] ^ (crc >> 8);
+        length--;
+    }
+    while (length >= SLICES) {
+        // Read the word byte by byte, so the result does not depend on the platform endianness
+        uint64_t word = crc
+            ^ ((uint64_t)data[0])
+            ^ ((uint64_t)data[1] << 8)
+            ^ ((uint64_t)data[2] << 16)
+            ^ ((uint64_t)data[3] << 24)
+            ^ ((uint64_t)data[4] << 32)
+            ^ ((uint64_t)data[5] << 40)
+            ^ ((uint64_t)data[6] << 48)
+            ^ ((uint64_t)data[7] << 56);
+        crc = crc_tables[7][word & 0xff]
+            ^ crc_tables[6][(word >> 8) & 0xff]
+            ^ crc_tables[5][(word >> 16) & 0xff]
+            ^ crc_tables[4][(word >> 24) & 0xff]
+            ^ crc_tables[3][(word >> 32) & 0xff]
+            ^ crc_tables[2][(word >> 40) & 0xff]
+            ^ crc_tables[1][(word >> 48) & 0xff]
+            ^ crc_tables[0][word >> 56];
+        data += SLICES;
+        length -= SLICES;
+    }
+    while (length--) {
+        crc = crc_tables[0][(crc ^ *data++) & 0xff] ^ (crc >> 8);
+    }
+    return ~crc;
+}
+
+static uint64_t gf2_matrix_times(const uint64_t *matrix, uint64_t vector)
+{
+    uint64_t sum = 0;
+    while (vector) {
+        if (vector & 1) {
+            sum ^= *matrix;
+        }
+        vector >>= 1;
+        matrix++;
+    }
+    return sum;
+}
+
+static void gf2_matrix_square(uint64_t *square, const uint64_t *matrix)
+{
+    for (int n = 0; n < 64; n++) {
+        square[n] = gf2_matrix_times(matrix, matrix[n]);
+    }
+}
+
+// The CRC of the concatenation of two blocks of data from the CRCs of the blocks, by
+// applying the CRC of length2 zero bytes to crc1, in O(log(length2)) (see zlib crc32_combine).
+static uint64_t combine_crc64(uint64_t crc1, uint64_t crc2, unsigned long long length2)
+{
+    uint64_t even[64];
+    uint64_t odd[64];
+    uint64_t row = 1;
+
+    if (length2 == 0) {
+        return crc1;
+    }
+
+    // The operator for one zero bit
+    odd[0] = POLY;
+    for (int n = 1; n < 64; n++) {
+        odd[n] = row;
+        row <<= 1;
+    }
+    // The operators for two and four zero bits
+    gf2_matrix_square(even, odd);
+    gf2_matrix_square(odd, even);
+
+    // Apply length2 zero bytes to crc1, the first square giving the operator for one zero byte
+    do {
+        gf2_matrix_square(even, odd);
+        if (length2 & 1) {
+            crc1 = gf2_matrix_times(even, crc1);
+        }
+        length2 >>= 1;
+        if (length2 == 0) {
+            break;
+        }
+        gf2_matrix_square(odd, even);
+        if (length2 & 1) {
+            crc1 = gf2_matrix_times(odd, crc1);
+        }
+        length2 >>= 1;
+    } while (length2 != 0);
+
+    return crc1 ^ crc2;
+}
+
+PyDoc_STRVAR(compute_doc,
+"compute(data, crc=0, /)\n"
+"--\n"
+"\n"
+"Compute the CRC64 of data, continuing from the CRC of the preceding data.\n"
+"\n"
+"data is a bytes-like object (bytes only on Python 3.9 and 3.10). The GIL is\n"
+"released while large buffers are processed.");
+
+static uint64_t compute_crc64_releasing_gil(uint64_t crc, const unsigned char *data, Py_ssize_t length)
+{
+    uint64_t result;
+
+    if (length < RELEASE_GIL_THRESHOLD) {
+        return compute_crc64(crc, data, length);
+    }
+    Py_BEGIN_ALLOW_THREADS
+    result = compute_crc64(crc, data, length);
+    Py_END_ALLOW_THREADS
+    return result;
+}
+
+static PyObject *
+crc64_compute(PyObject *self, PyObject *args)
+{
+    unsigned long long crc = 0;
+    uint64_t result;
+#ifdef HAVE_BUFFER_PROTOCOL
+    Py_buffer buffer;
+
+    // Any contiguous buffer, e.g. a memoryview of an mmap, is read in place
+    if (!PyArg_ParseTuple(args, "y*|K:compute", &buffer, &crc)) {
+        return NULL;
+    }
+    result = compute_crc64_releasing_gil((uint64_t)crc, (const unsigned char *)buffer.buf, buffer.len);
+    PyBuffer_Release(&buffer);
+#else
+    PyObject *bytes;
+    char *data;
+    Py_ssize_t length;
+
+    if (!PyArg_ParseTuple(args, "O|K:compute", &bytes, &crc)) {
+        return NULL;
+    }
+    if (PyBytes_AsStringAndSize(bytes, &data, &length) < 0) {
+        return NULL;
+    }
+    result = compute_crc64_releasing_gil((uint64_t)crc, (const unsigned char *)data, length);
+#endif
+    return PyLong_FromUnsignedLongLong(result);
+}
+
+PyDoc_STRVAR(combine_doc,
+"combine(crc1, crc2, length2, /)\n"
+"--\n"
+"\n"
+"Compute the CRC64 of two blocks of data from the CRC of each block and the\n"
+"length of the second block, without the data.");
+
+static PyObject *
+crc64_combine(PyObject *self, PyObject *args)
+{
+    unsigned long long crc1;
+    unsigned long long crc2;
+    long long length2;
+
+    if (!PyArg_ParseTuple(args, "KKL:combine", &crc1, &crc2, &length2)) {
+        return NULL;
+    }
+    if (length2 < 0) {
+        PyErr_SetString(PyExc_ValueError, "length2 must not be negative.");
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(
+        combine_crc64((uint64_t)crc1, (uint64_t)crc2, (unsigned long long)length2));
+}
+
+static PyMethodDef crc64_methods[] = {
+    {"compute", crc64_compute, METH_VARARGS, compute_doc},
+    {"combine", crc64_combine, METH_VARARGS, combine_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+PyDoc_STRVAR(module_doc, "The CRC64 used by Azure Storage to validate the content of transfers.");
+
+static struct PyModuleDef crc64_module = {
+    PyModuleDef_HEAD_INIT,
+    "crc64",
+    module_doc,
+    -1,
+    crc64_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit_crc64(void)
+{
+    init_tables();
+    return PyModule_Create(&crc64_module);
+}
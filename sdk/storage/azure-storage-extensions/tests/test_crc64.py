@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+import sys
+
+import pytest
+from azure.storage.extensions import crc64
+
+
+def _reference_crc64(data, crc=0):
+    crc ^= 0xFFFFFFFFFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x9A6C9329AC4BC9B5 if crc & 1 else crc >> 1
+    return crc ^ 0xFFFFFFFFFFFFFFFF
+
+
+class TestCrc64(object):
+
+    def test_compute(self):
+        assert crc64.compute(b'') == 0
+        assert crc64.compute(b'123456789') == 0xAE8B14860A799888
+
+    @pytest.mark.parametrize('length', [1, 7, 8, 9, 63, 64, 65, 1000, 8191, 8192, 20000])
+    def test_compute_matches_reference(self, length):
+        data = os.urandom(length)
+        assert crc64.compute(data) == _reference_crc64(data)
+        # Unaligned data
+        assert crc64.compute(data[3:]) == _reference_crc64(data[3:])
+
+    def test_compute_continues(self):
+        data = os.urandom(100000)
+        assert crc64.compute(data[30000:], crc64.compute(data[:30000])) == crc64.compute(data)
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="Builds for Python 3.9 and 3.10 only take bytes")
+    def test_compute_buffer(self):
+        data = os.urandom(100000)
+        assert crc64.compute(bytearray(data)) == crc64.compute(data)
+        assert crc64.compute(memoryview(data)[3:], 7) == crc64.compute(data[3:], 7)
+
+    @pytest.mark.parametrize('split', [0, 1, 8, 4095, 50000, 100000])
+    def test_combine(self, split):
+        data = os.urandom(100000)
+        first, second = data[:split], data[split:]
+        assert crc64.combine(crc64.compute(first), crc64.compute(second), len(second)) == crc64.compute(data)
+
+    def test_combine_large_length(self):
+        zeros = bytes(3 * 1024 * 1024 + 5)
+        assert crc64.combine(crc64.compute(b'abc'), crc64.compute(zeros), len(zeros)) == crc64.compute(b'abc' + zeros)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(TypeError):
+            crc64.compute('text')
+        with pytest.raises(ValueError):
+            crc64.combine(1, 2, -1)
@@ -424,7 +424,7 @@ class DataLakeFileClient(PathClient):
             If a date is passed in without timezone info, it is assumed to be UTC.
             Specify this header to perform the operation only if
             the resource has not been modified since the specified date/time.
-        :keyword bool validate_content:
+        :keyword validate_content:
             If true, calculates an MD5 hash for each chunk of the file. The storage
             service checks the hash of the content that has arrived with the hash
             that was sent. This is primarily valuable for detecting bitflips on
@@ -433,6 +433,13 @@ class DataLakeFileClient(PathClient):
             blob. Also note that if enabled, the memory-efficient upload algorithm
             will not be used because computing the MD5 hash requires buffering
             entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+
+            Pass 'crc64' to calculate a CRC64 instead of an MD5 hash, which is faster and
+            requires the azure-storage-extensions package.
+
+            .. versionadded:: 12.23.0
+                CRC64 validation with `validate_content='crc64'`.
+        :paramtype validate_content: bool or str
         :keyword str etag:
             An ETag value, or the wildcard character (*). Used to check if the resource has changed,
             and act according to the condition specified by the `match_condition` parameter.
@@ -492,13 +499,20 @@ class DataLakeFileClient(PathClient):
         :type length: int or None
         :keyword bool flush:
             If true, will commit the data after it is appended.
-        :keyword bool validate_content:
+        :keyword validate_content:
             If true, calculates an MD5 hash of the block content. The storage
             service checks the hash of the content that has arrived
             with the hash that was sent. This is primarily valuable for detecting
             bitflips on the wire if using http instead of https as https (the default)
             will already validate. Note that this MD5 hash is not stored with the
             file.
+
+            Pass 'crc64' to calculate a CRC64 instead of an MD5 hash, which is faster and
+            requires the azure-storage-extensions package.
+
+            .. versionadded:: 12.23.0
+                CRC64 validation with `validate_content='crc64'`.
+        :paramtype validate_content: bool or str
         :keyword lease_action:
             Used to perform lease operations along with appending data.
 
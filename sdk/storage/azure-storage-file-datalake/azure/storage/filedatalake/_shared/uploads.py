@@ -5,7 +5,7 @@
 # --------------------------------------------------------------------------
 
 from concurrent import futures
-from io import BytesIO, IOBase, SEEK_CUR, SEEK_END, SEEK_SET, UnsupportedOperation
+from io import BufferedIOBase, BytesIO, IOBase, RawIOBase, SEEK_CUR, SEEK_END, SEEK_SET, UnsupportedOperation
 from itertools import islice
 from math import ceil
 from threading import Lock
@@ -15,10 +15,43 @@ from azure.core.tracing.common import with_current_context
 from . import encode_base64, url_quote
 from .request_handlers import get_length
 from .response_handlers import return_response_headers
+from .validation import encode_crc64
 
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
 _ERROR_VALUE_SHOULD_BE_SEEKABLE_STREAM = "{0} should be a seekable file-like/io.IOBase type stream object."
+_ERROR_VALUE_SHOULD_BE_BYTES = "Blob data should be of type bytes."
+
+
+def _fill_chunk(buffer, length, data):
+    """Copy a read into the chunk buffer, after the `length` bytes already in it.
+
+    :param memoryview buffer: The chunk buffer.
+    :param int length: The number of bytes already in the buffer.
+    :param data: The bytes read.
+    :type data: bytes or memoryview
+    :return: The number of bytes in the buffer.
+    :rtype: int
+    """
+    if not isinstance(data, (bytes, memoryview)):
+        raise TypeError(_ERROR_VALUE_SHOULD_BE_BYTES)
+    buffer[length:length + len(data)] = data
+    return length + len(data)
+
+
+def _supports_readinto(stream):
+    """Whether the short reads of a stream can be read directly into the chunk buffer.
+
+    :param stream: The stream.
+    :type stream: IO
+    :return: True if the stream implements readinto.
+    :rtype: bool
+    """
+    if isinstance(stream, BufferedIOBase):
+        # The default readinto of a buffered stream calls read
+        return True
+    # A raw stream may implement read only
+    return isinstance(stream, RawIOBase) and type(stream).readinto is not RawIOBase.readinto
 
 
 def _parallel_uploads(executor, uploader, pending, running):
@@ -133,6 +166,7 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         encryptor=None,
         padder=None,
         progress_hook=None,
+        content_crc64=None,
         **kwargs,
     ):
         self.service = service
@@ -157,25 +191,66 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self.last_modified = None
         self.request_options = kwargs
 
+        # Composes the CRC64 of the content uploaded with CRC64 validation, see _get_chunk_crc64
+        self.content_crc64 = content_crc64
+
+    def _read_chunk(self, read_size):
+        """Read `read_size` bytes from the stream, or fewer at the end of the stream.
+
+        A file usually returns the whole chunk from the first read, which is used as is. Pipes, sockets
+        and generators return short reads: they are assembled in a buffer for the chunk, read into
+        directly when the stream supports it, so each byte is copied once whatever the reads.
+
+        :param int read_size: The number of bytes to read.
+        :return: The bytes read.
+        :rtype: bytes or memoryview
+        """
+        data = self.stream.read(read_size)
+        # A BufferStream returns views of its buffer, see BufferStream
+        if not isinstance(data, (bytes, memoryview)):
+            raise TypeError(_ERROR_VALUE_SHOULD_BE_BYTES)
+        if not data or len(data) == read_size:
+            return data
+
+        # Chunks are uploaded while the next ones are read: each gets a buffer of its own
+        buffer = memoryview(bytearray(read_size))
+        length = _fill_chunk(buffer, 0, data)
+        readinto = _supports_readinto(self.stream)
+        while length < read_size:
+            if readinto:
+                count = self.stream.readinto(buffer[length:])
+                if count is None:
+                    raise TypeError(_ERROR_VALUE_SHOULD_BE_BYTES)
+                new_length = length + count
+            else:
+                new_length = _fill_chunk(buffer, length, self.stream.read(read_size - length))
+            if new_length == length:
+                break
+            length = new_length
+        return buffer[:length]
+
+    def _get_chunk_crc64(self, chunk_offset, chunk_data):
+        """Get the CRC64 of a chunk uploaded with CRC64 validation.
+
+        The CRC64 is computed once, both for the request of the chunk and for the content uploaded.
+
+        :param int chunk_offset: The offset of the chunk.
+        :param bytes chunk_data: The chunk.
+        :return: The CRC64 of the chunk, or None without CRC64 validation.
+        :rtype: bytearray or None
+        """
+        if self.content_crc64 is None:
+            return None
+        return encode_crc64(self.content_crc64.add_data(chunk_offset, chunk_data))
+
     def get_chunk_streams(self):
         index = 0
         while True:
-            data = b""
             read_size = self.chunk_size
-
+            if self.total_size:
+                read_size = min(self.chunk_size, self.total_size - index)
             # Buffer until we either reach the end of the stream or get a whole chunk.
-            while True:
-                if self.total_size:
-                    read_size = min(self.chunk_size - len(data), self.total_size - (index + len(data)))
-                temp = self.stream.read(read_size)
-                if not isinstance(temp, bytes):
-                    raise TypeError("Blob data should be of type bytes.")
-                data += temp or b""
-
-                # We have read an empty string and so are at the end
-                # of the buffer or we have read a full chunk.
-                if temp == b"" or len(data) == self.chunk_size:
-                    break
+            data = self._read_chunk(read_size)
 
             if len(data) == self.chunk_size:
                 if self.padder:
@@ -265,6 +340,7 @@ class BlockBlobChunkUploader(_ChunkUploader):
             block_id,
             len(chunk_data),
             chunk_data,
+            transactional_content_crc64=self._get_chunk_crc64(chunk_offset, chunk_data),
             data_stream_total=self.total_size,
             upload_stream_current=self.progress_total,
             **self.request_options,
@@ -295,6 +371,8 @@ class PageBlobChunkUploader(_ChunkUploader):
         return not any(bytearray(chunk_data))
 
     def _upload_chunk(self, chunk_offset, chunk_data):
+        # The empty pages are part of the uploaded content, even though they are not uploaded
+        computed_crc64 = self._get_chunk_crc64(chunk_offset, chunk_data)
         # avoid uploading the empty pages
         if not self._is_chunk_empty(chunk_data):
             chunk_end = chunk_offset + len(chunk_data) - 1
@@ -304,6 +382,7 @@ class PageBlobChunkUploader(_ChunkUploader):
                 body=chunk_data,
                 content_length=len(chunk_data),
                 transactional_content_md5=computed_md5,
+                transactional_content_crc64=computed_crc64,
                 range=content_range,
                 cls=return_response_headers,
                 data_stream_total=self.total_size,
@@ -325,10 +404,12 @@ class AppendBlobChunkUploader(_ChunkUploader):
         self.current_length = None
 
     def _upload_chunk(self, chunk_offset, chunk_data):
+        computed_crc64 = self._get_chunk_crc64(chunk_offset, chunk_data)
         if self.current_length is None:
             self.response_headers = self.service.append_block(
                 body=chunk_data,
                 content_length=len(chunk_data),
+                transactional_content_crc64=computed_crc64,
                 cls=return_response_headers,
                 data_stream_total=self.total_size,
                 upload_stream_current=self.progress_total,
@@ -342,6 +423,7 @@ class AppendBlobChunkUploader(_ChunkUploader):
             self.response_headers = self.service.append_block(
                 body=chunk_data,
                 content_length=len(chunk_data),
+                transactional_content_crc64=computed_crc64,
                 cls=return_response_headers,
                 data_stream_total=self.total_size,
                 upload_stream_current=self.progress_total,
@@ -360,6 +442,7 @@ class DataLakeFileChunkUploader(_ChunkUploader):
             body=chunk_data,
             position=chunk_offset,
             content_length=len(chunk_data),
+            transactional_content_crc64=self._get_chunk_crc64(chunk_offset, chunk_data),
             cls=return_response_headers,
             data_stream_total=self.total_size,
             upload_stream_current=self.progress_total,
@@ -562,6 +645,57 @@ class SubStream(IOBase):
         return False
 
 
+class BufferStream(IOBase):
+    """A read-only, seekable stream over a bytes-like object, such as a memory-mapped file.
+
+    read returns memoryview slices of the buffer instead of bytes, so the chunks are uploaded without being copied,
+    and without the lock SubStream needs to share a stream between parallel uploads.
+    """
+
+    def __init__(self, buffer):
+        super(BufferStream, self).__init__()
+        self._buffer = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def close(self):
+        self._buffer.release()
+        IOBase.close(self)
+
+    def read(self, size=-1):
+        if self.closed:  # pylint: disable=using-constant-test
+            raise ValueError("Stream is closed.")
+        end = len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(self._position + size, end)
+        data = self._buffer[self._position:end]
+        self._position += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise ValueError("Invalid argument for the 'whence' parameter.")
+        self._position = max(position, 0)
+        return self._position
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+
 class IterStreamer(object):
     """
     File-like streaming iterator.
@@ -592,19 +726,21 @@ class IterStreamer(object):
         raise UnsupportedOperation("Data generator is not seekable.")
 
     def read(self, size):
-        data = self.leftover
+        chunks = [self.leftover]
         count = len(self.leftover)
         try:
             while count < size:
                 chunk = self.__next__()
                 if isinstance(chunk, str):
                     chunk = chunk.encode(self.encoding)
-                data += chunk
+                chunks.append(chunk)
                 count += len(chunk)
         # This means count < size and what's leftover will be returned in this call.
         except StopIteration:
             self.leftover = b""
 
+        # Join once: concatenating each chunk would copy the data read so far for every chunk
+        data = b"".join(chunks)
         if count >= size:
             self.leftover = data[size:]
 
@@ -5,7 +5,7 @@
 # --------------------------------------------------------------------------
 
 from typing import (
-    Any, cast, Dict, IO, Optional,
+    Any, cast, Dict, IO, Optional, Union,
     TYPE_CHECKING
 )
 
@@ -36,7 +36,7 @@ def _any_conditions(modified_access_conditions=None, **kwargs):  # pylint: disab
 def upload_datalake_file(
     client: "PathOperations",
     stream: IO,
-    validate_content: bool,
+    validate_content: Union[bool, str],
     max_concurrency: int,
     file_settings: "StorageConfiguration",
     length: Optional[int] = None,
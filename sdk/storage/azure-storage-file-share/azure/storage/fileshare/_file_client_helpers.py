@@ -13,6 +13,7 @@ from urllib.parse import quote, unquote, urlparse
 from ._serialize import get_access_conditions, get_source_conditions
 from ._shared.base_client import parse_query
 from ._shared.response_handlers import return_response_headers
+from ._shared.validation import CRC64, MD5, get_validation_algorithm
 
 if TYPE_CHECKING:
     from urllib.parse import ParseResult
@@ -56,6 +57,14 @@ def _from_file_url(
     return account_url, share_name, file_path, snapshot
 
 
+def _get_validate_content(validate_content: Union[bool, str, None]) -> bool:
+    # The File service only returns and checks the transactional MD5, it has no x-ms-content-crc64 header
+    if isinstance(validate_content, str) and validate_content.lower() == CRC64:
+        raise ValueError("CRC64 content validation is not supported by the File service. "
+                         "Use validate_content=True for MD5 content validation.")
+    return get_validation_algorithm(validate_content) == MD5
+
+
 def _format_url(
     scheme: str,
     hostname: str,
@@ -27,6 +27,7 @@ from .._file_client_helpers import (
     _format_url,
     _from_file_url,
     _get_ranges_options,
+    _get_validate_content,
     _parse_url,
     _upload_range_from_url_options
 )
@@ -587,7 +588,7 @@ class ShareFileClient(AsyncStorageAccountHostsMixin, StorageAccountHostsMixin):
         metadata = kwargs.pop('metadata', None)
         content_settings = kwargs.pop('content_settings', None)
         max_concurrency = kwargs.pop('max_concurrency', 1)
-        validate_content = kwargs.pop('validate_content', False)
+        validate_content = _get_validate_content(kwargs.pop('validate_content', False))
         progress_hook = kwargs.pop('progress_hook', None)
         timeout = kwargs.pop('timeout', None)
         encoding = kwargs.pop('encoding', 'UTF-8')
@@ -914,6 +915,7 @@ class ShareFileClient(AsyncStorageAccountHostsMixin, StorageAccountHostsMixin):
             name=self.file_name,
             path='/'.join(self.file_path),
             share=self.share_name,
+            validate_content=_get_validate_content(kwargs.pop('validate_content', False)),
             lease_access_conditions=access_conditions,
             cls=deserialize_file_stream,
             **kwargs
@@ -1311,7 +1313,7 @@ class ShareFileClient(AsyncStorageAccountHostsMixin, StorageAccountHostsMixin):
         :returns: File-updated property dict (Etag and last modified).
         :rtype: Dict[str, Any]
         """
-        validate_content = kwargs.pop('validate_content', False)
+        validate_content = _get_validate_content(kwargs.pop('validate_content', False))
         timeout = kwargs.pop('timeout', None)
         encoding = kwargs.pop('encoding', 'UTF-8')
         file_last_write_mode = kwargs.pop('file_last_write_mode', None)
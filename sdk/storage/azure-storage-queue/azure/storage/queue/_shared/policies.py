@@ -34,6 +34,13 @@ from azure.core.pipeline.policies import (
 from .authentication import AzureSigningError, StorageHttpChallenge
 from .constants import DEFAULT_OAUTH_SCOPE
 from .models import LocationMode, StorageErrorCode
+from .validation import (
+    CRC64,
+    CRC64_HEADER,
+    encode_crc64_header,
+    get_content_crc64,
+    get_validation_algorithm
+)
 
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
@@ -102,8 +109,15 @@ def is_retry(response, mode):  # pylint: disable=too-many-return-statements
 
 
 def is_checksum_retry(response):
-    # retry if invalid content md5
-    if response.context.get("validate_content", False) and response.http_response.headers.get("content-md5"):
+    # retry if invalid content md5 or crc64
+    algorithm = get_validation_algorithm(response.context.get("validate_content", False))
+    if algorithm == CRC64 and response.http_response.headers.get(CRC64_HEADER):
+        computed_crc64 = response.http_request.headers.get(CRC64_HEADER, None) or encode_crc64_header(
+            get_content_crc64(response.http_response.body())
+        )
+        if response.http_response.headers[CRC64_HEADER] != computed_crc64:
+            return True
+    elif algorithm and response.http_response.headers.get("content-md5"):
         computed_md5 = response.http_request.headers.get("content-md5", None) or encode_base64(
             StorageContentValidation.get_content_md5(response.http_response.body())
         )
@@ -358,7 +372,7 @@ class StorageContentValidation(SansIOHTTPPolicy):
         # we have to perform a None check.
         data = data or b""
         md5 = hashlib.md5()  # nosec
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             md5.update(data)
         elif hasattr(data, "read"):
             pos = 0
@@ -379,14 +393,36 @@ class StorageContentValidation(SansIOHTTPPolicy):
 
     def on_request(self, request: "PipelineRequest") -> None:
         validate_content = request.context.options.pop("validate_content", False)
-        if validate_content and request.http_request.method != "GET":
+        algorithm = get_validation_algorithm(validate_content)
+        if algorithm == CRC64 and request.http_request.method != "GET":
+            # The CRC64 of an upload chunk may have been computed already, see _ChunkUploader
+            computed_crc64 = request.http_request.headers.get(CRC64_HEADER) or encode_crc64_header(
+                get_content_crc64(request.http_request.data)
+            )
+            request.http_request.headers[CRC64_HEADER] = computed_crc64
+            request.context["validate_content_crc64"] = computed_crc64
+        elif algorithm and request.http_request.method != "GET":
             computed_md5 = encode_base64(StorageContentValidation.get_content_md5(request.http_request.data))
             request.http_request.headers[self.header_name] = computed_md5
             request.context["validate_content_md5"] = computed_md5
         request.context["validate_content"] = validate_content
 
     def on_response(self, request: "PipelineRequest", response: "PipelineResponse") -> None:
-        if response.context.get("validate_content", False) and response.http_response.headers.get("content-md5"):
+        algorithm = get_validation_algorithm(response.context.get("validate_content", False))
+        if algorithm == CRC64:
+            if response.http_response.headers.get(CRC64_HEADER):
+                computed_crc64 = request.context.get("validate_content_crc64") or encode_crc64_header(
+                    get_content_crc64(response.http_response.body())
+                )
+                if response.http_response.headers[CRC64_HEADER] != computed_crc64:
+                    raise AzureError(
+                        (
+                            f"CRC64 mismatch. Expected value is '{response.http_response.headers[CRC64_HEADER]}', "
+                            f"computed value is '{computed_crc64}'."
+                        ),
+                        response=response.http_response,
+                    )
+        elif algorithm and response.http_response.headers.get("content-md5"):
             computed_md5 = request.context.get("validate_content_md5") or encode_base64(
                 StorageContentValidation.get_content_md5(response.http_response.body())
             )
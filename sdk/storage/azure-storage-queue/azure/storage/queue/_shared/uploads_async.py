@@ -15,7 +15,15 @@ from typing import AsyncGenerator, Union
 from . import encode_base64, url_quote
 from .request_handlers import get_length
 from .response_handlers import return_response_headers
-from .uploads import SubStream, IterStreamer  # pylint: disable=unused-import
+from .uploads import (  # pylint: disable=unused-import
+    BufferStream,
+    IterStreamer,
+    SubStream,
+    _ERROR_VALUE_SHOULD_BE_BYTES,
+    _fill_chunk,
+    _supports_readinto,
+)
+from .validation import encode_crc64
 
 
 async def _async_parallel_uploads(uploader, pending, running):
@@ -156,6 +164,7 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         encryptor=None,
         padder=None,
         progress_hook=None,
+        content_crc64=None,
         **kwargs,
     ):
         self.service = service
@@ -180,27 +189,69 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self.last_modified = None
         self.request_options = kwargs
 
+        # Composes the CRC64 of the content uploaded with CRC64 validation, see _get_chunk_crc64
+        self.content_crc64 = content_crc64
+
+    async def _read(self, size):
+        data = self.stream.read(size)
+        if inspect.isawaitable(data):
+            data = await data
+        return data
+
+    async def _read_chunk(self, read_size):
+        """Read `read_size` bytes from the stream, or fewer at the end of the stream.
+
+        See the _read_chunk method of the sync uploader.
+
+        :param int read_size: The number of bytes to read.
+        :return: The bytes read.
+        :rtype: bytes or memoryview
+        """
+        data = await self._read(read_size)
+        # A BufferStream returns views of its buffer, see BufferStream
+        if not isinstance(data, (bytes, memoryview)):
+            raise TypeError(_ERROR_VALUE_SHOULD_BE_BYTES)
+        if not data or len(data) == read_size:
+            return data
+
+        buffer = memoryview(bytearray(read_size))
+        length = _fill_chunk(buffer, 0, data)
+        readinto = _supports_readinto(self.stream) and not inspect.iscoroutinefunction(self.stream.read)
+        while length < read_size:
+            if readinto:
+                count = self.stream.readinto(buffer[length:])
+                if count is None:
+                    raise TypeError(_ERROR_VALUE_SHOULD_BE_BYTES)
+                new_length = length + count
+            else:
+                new_length = _fill_chunk(buffer, length, await self._read(read_size - length))
+            if new_length == length:
+                break
+            length = new_length
+        return buffer[:length]
+
+    def _get_chunk_crc64(self, chunk_offset, chunk_data):
+        """Get the CRC64 of a chunk uploaded with CRC64 validation.
+
+        The CRC64 is computed once, both for the request of the chunk and for the content uploaded.
+
+        :param int chunk_offset: The offset of the chunk.
+        :param bytes chunk_data: The chunk.
+        :return: The CRC64 of the chunk, or None without CRC64 validation.
+        :rtype: bytearray or None
+        """
+        if self.content_crc64 is None:
+            return None
+        return encode_crc64(self.content_crc64.add_data(chunk_offset, chunk_data))
+
     async def get_chunk_streams(self):
         index = 0
         while True:
-            data = b""
             read_size = self.chunk_size
-
+            if self.total_size:
+                read_size = min(self.chunk_size, self.total_size - index)
             # Buffer until we either reach the end of the stream or get a whole chunk.
-            while True:
-                if self.total_size:
-                    read_size = min(self.chunk_size - len(data), self.total_size - (index + len(data)))
-                temp = self.stream.read(read_size)
-                if inspect.isawaitable(temp):
-                    temp = await temp
-                if not isinstance(temp, bytes):
-                    raise TypeError("Blob data should be of type bytes.")
-                data += temp or b""
-
-                # We have read an empty string and so are at the end
-                # of the buffer or we have read a full chunk.
-                if temp == b"" or len(data) == self.chunk_size:
-                    break
+            data = await self._read_chunk(read_size)
 
             if len(data) == self.chunk_size:
                 if self.padder:
@@ -290,6 +341,7 @@ class BlockBlobChunkUploader(_ChunkUploader):
             block_id,
             len(chunk_data),
             body=chunk_data,
+            transactional_content_crc64=self._get_chunk_crc64(chunk_offset, chunk_data),
             data_stream_total=self.total_size,
             upload_stream_current=self.progress_total,
             **self.request_options,
@@ -323,6 +375,8 @@ class PageBlobChunkUploader(_ChunkUploader):
         return True
 
     async def _upload_chunk(self, chunk_offset, chunk_data):
+        # The empty pages are part of the uploaded content, even though they are not uploaded
+        computed_crc64 = self._get_chunk_crc64(chunk_offset, chunk_data)
         # avoid uploading the empty pages
         if not self._is_chunk_empty(chunk_data):
             chunk_end = chunk_offset + len(chunk_data) - 1
@@ -332,6 +386,7 @@ class PageBlobChunkUploader(_ChunkUploader):
                 body=chunk_data,
                 content_length=len(chunk_data),
                 transactional_content_md5=computed_md5,
+                transactional_content_crc64=computed_crc64,
                 range=content_range,
                 cls=return_response_headers,
                 data_stream_total=self.total_size,
@@ -353,10 +408,12 @@ class AppendBlobChunkUploader(_ChunkUploader):
         self.current_length = None
 
     async def _upload_chunk(self, chunk_offset, chunk_data):
+        computed_crc64 = self._get_chunk_crc64(chunk_offset, chunk_data)
         if self.current_length is None:
             self.response_headers = await self.service.append_block(
                 body=chunk_data,
                 content_length=len(chunk_data),
+                transactional_content_crc64=computed_crc64,
                 cls=return_response_headers,
                 data_stream_total=self.total_size,
                 upload_stream_current=self.progress_total,
@@ -370,6 +427,7 @@ class AppendBlobChunkUploader(_ChunkUploader):
             self.response_headers = await self.service.append_block(
                 body=chunk_data,
                 content_length=len(chunk_data),
+                transactional_content_crc64=computed_crc64,
                 cls=return_response_headers,
                 data_stream_total=self.total_size,
                 upload_stream_current=self.progress_total,
@@ -387,6 +445,7 @@ class DataLakeFileChunkUploader(_ChunkUploader):
             body=chunk_data,
             position=chunk_offset,
             content_length=len(chunk_data),
+            transactional_content_crc64=self._get_chunk_crc64(chunk_offset, chunk_data),
             cls=return_response_headers,
             data_stream_total=self.total_size,
             upload_stream_current=self.progress_total,
@@ -0,0 +1,160 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import base64
+import struct
+from io import SEEK_SET
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    from azure.storage.extensions import crc64  # type: ignore [attr-defined]
+except ImportError:
+    crc64 = None
+
+
+MD5 = "md5"
+CRC64 = "crc64"
+CRC64_HEADER = "x-ms-content-crc64"
+
+# The size of the reads hashing a stream: the CRC64 is cheap enough for larger reads than the MD5
+_CRC64_READ_SIZE = 4 * 1024 * 1024
+
+
+def _get_crc64_extension() -> Any:
+    if crc64 is None:
+        raise ImportError(
+            "CRC64 content validation requires the azure-storage-extensions package. "
+            "Please check azure-storage-extensions is installed."
+        )
+    return crc64
+
+
+def get_validation_algorithm(validate_content: Union[bool, str, None]) -> Optional[str]:
+    """Get the algorithm of a `validate_content` option.
+
+    :param validate_content: True or "md5" for MD5, "crc64" for CRC64, or False or None to not validate.
+    :type validate_content: bool or str or None
+    :return: MD5, CRC64, or None to not validate.
+    :rtype: str or None
+    """
+    if isinstance(validate_content, str):
+        algorithm = validate_content.lower()
+        if algorithm not in (MD5, CRC64):
+            raise ValueError(f"Invalid validate_content '{validate_content}'. Expected True, 'md5' or 'crc64'.")
+        if algorithm == CRC64:
+            _get_crc64_extension()
+        return algorithm
+    return MD5 if validate_content else None
+
+
+def is_crc64(validate_content: Union[bool, str, None]) -> bool:
+    return get_validation_algorithm(validate_content) == CRC64
+
+
+def get_content_crc64(data: Any, crc: int = 0) -> int:
+    """Compute the CRC64 of some data, continuing from the CRC64 of the preceding data.
+
+    :param data: Bytes, or a seekable file-like object read from its current position, which is restored.
+    :type data: bytes or bytearray or memoryview or IO
+    :param int crc: The CRC64 of the preceding data.
+    :return: The CRC64.
+    :rtype: int
+    """
+    extension = _get_crc64_extension()
+    # Since HTTP does not differentiate between no content and empty content,
+    # we have to perform a None check.
+    data = data or b""
+    if isinstance(data, bytes):
+        return extension.compute(data, crc)
+    if isinstance(data, (bytearray, memoryview)):
+        try:
+            # Read in place, without a copy, by the extension built for Python 3.11+
+            return extension.compute(data, crc)
+        except (TypeError, BufferError):
+            return extension.compute(bytes(data), crc)
+    if hasattr(data, "read"):
+        pos = 0
+        try:
+            pos = data.tell()
+        except:  # pylint: disable=bare-except
+            pass
+        for chunk in iter(lambda: data.read(_CRC64_READ_SIZE), b""):
+            crc = extension.compute(chunk, crc)
+        try:
+            data.seek(pos, SEEK_SET)
+        except (AttributeError, IOError) as exc:
+            raise ValueError("Data should be bytes or a seekable file-like object.") from exc
+        return crc
+    raise ValueError("Data should be bytes or a seekable file-like object.")
+
+
+def encode_crc64(crc: int) -> bytes:
+    """The eight little-endian bytes of a CRC64, as the service sends and receives them.
+
+    :param int crc: The CRC64.
+    :return: The bytes of the CRC64.
+    :rtype: bytes
+    """
+    return struct.pack("<Q", crc)
+
+
+def encode_crc64_header(crc: int) -> str:
+    return base64.b64encode(encode_crc64(crc)).decode("utf-8")
+
+
+def decode_crc64(value: Union[str, bytes, bytearray]) -> int:
+    """Get a CRC64 from its header value, or from its bytes.
+
+    :param value: The base64 value of the x-ms-content-crc64 header, or its eight bytes.
+    :type value: str or bytes or bytearray
+    :return: The CRC64.
+    :rtype: int
+    """
+    if isinstance(value, str):
+        value = base64.b64decode(value)
+    return struct.unpack("<Q", bytes(value))[0]
+
+
+class ContentCrc64(object):
+    """The CRC64 of some content, composed from the CRC64 of its chunks.
+
+    The chunks of a parallel transfer complete in any order, so they are kept by offset and combined in
+    order when the CRC64 of the content is needed, from their CRC64 and length only, without their data.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: Dict[int, Tuple[int, int]] = {}
+
+    def add(self, offset: int, length: int, crc: int) -> None:
+        if length:
+            self._chunks[offset] = (length, crc)
+
+    def add_data(self, offset: int, data: bytes) -> int:
+        crc = get_content_crc64(data)
+        self.add(offset, len(data), crc)
+        return crc
+
+    def compose(self, start: int = 0, length: Optional[int] = None) -> Optional[int]:
+        """Compose the CRC64 of a range of the content.
+
+        :param int start: The offset of the range.
+        :param int length: The length of the range, or None for all the chunks following `start`.
+        :return: The CRC64 of the range, or None if the chunks added do not cover exactly the range.
+        :rtype: int or None
+        """
+        extension = _get_crc64_extension()
+        crc = 0
+        offset = start
+        while length is None or offset < start + length:
+            chunk = self._chunks.get(offset)
+            if chunk is None:
+                if length is None:
+                    break
+                return None
+            chunk_length, chunk_crc = chunk
+            crc = extension.combine(crc, chunk_crc, chunk_length)
+            offset += chunk_length
+        return crc if length is None or offset == start + length else None
@@ -17,32 +17,6 @@ from azure.core.rest import AsyncHttpResponse, HttpRequest
 from .. import models as _models
 from .._serialization import Deserializer, Serializer
 from ._configuration import ArtifactsClientConfiguration
-from .operations import (
-    BigDataPoolsOperations,
-    DataFlowDebugSessionOperations,
-    DataFlowOperations,
-    DatasetOperations,
-    IntegrationRuntimesOperations,
-    KqlScriptOperations,
-    KqlScriptsOperations,
-    LibraryOperations,
-    LinkConnectionOperations,
-    LinkedServiceOperations,
-    MetastoreOperations,
-    NotebookOperationResultOperations,
-    NotebookOperations,
-    PipelineOperations,
-    PipelineRunOperations,
-    RunNotebookOperations,
-    SparkConfigurationOperations,
-    SparkJobDefinitionOperations,
-    SqlPoolsOperations,
-    SqlScriptOperations,
-    TriggerOperations,
-    TriggerRunOperations,
-    WorkspaceGitRepoManagementOperations,
-    WorkspaceOperations,
-)
 
 if TYPE_CHECKING:
     from azure.core.credentials_async import AsyncTokenCredential
@@ -136,10 +110,39 @@ class ArtifactsClient:  # pylint: disable=client-accepts-api-version-keyword,too
             ]
         self._client: AsyncPipelineClient = AsyncPipelineClient(base_url=_endpoint, policies=_policies, **kwargs)
 
-        client_models = {k: v for k, v in _models.__dict__.items() if isinstance(v, type)}
+        client_models = {k: getattr(_models, k) for k in _models.__all__}
+        client_models = {k: v for k, v in client_models.items() if isinstance(v, type)}
         self._serialize = Serializer(client_models)
         self._deserialize = Deserializer(client_models)
         self._serialize.client_side_validation = False
+        # Operation groups and models are imported with the first client rather than with the package
+        from .operations import (  # pylint: disable=import-outside-toplevel
+            BigDataPoolsOperations,
+            DataFlowDebugSessionOperations,
+            DataFlowOperations,
+            DatasetOperations,
+            IntegrationRuntimesOperations,
+            KqlScriptOperations,
+            KqlScriptsOperations,
+            LibraryOperations,
+            LinkConnectionOperations,
+            LinkedServiceOperations,
+            MetastoreOperations,
+            NotebookOperationResultOperations,
+            NotebookOperations,
+            PipelineOperations,
+            PipelineRunOperations,
+            RunNotebookOperations,
+            SparkConfigurationOperations,
+            SparkJobDefinitionOperations,
+            SqlPoolsOperations,
+            SqlScriptOperations,
+            TriggerOperations,
+            TriggerRunOperations,
+            WorkspaceGitRepoManagementOperations,
+            WorkspaceOperations,
+        )
+
         self.link_connection = LinkConnectionOperations(self._client, self._config, self._serialize, self._deserialize)
         self.run_notebook = RunNotebookOperations(self._client, self._config, self._serialize, self._deserialize)
         self.kql_scripts = KqlScriptsOperations(self._client, self._config, self._serialize, self._deserialize)
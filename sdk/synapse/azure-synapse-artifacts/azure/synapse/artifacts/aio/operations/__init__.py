@@ -7,35 +7,36 @@
 # --------------------------------------------------------------------------
 # pylint: disable=wrong-import-position
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
 
-from ._link_connection_operations import LinkConnectionOperations  # type: ignore
-from ._run_notebook_operations import RunNotebookOperations  # type: ignore
-from ._kql_scripts_operations import KqlScriptsOperations  # type: ignore
-from ._kql_script_operations import KqlScriptOperations  # type: ignore
-from ._metastore_operations import MetastoreOperations  # type: ignore
-from ._spark_configuration_operations import SparkConfigurationOperations  # type: ignore
-from ._big_data_pools_operations import BigDataPoolsOperations  # type: ignore
-from ._data_flow_operations import DataFlowOperations  # type: ignore
-from ._data_flow_debug_session_operations import DataFlowDebugSessionOperations  # type: ignore
-from ._dataset_operations import DatasetOperations  # type: ignore
-from ._workspace_git_repo_management_operations import WorkspaceGitRepoManagementOperations  # type: ignore
-from ._integration_runtimes_operations import IntegrationRuntimesOperations  # type: ignore
-from ._library_operations import LibraryOperations  # type: ignore
-from ._linked_service_operations import LinkedServiceOperations  # type: ignore
-from ._notebook_operations import NotebookOperations  # type: ignore
-from ._notebook_operation_result_operations import NotebookOperationResultOperations  # type: ignore
-from ._pipeline_operations import PipelineOperations  # type: ignore
-from ._pipeline_run_operations import PipelineRunOperations  # type: ignore
-from ._spark_job_definition_operations import SparkJobDefinitionOperations  # type: ignore
-from ._sql_pools_operations import SqlPoolsOperations  # type: ignore
-from ._sql_script_operations import SqlScriptOperations  # type: ignore
-from ._trigger_operations import TriggerOperations  # type: ignore
-from ._trigger_run_operations import TriggerRunOperations  # type: ignore
-from ._workspace_operations import WorkspaceOperations  # type: ignore
+    from ._link_connection_operations import LinkConnectionOperations  # type: ignore
+    from ._run_notebook_operations import RunNotebookOperations  # type: ignore
+    from ._kql_scripts_operations import KqlScriptsOperations  # type: ignore
+    from ._kql_script_operations import KqlScriptOperations  # type: ignore
+    from ._metastore_operations import MetastoreOperations  # type: ignore
+    from ._spark_configuration_operations import SparkConfigurationOperations  # type: ignore
+    from ._big_data_pools_operations import BigDataPoolsOperations  # type: ignore
+    from ._data_flow_operations import DataFlowOperations  # type: ignore
+    from ._data_flow_debug_session_operations import DataFlowDebugSessionOperations  # type: ignore
+    from ._dataset_operations import DatasetOperations  # type: ignore
+    from ._workspace_git_repo_management_operations import WorkspaceGitRepoManagementOperations  # type: ignore
+    from ._integration_runtimes_operations import IntegrationRuntimesOperations  # type: ignore
+    from ._library_operations import LibraryOperations  # type: ignore
+    from ._linked_service_operations import LinkedServiceOperations  # type: ignore
+    from ._notebook_operations import NotebookOperations  # type: ignore
+    from ._notebook_operation_result_operations import NotebookOperationResultOperations  # type: ignore
+    from ._pipeline_operations import PipelineOperations  # type: ignore
+    from ._pipeline_run_operations import PipelineRunOperations  # type: ignore
+    from ._spark_job_definition_operations import SparkJobDefinitionOperations  # type: ignore
+    from ._sql_pools_operations import SqlPoolsOperations  # type: ignore
+    from ._sql_script_operations import SqlScriptOperations  # type: ignore
+    from ._trigger_operations import TriggerOperations  # type: ignore
+    from ._trigger_run_operations import TriggerRunOperations  # type: ignore
+    from ._workspace_operations import WorkspaceOperations  # type: ignore
 
 from ._patch import __all__ as _patch_all
 from ._patch import *
@@ -69,3 +70,45 @@ __all__ = [
 ]
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+# Each operation group is imported when it is first accessed (PEP 562), not with the package.
+_LAZY_IMPORTS = {
+    "LinkConnectionOperations": "._link_connection_operations",
+    "RunNotebookOperations": "._run_notebook_operations",
+    "KqlScriptsOperations": "._kql_scripts_operations",
+    "KqlScriptOperations": "._kql_script_operations",
+    "MetastoreOperations": "._metastore_operations",
+    "SparkConfigurationOperations": "._spark_configuration_operations",
+    "BigDataPoolsOperations": "._big_data_pools_operations",
+    "DataFlowOperations": "._data_flow_operations",
+    "DataFlowDebugSessionOperations": "._data_flow_debug_session_operations",
+    "DatasetOperations": "._dataset_operations",
+    "WorkspaceGitRepoManagementOperations": "._workspace_git_repo_management_operations",
+    "IntegrationRuntimesOperations": "._integration_runtimes_operations",
+    "LibraryOperations": "._library_operations",
+    "LinkedServiceOperations": "._linked_service_operations",
+    "NotebookOperations": "._notebook_operations",
+    "NotebookOperationResultOperations": "._notebook_operation_result_operations",
+    "PipelineOperations": "._pipeline_operations",
+    "PipelineRunOperations": "._pipeline_run_operations",
+    "SparkJobDefinitionOperations": "._spark_job_definition_operations",
+    "SqlPoolsOperations": "._sql_pools_operations",
+    "SqlScriptOperations": "._sql_script_operations",
+    "TriggerOperations": "._trigger_operations",
+    "TriggerRunOperations": "._trigger_run_operations",
+    "WorkspaceOperations": "._workspace_operations",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
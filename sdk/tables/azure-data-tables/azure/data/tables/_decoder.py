@@ -8,6 +8,11 @@ from datetime import datetime, timezone
 from urllib.parse import quote
 from uuid import UUID
 
+try:
+    from azure.core.runtime.datetime_codec import parse_iso8601 as _parse_iso8601
+except ImportError:  # azure-core without the shared datetime codec
+    _parse_iso8601 = None  # type: ignore
+
 from ._common_conversion import _decode_base64_to_bytes
 from ._entity import EntityProperty, EdmType, TableEntity, EntityMetadata
 
@@ -166,16 +171,39 @@ _ENTITY_TO_PYTHON_CONVERSIONS = {
 def deserialize_iso(value: Optional[str]) -> Optional[TablesEntityDatetime]:
     if not value:
         return None
-    # Cosmos returns this with a decimal point that throws an error on deserialization
-    cleaned_value = _clean_up_dotnet_timestamps(value)
-    try:
-        dt_obj = TablesEntityDatetime.strptime(cleaned_value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
-    except ValueError:
-        dt_obj = TablesEntityDatetime.strptime(cleaned_value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    dt_obj = _deserialize_iso_fast(value)
+    if dt_obj is None:
+        # Cosmos returns this with a decimal point that throws an error on deserialization
+        cleaned_value = _clean_up_dotnet_timestamps(value)
+        try:
+            dt_obj = TablesEntityDatetime.strptime(cleaned_value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+        except ValueError:
+            dt_obj = TablesEntityDatetime.strptime(cleaned_value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
     dt_obj._service_value = value  # pylint:disable=protected-access,assigning-non-slot
     return dt_obj
 
 
+def _deserialize_iso_fast(value: str) -> Optional[TablesEntityDatetime]:
+    # The shared codec of azure-core parses the usual UTC timestamps without strptime; anything else, or an older
+    # azure-core, goes through the strptime formats above.
+    if _parse_iso8601 is None or not value.endswith("Z"):
+        return None
+    try:
+        parsed = _parse_iso8601(value)
+    except (ValueError, OverflowError):
+        return None
+    return TablesEntityDatetime(
+        parsed.year,
+        parsed.month,
+        parsed.day,
+        parsed.hour,
+        parsed.minute,
+        parsed.second,
+        parsed.microsecond,
+        tzinfo=timezone.utc,
+    )
+
+
 def _clean_up_dotnet_timestamps(value):
     # .NET has more decimal places than Python supports in datetime objects, this truncates
     # values after 6 decimal places.